@@ -60,9 +60,11 @@ from cvxpy.transforms import (
     suppfunc as suppfunc,
 )
 from cvxpy.reductions.solvers.defines import installed_solvers as installed_solvers
+from cvxpy.utilities.profiling import profiling as profiling
 from cvxpy.settings import (
     CBC as CBC,
     CLARABEL as CLARABEL,
+    COO_CANON_BACKEND as COO_CANON_BACKEND,
     COPT as COPT,
     CPLEX as CPLEX,
     CPP_CANON_BACKEND as CPP_CANON_BACKEND,
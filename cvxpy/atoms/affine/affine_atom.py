@@ -37,12 +37,14 @@ class AffAtom(Atom):
         """
         return u.sign.sum_signs([arg for arg in self.args])
 
+    @perf.compute_once_bottom_up
     def is_imag(self) -> bool:
         """Is the expression imaginary?
         """
         # Default is most generic argument.
         return all(arg.is_imag() for arg in self.args)
 
+    @perf.compute_once_bottom_up
     def is_complex(self) -> bool:
         """Is the expression complex valued?
         """
@@ -71,9 +73,11 @@ class AffAtom(Atom):
         # Defaults to increasing.
         return False
 
+    @perf.compute_once_bottom_up
     def is_quadratic(self) -> bool:
         return all(arg.is_quadratic() for arg in self.args)
 
+    @perf.compute_once_bottom_up
     def has_quadratic_term(self) -> bool:
         """Does the affine head of the expression contain a quadratic term?
 
@@ -83,14 +87,16 @@ class AffAtom(Atom):
         """
         return any(arg.has_quadratic_term() for arg in self.args)
 
+    @perf.compute_once_bottom_up
     def is_qpwa(self) -> bool:
         return all(arg.is_qpwa() for arg in self.args)
 
+    @perf.compute_once_bottom_up
     def is_pwl(self) -> bool:
         return all(arg.is_pwl() for arg in self.args)
 
     # TODO is this right?
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_psd(self) -> bool:
         """Is the expression a positive semidefinite matrix?
         """
@@ -100,7 +106,7 @@ class AffAtom(Atom):
                 return False
         return True
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_nsd(self) -> bool:
         """Is the expression a positive semidefinite matrix?
         """
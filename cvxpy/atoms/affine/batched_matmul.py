@@ -0,0 +1,86 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+from cvxpy.atoms.affine.reshape import reshape
+from cvxpy.atoms.affine.vec import vec
+from cvxpy.expressions.expression import Expression
+
+
+def _block_diag(A) -> sp.csc_matrix:
+    """Returns the block diagonal matrix of the blocks A[i]."""
+    if isinstance(A, np.ndarray):
+        k, m, n = A.shape
+        # Entry A[i, r, c] multiplies X[i, c] in row r of block i.
+        rows = np.arange(k)[:, None, None] * m + np.arange(m)[None, :, None]
+        cols = np.arange(k)[:, None, None] * n + np.arange(n)[None, None, :]
+        rows, cols = np.broadcast_arrays(rows, cols)
+        P = sp.csc_matrix((A.ravel(), (rows.ravel(), cols.ravel())),
+                          shape=(k * m, k * n))
+        P.eliminate_zeros()
+        return P
+    return sp.block_diag(A, format="csc")
+
+
+def batched_matmul(A, X):
+    """Multiplies every row of X by its own constant matrix.
+
+    Returns the expression whose i-th row is ``A[i] @ X[i]``, as a single
+    product with a block diagonal matrix. This replaces a Python loop such as
+    ``[A[i] @ X[i] <= b[i] for i in range(k)]`` by the single constraint
+    ``batched_matmul(A, X) <= b``, which is much faster to construct and
+    compile. The dual value of the constraint stacks the dual values of the
+    loop's constraints as rows.
+
+    Parameters
+    ----------
+    A : numeric constant
+        A 3D array of shape (k, m, n), or a list of k (possibly sparse)
+        m-by-n matrices. A 2D array of shape (k, n) gives the inner products
+        ``A[i] @ X[i]``.
+    X : Expression or numeric constant
+        The matrix of shape (k, n).
+
+    Returns
+    -------
+    Expression
+        An Expression of shape (k, m), or (k,) if A is a 2D array.
+    """
+    X = Expression.cast_to_const(X)
+    if isinstance(A, Expression):
+        raise ValueError("A must be a numeric constant.")
+    if isinstance(A, (list, tuple)) and any(sp.issparse(block) for block in A):
+        A = [sp.csr_matrix(block) for block in A]
+        if len({block.shape for block in A}) != 1:
+            raise ValueError("The blocks of A must have the same shape.")
+        (m, n), k = A[0].shape, len(A)
+        inner = False
+    else:
+        A = np.asarray(A)
+        inner = A.ndim == 2
+        if inner:
+            A = A[:, np.newaxis, :]
+        elif A.ndim != 3:
+            raise ValueError("A must be a 2D or 3D array.")
+        k, m, n = A.shape
+    if X.shape != (k, n):
+        raise ValueError(
+            "X must have shape %s, not %s." % ((k, n), X.shape))
+    product = _block_diag(A) @ vec(X, order='C')
+    if inner:
+        return product
+    return reshape(product, (k, m), order='C')
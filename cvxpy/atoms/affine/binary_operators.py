@@ -39,6 +39,7 @@ from cvxpy.expressions.constants.parameter import (
     is_param_free,
 )
 from cvxpy.expressions.expression import Expression
+from cvxpy.utilities import performance_utils as perf
 
 
 class BinaryOperator(AffAtom):
@@ -71,12 +72,14 @@ class BinaryOperator(AffAtom):
         """
         return u.sign.mul_sign(self.args[0], self.args[1])
 
+    @perf.compute_once_bottom_up
     def is_imag(self) -> bool:
         """Is the expression imaginary?
         """
         return (self.args[0].is_imag() and self.args[1].is_real()) or \
             (self.args[0].is_real() and self.args[1].is_imag())
 
+    @perf.compute_once_bottom_up
     def is_complex(self) -> bool:
         """Is the expression complex valued?
         """
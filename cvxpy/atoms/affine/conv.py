@@ -26,6 +26,7 @@ import cvxpy.utilities as u
 from cvxpy.atoms.affine.affine_atom import AffAtom
 from cvxpy.constraints.constraint import Constraint
 from cvxpy.expressions.constants.parameter import is_param_free
+from cvxpy.utilities.torch_utils import torch_convolve
 
 
 class conv(AffAtom):
@@ -62,6 +63,13 @@ class conv(AffAtom):
         else:
             return output
 
+    def torch_numeric(self, values):
+        output = torch_convolve(*[value.flatten() for value in values])
+        if values[0].ndim == 2 or values[1].ndim == 2:
+            return output[:, None]
+        else:
+            return output
+
     def validate_arguments(self) -> None:
         """Checks that both arguments are vectors, and the first is constant.
         """
@@ -163,6 +171,9 @@ class convolve(AffAtom):
         """
         return np.convolve(values[0], values[1])
 
+    def torch_numeric(self, values):
+        return torch_convolve(values[0], values[1])
+
     def validate_arguments(self) -> None:
         """Checks that both arguments are vectors, and the first is constant.
         """
@@ -33,6 +33,8 @@ class imag(AffAtom):
     
     def torch_numeric(self, values):
         import torch
+        if not torch.is_complex(values[0]):
+            return torch.zeros_like(values[0])
         return torch.imag(values[0])
 
     def shape_from_args(self) -> Tuple[int, ...]:
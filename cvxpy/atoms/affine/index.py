@@ -26,6 +26,7 @@ from cvxpy.atoms.affine.vec import vec
 from cvxpy.constraints.constraint import Constraint
 from cvxpy.expressions.expression import Expression
 from cvxpy.utilities import key_utils as ku
+from cvxpy.utilities.torch_utils import torch_index
 
 
 class index(AffAtom):
@@ -74,6 +75,9 @@ class index(AffAtom):
         """
         return values[0][self._orig_key]
 
+    def torch_numeric(self, values):
+        return torch_index(values[0], self._orig_key)
+
     def shape_from_args(self) -> Tuple[int, ...]:
         """Returns the shape of the index expression.
         """
@@ -147,6 +151,9 @@ class special_index(AffAtom):
         """
         return values[0][self.key]
 
+    def torch_numeric(self, values):
+        return torch_index(values[0], self.key)
+
     def shape_from_args(self) -> Tuple[int, ...]:
         """Returns the shape of the index expression.
         """
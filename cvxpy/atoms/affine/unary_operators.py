@@ -44,6 +44,9 @@ class NegExpression(UnaryOperator):
     OP_NAME = "-"
     OP_FUNC = op.neg
 
+    def torch_numeric(self, values):
+        return self.OP_FUNC(values[0])
+
     def shape_from_args(self) -> Tuple[int, ...]:
         """Returns the (row, col) shape of the expression.
         """
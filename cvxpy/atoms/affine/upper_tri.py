@@ -66,14 +66,8 @@ class upper_tri(AffAtom):
     
     def torch_numeric(self, values):
         import torch
-        value = torch.zeros(self.shape[0])
-        count = 0
-        for i in range(values[0].shape[0]):
-            for j in range(values[0].shape[1]):
-                if i < j:
-                    value[count] = values[0][i, j]
-                    count += 1
-        return value
+        rows, cols = torch.triu_indices(*values[0].shape, offset=1)
+        return values[0][rows, cols]
 
     def validate_arguments(self) -> None:
         """Checks that the argument is a square matrix.
@@ -37,6 +37,9 @@ class Wrap(AffAtom):
         """
         return values[0]
 
+    def torch_numeric(self, values):
+        return values[0]
+
     def is_complex(self) -> bool:
         return self.args[0].is_complex()
 
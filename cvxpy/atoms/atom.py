@@ -14,12 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import abc
+import functools
+import threading
 from typing import TYPE_CHECKING, List, Tuple
 
 if TYPE_CHECKING:
     from cvxpy.constraints.constraint import Constraint
 
 import numpy as np
+import scipy.sparse as sp
 
 import cvxpy.lin_ops.lin_op as lo
 import cvxpy.lin_ops.lin_utils as lu
@@ -30,15 +33,78 @@ from cvxpy.expressions import cvxtypes
 #from cvxpy.expressions.constants import Constant #TODO (Amit): This was in the original code
 from cvxpy.expressions.constants.constant import Constant
 from cvxpy.expressions.expression import Expression
+from cvxpy.expressions.leaf import Leaf
 from cvxpy.utilities import performance_utils as perf
+from cvxpy.utilities import traversal
 from cvxpy.utilities.deterministic import unique_list
 
 #from cvxpy.atoms.affine.binary_operators import MulExpression
 
+def _stamp_children(atom) -> list:
+    """Returns the expressions whose values the value of atom depends on."""
+    data = atom.get_data()
+    if not data:
+        return atom.args
+    return atom.args + [elem for elem in data if isinstance(elem, Expression)]
+
+
+def _update_stamp(atom, latest: int) -> None:
+    """Memoizes the stamp of atom, the largest stamp of its children."""
+    stamp = 0
+    for expr in _stamp_children(atom):
+        if isinstance(expr, Atom) and expr._stamp_memo[0] == latest:
+            expr_stamp = expr._stamp_memo[1]
+        else:
+            expr_stamp = expr._value_stamp()
+        if expr_stamp is None:
+            stamp = None
+            break
+        stamp = max(stamp, expr_stamp)
+    atom._stamp_memo = (latest, stamp)
+
+
+def _copy_value(val):
+    """Returns a copy of a memoized value that can be modified safely."""
+    if isinstance(val, np.ndarray) or sp.issparse(val):
+        return val.copy()
+    return val
+
+
+_reading = threading.local()
+
+
+def _reads_values(method):
+    """Decorates the methods that read the value of an atom.
+
+    The leaves below the atom are checked for values that were modified in
+    place, see Leaf._check_value, once per outermost read.
+    """
+    @functools.wraps(method)
+    def _read(self):
+        if getattr(_reading, 'active', False):
+            return method(self)
+        _reading.active = True
+        try:
+            for leaf in self._value_leaves():
+                leaf._check_value()
+            return method(self)
+        finally:
+            _reading.active = False
+    return _read
+
+
 class Atom(Expression):
     """ Abstract base class for atoms. """
     __metaclass__ = abc.ABCMeta
     _allow_complex = False
+    # Values and gradients are memoized under the stamp of the atom, see
+    # _value_stamp, which is itself memoized under the latest version.
+    _stamp_memo = (None, None)
+    _value_memo = (None, None)
+    _grad_memo = (None, None)
+    # The leaves and the parameters below the atom, see _value_leaves.
+    _leaves_memo = None
+    _parameters_memo = None
     # args are the expressions passed into the Atom constructor.
 
     def __init__(self, *args) -> None:
@@ -55,6 +121,13 @@ class Atom(Expression):
         if len(self._shape) > 2:
             raise ValueError("Atoms must be at most 2D.")
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for memo in ['_stamp_memo', '_value_memo', '_grad_memo', '_leaves_memo',
+                     '_parameters_memo']:
+            state.pop(memo, None)
+        return state
+
     def name(self) -> str:
         """Returns the string representation of the function call.
         """
@@ -89,13 +162,13 @@ class Atom(Expression):
         """
         raise NotImplementedError()
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_nonneg(self) -> bool:
         """Is the expression nonnegative?
         """
         return self.sign_from_args()[0]
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_nonpos(self) -> bool:
         """Is the expression nonpositive?
         """
@@ -169,7 +242,7 @@ class Atom(Expression):
         """
         raise NotImplementedError()
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_convex(self) -> bool:
         """Is the expression convex?
         """
@@ -186,7 +259,7 @@ class Atom(Expression):
         else:
             return False
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_concave(self) -> bool:
         """Is the expression concave?
         """
@@ -213,7 +286,7 @@ class Atom(Expression):
         else:
             raise ValueError('Unsupported context ', context)
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_log_log_convex(self) -> bool:
         """Is the expression log-log convex?
         """
@@ -230,7 +303,7 @@ class Atom(Expression):
         else:
             return False
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_log_log_concave(self) -> bool:
         """Is the expression log-log concave?
         """
@@ -261,7 +334,7 @@ class Atom(Expression):
         return (self.is_scalar() and len(non_const) == 1 and
                 self.args[non_const[0]].is_scalar())
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_quasiconvex(self) -> bool:
         """Is the expression quaisconvex?
         """
@@ -286,7 +359,7 @@ class Atom(Expression):
             return True
         return False
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_quasiconcave(self) -> bool:
         """Is the expression quasiconcave?
         """
@@ -354,32 +427,103 @@ class Atom(Expression):
         raise NotImplementedError()
 
     @property
+    @_reads_values
     def value(self):
-        if any([p.value is None for p in self.parameters()]):
+        if self._parameters_memo is None:
+            self._parameters_memo = self.parameters()
+        if any(p.value is None for p in self._parameters_memo):
             return None
         return self._value_impl()
 
+    def _value_leaves(self) -> list:
+        """Returns the leaves whose values the value of the atom depends on.
+
+        The list is computed once, so that reading the value does not
+        traverse the whole tree to check the leaves.
+        """
+        if self._leaves_memo is None:
+            def children(node) -> list:
+                return _stamp_children(node) if isinstance(node, Atom) else []
+            self._leaves_memo = [node for node in traversal.post_order(self, children)
+                                 if isinstance(node, Leaf)]
+        return self._leaves_memo
+
+    def _value_stamp(self):
+        latest = perf.latest_value_version()
+
+        def stale(node) -> bool:
+            return (type(node)._value_stamp is Atom._value_stamp and
+                    node._stamp_memo[0] != latest)
+
+        # The stamps are computed bottom-up, so that the leaves are visited
+        # at most once per assignment of a value, even if subexpressions
+        # are shared.
+        if stale(self):
+            for node in traversal.post_order(self, _stamp_children, stale):
+                if stale(node):
+                    _update_stamp(node, latest)
+        return self._stamp_memo[1]
+
+    @_reads_values
     def _value_impl(self):
-        # shapes with 0's dropped in presolve.
-        if 0 in self.shape:
-            result = np.array([])
-        else:
-            arg_values = []
-            for arg in self.args:
-                # A argument without a value makes all higher level
-                # values None.
-                # But if the atom is constant with non-constant
-                # arguments it doesn't depend on its arguments,
-                # so it isn't None.
-                arg_val = arg._value_impl()
-                if arg_val is None and not self.is_constant():
-                    return None
-                else:
-                    arg_values.append(arg_val)
-            result = self.numeric(arg_values)
-        return result
+        latest = perf.latest_value_version()
+
+        def evaluated(node) -> bool:
+            # Atoms that implement _value_impl themselves are evaluated
+            # as a whole. Atoms with stale stamps are traversed, and their
+            # stamps are updated with their values, so that a value that
+            # was not memoized takes a single pass over the tree.
+            if type(node)._value_impl is not Atom._value_impl:
+                return True
+            stamp_version, stamp = node._stamp_memo
+            return stamp_version == latest and stamp is not None and \
+                node._value_memo[0] == stamp
+
+        def children(node) -> list:
+            return [] if evaluated(node) else node.args
+
+        def evaluate(node, values):
+            if type(node)._value_impl is not Atom._value_impl:
+                return node._value_impl()
+            if type(node)._value_stamp is not Atom._value_stamp:
+                stamp = node._value_stamp()
+            else:
+                if node._stamp_memo[0] != latest:
+                    # The stamps of the args were updated before.
+                    _update_stamp(node, latest)
+                stamp = node._stamp_memo[1]
+            if stamp is not None and node._value_memo[0] == stamp:
+                return _copy_value(node._value_memo[1])
+            # The args were traversed, and evaluated, before node.
+            arg_values = [values[id(arg)] for arg in node.args]
+            # shapes with 0's dropped in presolve.
+            if 0 in node.shape:
+                result = np.array([])
+            # A argument without a value makes all higher level
+            # values None.
+            # But if the atom is constant with non-constant
+            # arguments it doesn't depend on its arguments,
+            # so it isn't None.
+            elif any(val is None for val in arg_values) and not node.is_constant():
+                result = None
+            else:
+                result = node.numeric(arg_values)
+            if stamp is not None:
+                # The memo is not handed out, so that modifying the value
+                # that is returned does not modify the memo.
+                node._value_memo = (stamp, result)
+                result = _copy_value(result)
+            return result
+
+        # The values are computed bottom-up, so that deep trees do not hit
+        # the recursion limit.
+        values = {}
+        for node in traversal.post_order(self, children):
+            values[id(node)] = evaluate(node, values)
+        return values[id(self)]
 
     @property
+    @_reads_values
     def grad(self):
         """Gives the (sub/super)gradient of the expression w.r.t. each variable.
 
@@ -393,6 +537,11 @@ class Atom(Expression):
         if self.is_constant():
             return u.grad.constant_grad(self)
 
+        stamp = self._value_stamp()
+        memo_stamp, result = self._grad_memo
+        if stamp is not None and memo_stamp == stamp:
+            return {key: _copy_value(D) for key, D in result.items()}
+
         # Returns None if variable values not supplied.
         arg_values = []
         for arg in self.args:
@@ -424,6 +573,9 @@ class Atom(Expression):
                     else:
                         result[key] = D
 
+        if stamp is not None:
+            self._grad_memo = (stamp, {key: _copy_value(D)
+                                       for key, D in result.items()})
         return result
 
     @abc.abstractmethod
@@ -472,6 +624,10 @@ class Atom(Expression):
         """A list of the atom types present amongst this atom's arguments.
         """
         atom_list = []
-        for arg in self.args:
-            atom_list += arg.atoms()
-        return unique_list(atom_list + [type(self)])
\ No newline at end of file
+        for node in traversal.post_order(
+                self, expand=lambda node: isinstance(node, Atom)):
+            if isinstance(node, Atom):
+                atom_list.append(type(node))
+            else:
+                atom_list += node.atoms()
+        return unique_list(atom_list)
\ No newline at end of file
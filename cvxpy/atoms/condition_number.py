@@ -38,6 +38,11 @@ class condition_number(Atom):
         min_eigen = -LA.eigvalsh(-values[0], eigvals=(lo, hi))[0]
         return max_eigen / min_eigen
 
+    def torch_numeric(self, values):
+        import torch
+        eigs = torch.linalg.eigvalsh(values[0])
+        return eigs[-1] / eigs[0]
+
     def _domain(self) -> List[Constraint]:
         """Returns constraints describing the domain of the node.
         """
@@ -114,6 +114,10 @@ class floor(Elementwise):
     def numeric(self, values):
         return np.floor(values[0])
 
+    def torch_numeric(self, values):
+        import torch
+        return torch.floor(values[0])
+
     def sign_from_args(self) -> Tuple[bool, bool]:
         """Returns sign (is positive, is negative) of the expression.
         """
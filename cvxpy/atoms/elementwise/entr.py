@@ -42,6 +42,10 @@ class entr(Elementwise):
             results[np.isnan(results)] = -np.inf
         return results
 
+    def torch_numeric(self, values):
+        import torch
+        return torch.special.entr(values[0])
+
     def sign_from_args(self) -> Tuple[bool, bool]:
         """Returns sign (is positive, is negative) of the expression.
         """
@@ -55,6 +55,12 @@ class huber(Elementwise):
         """
         return 2*scipy.special.huber(self.M.value, values[0])
 
+    def torch_numeric(self, values):
+        import torch
+        M = float(self.M.value)
+        x = torch.abs(values[0])
+        return torch.where(x <= M, x**2, 2*M*x - M**2)
+
     def sign_from_args(self) -> Tuple[bool, bool]:
         """Returns sign (is positive, is negative) of the expression.
         """
@@ -35,6 +35,10 @@ class log1p(log):
         """
         return scipy.special.log1p(values[0])
 
+    def torch_numeric(self, values):
+        import torch
+        return torch.log1p(values[0])
+
     def sign_from_args(self) -> Tuple[bool, bool]:
         """The same sign as the argument.
         """
@@ -40,6 +40,12 @@ class rel_entr(Elementwise):
         y = values[1]
         return rel_entr_scipy(x, y)
 
+    def torch_numeric(self, values):
+        import torch
+        x, y = torch.broadcast_tensors(values[0], values[1])
+        result = torch.where((x > 0) & (y > 0), x*torch.log(x/y), torch.inf)
+        return torch.where((x == 0) & (y >= 0), 0.0, result)
+
     def sign_from_args(self) -> Tuple[bool, bool]:
         """Returns sign (is positive, is negative) of the expression.
         """
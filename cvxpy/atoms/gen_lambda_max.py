@@ -39,6 +39,14 @@ class gen_lambda_max(Atom):
                        eigvals_only=True,
                        eigvals=(lo, hi))[0]
 
+    def torch_numeric(self, values):
+        import torch
+        # Reduce to a standard eigenvalue problem with the Cholesky factor of B.
+        L = torch.linalg.cholesky(values[1])
+        C = torch.linalg.solve_triangular(L, values[0], upper=False)
+        C = torch.linalg.solve_triangular(L, C.T, upper=False)
+        return torch.linalg.eigvalsh(C)[-1]
+
     def _domain(self) -> List[Constraint]:
         """Returns constraints describing the domain of the node.
         """
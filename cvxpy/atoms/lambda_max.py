@@ -38,6 +38,10 @@ class lambda_max(Atom):
         lo = hi = self.args[0].shape[0]-1
         return LA.eigvalsh(values[0], eigvals=(lo, hi))[0]
 
+    def torch_numeric(self, values):
+        import torch
+        return torch.linalg.eigvalsh(values[0])[-1]
+
     def _domain(self) -> List[Constraint]:
         """Returns constraints describing the domain of the node.
         """
@@ -47,6 +47,11 @@ class lambda_sum_largest(lambda_max):
         eigs = LA.eigvalsh(values[0])
         return sum_largest(eigs, self.k).value
 
+    def torch_numeric(self, values):
+        import torch
+        eigs = torch.linalg.eigvalsh(values[0])
+        return torch.sum(eigs[eigs.shape[0] - int(self.k):])
+
     def get_data(self):
         """Returns the parameter k.
         """
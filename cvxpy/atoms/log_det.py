@@ -51,10 +51,8 @@ class log_det(Atom):
         import torch
         symm = (values[0] + torch.conj(values[0].T))/2
         sign, logdet = torch.linalg.slogdet(symm)
-        if np.isclose(np.real(sign), 1): #This has to be np
-            return logdet
-        else:
-            return -torch.inf
+        is_pos = torch.isclose(torch.real(sign), torch.ones_like(logdet))
+        return torch.where(is_pos, logdet, -torch.inf)
 
     # Any argument shape is valid.
     def validate_arguments(self) -> None:
@@ -51,6 +51,7 @@ class perspective(Atom):
     def __init__(self, f: Expression, s: Variable, f_recession: Expression = None) -> None:
         self.f = f
         self.f_recession = f_recession
+        self._torch_exps = {}
         super(perspective, self).__init__(s, *f.variables())
 
     def validate_arguments(self) -> None:
@@ -94,6 +95,26 @@ class perspective(Atom):
 
         return ret_val
 
+    def torch_numeric(self, values):
+        import torch
+        s_val = values[0]
+        value = s_val*self._torch_value(self.f, [x/s_val for x in values[1:]])
+        if self.f_recession is None:
+            return value
+        # Use the recession function where s = 0.
+        recession = self._torch_value(self.f_recession, values[1:])
+        return torch.where(torch.isclose(s_val, torch.zeros_like(s_val)), recession, value)
+
+    def _torch_value(self, f, values):
+        """Evaluates f in torch at the given values of its variables.
+        """
+        import torch
+        if id(f) not in self._torch_exps:
+            self._torch_exps[id(f)] = f.gen_torch_exp(provided_vars_list=f.variables())
+        torch_exp, vars_dict = self._torch_exps[id(f)]
+        params = list(vars_dict.vars_dict)[len(values):]
+        return torch_exp(*values, *[torch.as_tensor(param.value) for param in params])
+
     def sign_from_args(self) -> tuple[bool, bool]:
         f_pos = self.f.is_nonneg()
         f_neg = self.f.is_nonpos()
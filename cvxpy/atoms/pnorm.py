@@ -161,13 +161,13 @@ class Pnorm(AxisAtom):
         if self.axis is None:
             values = values.flatten()
 
-        if self.p < 1 and torch.any(values<0).item():
-            return -np.inf
-        if self.p < 0 and torch.any(values==0).item():
-            return 0.0
-
-        return torch.linalg.norm(values, float(self.p), axis=self.axis,
-                              keepdims=self.keepdims)
+        norm = torch.linalg.norm(values, float(self.p), axis=self.axis,
+                                 keepdims=self.keepdims)
+        if self.p < 0:
+            norm = torch.where(torch.any(values==0), 0.0, norm)
+        if self.p < 1:
+            norm = torch.where(torch.any(values<0), -np.inf, norm)
+        return norm
 
     def validate_arguments(self) -> None:
         super(Pnorm, self).validate_arguments()
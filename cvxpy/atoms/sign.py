@@ -36,9 +36,7 @@ class sign(Atom):
     def torch_numeric(self, values):
         import torch
         x = values[0]
-        x = torch.sign(x)
-        x[x==0] = -1.0
-        return x
+        return torch.where(x == 0, -1.0, torch.sign(x))
 
     def shape_from_args(self) -> Tuple[int, ...]:
         """Returns the (row, col) shape of the expression.
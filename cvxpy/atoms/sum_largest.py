@@ -45,6 +45,10 @@ class sum_largest(Atom):
         indices = np.argsort(-value)[:int(self.k)]
         return value[indices].sum()
 
+    def torch_numeric(self, values):
+        import torch
+        return torch.sum(torch.topk(values[0].flatten(), int(self.k)).values)
+
     def _grad(self, values):
         """Gives the (sub/super)gradient of the atom w.r.t. each argument.
 
@@ -105,6 +105,10 @@ class SuppFuncAtom(Atom):
     def is_quasiconcave(self) -> bool:
         return False
 
+    def _value_stamp(self):
+        # The value depends on the constraints of the parent, not only on y.
+        return None
+
     def _value_impl(self):
         from cvxpy.problems.objective import Maximize
         from cvxpy.problems.problem import Problem
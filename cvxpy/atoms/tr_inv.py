@@ -52,14 +52,12 @@ class tr_inv(Atom):
     def torch_numeric(self, values):
         import torch
         # if values[0] isn't Hermitian then return np.inf
-        if torch.any(torch.linalg.norm(values[0] - values[0].T.conj()) >= 1e-8).item():
-            return torch.inf
+        is_hermitian = torch.linalg.norm(values[0] - values[0].T.conj()) < 1e-8
         # take symmetric part of the input to enhance numerical stability
         symm = (values[0] + values[0].T)/2
-        eigVal = LA.eigvalsh(symm)
-        if min(eigVal) <= 0:
-            return torch.inf
-        return torch.sum(eigVal**-1)
+        eigVal = torch.linalg.eigvalsh(symm)
+        is_pd = torch.min(eigVal) > 0
+        return torch.where(is_hermitian & is_pd, torch.sum(eigVal**-1), torch.inf)
 
     # The shape of argument must be square.
     def validate_arguments(self) -> None:
@@ -62,6 +62,10 @@ class von_neumann_entr(Atom):
         val = np.sum(entr(w))
         return val
 
+    def torch_numeric(self, values):
+        import torch
+        return torch.sum(torch.special.entr(torch.linalg.eigvalsh(values[0])))
+
     def validate_arguments(self) -> None:
         """Verify that the argument A is PSD.
         """
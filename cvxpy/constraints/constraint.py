@@ -251,11 +251,13 @@ class Constraint(u.Canonical):
         """
         self.dual_variables[0].save_value(value)
 
-    def gen_torch_exp(self):
+    def gen_torch_exp(self, batched: bool = False, strict: bool = False):
         """ This function generates a torch expression (args[0]-args[1]). 
             The order of the arguments is as it appears in args[0]-args[1] (from left to right)
+            If batched is True, the torch expression accepts a leading batch axis.
+            If strict is True, atoms without torch_numeric raise instead of using NumPy.
         """
 
         exp = self.args[0]-self.args[1]
-        torch_exp, vars_dict = exp.gen_torch_exp()
+        torch_exp, vars_dict = exp.gen_torch_exp(batched=batched, strict=strict)
         return torch_exp, vars_dict
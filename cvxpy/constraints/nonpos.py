@@ -95,9 +95,9 @@ class NonPos(Constraint):
         viol = np.linalg.norm(res, ord=2)
         return viol
 
-    def gen_torch_exp(self):
+    def gen_torch_exp(self, batched: bool = False, strict: bool = False):
         exp = self.args[0]<=0
-        return exp.gen_torch_exp()
+        return exp.gen_torch_exp(batched=batched, strict=strict)
         # return super().gen_torch_exp()
 
 
@@ -159,9 +159,9 @@ class NonNeg(Constraint):
         viol = np.linalg.norm(res, ord=2)
         return viol
 
-    def gen_torch_exp(self):
+    def gen_torch_exp(self, batched: bool = False, strict: bool = False):
         exp = self.args[0]>=0
-        return exp.gen_torch_exp()
+        return exp.gen_torch_exp(batched=batched, strict=strict)
         # return super().gen_torch_exp()
 
 
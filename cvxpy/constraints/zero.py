@@ -95,9 +95,9 @@ class Zero(Constraint):
         """
         self.dual_variables[0].save_value(value)
 
-    def gen_torch_exp(self):
+    def gen_torch_exp(self, batched: bool = False, strict: bool = False):
         exp = self.args[0]==0
-        return exp.gen_torch_exp()
+        return exp.gen_torch_exp(batched=batched, strict=strict)
         # return super().gen_torch_exp()
 
 
@@ -23,6 +23,7 @@ import scipy.sparse as sp
 import cvxpy.settings as s
 from cvxpy.lin_ops import lin_op as lo
 from cvxpy.lin_ops.canon_backend import CanonBackend
+from cvxpy.utilities import profiling
 
 
 def get_parameter_vector(param_size,
@@ -62,6 +63,52 @@ def get_parameter_vector(param_size,
     return param_vec
 
 
+def get_parameter_matrix(param_size,
+                         param_id_to_col,
+                         param_id_to_size,
+                         param_id_to_values_fn,
+                         batch_size: int,
+                         zero_offset: bool = False):
+    """Returns a dense matrix whose columns are flattened parameter vectors
+
+    This is the batched analogue of get_parameter_vector: column j of the
+    returned matrix is the parameter vector (including the constant offset)
+    of the j-th parameter assignment.
+
+    Parameters
+    ----------
+        param_size: The number of parameters
+        param_id_to_col: A dict from parameter id to column offset
+        param_id_to_size: A dict from parameter id to parameter size
+        param_id_to_values_fn: A callable that returns, for a parameter id, an
+            array of values whose leading axis has length batch_size
+        batch_size: The number of parameter assignments
+        zero_offset: (optional) if True, zero out the constant offset in the
+                     parameter vectors
+
+    Returns
+    -------
+        A NumPy array of shape (param_size + 1, batch_size), or None if
+        param_size is 0
+    """
+    if param_size == 0:
+        return None
+    param_mat = np.zeros((param_size + 1, batch_size))
+    for param_id, col in param_id_to_col.items():
+        if param_id == lo.CONSTANT_ID:
+            if not zero_offset:
+                param_mat[col, :] = 1
+        else:
+            size = param_id_to_size[param_id]
+            values = np.asarray(param_id_to_values_fn(param_id))
+            # Flatten each instance in Fortran order by reversing its axes;
+            # the batch axis becomes the column axis of the parameter matrix.
+            axes = (0,) + tuple(range(values.ndim - 1, 0, -1))
+            values = np.transpose(values, axes).reshape((batch_size, size))
+            param_mat[col:col + size, :] = values.T
+    return param_mat
+
+
 def reduce_problem_data_tensor(A, var_length, quad_form: bool = False):
     """Reduce a problem data tensor, for efficient construction of the problem data
 
@@ -108,8 +155,10 @@ def reduce_problem_data_tensor(A, var_length, quad_form: bool = False):
         indptr: CSC indptr for the problem data matrix
         shape: the shape of the problem data matrix
     """
-    # construct a reduced COO matrix
-    A.eliminate_zeros()
+    # construct a reduced COO matrix; the check avoids writing to tensors
+    # that are read-only, e.g., memory-mapped from the compilation cache
+    if not A.data.all():
+        A.eliminate_zeros()
     A_coo = A.tocoo()
 
     unique_old_row, reduced_row = np.unique(A_coo.row, return_inverse=True)
@@ -189,11 +238,17 @@ def get_matrix_from_tensor(problem_data_tensor, param_vec,
     This function applies problem_data_tensor to param_vec to obtain
     a matrix representation of the corresponding affine map.
 
+    If param_vec is a two-dimensional array whose columns are parameter
+    vectors (see get_parameter_matrix), the tensor is applied to all
+    columns with a single product and a list with one (A, b) tuple per
+    column is returned.
+
     Parameters
     ----------
         problem_data_tensor: tensor returned from get_problem_matrix,
             representing a parameterized affine map
-        param_vec: flattened parameter vector
+        param_vec: flattened parameter vector, or a matrix of stacked
+            parameter vectors
         var_length: the number of variables
         nonzero_rows: (optional) rows in the part of problem_data_tensor
             corresponding to A that have nonzeros in them (i.e., rows that
@@ -209,6 +264,16 @@ def get_matrix_from_tensor(problem_data_tensor, param_vec,
         and b is a flattened NumPy array representing the constant offset.
         If with_offset=False, returned b is None.
     """
+    if param_vec is not None and np.ndim(param_vec) == 2:
+        # A single sparse-dense product for the whole batch.
+        flat_problem_data = np.asarray(problem_data_tensor @ param_vec)
+        return [
+            _assemble_problem_data(flat_problem_data[:, j], var_length,
+                                   nonzero_rows, with_offset,
+                                   problem_data_index)
+            for j in range(flat_problem_data.shape[1])
+        ]
+
     if param_vec is None:
         flat_problem_data = problem_data_tensor
         if problem_data_index is not None:
@@ -218,8 +283,20 @@ def get_matrix_from_tensor(problem_data_tensor, param_vec,
     else:
         param_vec = sp.csc_matrix(param_vec[:, None])
         flat_problem_data = problem_data_tensor @ param_vec
+    return _assemble_problem_data(flat_problem_data, var_length,
+                                  nonzero_rows, with_offset,
+                                  problem_data_index)
 
 
+def _assemble_problem_data(flat_problem_data, var_length, nonzero_rows,
+                           with_offset, problem_data_index):
+    """Forms (A, b) from the flattened problem data.
+
+    flat_problem_data is either the values array described by
+    problem_data_index, or (when problem_data_index is None) the full
+    column-major flattening of the problem data matrix, which may be a
+    sparse column vector or a dense 1D array.
+    """
     if problem_data_index is not None:
         indices, indptr, shape = problem_data_index
         M = sp.csc_matrix(
@@ -228,7 +305,11 @@ def get_matrix_from_tensor(problem_data_tensor, param_vec,
         n_cols = var_length
         if with_offset:
             n_cols += 1
-        M = flat_problem_data.reshape((-1, n_cols), order='F').tocsc()
+        if sp.issparse(flat_problem_data):
+            M = flat_problem_data.reshape((-1, n_cols), order='F').tocsc()
+        else:
+            M = sp.csc_matrix(
+                flat_problem_data.reshape((-1, n_cols), order='F'))
 
     if with_offset:
         A = M[:, :-1].tocsc()
@@ -277,7 +358,7 @@ def get_problem_matrix(linOps,
         param_to_col: A map from parameter id to column in tensor.
         constr_length: Summed sizes of constraints input.
         canon_backend :
-            'CPP' (default) | 'SCIPY'
+            'CPP' (default) | 'SCIPY' | 'COO'
             Specifies which backend to use for canonicalization, which can affect
             compilation time. Defaults to None, i.e., selecting the default backend.
 
@@ -294,10 +375,12 @@ def get_problem_matrix(linOps,
 
     if canon_backend == s.CPP_CANON_BACKEND:
         from cvxpy.cvxcore.python.cppbackend import build_matrix
-        return build_matrix(id_to_col, param_to_size, param_to_col, var_length, constr_length, linOps)
+        with profiling.span('build_matrix[%s]' % canon_backend):
+            return build_matrix(id_to_col, param_to_size, param_to_col, var_length,
+                                constr_length, linOps)
 
     elif canon_backend in {s.SCIPY_CANON_BACKEND, s.RUST_CANON_BACKEND,
-                           s.NUMPY_CANON_BACKEND}:
+                           s.NUMPY_CANON_BACKEND, s.COO_CANON_BACKEND}:
         param_size_plus_one = sum(param_to_size.values())
         output_shape = (np.int64(constr_length)*np.int64(var_length+1),
                    param_size_plus_one)
@@ -305,7 +388,8 @@ def get_problem_matrix(linOps,
             backend = CanonBackend.get_backend(canon_backend, id_to_col,
                                                           param_to_size, param_to_col,
                                                           param_size_plus_one, var_length)
-            A_py = backend.build_matrix(linOps)
+            with profiling.span('build_matrix[%s]' % canon_backend):
+                A_py = backend.build_matrix(linOps)
         else:
             A_py = sp.csc_matrix(((), ((), ())), output_shape)
         assert A_py.shape == output_shape
@@ -39,8 +39,6 @@ def build_matrix(
     constr_length: int,
     linOps: List[lo.LinOp],
 ) -> sp.csc_matrix:
-    lin_vec = cvxcore.ConstLinOpVector()
-
     id_to_col_C = cvxcore.IntIntMap()
     for id, col in id_to_col.items():
         id_to_col_C[int(id)] = int(col)
@@ -49,16 +47,12 @@ def build_matrix(
     for id, size in param_to_size.items():
         param_to_size_C[int(id)] = int(size)
 
-    # dict to memoize construction of C++ linOps, and to keep Python references
-    # to them to prevent their deletion
-    linPy_to_linC = {}
-    for lin in linOps:
-        build_lin_op_tree(lin, linPy_to_linC)
-        tree = linPy_to_linC[lin]
-        lin_vec.push_back(tree)
+    # Build all the C++ LinOps in a single call.
+    forest = cvxcore.LinOpForest()
+    forest.load(*serialize_lin_op_forest(linOps))
 
     problemData = cvxcore.build_matrix(
-        lin_vec, int(var_length), id_to_col_C, param_to_size_C, s.get_num_threads()
+        forest, int(var_length), id_to_col_C, param_to_size_C, s.get_num_threads()
     )
 
     # Populate tensors with info from problemData.
@@ -145,103 +139,76 @@ def get_type(linPy):
         raise NotImplementedError(f"Type {ty} is not supported.")
 
 
-def set_linC_data(linC, linPy) -> None:
-    """Sets numerical data fields in linC."""
-    assert linPy.data is not None
-    if isinstance(linPy.data, tuple) and isinstance(linPy.data[0], slice):
-        set_slice_data(linC, linPy)
-    elif isinstance(linPy.data, float) or isinstance(linPy.data, numbers.Integral):
-        linC.set_dense_data(format_matrix(linPy.data, format="scalar"))
-        linC.set_data_ndim(0)
-    else:
-        set_matrix_data(linC, linPy)
-
-
-def make_linC_from_linPy(linPy, linPy_to_linC) -> None:
-    """Construct a C++ LinOp corresponding to LinPy.
-
-    Children of linPy are retrieved from linPy_to_linC.
-    """
-
-    if linPy in linPy_to_linC:
-        return
-    typ = get_type(linPy)
-    shape = cvxcore.IntVector()
-    lin_args_vec = cvxcore.ConstLinOpVector()
-    for dim in linPy.shape:
-        shape.push_back(int(dim))
-    for argPy in linPy.args:
-        lin_args_vec.push_back(linPy_to_linC[argPy])
-    linC = cvxcore.LinOp(typ, shape, lin_args_vec)
-    linPy_to_linC[linPy] = linC
-
-    if linPy.data is not None:
-        if isinstance(linPy.data, lo.LinOp):
-            linC_data = linPy_to_linC[linPy.data]
-            linC.set_linOp_data(linC_data)
-            linC.set_data_ndim(len(linPy.data.shape))
-        else:
-            set_linC_data(linC, linPy)
+def serialize_lin_op_forest(linOps: List[lo.LinOp]):
+    """Serializes LinOp trees into the arrays read by LinOpForest.load.
 
+    The nodes are listed so that every node comes after its arguments and
+    its LinOp data; nodes shared between trees are listed once. See
+    LinOpForest.hpp for the layout of the arrays.
 
-def set_slice_data(linC, linPy) -> None:
+    Returns
+    -------
+    tuple
+        The int32 meta and index arrays and the float64 values array.
     """
-    Loads the slice data, start, stop, and step into our C++ linOp.
-    The semantics of the slice operator is treated exactly the same as in
-    Python.  Note that the 'None' cases had to be handled at the wrapper level,
-    since we must load integers into our vector.
-    """
-
-    for sl in linPy.data:
-        slice_vec = cvxcore.IntVector()
-        for var in [sl.start, sl.stop, sl.step]:
-            slice_vec.push_back(int(var))
-        linC.push_back_slice_vec(slice_vec)
-
-
-def build_lin_op_tree(root_linPy, linPy_to_linC) -> None:
-    """Construct C++ LinOp tree from Python LinOp tree.
-
-    Constructed C++ linOps are stored in the linPy_to_linC dict,
-    which maps Python linOps to their corresponding C++ linOps.
-
-    Parameters
-    ----------
-        linPy_to_linC: a dict for memoizing construction and storing
-            the C++ LinOps
-    """
-    bfs_stack = [root_linPy]
-    post_order_stack = []
-    while bfs_stack:
-        linPy = bfs_stack.pop()
-        if linPy not in linPy_to_linC:
-            post_order_stack.append(linPy)
-            for arg in linPy.args:
-                bfs_stack.append(arg)
-            if isinstance(linPy.data, lo.LinOp):
-                bfs_stack.append(linPy.data)
-    while post_order_stack:
-        linPy = post_order_stack.pop()
-        make_linC_from_linPy(linPy, linPy_to_linC)
-
-
-def set_matrix_data(linC, linPy) -> None:
-    """Calls the appropriate cvxcore function to set the matrix data field of
-    our C++ linOp.
-    """
-
-    if get_type(linPy) == cvxcore.SPARSE_CONST:
-        coo = format_matrix(linPy.data, format="sparse")
-        linC.set_sparse_data(
-            coo.data,
-            coo.row.astype(float),
-            coo.col.astype(float),
-            coo.shape[0],
-            coo.shape[1],
-        )
+    node_idx = {}
+    meta = [0]
+    idx = []
+    values = []
+    for root in linOps:
+        stack = [(root, False)]
+        while stack:
+            linPy, expanded = stack.pop()
+            if linPy in node_idx:
+                continue
+            if not expanded:
+                stack.append((linPy, True))
+                if isinstance(linPy.data, lo.LinOp):
+                    stack.append((linPy.data, False))
+                stack.extend((arg, False) for arg in reversed(linPy.args))
+                continue
+            node_idx[linPy] = len(node_idx)
+            meta.append(get_type(linPy))
+            meta.append(len(linPy.shape))
+            meta.extend(int(dim) for dim in linPy.shape)
+            meta.append(len(linPy.args))
+            meta.extend(node_idx[arg] for arg in linPy.args)
+            _serialize_data(linPy, node_idx, meta, idx, values)
+    meta[0] = len(node_idx)
+    meta.append(len(linOps))
+    meta.extend(node_idx[root] for root in linOps)
+    idx = np.concatenate(idx) if idx else np.zeros(0)
+    values = np.concatenate(values) if values else np.zeros(0)
+    return (np.array(meta, dtype=np.int32),
+            idx.astype(np.int32, copy=False),
+            values.astype(np.float64, copy=False))
+
+
+def _serialize_data(linPy, node_idx, meta, idx, values) -> None:
+    """Appends the data kind and payload of linPy to the serialization."""
+    data = linPy.data
+    if data is None:
+        meta.append(cvxcore.NO_DATA)
+    elif isinstance(data, lo.LinOp):
+        meta.extend([cvxcore.LINOP_DATA, node_idx[data], len(data.shape)])
+    elif isinstance(data, tuple) and isinstance(data[0], slice):
+        # The 'None' cases of the slices are handled at the wrapper level.
+        meta.extend([cvxcore.SLICE_DATA, len(data)])
+        for sl in data:
+            meta.extend([int(sl.start), int(sl.stop), int(sl.step)])
+    elif isinstance(data, float) or isinstance(data, numbers.Integral):
+        meta.extend([cvxcore.DENSE_DATA, 1, 1, 0])
+        values.append(np.array([data], dtype=np.float64))
+    elif get_type(linPy) == cvxcore.SPARSE_CONST:
+        coo = format_matrix(data, format="sparse")
+        meta.extend([cvxcore.SPARSE_DATA, coo.shape[0], coo.shape[1], coo.nnz])
+        idx.extend([coo.row, coo.col])
+        values.append(coo.data)
     else:
-        linC.set_dense_data(format_matrix(linPy.data, shape=linPy.shape))
-        linC.set_data_ndim(len(linPy.data.shape))
+        matrix = format_matrix(data, shape=linPy.shape)
+        meta.extend([cvxcore.DENSE_DATA, matrix.shape[0], matrix.shape[1],
+                     len(data.shape)])
+        values.append(np.ravel(matrix, order="F"))
 
 
 def format_matrix(matrix, shape=None, format="dense"):
@@ -39,6 +39,12 @@
 %include "LinOp.hpp"
 %include "Utils.hpp"
 
+/* Typemap for the load C++ routine in LinOpForest.hpp */
+%apply (int* IN_ARRAY1, int DIM1) {(int *meta, int meta_len),
+	(int *idx, int idx_len)};
+%apply (double* IN_ARRAY1, int DIM1) {(double *values, int values_len)};
+%include "LinOpForest.hpp"
+
 /* Typemap for the getV, getI, getJ, and getConstVec C++ routines in
 	 problemData.hpp */
 %apply (double* ARGOUT_ARRAY1, int DIM1) {(double* values, int num_values)}
@@ -55,6 +61,14 @@ namespace std {
    %template(ConstLinOpVector) vector< const LinOp * >;
 }
 
+/* Release the GIL while building the problem data, which does not touch
+   Python objects, so that other Python threads can run meanwhile. */
+%exception build_matrix {
+	Py_BEGIN_ALLOW_THREADS
+	$action
+	Py_END_ALLOW_THREADS
+}
+
 /* Wrapper for entry point into CVXCanon Library */
 ProblemData build_matrix(std::vector< const LinOp* > constraints,
                          int var_length,
@@ -66,3 +80,11 @@ ProblemData build_matrix(std::vector< const LinOp* > constraints,
                          std::map<int, int> id_to_col,
                          std::map<int, int> param_to_size,
                          std::vector<int> constr_offsets);
+ProblemData build_matrix(const LinOpForest &forest,
+                         int var_length,
+                         std::map<int, int> id_to_col,
+                         std::map<int, int> param_to_size,
+                         int num_threads);
+
+/* Whether cvxcore was built with OpenMP */
+bool openmp_enabled();
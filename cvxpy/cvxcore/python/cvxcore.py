@@ -218,6 +218,33 @@ def acc_tensor(lh_ten, rh_ten):
 
 def diagonalize(mat):
     return _cvxcore.diagonalize(mat)
+NO_DATA = _cvxcore.NO_DATA
+LINOP_DATA = _cvxcore.LINOP_DATA
+DENSE_DATA = _cvxcore.DENSE_DATA
+SPARSE_DATA = _cvxcore.SPARSE_DATA
+SLICE_DATA = _cvxcore.SLICE_DATA
+class LinOpForest(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self):
+        _cvxcore.LinOpForest_swiginit(self, _cvxcore.new_LinOpForest())
+    __swig_destroy__ = _cvxcore.delete_LinOpForest
+
+    def load(self, meta, idx, values):
+        return _cvxcore.LinOpForest_load(self, meta, idx, values)
+
+    def num_nodes(self):
+        return _cvxcore.LinOpForest_num_nodes(self)
+
+    def get_roots(self):
+        return _cvxcore.LinOpForest_get_roots(self)
+
+# Register LinOpForest in _cvxcore:
+_cvxcore.LinOpForest_swigregister(LinOpForest)
+cvar = _cvxcore.cvar
+CONSTANT_ID = cvar.CONSTANT_ID
+
 class ProblemData(object):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
@@ -230,6 +257,9 @@ class ProblemData(object):
     def init_id(self, new_param_id, param_size):
         return _cvxcore.ProblemData_init_id(self, new_param_id, param_size)
 
+    def reserve_id(self, param_id, param_size):
+        return _cvxcore.ProblemData_reserve_id(self, param_id, param_size)
+
     def getLen(self):
         return _cvxcore.ProblemData_getLen(self)
 
@@ -248,9 +278,6 @@ class ProblemData(object):
 
 # Register ProblemData in _cvxcore:
 _cvxcore.ProblemData_swigregister(ProblemData)
-cvar = _cvxcore.cvar
-CONSTANT_ID = cvar.CONSTANT_ID
-
 class IntVector(object):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
@@ -992,3 +1019,6 @@ _cvxcore.ConstLinOpVector_swigregister(ConstLinOpVector)
 def build_matrix(*args):
     return _cvxcore.build_matrix(*args)
 
+def openmp_enabled():
+    return _cvxcore.openmp_enabled()
+
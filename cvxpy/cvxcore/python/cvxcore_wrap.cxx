@@ -2986,41 +2986,42 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 #define SWIGTYPE_p_Eigen__SparseMatrixT_double_t swig_types[2]
 #define SWIGTYPE_p_Eigen__TripletT_double_t swig_types[3]
 #define SWIGTYPE_p_LinOp swig_types[4]
-#define SWIGTYPE_p_ProblemData swig_types[5]
-#define SWIGTYPE_p_allocator_type swig_types[6]
-#define SWIGTYPE_p_char swig_types[7]
-#define SWIGTYPE_p_difference_type swig_types[8]
-#define SWIGTYPE_p_double swig_types[9]
-#define SWIGTYPE_p_key_type swig_types[10]
-#define SWIGTYPE_p_mapped_type swig_types[11]
-#define SWIGTYPE_p_operatortype swig_types[12]
-#define SWIGTYPE_p_p_PyObject swig_types[13]
-#define SWIGTYPE_p_size_type swig_types[14]
-#define SWIGTYPE_p_std__allocatorT_LinOp_const_p_t swig_types[15]
-#define SWIGTYPE_p_std__allocatorT_LinOp_p_t swig_types[16]
-#define SWIGTYPE_p_std__allocatorT_double_t swig_types[17]
-#define SWIGTYPE_p_std__allocatorT_int_t swig_types[18]
-#define SWIGTYPE_p_std__allocatorT_std__pairT_int_const_int_t_t swig_types[19]
-#define SWIGTYPE_p_std__allocatorT_std__vectorT_double_std__allocatorT_double_t_t_t swig_types[20]
-#define SWIGTYPE_p_std__allocatorT_std__vectorT_int_std__allocatorT_int_t_t_t swig_types[21]
-#define SWIGTYPE_p_std__invalid_argument swig_types[22]
-#define SWIGTYPE_p_std__lessT_int_t swig_types[23]
-#define SWIGTYPE_p_std__mapT_int_Eigen__SparseMatrixT_double_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_Eigen__SparseMatrixT_double_t_t_t_t swig_types[24]
-#define SWIGTYPE_p_std__mapT_int_int_std__lessT_int_t_std__allocatorT_std__pairT_int_const_int_t_t_t swig_types[25]
-#define SWIGTYPE_p_std__mapT_int_std__mapT_int_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__mapT_int_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_t_t_t_t_t_t swig_types[26]
-#define SWIGTYPE_p_std__mapT_int_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_t_t_t swig_types[27]
-#define SWIGTYPE_p_std__mapT_int_std__vectorT_std__vectorT_double_std__allocatorT_double_t_t_std__allocatorT_std__vectorT_double_std__allocatorT_double_t_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_std__vectorT_double_std__allocatorT_double_t_t_std__allocatorT_std__vectorT_double_std__allocatorT_double_t_t_t_t_t_t_t swig_types[28]
-#define SWIGTYPE_p_std__mapT_int_std__vectorT_std__vectorT_int_std__allocatorT_int_t_t_std__allocatorT_std__vectorT_int_std__allocatorT_int_t_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_std__vectorT_int_std__allocatorT_int_t_t_std__allocatorT_std__vectorT_int_std__allocatorT_int_t_t_t_t_t_t_t swig_types[29]
-#define SWIGTYPE_p_std__vectorT_LinOp_const_p_std__allocatorT_LinOp_const_p_t_t swig_types[30]
-#define SWIGTYPE_p_std__vectorT_LinOp_p_std__allocatorT_LinOp_p_t_t swig_types[31]
-#define SWIGTYPE_p_std__vectorT_double_std__allocatorT_double_t_t swig_types[32]
-#define SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t swig_types[33]
-#define SWIGTYPE_p_std__vectorT_std__vectorT_double_std__allocatorT_double_t_t_std__allocatorT_std__vectorT_double_std__allocatorT_double_t_t_t_t swig_types[34]
-#define SWIGTYPE_p_std__vectorT_std__vectorT_int_std__allocatorT_int_t_t_std__allocatorT_std__vectorT_int_std__allocatorT_int_t_t_t_t swig_types[35]
-#define SWIGTYPE_p_swig__SwigPyIterator swig_types[36]
-#define SWIGTYPE_p_value_type swig_types[37]
-static swig_type_info *swig_types[39];
-static swig_module_info swig_module = {swig_types, 38, 0, 0, 0, 0};
+#define SWIGTYPE_p_LinOpForest swig_types[5]
+#define SWIGTYPE_p_ProblemData swig_types[6]
+#define SWIGTYPE_p_allocator_type swig_types[7]
+#define SWIGTYPE_p_char swig_types[8]
+#define SWIGTYPE_p_difference_type swig_types[9]
+#define SWIGTYPE_p_double swig_types[10]
+#define SWIGTYPE_p_key_type swig_types[11]
+#define SWIGTYPE_p_mapped_type swig_types[12]
+#define SWIGTYPE_p_operatortype swig_types[13]
+#define SWIGTYPE_p_p_PyObject swig_types[14]
+#define SWIGTYPE_p_size_type swig_types[15]
+#define SWIGTYPE_p_std__allocatorT_LinOp_const_p_t swig_types[16]
+#define SWIGTYPE_p_std__allocatorT_LinOp_p_t swig_types[17]
+#define SWIGTYPE_p_std__allocatorT_double_t swig_types[18]
+#define SWIGTYPE_p_std__allocatorT_int_t swig_types[19]
+#define SWIGTYPE_p_std__allocatorT_std__pairT_int_const_int_t_t swig_types[20]
+#define SWIGTYPE_p_std__allocatorT_std__vectorT_double_std__allocatorT_double_t_t_t swig_types[21]
+#define SWIGTYPE_p_std__allocatorT_std__vectorT_int_std__allocatorT_int_t_t_t swig_types[22]
+#define SWIGTYPE_p_std__invalid_argument swig_types[23]
+#define SWIGTYPE_p_std__lessT_int_t swig_types[24]
+#define SWIGTYPE_p_std__mapT_int_Eigen__SparseMatrixT_double_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_Eigen__SparseMatrixT_double_t_t_t_t swig_types[25]
+#define SWIGTYPE_p_std__mapT_int_int_std__lessT_int_t_std__allocatorT_std__pairT_int_const_int_t_t_t swig_types[26]
+#define SWIGTYPE_p_std__mapT_int_std__mapT_int_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__mapT_int_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_t_t_t_t_t_t swig_types[27]
+#define SWIGTYPE_p_std__mapT_int_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_Eigen__SparseMatrixT_double_t_std__allocatorT_Eigen__SparseMatrixT_double_t_t_t_t_t_t swig_types[28]
+#define SWIGTYPE_p_std__mapT_int_std__vectorT_std__vectorT_double_std__allocatorT_double_t_t_std__allocatorT_std__vectorT_double_std__allocatorT_double_t_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_std__vectorT_double_std__allocatorT_double_t_t_std__allocatorT_std__vectorT_double_std__allocatorT_double_t_t_t_t_t_t_t swig_types[29]
+#define SWIGTYPE_p_std__mapT_int_std__vectorT_std__vectorT_int_std__allocatorT_int_t_t_std__allocatorT_std__vectorT_int_std__allocatorT_int_t_t_t_t_std__lessT_int_t_std__allocatorT_std__pairT_int_const_std__vectorT_std__vectorT_int_std__allocatorT_int_t_t_std__allocatorT_std__vectorT_int_std__allocatorT_int_t_t_t_t_t_t_t swig_types[30]
+#define SWIGTYPE_p_std__vectorT_LinOp_const_p_std__allocatorT_LinOp_const_p_t_t swig_types[31]
+#define SWIGTYPE_p_std__vectorT_LinOp_p_std__allocatorT_LinOp_p_t_t swig_types[32]
+#define SWIGTYPE_p_std__vectorT_double_std__allocatorT_double_t_t swig_types[33]
+#define SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t swig_types[34]
+#define SWIGTYPE_p_std__vectorT_std__vectorT_double_std__allocatorT_double_t_t_std__allocatorT_std__vectorT_double_std__allocatorT_double_t_t_t_t swig_types[35]
+#define SWIGTYPE_p_std__vectorT_std__vectorT_int_std__allocatorT_int_t_t_std__allocatorT_std__vectorT_int_std__allocatorT_int_t_t_t_t swig_types[36]
+#define SWIGTYPE_p_swig__SwigPyIterator swig_types[37]
+#define SWIGTYPE_p_value_type swig_types[38]
+static swig_type_info *swig_types[40];
+static swig_module_info swig_module = {swig_types, 39, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -7355,7 +7356,7 @@ SWIGINTERN PyObject *_wrap_LinOp_get_args(PyObject *self, PyObject *args) {
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  std::vector< LinOp const *,std::allocator< LinOp const * > > result;
+  std::vector< LinOp const *,std::allocator< LinOp const * > > *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
@@ -7364,8 +7365,8 @@ SWIGINTERN PyObject *_wrap_LinOp_get_args(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LinOp_get_args" "', argument " "1"" of type '" "LinOp const *""'"); 
   }
   arg1 = reinterpret_cast< LinOp * >(argp1);
-  result = ((LinOp const *)arg1)->get_args();
-  resultobj = SWIG_NewPointerObj((new std::vector< LinOp const *,std::allocator< LinOp const * > >(result)), SWIGTYPE_p_std__vectorT_LinOp_const_p_std__allocatorT_LinOp_const_p_t_t, SWIG_POINTER_OWN |  0 );
+  result = (std::vector< LinOp const *,std::allocator< LinOp const * > > *) &((LinOp const *)arg1)->get_args();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_LinOp_const_p_std__allocatorT_LinOp_const_p_t_t, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
@@ -7949,6 +7950,200 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_new_LinOpForest(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  LinOpForest *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_LinOpForest", 0, 0, 0)) SWIG_fail;
+  result = (LinOpForest *)new LinOpForest();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_LinOpForest, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_LinOpForest(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  LinOpForest *arg1 = (LinOpForest *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_LinOpForest, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_LinOpForest" "', argument " "1"" of type '" "LinOpForest *""'"); 
+  }
+  arg1 = reinterpret_cast< LinOpForest * >(argp1);
+  delete arg1;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_LinOpForest_load(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  LinOpForest *arg1 = (LinOpForest *) 0 ;
+  int *arg2 = (int *) 0 ;
+  int arg3 ;
+  int *arg4 = (int *) 0 ;
+  int arg5 ;
+  double *arg6 = (double *) 0 ;
+  int arg7 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *array2 = NULL ;
+  int is_new_object2 = 0 ;
+  PyArrayObject *array4 = NULL ;
+  int is_new_object4 = 0 ;
+  PyArrayObject *array6 = NULL ;
+  int is_new_object6 = 0 ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "LinOpForest_load", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_LinOpForest, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LinOpForest_load" "', argument " "1"" of type '" "LinOpForest *""'"); 
+  }
+  arg1 = reinterpret_cast< LinOpForest * >(argp1);
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array2 = obj_to_array_contiguous_allow_conversion(swig_obj[1], NPY_INT,
+      &is_new_object2);
+    if (!array2 || !require_dimensions(array2, 1) ||
+      !require_size(array2, size, 1)) SWIG_fail;
+    arg2 = (int*) array_data(array2);
+    arg3 = (int) array_size(array2,0);
+  }
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array4 = obj_to_array_contiguous_allow_conversion(swig_obj[2], NPY_INT,
+      &is_new_object4);
+    if (!array4 || !require_dimensions(array4, 1) ||
+      !require_size(array4, size, 1)) SWIG_fail;
+    arg4 = (int*) array_data(array4);
+    arg5 = (int) array_size(array4,0);
+  }
+  {
+    npy_intp size[1] = {
+      -1 
+    };
+    array6 = obj_to_array_contiguous_allow_conversion(swig_obj[3], NPY_DOUBLE,
+      &is_new_object6);
+    if (!array6 || !require_dimensions(array6, 1) ||
+      !require_size(array6, size, 1)) SWIG_fail;
+    arg6 = (double*) array_data(array6);
+    arg7 = (int) array_size(array6,0);
+  }
+  (arg1)->load(arg2,arg3,arg4,arg5,arg6,arg7);
+  resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object2 && array2)
+    {
+      Py_DECREF(array2); 
+    }
+  }
+  {
+    if (is_new_object4 && array4)
+    {
+      Py_DECREF(array4); 
+    }
+  }
+  {
+    if (is_new_object6 && array6)
+    {
+      Py_DECREF(array6); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object2 && array2)
+    {
+      Py_DECREF(array2); 
+    }
+  }
+  {
+    if (is_new_object4 && array4)
+    {
+      Py_DECREF(array4); 
+    }
+  }
+  {
+    if (is_new_object6 && array6)
+    {
+      Py_DECREF(array6); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_LinOpForest_num_nodes(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  LinOpForest *arg1 = (LinOpForest *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_LinOpForest, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LinOpForest_num_nodes" "', argument " "1"" of type '" "LinOpForest const *""'"); 
+  }
+  arg1 = reinterpret_cast< LinOpForest * >(argp1);
+  result = (int)((LinOpForest const *)arg1)->num_nodes();
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_LinOpForest_get_roots(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  LinOpForest *arg1 = (LinOpForest *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  std::vector< LinOp const *,std::allocator< LinOp const * > > *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_LinOpForest, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "LinOpForest_get_roots" "', argument " "1"" of type '" "LinOpForest const *""'"); 
+  }
+  arg1 = reinterpret_cast< LinOpForest * >(argp1);
+  result = (std::vector< LinOp const *,std::allocator< LinOp const * > > *) &((LinOpForest const *)arg1)->get_roots();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_LinOp_const_p_std__allocatorT_LinOp_const_p_t_t, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *LinOpForest_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_LinOpForest, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *LinOpForest_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
 SWIGINTERN PyObject *_wrap_ProblemData_TensorV_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   ProblemData *arg1 = (ProblemData *) 0 ;
@@ -8246,6 +8441,43 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ProblemData_reserve_id(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  ProblemData *arg1 = (ProblemData *) 0 ;
+  int arg2 ;
+  size_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  size_t val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ProblemData_reserve_id", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_ProblemData, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ProblemData_reserve_id" "', argument " "1"" of type '" "ProblemData *""'"); 
+  }
+  arg1 = reinterpret_cast< ProblemData * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "ProblemData_reserve_id" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  ecode3 = SWIG_AsVal_size_t(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ProblemData_reserve_id" "', argument " "3"" of type '" "size_t""'");
+  } 
+  arg3 = static_cast< size_t >(val3);
+  (arg1)->reserve_id(arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_ProblemData_getLen(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   ProblemData *arg1 = (ProblemData *) 0 ;
@@ -20611,7 +20843,11 @@ SWIGINTERN PyObject *_wrap_build_matrix__SWIG_0(PyObject *self, Py_ssize_t nobjs
     SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "build_matrix" "', argument " "5"" of type '" "int""'");
   } 
   arg5 = static_cast< int >(val5);
-  result = build_matrix(SWIG_STD_MOVE(arg1),arg2,SWIG_STD_MOVE(arg3),SWIG_STD_MOVE(arg4),arg5);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = build_matrix(SWIG_STD_MOVE(arg1),arg2,SWIG_STD_MOVE(arg3),SWIG_STD_MOVE(arg4),arg5);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_NewPointerObj((new ProblemData(result)), SWIGTYPE_p_ProblemData, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -20672,7 +20908,75 @@ SWIGINTERN PyObject *_wrap_build_matrix__SWIG_1(PyObject *self, Py_ssize_t nobjs
     arg5 = *ptr;
     if (SWIG_IsNewObj(res)) delete ptr;
   }
-  result = build_matrix(SWIG_STD_MOVE(arg1),arg2,SWIG_STD_MOVE(arg3),SWIG_STD_MOVE(arg4),SWIG_STD_MOVE(arg5));
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = build_matrix(SWIG_STD_MOVE(arg1),arg2,SWIG_STD_MOVE(arg3),SWIG_STD_MOVE(arg4),SWIG_STD_MOVE(arg5));
+    Py_END_ALLOW_THREADS
+  }
+  resultobj = SWIG_NewPointerObj((new ProblemData(result)), SWIGTYPE_p_ProblemData, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_build_matrix__SWIG_2(PyObject *self, Py_ssize_t nobjs, PyObject **swig_obj) {
+  PyObject *resultobj = 0;
+  LinOpForest *arg1 = 0 ;
+  int arg2 ;
+  std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > > arg3 ;
+  std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > > arg4 ;
+  int arg5 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  ProblemData result;
+  
+  if ((nobjs < 5) || (nobjs > 5)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_LinOpForest,  0  | 0);
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "build_matrix" "', argument " "1"" of type '" "LinOpForest const &""'"); 
+  }
+  if (!argp1) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "build_matrix" "', argument " "1"" of type '" "LinOpForest const &""'"); 
+  }
+  arg1 = reinterpret_cast< LinOpForest * >(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "build_matrix" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  {
+    std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > > *ptr = (std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > > *)0;
+    int res = swig::asptr(swig_obj[2], &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "build_matrix" "', argument " "3"" of type '" "std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > > *ptr = (std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > > *)0;
+    int res = swig::asptr(swig_obj[3], &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "build_matrix" "', argument " "4"" of type '" "std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >""'"); 
+    }
+    arg4 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "build_matrix" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = static_cast< int >(val5);
+  {
+    Py_BEGIN_ALLOW_THREADS
+    result = build_matrix((LinOpForest const &)*arg1,arg2,SWIG_STD_MOVE(arg3),SWIG_STD_MOVE(arg4),arg5);
+    Py_END_ALLOW_THREADS
+  }
   resultobj = SWIG_NewPointerObj((new ProblemData(result)), SWIGTYPE_p_ProblemData, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
@@ -20688,6 +20992,34 @@ SWIGINTERN PyObject *_wrap_build_matrix(PyObject *self, PyObject *args) {
   
   if (!(argc = SWIG_Python_UnpackTuple(args, "build_matrix", 0, 5, argv))) SWIG_fail;
   --argc;
+  if (argc == 5) {
+    int _v = 0;
+    int res = SWIG_ConvertPtr(argv[0], 0, SWIGTYPE_p_LinOpForest, SWIG_POINTER_NO_NULL | 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        int res = swig::asptr(argv[2], (std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >**)(0));
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = swig::asptr(argv[3], (std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >**)(0));
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            {
+              int res = SWIG_AsVal_int(argv[4], NULL);
+              _v = SWIG_CheckState(res);
+            }
+            if (_v) {
+              return _wrap_build_matrix__SWIG_2(self, argc, argv);
+            }
+          }
+        }
+      }
+    }
+  }
   if (argc == 5) {
     int _v = 0;
     int res = swig::asptr(argv[0], (std::vector< LinOp const*,std::allocator< LinOp const * > >**)(0));
@@ -20747,11 +21079,25 @@ fail:
   SWIG_Python_RaiseOrModifyTypeError("Wrong number or type of arguments for overloaded function 'build_matrix'.\n"
     "  Possible C/C++ prototypes are:\n"
     "    build_matrix(std::vector< LinOp const *,std::allocator< LinOp const * > >,int,std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >,std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >,int)\n"
-    "    build_matrix(std::vector< LinOp const *,std::allocator< LinOp const * > >,int,std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >,std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >,std::vector< int,std::allocator< int > >)\n");
+    "    build_matrix(std::vector< LinOp const *,std::allocator< LinOp const * > >,int,std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >,std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >,std::vector< int,std::allocator< int > >)\n"
+    "    build_matrix(LinOpForest const &,int,std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >,std::map< int,int,std::less< int >,std::allocator< std::pair< int const,int > > >,int)\n");
   return 0;
 }
 
 
+SWIGINTERN PyObject *_wrap_openmp_enabled(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  bool result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "openmp_enabled", 0, 0, 0)) SWIG_fail;
+  result = (bool)openmp_enabled();
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 static PyMethodDef SwigMethods[] = {
 	 { "delete_SwigPyIterator", _wrap_delete_SwigPyIterator, METH_O, NULL},
 	 { "SwigPyIterator_value", _wrap_SwigPyIterator_value, METH_O, NULL},
@@ -20796,6 +21142,13 @@ static PyMethodDef SwigMethods[] = {
 	 { "tensor_mul", _wrap_tensor_mul, METH_VARARGS, NULL},
 	 { "acc_tensor", _wrap_acc_tensor, METH_VARARGS, NULL},
 	 { "diagonalize", _wrap_diagonalize, METH_O, NULL},
+	 { "new_LinOpForest", _wrap_new_LinOpForest, METH_NOARGS, NULL},
+	 { "delete_LinOpForest", _wrap_delete_LinOpForest, METH_O, NULL},
+	 { "LinOpForest_load", _wrap_LinOpForest_load, METH_VARARGS, NULL},
+	 { "LinOpForest_num_nodes", _wrap_LinOpForest_num_nodes, METH_O, NULL},
+	 { "LinOpForest_get_roots", _wrap_LinOpForest_get_roots, METH_O, NULL},
+	 { "LinOpForest_swigregister", LinOpForest_swigregister, METH_O, NULL},
+	 { "LinOpForest_swiginit", LinOpForest_swiginit, METH_VARARGS, NULL},
 	 { "ProblemData_TensorV_set", _wrap_ProblemData_TensorV_set, METH_VARARGS, NULL},
 	 { "ProblemData_TensorV_get", _wrap_ProblemData_TensorV_get, METH_O, NULL},
 	 { "ProblemData_TensorI_set", _wrap_ProblemData_TensorI_set, METH_VARARGS, NULL},
@@ -20807,6 +21160,7 @@ static PyMethodDef SwigMethods[] = {
 	 { "ProblemData_vec_idx_set", _wrap_ProblemData_vec_idx_set, METH_VARARGS, NULL},
 	 { "ProblemData_vec_idx_get", _wrap_ProblemData_vec_idx_get, METH_O, NULL},
 	 { "ProblemData_init_id", _wrap_ProblemData_init_id, METH_VARARGS, NULL},
+	 { "ProblemData_reserve_id", _wrap_ProblemData_reserve_id, METH_VARARGS, NULL},
 	 { "ProblemData_getLen", _wrap_ProblemData_getLen, METH_O, NULL},
 	 { "ProblemData_getV", _wrap_ProblemData_getV, METH_VARARGS, NULL},
 	 { "ProblemData_getI", _wrap_ProblemData_getI, METH_VARARGS, NULL},
@@ -21059,6 +21413,7 @@ static PyMethodDef SwigMethods[] = {
 	 { "ConstLinOpVector_swigregister", ConstLinOpVector_swigregister, METH_O, NULL},
 	 { "ConstLinOpVector_swiginit", ConstLinOpVector_swiginit, METH_VARARGS, NULL},
 	 { "build_matrix", _wrap_build_matrix, METH_VARARGS, NULL},
+	 { "openmp_enabled", _wrap_openmp_enabled, METH_NOARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -21070,6 +21425,7 @@ static swig_type_info _swigt__p_Eigen__MatrixXd = {"_p_Eigen__MatrixXd", "Eigen:
 static swig_type_info _swigt__p_Eigen__SparseMatrixT_double_t = {"_p_Eigen__SparseMatrixT_double_t", "Matrix *|Eigen::SparseMatrix< double > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_Eigen__TripletT_double_t = {"_p_Eigen__TripletT_double_t", "Triplet *|Eigen::Triplet< double > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_LinOp = {"_p_LinOp", "std::vector< LinOp * >::value_type|std::vector< LinOp const * >::value_type|LinOp *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_LinOpForest = {"_p_LinOpForest", "LinOpForest *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_ProblemData = {"_p_ProblemData", "ProblemData *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_allocator_type = {"_p_allocator_type", "allocator_type *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
@@ -21110,6 +21466,7 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_Eigen__SparseMatrixT_double_t,
   &_swigt__p_Eigen__TripletT_double_t,
   &_swigt__p_LinOp,
+  &_swigt__p_LinOpForest,
   &_swigt__p_ProblemData,
   &_swigt__p_allocator_type,
   &_swigt__p_char,
@@ -21150,6 +21507,7 @@ static swig_cast_info _swigc__p_Eigen__MatrixXd[] = {  {&_swigt__p_Eigen__Matrix
 static swig_cast_info _swigc__p_Eigen__SparseMatrixT_double_t[] = {  {&_swigt__p_Eigen__SparseMatrixT_double_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Eigen__TripletT_double_t[] = {  {&_swigt__p_Eigen__TripletT_double_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_LinOp[] = {  {&_swigt__p_LinOp, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_LinOpForest[] = {  {&_swigt__p_LinOpForest, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_ProblemData[] = {  {&_swigt__p_ProblemData, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_allocator_type[] = {  {&_swigt__p_allocator_type, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
@@ -21190,6 +21548,7 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_Eigen__SparseMatrixT_double_t,
   _swigc__p_Eigen__TripletT_double_t,
   _swigc__p_LinOp,
+  _swigc__p_LinOpForest,
   _swigc__p_ProblemData,
   _swigc__p_allocator_type,
   _swigc__p_char,
@@ -21730,6 +22089,11 @@ SWIG_init(void) {
   }
   PyDict_SetItemString(md, "cvar", globals);
   SWIG_addvarlink(globals, "CONSTANT_ID", Swig_var_CONSTANT_ID_get, Swig_var_CONSTANT_ID_set);
+  SWIG_Python_SetConstant(d, "NO_DATA",SWIG_From_int(static_cast< int >(NO_DATA)));
+  SWIG_Python_SetConstant(d, "LINOP_DATA",SWIG_From_int(static_cast< int >(LINOP_DATA)));
+  SWIG_Python_SetConstant(d, "DENSE_DATA",SWIG_From_int(static_cast< int >(DENSE_DATA)));
+  SWIG_Python_SetConstant(d, "SPARSE_DATA",SWIG_From_int(static_cast< int >(SPARSE_DATA)));
+  SWIG_Python_SetConstant(d, "SLICE_DATA",SWIG_From_int(static_cast< int >(SLICE_DATA)));
   
   // thread safe initialization
   swig::container_owner_attribute();
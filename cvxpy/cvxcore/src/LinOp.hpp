@@ -72,7 +72,7 @@ public:
   }
   std::vector<int> get_shape() const { return shape_; }
 
-  const std::vector<const LinOp *> get_args() const { return args_; }
+  const std::vector<const LinOp *> &get_args() const { return args_; }
   const std::vector<std::vector<int> > get_slice() const { return slice_; }
   void push_back_slice_vec(const std::vector<int> &slice_vec) {
     slice_.push_back(slice_vec);
@@ -135,6 +135,17 @@ public:
     data_has_been_set_ = true;
   }
 
+#ifndef SWIG
+  /* Initializes SPARSE_DATA from an assembled sparse matrix. */
+  void set_sparse_data(const Matrix &sparse_coeffs) {
+    assert(!data_has_been_set_);
+    sparse_ = true;
+    sparse_data_ = sparse_coeffs;
+    data_ndim_ = 2;
+    data_has_been_set_ = true;
+  }
+#endif
+
 private:
   const OperatorType type_;
   std::vector<int> shape_;
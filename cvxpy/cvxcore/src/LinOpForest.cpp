@@ -0,0 +1,87 @@
+//   Copyright, the CVXPY authors
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+
+#include "LinOpForest.hpp"
+#include <cassert>
+
+LinOpForest::~LinOpForest() {
+  for (LinOp *node : nodes_) {
+    delete node;
+  }
+}
+
+void LinOpForest::load(int *meta, int meta_len, int *idx, int idx_len,
+                       double *values, int values_len) {
+  int pos = 0;
+  long idx_pos = 0;
+  long values_pos = 0;
+  int num_nodes = meta[pos++];
+  nodes_.reserve(nodes_.size() + num_nodes);
+  int first = static_cast<int>(nodes_.size());
+
+  for (int n = 0; n < num_nodes; ++n) {
+    OperatorType type = static_cast<OperatorType>(meta[pos++]);
+    int ndim = meta[pos++];
+    std::vector<int> shape(meta + pos, meta + pos + ndim);
+    pos += ndim;
+    int nargs = meta[pos++];
+    std::vector<const LinOp *> args;
+    args.reserve(nargs);
+    for (int i = 0; i < nargs; ++i) {
+      args.push_back(nodes_[first + meta[pos++]]);
+    }
+    LinOp *node = new LinOp(type, shape, args);
+    nodes_.push_back(node);
+
+    int kind = meta[pos++];
+    if (kind == LINOP_DATA) {
+      node->set_linOp_data(nodes_[first + meta[pos++]]);
+      node->set_data_ndim(meta[pos++]);
+    } else if (kind == DENSE_DATA) {
+      int rows = meta[pos++];
+      int cols = meta[pos++];
+      node->set_dense_data(values + values_pos, rows, cols);
+      node->set_data_ndim(meta[pos++]);
+      values_pos += static_cast<long>(rows) * cols;
+    } else if (kind == SPARSE_DATA) {
+      int rows = meta[pos++];
+      int cols = meta[pos++];
+      int nnz = meta[pos++];
+      std::vector<Triplet> triplets;
+      triplets.reserve(nnz);
+      for (int k = 0; k < nnz; ++k) {
+        triplets.push_back(Triplet(idx[idx_pos + k], idx[idx_pos + nnz + k],
+                                   values[values_pos + k]));
+      }
+      Matrix sparse_coeffs(rows, cols);
+      sparse_coeffs.setFromTriplets(triplets.begin(), triplets.end());
+      sparse_coeffs.makeCompressed();
+      node->set_sparse_data(sparse_coeffs);
+      idx_pos += 2 * static_cast<long>(nnz);
+      values_pos += nnz;
+    } else if (kind == SLICE_DATA) {
+      int nslices = meta[pos++];
+      for (int i = 0; i < nslices; ++i) {
+        node->push_back_slice_vec(std::vector<int>(meta + pos, meta + pos + 3));
+        pos += 3;
+      }
+    }
+  }
+
+  int num_roots = meta[pos++];
+  for (int i = 0; i < num_roots; ++i) {
+    roots_.push_back(nodes_[first + meta[pos++]]);
+  }
+  assert(pos == meta_len && idx_pos == idx_len && values_pos == values_len);
+}
@@ -0,0 +1,71 @@
+//   Copyright, the CVXPY authors
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+
+#ifndef LINOPFOREST_H
+#define LINOPFOREST_H
+
+#include "LinOp.hpp"
+#include <vector>
+
+/* Kinds of data attached to a serialized LinOp. */
+enum linopdatakind {
+  NO_DATA,
+  LINOP_DATA,
+  DENSE_DATA,
+  SPARSE_DATA,
+  SLICE_DATA
+};
+
+/* A collection of LinOp trees built from a flat serialization, in a single
+ * call from Python.
+ *
+ * The forest is described by three contiguous arrays. META holds, in order,
+ * the number of nodes; for each node, in an order in which every node comes
+ * after its arguments and its LinOp data,
+ *
+ *   type, ndim, dims..., nargs, arg node indices..., data kind, payload...
+ *
+ * where the payload is empty for NO_DATA; (node index, data ndim) for
+ * LINOP_DATA; (rows, cols, data ndim) for DENSE_DATA, whose rows * cols
+ * values are read from VALUES in Fortran order; (rows, cols, nnz) for
+ * SPARSE_DATA, whose nnz row indices and nnz column indices are read from
+ * IDX and nnz values from VALUES; and (nslices, (start, stop, step)...) for
+ * SLICE_DATA. META ends with the number of roots and the root node indices.
+ *
+ * The forest owns its LinOps, which are freed with it. */
+class LinOpForest {
+public:
+  LinOpForest() {}
+  ~LinOpForest();
+
+  /* Builds the LinOps described by META, IDX and VALUES.
+   *
+   * NOTE: The function prototype must match the type-map in cvxcore.i
+   * exactly to compile and run properly.
+   */
+  void load(int *meta, int meta_len, int *idx, int idx_len, double *values,
+            int values_len);
+
+  int num_nodes() const { return static_cast<int>(nodes_.size()); }
+  const std::vector<const LinOp *> &get_roots() const { return roots_; }
+
+private:
+  LinOpForest(const LinOpForest &);
+  LinOpForest &operator=(const LinOpForest &);
+
+  std::vector<LinOp *> nodes_;
+  std::vector<const LinOp *> roots_;
+};
+
+#endif
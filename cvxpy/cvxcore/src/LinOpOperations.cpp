@@ -18,6 +18,8 @@
 #include <cassert>
 #include <iostream>
 #include <map>
+#include <unordered_map>
+#include <utility>
 
 /***********************
  * FUNCTION PROTOTYPES *
@@ -152,19 +154,49 @@ Tensor get_node_coeffs(const LinOp &lin, int arg_idx) {
 }
 
 Tensor lin_to_tensor(const LinOp &lin) {
-  if (lin.get_args().size() == 0) {
-    return get_node_coeffs(lin, 0);
-  } else {
+  /* Order the nodes so that every node comes after its arguments, with an
+   * explicit stack, so that deep trees do not overflow the call stack.
+   * Nodes shared within the tree are listed once; uses counts the parents
+   * of every node. */
+  std::vector<const LinOp *> order;
+  std::unordered_map<const LinOp *, int> uses;
+  std::vector<std::pair<const LinOp *, unsigned> > stack;
+  stack.emplace_back(&lin, 0);
+  while (!stack.empty()) {
+    const LinOp *node = stack.back().first;
+    const std::vector<const LinOp *> &args = node->get_args();
+    if (stack.back().second < args.size()) {
+      const LinOp *arg = args[stack.back().second++];
+      if (uses[arg]++ == 0) {
+        stack.emplace_back(arg, 0);
+      }
+    } else {
+      order.push_back(node);
+      stack.pop_back();
+    }
+  }
+
+  /* The tensors of the arguments are released once all their parents have
+   * been evaluated. */
+  std::unordered_map<const LinOp *, Tensor> tensors;
+  for (const LinOp *node : order) {
+    const std::vector<const LinOp *> &args = node->get_args();
     Tensor result;
+    if (args.size() == 0) {
+      result = get_node_coeffs(*node, 0);
+    }
     /* Multiply the arguments of the function coefficient in order */
-    for (unsigned i = 0; i < lin.get_args().size(); ++i) {
-      Tensor lh_coeff = get_node_coeffs(lin, i);
-      Tensor rh_coeff = lin_to_tensor(*lin.get_args()[i]);
-      Tensor prod = tensor_mul(lh_coeff, rh_coeff);
+    for (unsigned i = 0; i < args.size(); ++i) {
+      Tensor lh_coeff = get_node_coeffs(*node, i);
+      Tensor prod = tensor_mul(lh_coeff, tensors[args[i]]);
       acc_tensor(result, prod);
+      if (--uses[args[i]] == 0) {
+        tensors.erase(args[i]);
+      }
     }
-    return result;
+    tensors[node] = std::move(result);
   }
+  return std::move(tensors[&lin]);
 }
 
 /*******************
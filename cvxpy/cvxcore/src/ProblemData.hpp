@@ -15,6 +15,8 @@
 #ifndef PROBLEMDATA_H
 #define PROBLEMDATA_H
 
+#include <algorithm>
+#include <cassert>
 #include <map>
 #include <vector>
 
@@ -35,20 +37,19 @@ public:
   // Initialize TensorV/I/J for the given parameter.
   void init_id(int new_param_id, int param_size) {
     assert(TensorV.count(new_param_id) == 0);
-    std::vector<std::vector<double> > vecV(param_size);
-    std::vector<std::vector<int> > vecI(param_size);
-    std::vector<std::vector<int> > vecJ(param_size);
-    for (int i = 0; i < param_size; ++i) {
-      std::vector<double> elemV;
-      std::vector<int> elemI;
-      std::vector<int> elemJ;
-      vecV.push_back(elemV);
-      vecI.push_back(elemI);
-      vecJ.push_back(elemJ);
+    TensorV[new_param_id] = std::vector<std::vector<double> >(param_size);
+    TensorI[new_param_id] = std::vector<std::vector<int> >(param_size);
+    TensorJ[new_param_id] = std::vector<std::vector<int> >(param_size);
+  }
+
+  // Ensure TensorV/I/J hold at least param_size slices for the parameter.
+  void reserve_id(int param_id, size_t param_size) {
+    std::vector<std::vector<double> > &vecV = TensorV[param_id];
+    if (vecV.size() < param_size) {
+      vecV.resize(param_size);
+      TensorI[param_id].resize(param_size);
+      TensorJ[param_id].resize(param_size);
     }
-    TensorV[new_param_id] = vecV;
-    TensorI[new_param_id] = vecI;
-    TensorJ[new_param_id] = vecJ;
   }
 
   /*******************************************
@@ -70,38 +71,31 @@ public:
 
   // Get length of V, I, J.
   int getLen() {
-    std::vector<double> V = TensorV[param_id][vec_idx];
-    return V.size();
+    return TensorV[param_id][vec_idx].size();
   }
 
   /**
    * Returns the data vector V as a contiguous 1D numpy array.
    */
   void getV(double *values, int num_values) {
-    std::vector<double> V = TensorV[param_id][vec_idx];
-    for (int i = 0; i < num_values; i++) {
-      values[i] = V[i];
-    }
+    const std::vector<double> &V = TensorV[param_id][vec_idx];
+    std::copy(V.begin(), V.begin() + num_values, values);
   }
 
   /**
    * Returns the row index vector I as a contiguous 1D numpy array.
    */
   void getI(double *values, int num_values) {
-    std::vector<int> I = TensorI[param_id][vec_idx];
-    for (int i = 0; i < num_values; i++) {
-      values[i] = I[i];
-    }
+    const std::vector<int> &I = TensorI[param_id][vec_idx];
+    std::copy(I.begin(), I.begin() + num_values, values);
   }
 
   /**
    * Returns the column index vector J as a contiguous 1D numpy array.
    */
   void getJ(double *values, int num_values) {
-    std::vector<int> J = TensorJ[param_id][vec_idx];
-    for (int i = 0; i < num_values; i++) {
-      values[i] = J[i];
-    }
+    const std::vector<int> &J = TensorJ[param_id][vec_idx];
+    std::copy(J.begin(), J.begin() + num_values, values);
   }
 };
 
@@ -25,6 +25,10 @@
 #include "omp.h"
 #endif
 
+/* The number of chunks of constraints per thread in build_matrix; more
+ * chunks than threads balance the load when constraints differ in size. */
+static const size_t CHUNKS_PER_THREAD = 4;
+
 
 /* function: add_matrix_to_vectors
  *
@@ -66,6 +70,9 @@ void process_constraint(const LinOp &lin, ProblemData &problemData,
     for (auto in_it = var_map.begin(); in_it != var_map.end(); ++in_it) {
       int var_id = in_it->first; // Horiz offset determined by the id
       const std::vector<Matrix>& blocks = in_it->second;
+      // Slices are allocated on first use, so that problem data that only
+      // holds a subset of the constraints stays small.
+      problemData.reserve_id(param_id, blocks.size());
       // Constant term is last column.
       for (unsigned i = 0; i < blocks.size(); ++i) {
         int horiz_offset;
@@ -74,19 +81,76 @@ void process_constraint(const LinOp &lin, ProblemData &problemData,
         } else {
           horiz_offset = id_to_col.at(var_id);
         }
+        add_matrix_to_vectors(blocks[i], problemData.TensorV[param_id][i],
+                              problemData.TensorI[param_id][i],
+                              problemData.TensorJ[param_id][i], vert_offset,
+                              horiz_offset);
+      }
+    }
+  }
+}
 
-        #ifdef _OPENMP
-        #pragma omp critical
-        #endif
-        {
-          add_matrix_to_vectors(blocks[i], problemData.TensorV[param_id][i],
-                                problemData.TensorI[param_id][i],
-                                problemData.TensorJ[param_id][i], vert_offset,
-                                horiz_offset);
-        }
+/* Appends the V, I and J vectors of each chunk, in order, to the vectors of
+ * OUTPUT, releasing the memory of the chunks along the way. Each slice of
+ * the output is filled by exactly one thread. */
+void merge_problem_data(std::vector<ProblemData> &chunks,
+                        ProblemData &output) {
+  std::vector<std::pair<int, int> > slices;
+  for (auto it = output.TensorV.begin(); it != output.TensorV.end(); ++it) {
+    int param_id = it->first;
+    bool present = false;
+    for (const ProblemData &chunk : chunks) {
+      if (chunk.TensorV.count(param_id) > 0) {
+        present = true;
+        break;
+      }
+    }
+    if (!present) {
+      continue;
+    }
+    for (size_t i = 0; i < it->second.size(); ++i) {
+      slices.push_back(std::make_pair(param_id, static_cast<int>(i)));
+    }
+  }
+
+  #ifdef _OPENMP
+  #pragma omp parallel for schedule(dynamic, 64)
+  #endif
+  for (long k = 0; k < static_cast<long>(slices.size()); ++k) {
+    int param_id = slices[k].first;
+    int i = slices[k].second;
+    std::vector<double> &V = output.TensorV.at(param_id)[i];
+    std::vector<int> &I = output.TensorI.at(param_id)[i];
+    std::vector<int> &J = output.TensorJ.at(param_id)[i];
 
+    size_t total = V.size();
+    for (const ProblemData &chunk : chunks) {
+      auto chunk_it = chunk.TensorV.find(param_id);
+      if (chunk_it != chunk.TensorV.end() &&
+          static_cast<size_t>(i) < chunk_it->second.size()) {
+        total += chunk_it->second[i].size();
       }
     }
+    V.reserve(total);
+    I.reserve(total);
+    J.reserve(total);
+
+    for (ProblemData &chunk : chunks) {
+      auto chunk_it = chunk.TensorV.find(param_id);
+      if (chunk_it == chunk.TensorV.end() ||
+          static_cast<size_t>(i) >= chunk_it->second.size()) {
+        continue;
+      }
+      std::vector<double> &chunkV = chunk_it->second[i];
+      std::vector<int> &chunkI = chunk.TensorI.at(param_id)[i];
+      std::vector<int> &chunkJ = chunk.TensorJ.at(param_id)[i];
+      V.insert(V.end(), chunkV.begin(), chunkV.end());
+      I.insert(I.end(), chunkI.begin(), chunkI.end());
+      J.insert(J.end(), chunkJ.begin(), chunkJ.end());
+      std::vector<double>().swap(chunkV);
+      std::vector<int>().swap(chunkI);
+      std::vector<int>().swap(chunkJ);
+    }
   }
 }
 
@@ -171,22 +235,44 @@ ProblemData build_matrix(std::vector<const LinOp *> constraints, int var_length,
     vert_offset += vecprod(constraint->get_shape());
   }
 
-  // TODO: to get full parallelism, each thread should use its own ProblemData;
-  // the ProblemData objects could be reduced afterwards (specifically
-  // the V, I, and J arrays would be merged)
+  size_t num_constraints = constraints_and_offsets.size();
+  size_t num_chunks = 1;
   #ifdef _OPENMP
   if (num_threads > 0) {
     omp_set_num_threads(num_threads);
   }
-  #pragma omp parallel for
+  num_chunks = CHUNKS_PER_THREAD * static_cast<size_t>(omp_get_max_threads());
+  #endif
+  if (num_chunks > num_constraints) {
+    num_chunks = num_constraints;
+  }
+  if (num_chunks <= 1) {
+    for (size_t i = 0; i < num_constraints; ++i) {
+      process_constraint(*constraints_and_offsets[i].first, prob_data,
+                         constraints_and_offsets[i].second, var_length,
+                         id_to_col);
+    }
+    return prob_data;
+  }
+
+  // Each chunk of consecutive constraints is processed into its own
+  // ProblemData, so that threads never write to shared vectors; the chunks
+  // are then merged in order, which makes the output independent of the
+  // number of threads.
+  std::vector<ProblemData> chunks(num_chunks);
+  #ifdef _OPENMP
+  #pragma omp parallel for schedule(dynamic, 1)
   #endif
-  for (size_t i = 0; i < constraints_and_offsets.size(); ++i) {
-    const std::pair<const LinOp*, int>& pair = constraints_and_offsets.at(i);
-    const LinOp* constraint = pair.first;
-    int vert_offset = pair.second;
-    process_constraint(
-      *constraint, prob_data, vert_offset, var_length, id_to_col);
+  for (long c = 0; c < static_cast<long>(num_chunks); ++c) {
+    size_t begin = num_constraints * c / num_chunks;
+    size_t end = num_constraints * (c + 1) / num_chunks;
+    for (size_t i = begin; i < end; ++i) {
+      process_constraint(*constraints_and_offsets[i].first, chunks[c],
+                         constraints_and_offsets[i].second, var_length,
+                         id_to_col);
+    }
   }
+  merge_problem_data(chunks, prob_data);
   return prob_data;
 }
 
@@ -213,3 +299,18 @@ ProblemData build_matrix(std::vector<const LinOp *> constraints, int var_length,
   }
   return prob_data;
 }
+
+ProblemData build_matrix(const LinOpForest &forest, int var_length,
+                         std::map<int, int> id_to_col,
+                         std::map<int, int> param_to_size, int num_threads) {
+  return build_matrix(forest.get_roots(), var_length, id_to_col,
+                      param_to_size, num_threads);
+}
+
+bool openmp_enabled() {
+  #ifdef _OPENMP
+  return true;
+  #else
+  return false;
+  #endif
+}
@@ -16,6 +16,7 @@
 #define CVXCANON_H
 #define EIGEN_MPL2_ONLY
 #include "LinOp.hpp"
+#include "LinOpForest.hpp"
 #include "ProblemData.hpp"
 #include "Utils.hpp"
 #include <vector>
@@ -31,4 +32,12 @@ ProblemData build_matrix(std::vector<const LinOp *> constraints, int var_length,
                          std::map<int, int> id_to_col,
                          std::map<int, int> param_to_size,
                          std::vector<int> constr_offsets);
+ProblemData build_matrix(const LinOpForest &forest, int var_length,
+                         std::map<int, int> id_to_col,
+                         std::map<int, int> param_to_size,
+                         int num_threads);
+
+// Whether cvxcore was built with OpenMP, i.e., whether build_matrix can use
+// more than one thread.
+bool openmp_enabled();
 #endif
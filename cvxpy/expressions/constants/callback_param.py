@@ -52,3 +52,7 @@ class CallbackParam(Parameter):
     @value.setter
     def value(self, _val):
         raise NotImplementedError("Cannot set the value of a CallbackParam.")
+
+    def _value_stamp(self):
+        # The value changes with the state read by the callback.
+        return None
@@ -63,6 +63,7 @@ class Constant(Leaf):
         self._nsd_test: Optional[bool] = None
         self._cached_is_pos = None
         self._skew_symm = None
+        self._torch_tensors = {}
         self._name = name
         super(Constant, self).__init__(intf.shape(self.value))
 
@@ -93,6 +94,26 @@ class Constant(Leaf):
         """
         return self._value
 
+    def _check_value(self) -> None:
+        # Constants are not modified, e.g., their sign is computed once.
+        pass
+
+    def torch_tensor(self, dtype=None):
+        """Returns the value of the constant as a torch tensor.
+
+        The value is converted once per dtype, and the tensor is cached, so
+        large constants are only converted once. Sparse values are converted
+        to sparse COO tensors. Dense tensors share the memory of the value.
+        """
+        import torch
+
+        from cvxpy.utilities.torch_utils import gen_tensor
+        if dtype is None:
+            dtype = torch.float64
+        if dtype not in self._torch_tensors:
+            self._torch_tensors[dtype] = gen_tensor(self._value, dtype=dtype)
+        return self._torch_tensors[dtype]
+
     def is_pos(self) -> bool:
         """Returns whether the constant is elementwise positive.
         """
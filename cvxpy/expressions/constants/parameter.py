@@ -84,7 +84,13 @@ class Parameter(Leaf):
 
     @value.setter
     def value(self, val):
-        self._value = self._validate_value(val)
+        self.save_value(self._validate_value(val))
+
+    def _value_stamp(self):
+        # Expressions with unset parameters have no value to memoize.
+        if self._value is None:
+            return None
+        return self._value_version
 
     @property
     def grad(self):
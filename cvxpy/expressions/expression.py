@@ -16,7 +16,7 @@ limitations under the License.
 
 import abc
 import warnings
-from functools import partial, wraps
+from functools import wraps
 from typing import List, Tuple
 
 import numpy as np
@@ -30,7 +30,7 @@ from cvxpy.constraints import PSD, Equality, Inequality
 from cvxpy.expressions import cvxtypes
 from cvxpy.utilities import scopes
 from cvxpy.utilities.shape import size_from_shape
-from cvxpy.utilities.torch_utils import VAR_TYPE, VariablesDict, gen_tensor
+from cvxpy.utilities.torch_utils import TorchExpression, VariablesDict
 
 
 def _cast_other(binary_op):
@@ -127,6 +127,15 @@ class Expression(u.Canonical):
         """
         return self.value
 
+    def _value_stamp(self):
+        """The largest version of the values of the leaves of the expression.
+
+        The stamp changes whenever one of the values changes, so that values
+        derived from the leaves can be memoized under it. None means that the
+        value cannot be memoized.
+        """
+        return None
+
     @abc.abstractproperty
     def grad(self):
         """Gives the (sub/super)gradient of the expression w.r.t. each variable.
@@ -237,7 +246,7 @@ class Expression(u.Canonical):
             curvature_str = s.UNKNOWN
         return curvature_str
 
-    @perf.compute_once
+    @perf.compute_once_bottom_up
     def is_constant(self) -> bool:
         """Is the expression constant?
         """
@@ -802,160 +811,24 @@ class Expression(u.Canonical):
         else:
             return self.numeric(values)
 
-    def gen_torch_exp(self, provided_vars_list:list = []) -> tuple[callable, VariablesDict]:
+    def gen_torch_exp(self, provided_vars_list:list = [], batched: bool = False,
+                      strict: bool = False) -> tuple[callable, VariablesDict]:
         """ This function generates a torch expression.
         Also returns vars_dict to help keep track of the order of the variables.
         If no vars_dict is provided, this function will generate one automatically.
         The order of the arguments is the same as in self.args (left to right).
+
+        The torch expression is a TorchExpression module, which is built once: evaluating
+        it does not walk the expression tree or convert the constants again.
+        If batched is True, the values of the variables and parameters may carry a leading
+        batch axis, and the torch expression returns the value of the expression for each
+        entry of the batch.
+        If strict is True, a ValueError is raised if an atom of the expression has no
+        torch_numeric method, instead of evaluating the atom with NumPy.
         """
-        import torch
-
-        from cvxpy.expressions.constants.constant import Constant
-        from cvxpy.expressions.constants.parameter import Parameter
-        from cvxpy.expressions.variable import Variable
-
-        def _gen_var_type(arg) -> VAR_TYPE:
-            """
-            This is a helper function that generates a VAR_TYPE from an arg.
-            """
-            if isinstance(arg, Constant):
-                return VAR_TYPE.CONSTANT
-            elif isinstance(arg, Parameter) or isinstance(arg, Variable):
-                return VAR_TYPE.VARIABLE_PARAMETER
-            else:
-                return VAR_TYPE.EXPRESSION
-
-        def _gen_consts_vars(self, vars_dict: VariablesDict) -> dict:
-            """ This is a helper function that generates the index -> (value, type) dictionary. """
-            ind_to_value_type = dict() #Local dictionary
-            for i, arg in enumerate(self.args):
-                var_type = _gen_var_type(arg)
-                if isinstance(arg, Constant):
-                    ind_to_value_type[i] = (gen_tensor(arg.value, dtype=torch.float64), var_type)
-                elif isinstance(arg, Parameter) or isinstance(arg, Variable):
-                    ind_to_value_type[i] = (arg, var_type)
-                    vars_dict.add_var(arg)
-                else:
-                    ind_to_value_type[i] = (arg, var_type)
-                    _gen_consts_vars(arg, vars_dict)
-            return ind_to_value_type
-        
-        def wrapped_func(self, ind_to_value_type: dict, vars_dict: VariablesDict, *args):
-            def transpose_if_matmul(self, res: list, should_transpose: list) -> None:
-                """
-                This function transposes the second element if the wrapped function is a dot product
-                between two vectors. While transposing a vector in CVXPY does nothing, this function
-                is important because it helps overloading this function to the case where the
-                one of the elements is a matrix, where each row is a vector to be multiplied with.
-                """
-
-                def is_matmul(self) -> bool:
-                    """
-                    This function checks if self is a valid matrix multiplication
-                    """
-                    from cvxpy.atoms.affine.binary_operators import MulExpression, multiply
-                    if not isinstance(self, MulExpression):
-                        return False
-                    #Check if the current expression is not elementwise multiplication
-                    if isinstance(self, multiply):
-                        return False
-                    return True
-
-                def check_should_transpose(should_transpose: list) -> bool:
-                    """
-                    This is a helper function that determines if transpose should happen, based
-                    on the CVXPY types.
-                    """
-                    if len(should_transpose) != 2: #Only support a dot product, hence two elements
-                        return False
-                    return all(should_transpose)
-                
-                def is_valid_input(res: list) -> tuple[bool, list]:
-                    """
-                    This function checks if res is valid for transpose, and if it does, returns
-                    the ndims list.
-                    """
-                    ndims = None
-                    valid = False
-
-                    #######################
-                    #Check input validity
-                    #######################
-                    #Transpose only a dot product between two elements
-                    if len(res) != 2:
-                        return valid, ndims
-                    
-                    #Work only on objects with ndim (torch/numpy/cvxpy etc.) and ndim==1
-                    ndims = [0]*2
-                    for i, vec in enumerate(res):
-                        if not hasattr(vec, "ndim"):
-                            return valid, ndims
-                        if vec.ndim >2:
-                            return valid, ndims#Only deal with scalars, vectors, or matrices
-                        ndims[i] = vec.ndim
-
-                    if max(ndims)<2:
-                        #No need to transpose scalars and vectors
-                        #If both elements are matrices, do not transpose -
-                        # we only make a vector-by-matrix compatible.
-                        return valid, ndims 
-                    if min(ndims)==2:
-                        return valid, ndims
-                    valid = True
-                    return valid, ndims
-
-                if not is_matmul(self):
-                    return
-                if not check_should_transpose(should_transpose):
-                    return
-                valid, ndims = is_valid_input(res)
-                if not valid:
-                    return
-                matrix_ind = ndims.index(2)
-                #Since ndims is a vector with 2 elements, 1-matrix_ind returns the other index
-                vector_ind = 1-matrix_ind
-                if res[vector_ind].shape[0] == res[matrix_ind].shape[matrix_ind]:
-                    res[matrix_ind] = res[matrix_ind].T
-
-            def should_transpose(curr_arg):
-                """
-                This is a helper function that determines if an element should be transposed for
-                matrix multiplication (allows broadcasting vectors into matrices)
-                """
-                ndim = getattr(curr_arg[0], "ndim", False)
-                if curr_arg[1]==VAR_TYPE.CONSTANT and ndim != 1:
-                    return False
-                return ndim==1
-            res =  []
-            #In order to support dot products of vectors,
-            #where one vector is represented by a matrix, we need to see if:
-            #1. The operation is matmul
-            #2. between two vectors (variables/parameters with ndim==1)
-            #These checks should happen on the original variables/parameters,
-            #and NOT on the elements of args.
-            #So the transpose happens only if should_tranpose contains two Trues.
-            transposable_elements = []
-            #Iterate over the range instead of the dictionary directly:
-            #dictionaries have no order, but we must iterate in order
-            for ind in range(len(ind_to_value_type)): 
-                curr_arg = ind_to_value_type[ind]
-                if curr_arg[1]==VAR_TYPE.CONSTANT:
-                    res.append(curr_arg[0])
-                elif curr_arg[1]==VAR_TYPE.VARIABLE_PARAMETER:
-                    res.append(args[vars_dict.vars_dict[curr_arg[0]]])
-                else:
-                    rec_ind_to_value_type = _gen_consts_vars(curr_arg[0], vars_dict)
-                    res.append(wrapped_func(curr_arg[0], rec_ind_to_value_type, vars_dict, *args))
-                transposable_elements.append(should_transpose(curr_arg))
-            #If this is a matrix multiplicaiton operation between 2 elements, transpose the second.
-            #This helps with overloading this function to be used with matrices.
-            transpose_if_matmul(self, res, transposable_elements)
-            return self.apply_torch_numeric(res)
-        
         vars_dict = VariablesDict(provided_vars_list=provided_vars_list)
-        ind_to_value_type = _gen_consts_vars(self, vars_dict)
-        return partial(wrapped_func, self, ind_to_value_type, vars_dict), vars_dict
-      
+        return TorchExpression(self, vars_dict, batched, strict), vars_dict
+
     def conj(self):
         """
         Equivalent to `cp.conj(self)`.
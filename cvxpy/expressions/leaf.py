@@ -16,6 +16,7 @@ limitations under the License.
 from __future__ import annotations
 
 import abc
+import hashlib
 from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
@@ -29,6 +30,7 @@ import numpy.linalg as LA
 import scipy.sparse as sp
 
 import cvxpy.interface as intf
+import cvxpy.utilities.performance_utils as perf
 from cvxpy.constraints.constraint import Constraint
 from cvxpy.expressions import expression
 from cvxpy.settings import (
@@ -38,6 +40,25 @@ from cvxpy.settings import (
 )
 
 
+def _digest(val):
+    """Returns a digest of the contents of an array, which changes when the
+    array is modified in place, or None for other values.
+    """
+    if sp.issparse(val):
+        parts = [getattr(val, name) for name in ['data', 'indices', 'indptr', 'row', 'col']
+                 if isinstance(getattr(val, name, None), np.ndarray)]
+    elif isinstance(val, np.ndarray):
+        parts = [val]
+    else:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if part.dtype.hasobject:
+            return None
+        digest.update(np.ascontiguousarray(part))
+    return digest.digest()
+
+
 class Leaf(expression.Expression):
     """
     A leaf node of an expression tree; i.e., a Variable, Constant, or Parameter.
@@ -95,6 +116,10 @@ class Leaf(expression.Expression):
     """
 
     __metaclass__ = abc.ABCMeta
+    # The version of the value, see save_value, and the digest of its
+    # contents, see _check_value.
+    _value_version = 0
+    _value_digest = None
 
     def __init__(
         self, shape: int | Iterable[int, ...], value=None, nonneg: bool = False,
@@ -424,6 +449,27 @@ class Leaf(expression.Expression):
     # Getter and setter for parameter value.
     def save_value(self, val) -> None:
         self._value = val
+        self._value_version = perf.next_value_version()
+        self._value_digest = _digest(val)
+
+    def _value_stamp(self):
+        return self._value_version
+
+    def _check_value(self) -> None:
+        """Draws a new version if the value was modified in place, e.g., by
+        leaf.value[0] = 0, so that the values memoized under the old version
+        are not used.
+        """
+        digest = _digest(self._value)
+        if digest != self._value_digest:
+            self._value_digest = digest
+            self._value_version = perf.next_value_version()
+
+    def __getstate__(self):
+        # Versions are only meaningful within the process that drew them.
+        state = self.__dict__.copy()
+        state.pop('_value_version', None)
+        return state
 
     @property
     def value(self):
@@ -552,14 +598,14 @@ class Leaf(expression.Expression):
     def atoms(self) -> list[Atom]:
         return []
 
-    def gen_torch_exp(self):
+    def gen_torch_exp(self, batched: bool = False, strict: bool = False):
         """
         This function generates a torch expression for a leaf.
         Also returns a vars_dict with the leaf.
         """
         from cvxpy.atoms.affine.add_expr import AddExpression
         tmp_aff_exp = AddExpression([self])
-        return tmp_aff_exp.gen_torch_exp()
+        return tmp_aff_exp.gen_torch_exp(batched=batched, strict=strict)
 
     @property
     def bounds(self):
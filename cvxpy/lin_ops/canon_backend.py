@@ -26,10 +26,12 @@ from scipy.signal import convolve
 
 from cvxpy.lin_ops import LinOp
 from cvxpy.settings import (
+    COO_CANON_BACKEND,
     NUMPY_CANON_BACKEND,
     RUST_CANON_BACKEND,
     SCIPY_CANON_BACKEND,
 )
+from cvxpy.utilities import traversal
 
 """
 Note: this file is tested extensively with illustrative examples in test_python_backends.py,
@@ -92,6 +94,11 @@ class TensorRepresentation:
             self.shape
         )
 
+    def __neg__(self) -> TensorRepresentation:
+        return TensorRepresentation(
+            -self.data, self.row, self.col, self.parameter_offset, self.shape
+        )
+
     @classmethod
     def empty_with_shape(cls, shape: tuple[int, int]) -> TensorRepresentation:
         return cls(
@@ -158,6 +165,7 @@ class CanonBackend(ABC):
         backends = {
             NUMPY_CANON_BACKEND: NumPyCanonBackend,
             SCIPY_CANON_BACKEND: SciPyCanonBackend,
+            COO_CANON_BACKEND: COOCanonBackend,
             RUST_CANON_BACKEND: RustCanonBackend
         }
         return backends[backend_name](*args, **kwargs)
@@ -211,11 +219,39 @@ class PythonCanonBackend(CanonBackend):
 
     def process_constraint(self, lin_op: LinOp, empty_view: TensorView) -> TensorView:
         """
-        Depth-first parsing of a linOp node.
+        Post-order parsing of a linOp tree.
+
+        The tree is traversed with an explicit stack, so that deep trees do not hit the
+        recursion limit. The args of stacking nodes are parsed by the stacking functions.
+
+        Parameters
+        ----------
+        lin_op: the root of the linOp tree.
+        empty_view: TensorView used to create tensors for leaf nodes.
+
+        Returns
+        -------
+        The processed node as a TensorView.
+        """
+        def children(node: LinOp) -> list[LinOp]:
+            if node.type in {"vstack", "hstack"} or node.args is None:
+                return []
+            return node.args
+
+        def combine(node: LinOp, arg_coeffs: list[TensorView]) -> TensorView:
+            return self.process_node(node, arg_coeffs, empty_view)
+
+        return traversal.fold_tree(lin_op, combine, children)
+
+    def process_node(self, lin_op: LinOp, arg_coeffs: list[TensorView],
+                     empty_view: TensorView) -> TensorView:
+        """
+        Parsing of a single linOp node, given the processed args.
 
         Parameters
         ----------
         lin_op: a node in the linOp tree.
+        arg_coeffs: the processed args of the node, as TensorViews.
         empty_view: TensorView used to create tensors for leaf nodes.
 
         Returns
@@ -246,8 +282,7 @@ class PythonCanonBackend(CanonBackend):
                 return func(lin_op, empty_view)
 
             res = None
-            for arg in lin_op.args:
-                arg_coeff = self.process_constraint(arg, empty_view)
+            for arg_coeff in arg_coeffs:
                 arg_res = func(lin_op, arg_coeff)
                 if res is None:
                     res = arg_res
@@ -1520,6 +1555,468 @@ class SciPyCanonBackend(PythonCanonBackend):
         return {Constant.ID.value: {parameter_id: param_vec}}
 
 
+def _ragged_arange(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Concatenates np.arange(start, start + count) for all pairs of starts and counts.
+    """
+    ends = np.cumsum(counts)
+    return np.arange(ends[-1] if len(ends) else 0) + np.repeat(starts - ends + counts, counts)
+
+
+def _join(left_keys: np.ndarray, right_keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns index arrays (i, j) enumerating all pairs with left_keys[i] == right_keys[j].
+    """
+    order = np.argsort(right_keys, kind="stable")
+    sorted_keys = right_keys[order]
+    starts = np.searchsorted(sorted_keys, left_keys, side="left")
+    counts = np.searchsorted(sorted_keys, left_keys, side="right") - starts
+    i = np.repeat(np.arange(len(left_keys)), counts)
+    j = order[_ragged_arange(starts, counts)]
+    return i, j
+
+
+def _unique_inverse(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Equivalent to np.unique(keys, return_inverse=True) for non-negative integer keys.
+    Keys from a range that is small relative to their number are labeled by counting
+    instead of sorting.
+    """
+    if len(keys) == 0:
+        return keys, keys
+    num_keys = int(keys.max()) + 1
+    if num_keys > 4 * len(keys):
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        return unique_keys, inverse.ravel()
+    present = np.zeros(num_keys, dtype=bool)
+    present[keys] = True
+    labels = np.cumsum(present) - 1
+    return np.flatnonzero(present), labels[keys]
+
+
+def _sum_duplicates(tensor: TensorRepresentation) -> TensorRepresentation:
+    """
+    Sums the entries of tensor that share a row, column and parameter offset.
+    Products of views repeat entries, which would otherwise accumulate over the
+    nodes of a LinOp tree.
+    """
+    if len(tensor.data) == 0:
+        return tensor
+    rows, cols = tensor.shape
+    num_slices = int(tensor.parameter_offset.max()) + 1
+    if float(num_slices) * rows * cols >= 2 ** 62:
+        # The linear index would overflow; duplicates are summed when flattening.
+        return tensor
+    keys = (tensor.parameter_offset.astype(np.int64) * cols + tensor.col) * rows + tensor.row
+    unique_keys, inverse = _unique_inverse(keys)
+    data = np.bincount(inverse, weights=tensor.data, minlength=len(unique_keys))
+    parameter_offset, keys = np.divmod(unique_keys, rows * cols)
+    col, row = np.divmod(keys, rows)
+    return TensorRepresentation(data, row, col, parameter_offset, tensor.shape)
+
+
+class COOCanonBackend(PythonCanonBackend):
+    """
+    Each TensorView holds a single set of COO triplets with an additional parameter offset per
+    entry, i.e., a TensorRepresentation of shape (rows, var_length + 1), with the columns already
+    offset by id_to_col and the parameter offsets by param_to_col. Constant data is represented
+    by a TensorRepresentation of the same form in the coordinates of the constant matrix.
+    Every LinOp is a vectorized transformation of the index arrays, with no loops over
+    variables or parameter slices.
+    """
+
+    @property
+    def constant_offset(self) -> int:
+        """
+        The parameter offset of the non-parametrized slice of the tensor.
+        """
+        return self.param_to_col[Constant.ID.value]
+
+    def get_constant_data(self, lin_op: LinOp, view: COOTensorView, column: bool) \
+            -> tuple[TensorRepresentation, bool]:
+        """
+        Extract the constant data from a LinOp node as a TensorRepresentation in the
+        coordinates of the (possibly parametrized) constant matrix.
+        """
+        # Fast path for constant data to prevent reshape into column vector.
+        constants = {"scalar_const", "dense_const", "sparse_const"}
+        if not column and lin_op.type in constants and len(lin_op.shape) == 2:
+            coo = self.get_constant_data_from_const(lin_op)
+            return TensorRepresentation(coo.data, coo.row, coo.col,
+                                        np.full(coo.nnz, self.constant_offset),
+                                        coo.shape), True
+
+        constant_view = self.process_constraint(lin_op, view)
+        assert constant_view.variable_ids == {Constant.ID.value}
+        if not column and len(lin_op.shape) >= 1:
+            lin_op_shape = lin_op.shape if len(lin_op.shape) == 2 else (1, lin_op.shape[0])
+        else:
+            lin_op_shape = (constant_view.rows, 1)
+        constant_data = self.reshape_constant_data(constant_view.tensor, lin_op_shape)
+        return constant_data, constant_view.is_parameter_free
+
+    @staticmethod
+    def get_constant_data_from_const(lin_op: LinOp) -> sp.coo_matrix:
+        """
+        Extract the constant data from a LinOp node of type "*_const".
+        """
+        constant = sp.coo_matrix(lin_op.data)
+        assert constant.shape == lin_op.shape
+        return constant
+
+    @staticmethod
+    def reshape_constant_data(constant_data: TensorRepresentation,
+                              lin_op_shape: tuple[int, int]) -> TensorRepresentation:
+        """
+        Reshape the rows of constant data, which index the constant in column-major order,
+        into the rows and columns of a matrix of shape lin_op_shape.
+        """
+        col, row = np.divmod(constant_data.row, lin_op_shape[0])
+        return TensorRepresentation(constant_data.data, row, col,
+                                    constant_data.parameter_offset, tuple(lin_op_shape))
+
+    @staticmethod
+    def _transpose(lhs: TensorRepresentation) -> TensorRepresentation:
+        return TensorRepresentation(lhs.data, lhs.col, lhs.row, lhs.parameter_offset,
+                                    (lhs.shape[1], lhs.shape[0]))
+
+    def get_empty_view(self) -> COOTensorView:
+        """
+        Returns an empty view of the corresponding COOTensorView subclass,
+        coupling the COOCanonBackend subclass with the COOTensorView subclass.
+        """
+        return COOTensorView.get_empty_view(self.param_size_plus_one, self.id_to_col,
+                                            self.param_to_size, self.param_to_col,
+                                            self.var_length)
+
+    @staticmethod
+    def _multiply(lhs: TensorRepresentation, is_param_free_lhs: bool, view: COOTensorView,
+                  lhs_idx: np.ndarray, x_idx: np.ndarray, rows: np.ndarray,
+                  total_rows: int) -> COOTensorView:
+        """
+        Replaces the tensor of view by the products of the entries lhs_idx of lhs with the
+        entries x_idx of the tensor, placed in rows.
+        When the lhs is parametrized, the products take the parameter offsets of the lhs,
+        otherwise those of the tensor.
+        """
+        x = view.tensor
+        parameter_offset = x.parameter_offset[x_idx] if is_param_free_lhs \
+            else lhs.parameter_offset[lhs_idx]
+        view.tensor = TensorRepresentation(lhs.data[lhs_idx] * x.data[x_idx], rows, x.col[x_idx],
+                                           parameter_offset, (total_rows, x.shape[1]))
+        view.is_parameter_free = view.is_parameter_free and is_param_free_lhs
+        return view
+
+    @staticmethod
+    def _contract(lhs: TensorRepresentation, lhs_outer: np.ndarray, num_lhs_outer: int,
+                  lhs_inner: np.ndarray, x: TensorRepresentation, x_outer: np.ndarray,
+                  num_x_outer: int, x_inner: np.ndarray, num_inner: int,
+                  is_param_free_lhs: bool) -> tuple[np.ndarray, ...]:
+        """
+        Sums the products of the entries of lhs and x with equal inner indices, using a single
+        sparse matrix product. The entries of lhs are labeled by their parameter offset and
+        lhs_outer, those of x by their parameter offset, x_outer and column.
+
+        Returns
+        -------
+        The data, lhs_outer, x_outer, column and parameter offset of the summed products.
+        """
+        num_cols = x.shape[1]
+        lhs_keys, lhs_labels = _unique_inverse(
+            lhs.parameter_offset.astype(np.int64) * num_lhs_outer + lhs_outer)
+        x_keys, x_labels = _unique_inverse(
+            (x.parameter_offset.astype(np.int64) * num_x_outer + x_outer) * num_cols + x.col)
+        lhs_matrix = sp.csr_matrix((lhs.data, (lhs_labels, lhs_inner)),
+                                   shape=(len(lhs_keys), num_inner))
+        x_matrix = sp.csr_matrix((x.data, (x_inner, x_labels)),
+                                 shape=(num_inner, len(x_keys)))
+        product = (lhs_matrix @ x_matrix).tocoo()
+        # Decode the (fewer) unique keys before expanding them to the products.
+        lhs_param, lhs_outer = np.divmod(lhs_keys, num_lhs_outer)
+        x_keys, col = np.divmod(x_keys, num_cols)
+        x_param, x_outer = np.divmod(x_keys, num_x_outer)
+        parameter_offset = x_param[product.col] if is_param_free_lhs \
+            else lhs_param[product.row]
+        return (product.data, lhs_outer[product.row], x_outer[product.col], col[product.col],
+                parameter_offset)
+
+    def _matmul(self, lhs: TensorRepresentation, is_param_free_lhs: bool,
+                view: COOTensorView) -> COOTensorView:
+        """
+        Multiply view with lhs from the left, where the rows of view are the columns of an
+        expression of shape (lhs.shape[1], reps), stacked in column-major order.
+        """
+        m, k = lhs.shape
+        reps = view.rows // k
+        block, inner = np.divmod(view.tensor.row, k)
+        data, lhs_row, block, col, parameter_offset = self._contract(
+            lhs, lhs.row, m, lhs.col, view.tensor, block, reps, inner, k, is_param_free_lhs)
+        view.tensor = TensorRepresentation(data, block * m + lhs_row, col, parameter_offset,
+                                           (reps * m, view.tensor.shape[1]))
+        view.is_parameter_free = view.is_parameter_free and is_param_free_lhs
+        return view
+
+    def mul(self, lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Multiply view with constant data from the left, i.e., apply kron(eye(reps), lhs)
+        to the rows of the view by joining the columns of lhs with the rows of the view.
+        """
+        lhs, is_param_free_lhs = self.get_constant_data(lin.data, view, column=False)
+        return self._matmul(lhs, is_param_free_lhs, view)
+
+    @staticmethod
+    def promote(lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Promote view by repeating along axis 0 (rows).
+        """
+        num_entries = int(np.prod(lin.shape))
+        view.select_rows(np.zeros(num_entries, dtype=int))
+        return view
+
+    def _elementwise(self, lhs: TensorRepresentation, is_param_free_lhs: bool,
+                     view: COOTensorView) -> COOTensorView:
+        lhs_idx, x_idx = _join(lhs.row, view.tensor.row)
+        return self._multiply(lhs, is_param_free_lhs, view, lhs_idx, x_idx,
+                              view.tensor.row[x_idx], view.rows)
+
+    def mul_elem(self, lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Given (A, b) in view and constant data d, return (A*d, b*d), joining the entries of
+        d with the rows of the view.
+        """
+        lhs, is_param_free_lhs = self.get_constant_data(lin.data, view, column=True)
+        return self._elementwise(lhs, is_param_free_lhs, view)
+
+    @staticmethod
+    def sum_entries(_lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Given (A, b) in view, return (sum(A,axis=0), sum(b, axis=0)).
+        """
+        def func(x):
+            return _sum_duplicates(TensorRepresentation(
+                x.data, np.zeros_like(x.row), x.col, x.parameter_offset, (1, x.shape[1])))
+
+        view.apply_all(func)
+        return view
+
+    def div(self, lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Given (A, b) in view and constant data d, return (A*(1/d), b*(1/d)).
+
+        Note: div currently doesn't support parameters.
+        """
+        lhs, is_param_free_lhs = self.get_constant_data(lin.data, view, column=True)
+        assert is_param_free_lhs
+        # dtype is important here, will do integer division if data is of dtype "int" otherwise.
+        lhs.data = np.reciprocal(lhs.data, dtype=float)
+        return self._elementwise(lhs, is_param_free_lhs, view)
+
+    @staticmethod
+    def diag_vec(lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Diagonal vector to matrix. Given (A, b) with n rows in view, move the rows to the
+        diagonal entries of the n x n expression.
+        An optional offset parameter `k` can be specified, with k>0 for diagonals above
+        the main diagonal, and k<0 for diagonals below the main diagonal.
+        """
+        assert lin.shape[0] == lin.shape[1]
+        k = lin.data
+        rows = lin.shape[0]
+        total_rows = int(lin.shape[0] ** 2)
+
+        def func(x):
+            if k == 0:
+                new_rows = x.row * (rows + 1)
+            elif k > 0:
+                new_rows = x.row * (rows + 1) + rows * k
+            else:
+                new_rows = x.row * (rows + 1) - k
+            return TensorRepresentation(x.data, new_rows, x.col, x.parameter_offset,
+                                        (total_rows, x.shape[1]))
+
+        view.apply_all(func)
+        return view
+
+    @staticmethod
+    def get_stack_func(total_rows: int, offset: int) -> Callable:
+        """
+        Returns a function that takes in a tensor, modifies the shape of the tensor by extending
+        it to total_rows, and then shifts the entries by offset along axis 0.
+        """
+        def stack_func(tensor):
+            return TensorRepresentation(tensor.data, tensor.row + offset, tensor.col,
+                                        tensor.parameter_offset, (total_rows, tensor.shape[1]))
+
+        return stack_func
+
+    def rmul(self, lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Multiply view with constant data from the right, i.e., apply kron(lhs.T, eye(reps))
+        to the rows of the view by joining the rows of lhs with the columns of the expression.
+
+        Note: Even though this is rmul, we still use "lhs", for consistency with the other
+        backends.
+        """
+        lhs, is_param_free_lhs = self.get_constant_data(lin.data, view, column=False)
+
+        arg_cols = lin.args[0].shape[0] if len(lin.args[0].shape) == 1 else lin.args[0].shape[1]
+        if len(lin.data.shape) == 1 and arg_cols != lhs.shape[0]:
+            # Example: (n,n) @ (n,), we need to interpret the rhs as a column vector,
+            # but it is a row vector by default, so we need to transpose
+            lhs = self._transpose(lhs)
+
+        k, n = lhs.shape
+        reps = view.rows // k
+        block, inner = np.divmod(view.tensor.row, reps)
+        data, lhs_col, inner, col, parameter_offset = self._contract(
+            lhs, lhs.col, n, lhs.row, view.tensor, inner, reps, block, k, is_param_free_lhs)
+        view.tensor = TensorRepresentation(data, lhs_col * reps + inner, col, parameter_offset,
+                                           (reps * n, view.tensor.shape[1]))
+        view.is_parameter_free = view.is_parameter_free and is_param_free_lhs
+        return view
+
+    @staticmethod
+    def trace(lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Select the rows corresponding to the diagonal entries in the expression and sum along
+        axis 0.
+        """
+        n = lin.args[0].shape[0]
+
+        def func(x):
+            mask = x.row % (n + 1) == 0
+            return _sum_duplicates(TensorRepresentation(
+                x.data[mask], np.zeros(np.count_nonzero(mask), dtype=int), x.col[mask],
+                x.parameter_offset[mask], (1, x.shape[1])))
+
+        view.apply_all(func)
+        return view
+
+    def conv(self, lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Returns view corresponding to a discrete convolution with data 'a', i.e., multiplying from
+        the left a repetition of the column vector of 'a' for each column in A, shifted down one row
+        after each column, i.e., a Toeplitz matrix.
+        If lin_data is a row vector, we must transform the lhs to become a column vector before
+        applying the convolution.
+
+        Note: conv currently doesn't support parameters.
+        """
+        lhs, is_param_free_lhs = self.get_constant_data(lin.data, view, column=False)
+        assert is_param_free_lhs, \
+            "COO backend does not support parametrized left operand for conv."
+        assert view.is_parameter_free, \
+            "COO backend does not support parametrized right operand for conv."
+        if len(lin.data.shape) == 1:
+            lhs = self._transpose(lhs)
+
+        rows = lin.shape[0]
+        cols = lin.args[0].shape[0] if len(lin.args[0].shape) > 0 else 1
+        nnz = len(lhs.data)
+        shifts = np.repeat(np.arange(cols), nnz)
+        toeplitz = TensorRepresentation(np.tile(lhs.data, cols), np.tile(lhs.row, cols) + shifts,
+                                        np.tile(lhs.col, cols) + shifts,
+                                        np.tile(lhs.parameter_offset, cols), (rows, cols))
+        return self._matmul(toeplitz, is_param_free_lhs, view)
+
+    def _kron(self, const: TensorRepresentation, view: COOTensorView, const_first: bool,
+              row_idx: np.ndarray) -> COOTensorView:
+        """
+        Returns view corresponding to kron(const, x) if const_first and kron(x, const)
+        otherwise, with the rows reordered by row_idx.
+        """
+        x_rows = view.rows
+        const_rows = const.shape[0]
+        const_idx = np.repeat(np.arange(len(const.data)), len(view.tensor.data))
+        x_idx = np.tile(np.arange(len(view.tensor.data)), len(const.data))
+        if const_first:
+            rows = const.row[const_idx] * x_rows + view.tensor.row[x_idx]
+        else:
+            rows = view.tensor.row[x_idx] * const_rows + const.row[const_idx]
+        view = self._multiply(const, True, view, const_idx, x_idx, rows, const_rows * x_rows)
+        view.select_rows(row_idx)
+        return view
+
+    def kron_r(self, lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Returns view corresponding to Kronecker product of data 'a' with view x, i.e., kron(a,x).
+        This function reshapes 'a' into a column vector, computes the Kronecker product with the
+        view of x and reorders the row indices afterwards.
+
+        Note: kron_r currently doesn't support parameters.
+        """
+        lhs, is_param_free_lhs = self.get_constant_data(lin.data, view, column=True)
+        assert is_param_free_lhs, \
+            "COO backend does not support parametrized left operand for kron_r."
+        assert view.is_parameter_free, \
+            "COO backend does not support parametrized right operand for kron_r."
+        assert len({arg.shape for arg in lin.args}) == 1
+        row_idx = self._get_kron_row_indices(lin.data.shape, lin.args[0].shape)
+        return self._kron(lhs, view, True, row_idx)
+
+    def kron_l(self, lin: LinOp, view: COOTensorView) -> COOTensorView:
+        """
+        Returns view corresponding to Kronecker product of view x with data 'a', i.e., kron(x,a).
+        This function reshapes 'a' into a column vector, computes the Kronecker product with the
+        view of x and reorders the row indices afterwards.
+
+        Note: kron_l currently doesn't support parameters.
+        """
+        rhs, is_param_free_rhs = self.get_constant_data(lin.data, view, column=True)
+        assert is_param_free_rhs, \
+            "COO backend does not support parametrized right operand for kron_l."
+        assert view.is_parameter_free, \
+            "COO backend does not support parametrized left operand for kron_l."
+        assert len({arg.shape for arg in lin.args}) == 1
+        row_idx = self._get_kron_row_indices(lin.args[0].shape, lin.data.shape)
+        return self._kron(rhs, view, False, row_idx)
+
+    def get_variable_tensor(self, shape: tuple[int, ...], variable_id: int) \
+            -> TensorRepresentation:
+        """
+        Returns tensor of a variable node, i.e., eye(n) across axes 0 and 1, where n is
+        the size of the variable, offset by the column of the variable.
+        """
+        assert variable_id != Constant.ID
+        n = int(np.prod(shape))
+        rows = np.arange(n)
+        return TensorRepresentation(np.ones(n), rows, rows + self.id_to_col[variable_id],
+                                    np.full(n, self.constant_offset),
+                                    (n, self.var_length + 1))
+
+    def get_data_tensor(self, data: np.ndarray | sp.spmatrix) -> TensorRepresentation:
+        """
+        Returns tensor of constant node as a column vector, in the column of the constant
+        offset.
+        """
+        if sp.issparse(data):
+            coo = sp.coo_matrix(data)
+            n = int(np.prod(coo.shape))
+            rows = coo.row.astype(np.int64) + coo.col.astype(np.int64) * coo.shape[0]
+            values = coo.data
+        else:
+            flat = np.asarray(data).flatten(order="F")
+            n = flat.size
+            rows = np.flatnonzero(flat)
+            values = flat[rows]
+        return TensorRepresentation(values, rows, np.full(len(rows), self.var_length),
+                                    np.full(len(rows), self.constant_offset),
+                                    (n, self.var_length + 1))
+
+    def get_param_tensor(self, shape: tuple[int, ...], parameter_id: int) \
+            -> TensorRepresentation:
+        """
+        Returns tensor of a parameter node, i.e., eye(n) across axes 0 and 2, where n is
+        the size of the parameter, offset by the parameter offset of the parameter.
+        """
+        assert parameter_id != Constant.ID
+        n = int(np.prod(shape))
+        rows = np.arange(n)
+        return TensorRepresentation(np.ones(n), rows, np.full(n, self.var_length),
+                                    rows + self.param_to_col[parameter_id],
+                                    (n, self.var_length + 1))
+
+
 class TensorView(ABC):
     """
     A TensorView represents the tensors for A and b, which are of shape
@@ -1898,3 +2395,74 @@ class SciPyTensorView(DictTensorView):
         sparse matrix instead of smaller sparse matrices in a list.
         """
         return sp.spmatrix
+
+
+class COOTensorView(TensorView):
+    """
+    The tensor of a COOTensorView is a single TensorRepresentation of shape
+    (rows, var_length + 1), whose columns and parameter offsets are those of the final
+    tensor.
+    """
+
+    @property
+    def rows(self) -> int:
+        """
+        Number of rows of the TensorView.
+        """
+        if self.tensor is not None:
+            return self.tensor.shape[0]
+        else:
+            raise ValueError('Tensor cannot be None')
+
+    @staticmethod
+    def combine_potentially_none(a: TensorRepresentation | None,
+                                 b: TensorRepresentation | None) \
+            -> TensorRepresentation | None:
+        """
+        Adds the tensor a to b if they are both not none.
+        If a (b) is not None but b (a) is None, returns a (b).
+        Returns None if both a and b are None.
+        """
+        if a is None:
+            return b
+        elif b is None:
+            return a
+        else:
+            return a + b
+
+    def get_tensor_representation(self, row_offset: int, total_rows: int) -> TensorRepresentation:
+        """
+        Returns a TensorRepresentation of [A b] tensor, which only requires offsetting the rows.
+        """
+        assert self.tensor is not None
+        return TensorRepresentation(self.tensor.data, self.tensor.row + row_offset,
+                                    self.tensor.col, self.tensor.parameter_offset,
+                                    (total_rows, self.var_length + 1))
+
+    def select_rows(self, rows: np.ndarray) -> None:
+        """
+        Select 'rows' from tensor, joining the rows of the entries with 'rows'. Rows
+        that are selected more than once have their entries repeated.
+        """
+        def func(x):
+            x_idx, new_rows = _join(x.row, np.asarray(rows))
+            return TensorRepresentation(x.data[x_idx], new_rows, x.col[x_idx],
+                                        x.parameter_offset[x_idx], (len(rows), x.shape[1]))
+
+        self.apply_all(func)
+
+    def apply_all(self, func: Callable) -> None:
+        """
+        Apply 'func' to the tensor, which holds all variables and parameter slices.
+        """
+        self.tensor = func(self.tensor)
+
+    def create_new_tensor_view(self, variable_ids: set[int], tensor: Any,
+                               is_parameter_free: bool) -> COOTensorView:
+        """
+        Create new COOTensorView with same shape information as self,
+        but new tensor data.
+        """
+        return COOTensorView(variable_ids, tensor, is_parameter_free, self.param_size_plus_one,
+                             self.id_to_col, self.param_to_size, self.param_to_col,
+                             self.var_length)
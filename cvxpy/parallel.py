@@ -0,0 +1,162 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import cvxpy.settings as s
+from cvxpy.problems.problem import Problem
+
+PROCESS_BACKEND = "process"
+THREAD_BACKEND = "thread"
+BACKENDS = [PROCESS_BACKEND, THREAD_BACKEND]
+
+
+def solve_many(problems_or_param_sets,
+               n_workers: int | None = None,
+               backend: str = PROCESS_BACKEND,
+               solver: str | None = None,
+               verbose: bool = False,
+               enforce_dpp: bool = False,
+               canon_backend: str | None = None,
+               **kwargs):
+    """Solves many problems, or one problem for many parameter values, in parallel.
+
+    Compilation happens in the calling process. Only the compiled solver
+    data (e.g., ``A``, ``b``, ``c`` and the cone dimensions) and the data
+    needed to invert the solver's output are sent to the workers, which
+    invoke the numerical solver; the expression trees of the problems are
+    never shipped.
+
+    Arguments
+    ---------
+    problems_or_param_sets : list of Problem, or tuple of (Problem, param_values)
+        Either a list of problems to solve, or a pair of a DPP problem and a
+        batch of parameter values, in any format accepted by
+        :meth:`~cvxpy.problems.problem.Problem.solve_batch`.
+    n_workers : int, optional
+        The number of workers; defaults to the number of CPUs.
+    backend : str, optional
+        ``"process"`` (default) to solve in a pool of worker processes, or
+        ``"thread"`` to solve in a pool of threads. Threads avoid the cost of
+        sending the problem data to other processes, and scale with the
+        number of cores for solvers that release the GIL.
+    solver : str, optional
+        The solver to use.
+    verbose : bool, optional
+        Overrides the default of hiding solver output.
+    enforce_dpp : bool, optional
+        When True, a DPPError will be thrown when trying to solve a non-DPP
+        problem (instead of just a warning).
+    canon_backend : str, optional
+        'CPP' (default) | 'SCIPY' | 'COO'
+        Specifies which backend to use for canonicalization.
+    kwargs : dict, optional
+        A dict of options that will be passed to the specific solver.
+
+    Returns
+    -------
+    list
+        When given a list of problems, the optimal values of the problems,
+        whose status, value and variables are populated as by ``solve()``.
+        When given a problem and parameter values, a list of
+        :class:`~cvxpy.problems.problem.SolveResult`, as returned by
+        ``solve_batch()``.
+    """
+    if backend not in BACKENDS:
+        raise ValueError("Unknown parallel backend '%s'; expected one of %s."
+                         % (backend, BACKENDS))
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if _is_param_set(problems_or_param_sets):
+        problem, param_values = problems_or_param_sets
+        solving_chain, batch_data = problem._get_batch_problem_data(
+            param_values, solver, enforce_dpp, verbose, canon_backend, kwargs)
+        chains = [solving_chain] * len(batch_data)
+    else:
+        problems = list(problems_or_param_sets)
+        chains, batch_data = [], []
+        for problem in problems:
+            data, solving_chain, inverse_data = problem.get_problem_data(
+                solver, enforce_dpp=enforce_dpp, verbose=verbose,
+                canon_backend=canon_backend, solver_opts=kwargs)
+            chains.append(solving_chain)
+            batch_data.append((data, inverse_data))
+
+    tasks = [
+        (chain.solver, _strip_param_prob(data), inverse_data[-1], verbose, kwargs,
+         backend == PROCESS_BACKEND)
+        for chain, (data, inverse_data) in zip(chains, batch_data)
+    ]
+    executor_cls = ProcessPoolExecutor if backend == PROCESS_BACKEND \
+        else ThreadPoolExecutor
+    with executor_cls(max_workers=n_workers) as executor:
+        outputs = list(executor.map(_solve_task, *zip(*tasks)))
+
+    results = []
+    for index, (solution, solve_time) in enumerate(outputs):
+        chain = chains[index]
+        inverse_data = batch_data[index][1]
+        # The solver's own inversion already ran in the worker.
+        for reduction, inv in reversed(
+                list(zip(chain.reductions[:-1], inverse_data[:-1]))):
+            solution = reduction.invert(solution, inv)
+        if _is_param_set(problems_or_param_sets):
+            results.append(Problem._batch_result(solution))
+        else:
+            problem = problems[index]
+            problem._solve_time = solve_time
+            problem._unpack_inverted(solution, chain.solver.name())
+            results.append(problem.value)
+    return results
+
+
+def _is_param_set(problems_or_param_sets) -> bool:
+    return (isinstance(problems_or_param_sets, tuple)
+            and len(problems_or_param_sets) == 2
+            and isinstance(problems_or_param_sets[0], Problem)
+            and not isinstance(problems_or_param_sets[1], Problem))
+
+
+def _strip_param_prob(data):
+    """Drops the parameterized program, which holds the expression tree."""
+    if isinstance(data, dict) and s.PARAM_PROB in data:
+        data = {key: value for key, value in data.items() if key != s.PARAM_PROB}
+    return data
+
+
+def _solve_task(solver, data, solver_inverse_data, verbose, solver_opts,
+                needs_pickling):
+    """Invokes the solver on compiled data and inverts the solver's output.
+
+    Runs in a worker. Returns the solution to the solver's input problem and
+    the time spent in the solver interface.
+    """
+    start = time.time()
+    raw_solution = solver.solve_via_data(data, False, verbose, solver_opts, {})
+    solve_time = time.time() - start
+    solution = solver.invert(raw_solution, solver_inverse_data)
+    if needs_pickling and s.EXTRA_STATS in solution.attr:
+        # Some solvers return native result objects that cannot be sent
+        # back to the parent process.
+        try:
+            pickle.dumps(solution.attr[s.EXTRA_STATS])
+        except (pickle.PicklingError, TypeError, AttributeError):
+            del solution.attr[s.EXTRA_STATS]
+    return solution, solve_time
@@ -15,6 +15,8 @@ limitations under the License.
 """
 import abc
 
+import numpy as np
+
 
 class ParamProb:
     """An abstract base class for parameterized problems.
@@ -42,3 +44,156 @@ class ParamProb:
                         parameters are affected
         """
         raise NotImplementedError()
+
+    def apply_parameters_batch(self, id_to_param_values, batch_size: int,
+                               keep_zeros: bool = False):
+        """Applies a batch of parameter assignments at once.
+
+        Args:
+          id_to_param_values: dict mapping parameter ids to arrays of values
+                              with a leading batch axis of length batch_size
+          batch_size: the number of parameter assignments
+          keep_zeros: (optional) if True, store explicit zeros in A where
+                        parameters are affected
+
+        Returns:
+          A list with one apply_parameters result per assignment.
+        """
+        raise NotImplementedError()
+
+
+class ParamProbBatch:
+    """A batch of parameter assignments for a parameterized problem.
+
+    The problem data for every assignment is computed lazily, with a
+    single product of the parameter tensors and the stacked parameter
+    vectors, and is cached per combination of keyword arguments to
+    apply_parameters.
+
+    Attributes
+    ----------
+    param_prog : ParamProb
+        The parameterized problem.
+    id_to_param_values : dict
+        Map from parameter id to values with a leading batch axis.
+    batch_size : int
+        The number of parameter assignments.
+    """
+
+    def __init__(self, param_prog, id_to_param_values, batch_size: int) -> None:
+        self.param_prog = param_prog
+        self.id_to_param_values = id_to_param_values
+        self.batch_size = batch_size
+        self._applied = {}
+
+    def applied(self, **kwargs):
+        """Returns the list of apply_parameters results for the batch."""
+        key = tuple(sorted(kwargs.items()))
+        if key not in self._applied:
+            self._applied[key] = self.param_prog.apply_parameters_batch(
+                self.id_to_param_values, self.batch_size, **kwargs)
+        return self._applied[key]
+
+    def instance(self, index: int) -> "ParamProbInstance":
+        """Returns a view of the parameterized problem for one assignment."""
+        return ParamProbInstance(self, index)
+
+
+class ParamProbInstance:
+    """A view of a parameterized problem bound to one assignment of a batch.
+
+    Solver interfaces can apply this view exactly like the parameterized
+    problem itself; apply_parameters returns the data for the bound
+    assignment instead of reading the values of the Parameter objects.
+    """
+
+    def __init__(self, batch: ParamProbBatch, index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    def __getattr__(self, name):
+        if name == '_batch':
+            raise AttributeError(name)
+        return getattr(self._batch.param_prog, name)
+
+    def apply_parameters(self, id_to_param_value=None, zero_offset: bool = False,
+                         **kwargs):
+        if id_to_param_value is not None or zero_offset:
+            return self._batch.param_prog.apply_parameters(
+                id_to_param_value, zero_offset, **kwargs)
+        return self._batch.applied(**kwargs)[self._index]
+
+
+class RemappedParamProb:
+    """A view of a parameterized problem compiled for a template problem.
+
+    The view reads parameter values from, and reports results in terms of
+    the ids of, a structurally identical problem whose leaves correspond to
+    the template's leaves (see cvxpy.reductions.template_remap).
+
+    Parameters
+    ----------
+    param_prog : ParamProb
+        The parameterized problem of the template.
+    leaf_map : dict
+        Map from the ids of the template's leaves to the corresponding leaves.
+    """
+
+    def __init__(self, param_prog, leaf_map) -> None:
+        self._param_prog = param_prog
+        self._leaf_map = leaf_map
+        self._to_template = {leaf.id: template_id
+                             for template_id, leaf in leaf_map.items()}
+
+    def __getattr__(self, name):
+        if name in ('_param_prog', '_leaf_map', '_to_template'):
+            raise AttributeError(name)
+        return getattr(self._param_prog, name)
+
+    @property
+    def parameters(self):
+        return [self._leaf_map[param.id]
+                for param in self._param_prog.parameters]
+
+    def _template_keys(self, id_to_value):
+        return {self._to_template[leaf_id]: value
+                for leaf_id, value in id_to_value.items()}
+
+    def _leaf_keys(self, template_id_to_value):
+        return {self._leaf_map[template_id].id
+                if template_id in self._leaf_map else template_id: value
+                for template_id, value in template_id_to_value.items()}
+
+    def apply_parameters(self, id_to_param_value=None, zero_offset: bool = False,
+                         **kwargs):
+        if id_to_param_value is None:
+            id_to_param_value = {param.id: np.array(param.value)
+                                 for param in self.parameters}
+        return self._param_prog.apply_parameters(
+            self._template_keys(id_to_param_value), zero_offset, **kwargs)
+
+    def apply_parameters_batch(self, id_to_param_values, batch_size: int,
+                               **kwargs):
+        return self._param_prog.apply_parameters_batch(
+            self._template_keys(id_to_param_values), batch_size, **kwargs)
+
+    def apply_param_jac(self, *args, active_params=None, **kwargs):
+        if active_params is not None:
+            active_params = {self._to_template[pid] for pid in active_params}
+        return self._leaf_keys(self._param_prog.apply_param_jac(
+            *args, active_params=active_params, **kwargs))
+
+    def apply_param_jac_batch(self, *args, active_params=None, **kwargs):
+        if active_params is not None:
+            active_params = {self._to_template[pid] for pid in active_params}
+        return self._leaf_keys(self._param_prog.apply_param_jac_batch(
+            *args, active_params=active_params, **kwargs))
+
+    def split_solution(self, sltn, active_vars=None):
+        if active_vars is not None:
+            active_vars = [self._to_template[vid] for vid in active_vars]
+        return self._leaf_keys(
+            self._param_prog.split_solution(sltn, active_vars))
+
+    def split_adjoint(self, del_vars=None):
+        return self._param_prog.split_adjoint(self._template_keys(del_vars))
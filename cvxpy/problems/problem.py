@@ -18,6 +18,7 @@ from __future__ import annotations
 import time
 import warnings
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Union
 
@@ -35,12 +36,18 @@ from cvxpy.expressions import cvxtypes
 from cvxpy.expressions.variable import Variable
 from cvxpy.interface.matrix_utilities import scalar_value
 from cvxpy.problems.objective import Maximize, Minimize
+from cvxpy.problems.param_prob import ParamProbBatch, RemappedParamProb
 from cvxpy.reductions import InverseData
 from cvxpy.reductions.chain import Chain
+from cvxpy.reductions.compilation_cache import (
+    CompiledProblem,
+    get_compiled_problem_cache,
+)
 from cvxpy.reductions.dgp2dcp.dgp2dcp import Dgp2Dcp
 from cvxpy.reductions.dqcp2dcp import dqcp2dcp
 from cvxpy.reductions.eval_params import EvalParams
 from cvxpy.reductions.flip_objective import FlipObjective
+from cvxpy.reductions.incremental import IncrementalCompilation
 from cvxpy.reductions.solution import INF_OR_UNB_MESSAGE
 from cvxpy.reductions.solvers import bisection
 from cvxpy.reductions.solvers import defines as slv_def
@@ -52,9 +59,15 @@ from cvxpy.reductions.solvers.solving_chain import (
     SolvingChain,
     construct_solving_chain,
 )
+from cvxpy.reductions.template_remap import TemplateRemap
+from cvxpy.reductions.warm_start_store import get_warm_start_store
 from cvxpy.settings import SOLVERS
-from cvxpy.utilities import debug_tools
+from cvxpy.utilities import debug_tools, profiling
 from cvxpy.utilities.deterministic import unique_list
+from cvxpy.utilities.fingerprint import (
+    structural_fingerprint,
+    structural_fingerprint_and_leaves,
+)
 
 SolveResult = namedtuple(
     'SolveResult',
@@ -100,12 +113,14 @@ class Cache:
         self.solving_chain: Optional[SolvingChain] = None
         self.param_prog = None
         self.inverse_data: Optional[InverseData] = None
+        self.fingerprint: Optional[str] = None
 
     def invalidate(self) -> None:
         self.key = None
         self.solving_chain = None
         self.param_prog = None
         self.inverse_data = None
+        self.fingerprint = None
 
     def make_key(self, solver, gp, ignore_dpp, use_quad_obj):
         return (solver, gp, ignore_dpp, use_quad_obj)
@@ -169,6 +184,8 @@ class Problem(u.Canonical):
         self._solution = None
         self._cache = Cache()
         self._solver_cache = {}
+        # The memos shared with the problems built by add_constraints.
+        self._incremental: Optional[IncrementalCompilation] = None
         # Information about the shape of the problem and its constituent parts
         self._size_metrics: Optional["SizeMetrics"] = None
         # Benchmarks reported by the solver:
@@ -220,6 +237,39 @@ class Problem(u.Canonical):
         """
         return self._constraints[:]
 
+    def add_constraints(self, *constraints: Constraint) -> "Problem":
+        """Returns a copy of the problem with the given constraints appended.
+
+        Problems are immutable, so this method builds a new problem, but the
+        new problem is compiled incrementally: the canonicalization of the
+        constraints of this problem, and their rows in the problem data, are
+        reused, and only the appended constraints are canonicalized and
+        stuffed. This makes loops that add a few constraints per iteration,
+        such as cutting-plane and column generation methods, much cheaper
+        than building each problem from scratch.
+
+        The work of compiling this problem is only reused if this problem
+        was itself built by add_constraints, or was compiled after
+        add_constraints was first called on it.
+
+        Arguments
+        ---------
+        *constraints : Constraint
+            The constraints to append.
+
+        Returns
+        -------
+        Problem
+            A problem with the objective of this problem and its
+            constraints followed by the given constraints.
+        """
+        if self._incremental is None:
+            self._incremental = IncrementalCompilation()
+        problem = Problem(self._objective,
+                          self._constraints + list(constraints))
+        problem._incremental = self._incremental
+        return problem
+
     @property
     def param_dict(self):
         """
@@ -602,7 +652,7 @@ class Problem(u.Canonical):
             When True, DPP problems will be treated as non-DPP,
             which may speed up compilation. Defaults to False.
         canon_backend : str, optional
-            'CPP' (default) | 'SCIPY'
+            'CPP' (default) | 'SCIPY' | 'COO'
             Specifies which backend to use for canonicalization, which can affect
             compilation time. Defaults to None, i.e., selecting the default
             backend.
@@ -641,19 +691,23 @@ class Problem(u.Canonical):
         else:
             use_quad_obj = solver_opts.get('use_quad_obj', None)
         key = self._cache.make_key(solver, gp, ignore_dpp, use_quad_obj)
+        compiled_key, leaves = None, None
         if key != self._cache.key:
             self._cache.invalidate()
-            solving_chain = self._construct_chain(
-                solver=solver, gp=gp,
-                enforce_dpp=enforce_dpp,
-                ignore_dpp=ignore_dpp,
-                canon_backend=canon_backend,
-                solver_opts=solver_opts)
+            compiled_key, leaves = self._compiled_problem_key(key)
+            if not self._load_compiled_problem(compiled_key, leaves):
+                with profiling.span('construct_chain'):
+                    self._cache.solving_chain = self._construct_chain(
+                        solver=solver, gp=gp,
+                        enforce_dpp=enforce_dpp,
+                        ignore_dpp=ignore_dpp,
+                        canon_backend=canon_backend,
+                        solver_opts=solver_opts)
+                if self._incremental is not None:
+                    self._incremental.attach(self._cache.solving_chain)
             self._cache.key = key
-            self._cache.solving_chain = solving_chain
             self._solver_cache = {}
-        else:
-            solving_chain = self._cache.solving_chain
+        solving_chain = self._cache.solving_chain
 
         if verbose:
             print(_COMPILATION_STR)
@@ -677,8 +731,9 @@ class Problem(u.Canonical):
                         old_params_to_new_params[param].value = np.log(
                             param.value)
 
-            data, solver_inverse_data = solving_chain.solver.apply(
-                self._cache.param_prog)
+            with profiling.span(type(solving_chain.solver).__name__):
+                data, solver_inverse_data = solving_chain.solver.apply(
+                    self._cache.param_prog)
             inverse_data = self._cache.inverse_data + [solver_inverse_data]
             self._compilation_time = time.time() - start
             if verbose:
@@ -714,8 +769,77 @@ class Problem(u.Canonical):
                 # the last datum in inverse_data corresponds to the solver,
                 # so we shouldn't cache it
                 self._cache.inverse_data = inverse_data[:-1]
+                if compiled_key is not None:
+                    get_compiled_problem_cache().put(compiled_key, CompiledProblem(
+                        TemplateRemap(self, leaves), solving_chain,
+                        self._cache.param_prog, self._cache.inverse_data))
         return data, solving_chain, inverse_data
 
+    def _compiled_problem_key(self, key):
+        """Returns the key of the problem in the process-wide cache of
+        compiled problems, and the leaves of the problem.
+
+        Returns (None, None) if the cache is disabled or the compilation
+        cannot be shared, as for DGP problems, whose compilation introduces
+        parameters that depend on the problem's own parameters.
+        """
+        if get_compiled_problem_cache() is None or key[1]:
+            return None, None
+        fingerprint, leaves = structural_fingerprint_and_leaves(self)
+        self._cache.fingerprint = fingerprint
+        return (fingerprint, key), leaves
+
+    def _load_compiled_problem(self, compiled_key, leaves) -> bool:
+        """Reuses the compilation of a structurally identical problem.
+
+        Returns True if a compilation was found in the process-wide cache of
+        compiled problems.
+        """
+        if compiled_key is None:
+            return False
+        compiled = get_compiled_problem_cache().get(compiled_key)
+        if compiled is None:
+            return False
+        remap = compiled.remap
+        self._cache.solving_chain = SolvingChain(
+            reductions=[remap] + compiled.solving_chain.reductions)
+        self._cache.param_prog = RemappedParamProb(
+            compiled.param_prog, remap.leaf_map(leaves))
+        self._cache.inverse_data = [remap.id_maps(leaves, self.constraints)] + \
+            compiled.inverse_data
+        return True
+
+    def _warm_start_store_key(self, solving_chain):
+        """Returns the key of the problem's warm-start state in the
+        process-wide warm-start store, or None if no store is set.
+
+        The state of DIFFCP is never shared, because it holds the derivative
+        of the solution map of the problem for backward().
+        """
+        if get_warm_start_store() is None or self._cache.key is None or \
+                solving_chain.solver.name() == s.DIFFCP:
+            return None
+        if self._cache.fingerprint is None:
+            self._cache.fingerprint = structural_fingerprint(self)
+        return (self._cache.fingerprint, self._cache.key,
+                solving_chain.solver.name())
+
+    def _take_warm_start(self, store_key, solving_chain) -> None:
+        """Moves the warm-start state of a structurally identical problem
+        from the warm-start store into the solver cache."""
+        name = solving_chain.solver.name()
+        if name not in self._solver_cache:
+            entry = get_warm_start_store().take(store_key)
+            if entry is not None:
+                self._solver_cache[name] = entry
+
+    def _put_warm_start(self, store_key, solving_chain) -> None:
+        """Moves the warm-start state of the solver cache to the warm-start
+        store, which then owns it."""
+        name = solving_chain.solver.name()
+        if name in self._solver_cache:
+            get_warm_start_store().put(store_key, self._solver_cache.pop(name))
+
     def _find_candidate_solvers(self,
                                 solver=None,
                                 gp: bool = False):
@@ -882,7 +1006,7 @@ class Problem(u.Canonical):
             When True, DPP problems will be treated as non-DPP,
             which may speed up compilation. Defaults to False.
         canon_backend : str, optional
-            'CPP' (default) | 'SCIPY'
+            'CPP' (default) | 'SCIPY' | 'COO'
             Specifies which backend to use for canonicalization, which can affect
             compilation time. Defaults to None, i.e., selecting the default
             backend.
@@ -971,7 +1095,7 @@ class Problem(u.Canonical):
             When True, DPP problems will be treated as non-DPP,
             which may speed up compilation. Defaults to False.
         canon_backend : str, optional
-            'CPP' (default) | 'SCIPY'
+            'CPP' (default) | 'SCIPY' | 'COO'
             Specifies which backend to use for canonicalization, which can affect
             compilation time. Defaults to None, i.e., selecting the default
             backend.
@@ -1070,9 +1194,11 @@ class Problem(u.Canonical):
                 self.unpack(chain.retrieve(soln))
                 return self.value
 
-        data, solving_chain, inverse_data = self.get_problem_data(
-            solver, gp, enforce_dpp, ignore_dpp, verbose, canon_backend, kwargs
-        )
+        with profiling.span('compilation'):
+            data, solving_chain, inverse_data = self.get_problem_data(
+                solver, gp, enforce_dpp, ignore_dpp, verbose, canon_backend,
+                kwargs
+            )
 
         if verbose:
             print(_NUM_SOLVER_STR)
@@ -1083,11 +1209,18 @@ class Problem(u.Canonical):
         solver_verbose = kwargs.pop('solver_verbose', verbose)
         if solver_verbose and (not verbose):
             print(_NUM_SOLVER_STR)
-        solution = solving_chain.solve_via_data(
-            self, data, warm_start, solver_verbose, kwargs)
+        store_key = self._warm_start_store_key(solving_chain)
+        if store_key is not None:
+            self._take_warm_start(store_key, solving_chain)
+        with profiling.span('solve_via_data'):
+            solution = solving_chain.solve_via_data(
+                self, data, warm_start, solver_verbose, kwargs)
+        if store_key is not None:
+            self._put_warm_start(store_key, solving_chain)
         end = time.time()
         self._solve_time = end - start
-        self.unpack_results(solution, solving_chain, inverse_data)
+        with profiling.span('unpack_results'):
+            self.unpack_results(solution, solving_chain, inverse_data)
         if verbose:
             print(_FOOTER)
             s.LOGGER.info('Problem status: %s', self.status)
@@ -1099,6 +1232,195 @@ class Problem(u.Canonical):
                     '%.3e seconds', self._solve_time)
         return self.value
 
+    def solve_batch(self,
+                    param_values,
+                    solver: str = None,
+                    warm_start: bool = True,
+                    verbose: bool = False,
+                    enforce_dpp: bool = False,
+                    canon_backend: str | None = None,
+                    **kwargs) -> List[SolveResult]:
+        """Solves the problem for many assignments of its Parameters.
+
+        The problem is compiled once; the parameter assignments are then
+        stacked into a single matrix and applied to the cached parameterized
+        program with one sparse product, after which the solver is invoked
+        once per assignment.
+
+        Unlike ``solve()``, this method does not populate the values of
+        the problem's Variables, constraints' dual variables, or the
+        problem's ``status`` and ``value``; the results are returned
+        instead. The values of the Parameters are left unchanged.
+
+        Only DPP problems (``problem.is_dcp(dpp=True)``) are supported.
+
+        For example:
+
+        ::
+
+            p = cp.Parameter()
+            x = cp.Variable()
+            problem = cp.Problem(cp.Minimize(cp.square(x - p)), [x >= 0])
+            results = problem.solve_batch({p: np.array([-1.0, 1.0, 2.0])})
+            [r.primal_values[x.id] for r in results]  # [0.0, 1.0, 2.0]
+
+        Arguments
+        ---------
+        param_values : list of dict or dict
+            Either a list with one dict mapping Parameters to values per
+            assignment, or a dict mapping Parameters to arrays whose leading
+            axis indexes the assignments. Parameters that are omitted keep
+            their current value in every assignment.
+        solver : str, optional
+            The solver to use.
+        warm_start : bool, optional
+            Should each solve be warm started from the previous one?
+        verbose : bool, optional
+            Overrides the default of hiding solver output.
+        enforce_dpp : bool, optional
+            When True, a DPPError will be thrown when trying to solve a non-DPP
+            problem (instead of just a warning). Defaults to False.
+        canon_backend : str, optional
+            'CPP' (default) | 'SCIPY' | 'COO'
+            Specifies which backend to use for canonicalization.
+        kwargs : dict, optional
+            A dict of options that will be passed to the specific solver.
+
+        Returns
+        -------
+        list of SolveResult
+            One result per assignment. ``primal_values`` maps variable ids
+            to values and ``dual_values`` maps constraint ids to dual values;
+            both are empty unless the solver returned a solution.
+
+        Raises
+        ------
+        ValueError
+            If the parameter values are malformed.
+        cvxpy.error.DPPError
+            If the problem is not DPP.
+        """
+        solving_chain, batch_data = self._get_batch_problem_data(
+            param_values, solver, enforce_dpp, verbose, canon_backend, kwargs)
+        results = []
+        for data, inverse_data in batch_data:
+            raw_solution = solving_chain.solve_via_data(
+                self, data, warm_start, verbose, kwargs)
+            solution = solving_chain.invert(raw_solution, inverse_data)
+            results.append(self._batch_result(solution))
+        return results
+
+    def _get_batch_problem_data(self, param_values, solver, enforce_dpp,
+                                verbose, canon_backend, solver_opts):
+        """Compiles the problem once and applies a batch of parameter values.
+
+        Returns the solving chain and a list with one (data, inverse_data)
+        pair per parameter assignment.
+        """
+        param_values, batch_size = self._stack_param_values(param_values)
+        if not self.is_dcp(dpp=True):
+            raise error.DPPError(
+                "solve_batch requires a DPP problem; see "
+                "https://www.cvxpy.org/tutorial/advanced/index.html"
+                "#disciplined-parametrized-programming")
+
+        # Parameters without values are temporarily assigned their first
+        # value in the batch, so that the problem can be compiled.
+        unset = [p for p in self.parameters() if p.value is None]
+        for param in unset:
+            param.save_value(param_values[param.id][0])
+        try:
+            _, solving_chain, _ = self.get_problem_data(
+                solver, enforce_dpp=enforce_dpp, verbose=verbose,
+                canon_backend=canon_backend, solver_opts=solver_opts)
+        finally:
+            for param in unset:
+                param.save_value(None)
+        if self._cache.param_prog is None:
+            raise error.DPPError(
+                "solve_batch requires a problem whose compilation can be "
+                "cached; the problem could not be compiled as a DPP problem.")
+
+        param_prog = self._cache.param_prog
+        for param in param_prog.parameters:
+            if param.id not in param_values:
+                param_values[param.id] = np.broadcast_to(
+                    param.value, (batch_size,) + param.shape)
+        batch = ParamProbBatch(param_prog, param_values, batch_size)
+
+        batch_data = []
+        for index in range(batch_size):
+            data, solver_inverse_data = solving_chain.solver.apply(
+                batch.instance(index))
+            batch_data.append(
+                (data, self._cache.inverse_data + [solver_inverse_data]))
+        return solving_chain, batch_data
+
+    @staticmethod
+    def _batch_result(solution) -> SolveResult:
+        """Converts an inverted Solution into a SolveResult."""
+        if solution.status in s.SOLUTION_PRESENT:
+            primal_values = solution.primal_vars
+            dual_values = solution.dual_vars
+        else:
+            primal_values, dual_values = {}, {}
+        return SolveResult(solution.opt_val, solution.status,
+                           primal_values, dual_values)
+
+    def _stack_param_values(self, param_values):
+        """Validates a batch of parameter values and stacks it.
+
+        Returns a dict from parameter id to an array with a leading batch
+        axis, and the size of the batch.
+        """
+        if isinstance(param_values, dict):
+            stacked = {param: np.asarray(values, dtype=float)
+                       for param, values in param_values.items()}
+        else:
+            param_values = list(param_values)
+            if not param_values:
+                raise ValueError("param_values must contain at least one "
+                                 "assignment.")
+            params = unique_list(p for values in param_values for p in values)
+            for values in param_values:
+                if any(p not in values for p in params):
+                    raise ValueError("Every assignment in param_values must "
+                                     "assign the same Parameters.")
+            stacked = {param: np.stack([np.asarray(values[param], dtype=float)
+                                        for values in param_values])
+                       for param in params}
+        batch_sizes = {values.shape[0] if values.ndim else None
+                       for values in stacked.values()}
+        if len(batch_sizes) != 1 or None in batch_sizes:
+            raise ValueError("All parameter values must have the same, "
+                             "leading batch axis.")
+        batch_size = batch_sizes.pop()
+        if batch_size == 0:
+            raise ValueError("param_values must contain at least one "
+                             "assignment.")
+
+        problem_params = set(self.parameters())
+        id_to_values = {}
+        for param, values in stacked.items():
+            if param not in problem_params:
+                raise ValueError("Parameter '%s' does not appear in the "
+                                 "problem." % param.name())
+            if values.shape[1:] != param.shape:
+                raise ValueError(
+                    "Invalid dimensions %s for the values of Parameter '%s'; "
+                    "expected (batch_size,) + %s." % (
+                        values.shape, param.name(), param.shape))
+            for value in values:
+                param._validate_value(value)
+            id_to_values[param.id] = values
+        for param in problem_params:
+            if param not in stacked and param.value is None:
+                raise error.ParameterError(
+                    "A Parameter (whose name is '%s') does not have a value "
+                    "associated with it and was not assigned values in "
+                    "param_values." % param.name())
+        return id_to_values, batch_size
+
     def backward(self) -> None:
         """Compute the gradient of a solution with respect to Parameters.
 
@@ -1332,6 +1654,233 @@ class Problem(u.Canonical):
                 # dx_gp/d x_cone_program = exp(x_cone_program) = x_gp
                 variable.delta *= variable.value
 
+    def backward_batch(self,
+                       param_values,
+                       variable_gradients=None,
+                       n_workers: int | None = None,
+                       verbose: bool = False,
+                       canon_backend: str | None = None,
+                       **kwargs):
+        """Computes the gradients of a batch of solutions with respect to Parameters.
+
+        This is the batched counterpart of ``backward()``, for using a
+        problem as a layer that is applied to a minibatch. The problem is
+        compiled once, the forward solves and the adjoint solves of the
+        parameter assignments run in a pool of threads, and the adjoint of
+        the map from parameters to problem data is applied to the whole
+        batch with one sparse product.
+
+        Like ``solve_batch()``, this method does not populate the values of
+        the Variables or the ``gradient`` attributes of the Parameters; the
+        results are returned instead. Only DPP problems
+        (``problem.is_dcp(dpp=True)``) are supported.
+
+        For example:
+
+        ::
+
+            p = cp.Parameter()
+            x = cp.Variable()
+            problem = cp.Problem(cp.Minimize(cp.square(x - 2 * p)), [x >= 0])
+            results, grads = problem.backward_batch(
+                {p: np.array([1.0, 2.0, 3.0])}, {x: np.array([1.0, 1.0, 4.0])})
+            grads[p]  # [2.0, 2.0, 8.0]
+
+        Arguments
+        ---------
+        param_values : list of dict or dict
+            The parameter assignments, in any format accepted by
+            ``solve_batch()``.
+        variable_gradients : dict, optional
+            Map from Variables to the gradients of a scalar function of the
+            solution with respect to them, either shared by the batch or
+            stacked along a leading batch axis. Variables that are omitted
+            get a gradient of all ones, as in ``backward()``.
+        n_workers : int, optional
+            The number of threads; defaults to the default of
+            ThreadPoolExecutor.
+        verbose : bool, optional
+            Overrides the default of hiding solver output.
+        canon_backend : str, optional
+            'CPP' (default) | 'SCIPY' | 'COO'
+            Specifies which backend to use for canonicalization.
+        kwargs : dict, optional
+            A dict of options that will be passed to DIFFCP.
+
+        Returns
+        -------
+        tuple
+            A list with one SolveResult per assignment, and a dict mapping
+            each Parameter to its gradients, stacked along a leading batch
+            axis.
+
+        Raises
+        ------
+        ValueError
+            If the parameter values or the gradients are malformed.
+        SolverError
+            If the problem is infeasible or unbounded for some assignment.
+        """
+        _, batch_size = self._stack_param_values(param_values)
+        del_vars = self._stack_leaf_values(
+            variable_gradients, self.variables(), batch_size, 1.0,
+            "variable_gradients")
+        param_prog, raw_solutions, results = self._solve_batch_requiring_grad(
+            param_values, n_workers, verbose, canon_backend, kwargs)
+        dxs = [param_prog.split_adjoint({var_id: values[index]
+                                         for var_id, values in del_vars.items()})
+               for index in range(batch_size)]
+
+        def adjoint(raw_solution, dx):
+            zeros = np.zeros(raw_solution["s"].shape)
+            return raw_solution["DT"](dx, zeros, zeros)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            dAs, dbs, dcs = zip(*executor.map(adjoint, raw_solutions, dxs))
+        dparams = param_prog.apply_param_jac_batch(
+            np.stack(dcs), [-dA for dA in dAs], np.stack(dbs))
+        return results, {param: dparams[param.id]
+                         for param in self.parameters()}
+
+    def derivative_batch(self,
+                         param_values,
+                         param_deltas=None,
+                         n_workers: int | None = None,
+                         verbose: bool = False,
+                         canon_backend: str | None = None,
+                         **kwargs):
+        """Applies the derivative of the solution map to a batch of perturbations.
+
+        This is the batched counterpart of ``derivative()``. The problem is
+        compiled once and the forward solves and the derivative solves of
+        the parameter assignments run in a pool of threads.
+
+        Like ``solve_batch()``, this method does not populate the values or
+        the ``delta`` attributes of the Variables; the results are returned
+        instead. Only DPP problems (``problem.is_dcp(dpp=True)``) are
+        supported.
+
+        Arguments
+        ---------
+        param_values : list of dict or dict
+            The parameter assignments, in any format accepted by
+            ``solve_batch()``.
+        param_deltas : dict, optional
+            Map from Parameters to their perturbations, either shared by the
+            batch or stacked along a leading batch axis. Parameters that are
+            omitted are not perturbed.
+        n_workers : int, optional
+            The number of threads; defaults to the default of
+            ThreadPoolExecutor.
+        verbose : bool, optional
+            Overrides the default of hiding solver output.
+        canon_backend : str, optional
+            'CPP' (default) | 'SCIPY' | 'COO'
+            Specifies which backend to use for canonicalization.
+        kwargs : dict, optional
+            A dict of options that will be passed to DIFFCP.
+
+        Returns
+        -------
+        tuple
+            A list with one SolveResult per assignment, and a dict mapping
+            each Variable to the perturbations of its optimal values, stacked
+            along a leading batch axis.
+
+        Raises
+        ------
+        ValueError
+            If the parameter values or the perturbations are malformed.
+        SolverError
+            If the problem is infeasible or unbounded for some assignment.
+        """
+        _, batch_size = self._stack_param_values(param_values)
+        deltas = self._stack_leaf_values(
+            param_deltas, self.parameters(), batch_size, 0.0, "param_deltas")
+        param_prog, raw_solutions, results = self._solve_batch_requiring_grad(
+            param_values, n_workers, verbose, canon_backend, kwargs)
+        perturbations = [
+            param_prog.apply_parameters({param_id: values[index]
+                                         for param_id, values in deltas.items()},
+                                        zero_offset=True)
+            for index in range(batch_size)]
+
+        def derivative(raw_solution, perturbation):
+            dc, _, dA, db = perturbation
+            dx, _, _ = raw_solution["D"](-dA, db, dc)
+            return dx
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            dxs = list(executor.map(derivative, raw_solutions, perturbations))
+        variables = self.variables()
+        dvars = [param_prog.split_solution(dx, [var.id for var in variables])
+                 for dx in dxs]
+        return results, {var: np.stack([dvar[var.id] for dvar in dvars])
+                         for var in variables}
+
+    def _solve_batch_requiring_grad(self, param_values, n_workers, verbose,
+                                    canon_backend, solver_opts):
+        """Solves a batch of parameter assignments with DIFFCP, in parallel.
+
+        Returns the parameterized program, the raw solutions of DIFFCP,
+        which hold the derivatives of the solution maps, and the results.
+        """
+        if s.DIFFCP not in slv_def.INSTALLED_SOLVERS:
+            raise ModuleNotFoundError(
+                "The Python package diffcp must be installed to "
+                "differentiate through problems. Please follow the "
+                "installation instructions at "
+                "https://github.com/cvxgrp/diffcp")
+        solving_chain, batch_data = self._get_batch_problem_data(
+            param_values, s.DIFFCP, False, verbose, canon_backend, solver_opts)
+
+        def forward(data):
+            # DIFFCP sets its defaults in the options.
+            return solving_chain.solver.solve_via_data(
+                data, False, verbose, dict(solver_opts))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            raw_solutions = list(executor.map(
+                forward, [data for data, _ in batch_data]))
+
+        results = []
+        for raw_solution, (_, inverse_data) in zip(raw_solutions, batch_data):
+            solution = solving_chain.invert(raw_solution, inverse_data)
+            if solution.status not in s.SOLUTION_PRESENT:
+                raise error.SolverError(
+                    "Differentiating through infeasible/unbounded problems "
+                    "is not yet supported. Please file an issue on Github if "
+                    "you need this feature.")
+            results.append(self._batch_result(solution))
+        return self._cache.param_prog, raw_solutions, results
+
+    @staticmethod
+    def _stack_leaf_values(leaf_values, leaves, batch_size: int, default,
+                           name: str):
+        """Stacks values of leaves along a leading batch axis.
+
+        Returns a dict from leaf id to an array of shape
+        (batch_size,) + leaf.shape; leaves without values are filled with
+        default.
+        """
+        leaf_values = {} if leaf_values is None else leaf_values
+        leaf_ids = {leaf.id for leaf in leaves}
+        for leaf in leaf_values:
+            if leaf.id not in leaf_ids:
+                raise ValueError("'%s' in %s does not appear in the problem."
+                                 % (leaf.name(), name))
+        stacked = {}
+        for leaf in leaves:
+            shape = (batch_size,) + leaf.shape
+            if leaf not in leaf_values:
+                stacked[leaf.id] = np.full(shape, default)
+                continue
+            values = np.asarray(leaf_values[leaf], dtype=np.float64)
+            if values.shape not in (leaf.shape, shape):
+                raise ValueError(
+                    "Invalid dimensions %s for '%s' in %s; expected %s or "
+                    "(batch_size,) + %s." % (values.shape, leaf.name(), name,
+                                             leaf.shape, leaf.shape))
+            stacked[leaf.id] = np.broadcast_to(values, shape)
+        return stacked
+
     def _clear_solution(self) -> None:
         for v in self.variables():
             v.save_value(None)
@@ -1403,6 +1952,14 @@ class Problem(u.Canonical):
         """
 
         solution = chain.invert(solution, inverse_data)
+        self._unpack_inverted(solution, chain.solver.name())
+
+    def _unpack_inverted(self, solution, solver_name: str) -> None:
+        """Updates the problem state given a solution to this problem.
+
+        Unlike unpack, this method warns about inaccurate solutions, raises
+        on solver errors, and records the solver statistics.
+        """
         if solution.status in s.INACCURATE:
             warnings.warn(
                 "Solution may be inaccurate. Try another solver, "
@@ -1413,13 +1970,13 @@ class Problem(u.Canonical):
             warnings.warn(INF_OR_UNB_MESSAGE)
         if solution.status in s.ERROR:
             raise error.SolverError(
-                    "Solver '%s' failed. " % chain.solver.name() +
+                    "Solver '%s' failed. " % solver_name +
                     "Try another solver, or solve with verbose=True for more "
                     "information.")
 
         self.unpack(solution)
         self._solver_stats = SolverStats.from_dict(self._solution.attr,
-                                         chain.solver.name())
+                                                   solver_name)
 
     def __str__(self) -> str:
         if len(self.constraints) == 0:
@@ -20,6 +20,15 @@ from cvxpy.expressions.expression import Expression
 from cvxpy.reductions.inverse_data import InverseData
 from cvxpy.reductions.reduction import Reduction
 from cvxpy.reductions.solution import Solution
+from cvxpy.utilities import profiling, traversal
+
+
+def _canon_args(expr) -> list:
+    """Returns the nodes canonicalized before expr."""
+    if type(expr) is cvxtypes.partial_problem():
+        problem = expr.args[0]
+        return [problem.objective.expr] + problem.constraints
+    return expr.args
 
 
 class Canonicalization(Reduction):
@@ -56,7 +65,7 @@ class Canonicalization(Reduction):
         """Recursively canonicalize the objective and every constraint."""
         inverse_data = InverseData(problem)
 
-        canon_objective, canon_constraints = self.canonicalize_tree(
+        canon_objective, canon_constraints = self.memoized_canonicalize_tree(
             problem.objective)
 
         for constraint in problem.constraints:
@@ -64,10 +73,12 @@ class Canonicalization(Reduction):
             # its canonicalized arguments, and aux_constr are the constraints
             # generated while canonicalizing the arguments of the original
             # constraint
-            canon_constr, aux_constr = self.canonicalize_tree(
+            canon_constr, aux_constr = self.memoized_canonicalize_tree(
                 constraint)
             canon_constraints += aux_constr + [canon_constr]
             inverse_data.cons_id_map.update({constraint.id: canon_constr.id})
+        if self.memo is not None:
+            self.memo.commit()
 
         new_problem = problems.problem.Problem(canon_objective,
                                                canon_constraints)
@@ -83,9 +94,30 @@ class Canonicalization(Reduction):
         return Solution(solution.status, solution.opt_val, pvars, dvars,
                         solution.attr)
 
+    def memoized_canonicalize_tree(self, expr, *args):
+        """Canonicalizes the tree of an objective or constraint.
+
+        If the reduction has a memo, the canonicalization computed for the
+        same object by an earlier application of the reduction is reused.
+        The arguments after expr are passed to canonicalize_tree.
+        """
+        if self.memo is None:
+            return self.canonicalize_tree(expr, *args)
+        canon = self.memo.get(expr)
+        if canon is None:
+            canon = self.canonicalize_tree(expr, *args)
+            self.memo.put(expr, canon)
+        canon_expr, constrs = canon
+        # Callers extend the list of constraints.
+        return canon_expr, list(constrs)
+
     def canonicalize_tree(self, expr, canonicalize_params: bool = True):
-        """Recursively canonicalize an Expression.
-        
+        """Canonicalize an Expression, visiting its arguments first.
+
+        The tree is traversed without recursion. Every occurrence of a shared
+        subexpression is canonicalized separately, as later reductions may
+        modify the canonicalized tree in place.
+
         Args:
             expr: Expression to canonicalize.
             canonicalize_params: Should constant subtrees 
@@ -94,32 +126,23 @@ class Canonicalization(Reduction):
         Returns:
             canonicalized expression, constraints
         """
-        # TODO don't copy affine expressions?
-        if type(expr) == cvxtypes.partial_problem():
-            canon_expr, constrs = self.canonicalize_tree(
-              expr.args[0].objective.expr, canonicalize_params=canonicalize_params)
-            for constr in expr.args[0].constraints:
-                canon_constr, aux_constr = self.canonicalize_tree(
-                    constr, 
-                    canonicalize_params=canonicalize_params
-                )
-                constrs += [canon_constr] + aux_constr
-        else:
-            canon_args = []
-            constrs = []
-            for arg in expr.args:
-                canon_arg, c = self.canonicalize_tree(
-                    arg, 
-                    canonicalize_params=canonicalize_params
-                )
-                canon_args += [canon_arg]
-                constrs += c
+        constrs = []
+
+        def canonicalize(node, canon_args):
+            if type(node) is cvxtypes.partial_problem():
+                # The arguments are the objective and the constraints.
+                constrs.extend(canon_args[1:])
+                return canon_args[0]
+            # TODO don't copy affine expressions?
             canon_expr, c = self.canonicalize_expr(
-                expr, 
-                canon_args, 
+                node,
+                canon_args,
                 canonicalize_params=canonicalize_params
             )
-            constrs += c
+            constrs.extend(c)
+            return canon_expr
+
+        canon_expr = traversal.fold_tree(expr, canonicalize, _canon_args)
         return canon_expr, constrs
 
     def canonicalize_expr(
@@ -143,14 +166,16 @@ class Canonicalization(Reduction):
             # Constant trees are collapsed, but parameter trees are preserved
             # when canonicalize_params = True. Otherwise parameters
             # are collapsed as well.
-            canon_with_params = canonicalize_params and expr.parameters() 
-            skip_canon = expr.is_constant() and not canon_with_params
+            # Check is_constant first: parameters() walks the whole subtree.
+            skip_canon = expr.is_constant() and not (
+                canonicalize_params and expr.parameters())
         else:
             skip_canon = False
 
         if skip_canon:
             return expr, []
         if type(expr) in self.canon_methods:
-            return self.canon_methods[type(expr)](expr, args)
+            with profiling.span(type(expr).__name__):
+                return self.canon_methods[type(expr)](expr, args)
         else:
             return expr.copy(args), []
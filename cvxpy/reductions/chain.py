@@ -1,5 +1,6 @@
 from cvxpy import settings as s
 from cvxpy.reductions.reduction import Reduction
+from cvxpy.utilities import profiling
 
 
 class Chain(Reduction):
@@ -73,7 +74,8 @@ class Chain(Reduction):
         for r in self.reductions:
             if verbose:
                 s.LOGGER.info('Applying reduction %s', type(r).__name__)
-            problem, inv = r.apply(problem)
+            with profiling.span(type(r).__name__):
+                problem, inv = r.apply(problem)
             inverse_data.append(inv)
         return problem, inverse_data
 
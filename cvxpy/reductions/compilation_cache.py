@@ -0,0 +1,262 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse as sp
+
+from cvxpy.expressions import cvxtypes
+from cvxpy.utilities.fingerprint import structural_fingerprint
+
+# The environment variable naming a directory for a DiskCompilationCache
+# that is used when no cache is set with set_compilation_cache.
+CACHE_DIR_ENV_VAR = 'CVXPY_COMPILATION_CACHE_DIR'
+
+_COMPRESSED_ARRAYS = ['data', 'indices', 'indptr']
+_COMPRESSED_FORMATS = {'csc': sp.csc_matrix, 'csr': sp.csr_matrix}
+
+
+def compilation_key(reduction, problem, **options) -> str:
+    """Returns a key identifying the output of a reduction applied to a problem.
+
+    The key combines the type of the reduction, its options, the version of
+    CVXPY and the structural fingerprint of the problem, so that it is
+    shared by structurally identical problems in different processes.
+    """
+    token = repr((type(reduction).__name__, sorted(options.items()),
+                  cvxtypes.version(), structural_fingerprint(problem)))
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class DiskCompilationCache:
+    """Stores the problem data tensors produced by matrix stuffing on disk.
+
+    The tensors map parameter values to the problem data and are the most
+    expensive part of compiling a DPP problem. Each entry is a directory
+    holding one ``.npy`` file per compressed sparse array, so that entries can be loaded
+    as read-only memory maps and shared among processes.
+
+    Parameters
+    ----------
+    path : str
+        The directory holding the cache; it is created if necessary.
+    mmap : bool, optional
+        Whether to memory-map the stored arrays when loading them.
+    """
+
+    def __init__(self, path: str, mmap: bool = True) -> None:
+        self.path = path
+        self.mmap = mmap
+        os.makedirs(path, exist_ok=True)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key)
+
+    def load(self, key: str):
+        """Returns the dict of tensors stored under key, or None."""
+        entry = self._entry_path(key)
+        meta_file = os.path.join(entry, 'meta.json')
+        if not os.path.exists(meta_file):
+            return None
+        with open(meta_file) as f:
+            meta = json.load(f)
+        mmap_mode = 'r' if self.mmap else None
+        tensors = {}
+        for name, tensor_meta in meta.items():
+            if tensor_meta is None:
+                tensors[name] = None
+                continue
+            data, indices, indptr = [
+                np.load(os.path.join(entry, '%s.%s.npy' % (name, array)),
+                        mmap_mode=mmap_mode)
+                for array in _COMPRESSED_ARRAYS
+            ]
+            matrix_cls = _COMPRESSED_FORMATS[tensor_meta['format']]
+            tensors[name] = matrix_cls(
+                (data, indices, indptr), shape=tuple(tensor_meta['shape']),
+                copy=False)
+        return tensors
+
+    def save(self, key: str, tensors) -> None:
+        """Stores a dict of sparse tensors (or None values) under key."""
+        entry = self._entry_path(key)
+        if os.path.exists(entry):
+            return
+        # Write to a temporary directory first, so that concurrent writers
+        # and readers never observe a partially written entry.
+        tmp_entry = tempfile.mkdtemp(dir=self.path, prefix='.tmp-')
+        meta = {}
+        try:
+            for name, tensor in tensors.items():
+                if tensor is None:
+                    meta[name] = None
+                    continue
+                if tensor.format not in _COMPRESSED_FORMATS:
+                    tensor = tensor.tocsc()
+                tensor.eliminate_zeros()
+                tensor.sort_indices()
+                meta[name] = {'format': tensor.format,
+                              'shape': [int(dim) for dim in tensor.shape]}
+                for array in _COMPRESSED_ARRAYS:
+                    np.save(os.path.join(tmp_entry, '%s.%s.npy' % (name, array)),
+                            getattr(tensor, array))
+            with open(os.path.join(tmp_entry, 'meta.json'), 'w') as f:
+                json.dump(meta, f)
+            os.rename(tmp_entry, entry)
+        except OSError:
+            # Another process stored the same entry first.
+            if not os.path.exists(entry):
+                raise
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        for name in os.listdir(self.path):
+            shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
+
+
+class CompiledProblem:
+    """The compilation of a problem, reusable by identical problems.
+
+    Attributes
+    ----------
+    remap : TemplateRemap
+        The reduction that maps structurally identical problems onto the
+        compiled problem.
+    solving_chain : SolvingChain
+        The chain that compiled the problem.
+    param_prog : ParamProb
+        The parameterized problem produced by the chain.
+    inverse_data : list
+        The inverse data of the chain's reductions, except the solver.
+    """
+
+    def __init__(self, remap, solving_chain, param_prog, inverse_data) -> None:
+        self.remap = remap
+        self.solving_chain = solving_chain
+        self.param_prog = param_prog
+        self.inverse_data = inverse_data
+
+
+class CompiledProblemCache:
+    """A thread-safe LRU cache of compiled DPP problems.
+
+    Entries are keyed by the structural fingerprint of a problem together
+    with the options that affect its compilation. A problem that is rebuilt
+    with fresh variables and parameters, e.g., once per request in a
+    service, reuses the compilation of the first such problem instead of
+    being compiled from scratch.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of compiled problems to keep.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        """Returns the CompiledProblem stored under key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry: CompiledProblem) -> None:
+        """Stores a CompiledProblem, evicting the least recently used one."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_COMPILED_PROBLEM_CACHE = None
+
+
+def set_compiled_problem_cache(cache) -> None:
+    """Sets the process-wide cache of compiled problems.
+
+    Parameters
+    ----------
+    cache : CompiledProblemCache or None
+        The cache consulted when a problem is compiled, or None to disable
+        caching.
+    """
+    global _COMPILED_PROBLEM_CACHE
+    _COMPILED_PROBLEM_CACHE = cache
+
+
+def get_compiled_problem_cache():
+    """Returns the process-wide cache of compiled problems, or None."""
+    return _COMPILED_PROBLEM_CACHE
+
+
+_COMPILATION_CACHE = None
+
+
+def set_compilation_cache(cache) -> None:
+    """Sets the process-wide compilation cache.
+
+    Parameters
+    ----------
+    cache : DiskCompilationCache or None
+        The cache consulted by the matrix stuffing reductions, or None to
+        disable caching.
+    """
+    global _COMPILATION_CACHE
+    _COMPILATION_CACHE = cache
+
+
+def get_compilation_cache():
+    """Returns the process-wide compilation cache, or None.
+
+    If no cache was set with set_compilation_cache, and the environment
+    variable CVXPY_COMPILATION_CACHE_DIR names a directory, a
+    DiskCompilationCache for that directory is used.
+    """
+    global _COMPILATION_CACHE
+    if _COMPILATION_CACHE is None and os.environ.get(CACHE_DIR_ENV_VAR):
+        _COMPILATION_CACHE = DiskCompilationCache(os.environ[CACHE_DIR_ENV_VAR])
+    return _COMPILATION_CACHE
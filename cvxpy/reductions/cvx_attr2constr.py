@@ -105,6 +105,9 @@ class CvxAttr2Constr(Reduction):
         self.reduce_bounds = reduce_bounds
         super(CvxAttr2Constr, self).__init__(problem=problem)
 
+    def memo_key(self):
+        return (type(self), self.reduce_bounds)
+
     def reduction_attributes(self) -> List[str]:
         """Returns the attributes that will be reduced."""
         if self.reduce_bounds:
@@ -132,59 +135,92 @@ class CvxAttr2Constr(Reduction):
         for var in problem.variables():
             if var.id not in id2new_var:
                 id2old_var[var.id] = var
-                new_var = False
-                new_attr = var.attributes.copy()
-                for key in reduction_attributes:
-                    if new_attr[key]:
-                        if key == 'bounds':
-                            new_var = True
-                            new_attr[key] = None
-                        else:
-                            new_var = True
-                            new_attr[key] = False
-
-                if attributes_present([var], SYMMETRIC_ATTRIBUTES):
-                    n = var.shape[0]
-                    shape = (n*(n+1)//2, 1)
-                    upper_tri = Variable(shape, var_id=var.id, **new_attr)
-                    upper_tri.set_variable_of_provenance(var)
-                    id2new_var[var.id] = upper_tri
-                    fill_coeff = Constant(upper_tri_to_full(n))
-                    full_mat = fill_coeff @ upper_tri
-                    obj = reshape(full_mat, (n, n))
-                elif var.attributes['diag']:
-                    diag_var = Variable(var.shape[0], var_id=var.id, **new_attr)
-                    diag_var.set_variable_of_provenance(var)
-                    id2new_var[var.id] = diag_var
-                    obj = diag(diag_var)
-                elif new_var:
-                    obj = Variable(var.shape, var_id=var.id, **new_attr)
-                    obj.set_variable_of_provenance(var)
-                    id2new_var[var.id] = obj
-                else:
-                    obj = var
-                    id2new_var[var.id] = obj
-
-                id2new_obj[id(var)] = obj
-                # Attributes related to positive and negative definiteness.
-                if var.is_psd():
-                    constr.append(obj >> 0)
-                elif var.attributes['NSD']:
-                    constr.append(obj << 0)
-
-                # Add in constraints from bounds.
-                if self.reduce_bounds:
-                    var._bound_domain(obj, constr)
+                reduced = None if self.memo is None else self.memo.get(var)
+                if reduced is None:
+                    reduced = self.reduce_variable(var, reduction_attributes)
+                    if self.memo is not None:
+                        self.memo.put(var, reduced)
+                id2new_var[var.id], id2new_obj[id(var)], var_constr = reduced
+                constr += var_constr
 
         # Create new problem.
-        obj = problem.objective.tree_copy(id_objects=id2new_obj)
+        obj = self.memoized_tree_copy(problem.objective, id2new_obj)
         cons_id_map = {}
         for cons in problem.constraints:
-            constr.append(cons.tree_copy(id_objects=id2new_obj))
+            constr.append(self.memoized_tree_copy(cons, id2new_obj))
             cons_id_map[cons.id] = constr[-1].id
+        if self.memo is not None:
+            self.memo.commit()
         inverse_data = (id2new_var, id2old_var, cons_id_map)
         return cvxtypes.problem()(obj, constr), inverse_data
 
+    def reduce_variable(self, var, reduction_attributes):
+        """Removes the reduced attributes of a variable.
+
+        Returns
+        -------
+        tuple
+            The variable without the attributes, an expression that replaces
+            the original variable, and the constraints that the attributes
+            impose on the expression.
+        """
+        constr = []
+        new_var = False
+        new_attr = var.attributes.copy()
+        for key in reduction_attributes:
+            if new_attr[key]:
+                if key == 'bounds':
+                    new_var = True
+                    new_attr[key] = None
+                else:
+                    new_var = True
+                    new_attr[key] = False
+
+        if attributes_present([var], SYMMETRIC_ATTRIBUTES):
+            n = var.shape[0]
+            shape = (n*(n+1)//2, 1)
+            upper_tri = Variable(shape, var_id=var.id, **new_attr)
+            upper_tri.set_variable_of_provenance(var)
+            reduced_var = upper_tri
+            fill_coeff = Constant(upper_tri_to_full(n))
+            full_mat = fill_coeff @ upper_tri
+            obj = reshape(full_mat, (n, n))
+        elif var.attributes['diag']:
+            diag_var = Variable(var.shape[0], var_id=var.id, **new_attr)
+            diag_var.set_variable_of_provenance(var)
+            reduced_var = diag_var
+            obj = diag(diag_var)
+        elif new_var:
+            obj = Variable(var.shape, var_id=var.id, **new_attr)
+            obj.set_variable_of_provenance(var)
+            reduced_var = obj
+        else:
+            obj = var
+            reduced_var = obj
+
+        # Attributes related to positive and negative definiteness.
+        if var.is_psd():
+            constr.append(obj >> 0)
+        elif var.attributes['NSD']:
+            constr.append(obj << 0)
+
+        # Add in constraints from bounds.
+        if self.reduce_bounds:
+            var._bound_domain(obj, constr)
+        return reduced_var, obj, constr
+
+    def memoized_tree_copy(self, expr, id2new_obj):
+        """Copies the tree of an objective or constraint with the variables
+        replaced, reusing the copy memoized for it, if any.
+        """
+        if self.memo is None:
+            return expr.tree_copy(id_objects=id2new_obj)
+        copy = self.memo.get(expr)
+        if copy is None:
+            copy = expr.tree_copy(id_objects=id2new_obj)
+            self.memo.put(expr, copy)
+        return copy
+
     def invert(self, solution, inverse_data):
         if not inverse_data:
             return solution
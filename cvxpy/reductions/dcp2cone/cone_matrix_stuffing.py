@@ -31,23 +31,23 @@ from cvxpy.constraints import (
     Zero,
 )
 from cvxpy.cvxcore.python import canonInterface
-from cvxpy.expressions.variable import Variable
 from cvxpy.problems.objective import Minimize
 from cvxpy.problems.param_prob import ParamProb
 from cvxpy.reductions import InverseData, Solution, cvx_attr2constr
 from cvxpy.reductions.matrix_stuffing import (
     MatrixStuffing,
     extract_lower_bounds,
-    extract_mip_idx,
     extract_upper_bounds,
 )
 from cvxpy.reductions.utilities import (
     ReducedMat,
     are_args_affine,
+    csc_from_index,
     group_constraints,
     lower_equality,
     lower_ineq_to_nonneg,
     nonpos2nonneg,
+    parameter_entries,
 )
 from cvxpy.utilities.coeff_extractor import CoeffExtractor
 
@@ -162,6 +162,7 @@ class ParamConeProg(ParamProb):
         # of parameters.
         self.reduced_A = ReducedMat(self.A, self.x.size)
         self.reduced_P = ReducedMat(self.P, self.x.size, quad_form=True)
+        self._parameter_entries = None
 
         self.constraints = constraints
         self.constr_size = sum([c.size for c in constraints])
@@ -186,6 +187,21 @@ class ParamConeProg(ParamProb):
         return self.x.attributes['boolean'] or \
             self.x.attributes['integer']
 
+    def parameter_entries(self) -> dict:
+        """Returns the entries of the problem data that depend on parameters.
+
+        Returns:
+          A dict mapping 'c' and 'b' to the indices of the entries of c and
+          b, and 'A' and 'P' to tuples (rows, cols) of the entries of A and
+          P, whose values change with the values of the parameters.
+        """
+        if self._parameter_entries is None:
+            entries = parameter_entries(
+                self.c, self.reduced_A, self.reduced_P, self.x.size)
+            entries['c'] = entries.pop('q')
+            self._parameter_entries = entries
+        return self._parameter_entries
+
     def apply_parameters(self, id_to_param_value=None, zero_offset: bool = False,
                          keep_zeros: bool = False, quad_obj: bool = False):
         """Returns A, b after applying parameters (and reshaping).
@@ -221,44 +237,141 @@ class ParamConeProg(ParamProb):
         else:
             return c, d, A, np.atleast_1d(b)
 
-    def apply_param_jac(self, delc, delA, delb, active_params=None):
+    def apply_parameter_matrix(self, param_mat: np.ndarray, quad_obj: bool = False):
+        """Applies a matrix of stacked parameter vectors.
+
+        Every instance shares the sparsity structure of A (and P), so the
+        problem data is returned as stacked arrays whose last axis indexes
+        the instances.
+
+        Args:
+          param_mat: matrix of shape (total_param_size + 1, k) whose columns
+                     are parameter vectors.
+          quad_obj: (optional) if True, include quadratic objective term.
+
+        Returns:
+          A tuple (c, d, A_data, A_index, b), where c has shape (n, k), d has
+          shape (k,), A_data has shape (nnz, k) and holds the CSC values of
+          A for each instance, A_index is the shared (indices, indptr, shape)
+          structure of A, and b has shape (m, k). If quad_obj is True, the
+          tuple is prefixed with (P_data, P_index).
+        """
+        c = np.asarray(self.c @ param_mat)
+        A_data, A_index, b = self.reduced_A.get_stacked_data_from_tensor(
+            param_mat, with_offset=True)
+        if quad_obj:
+            P_data, P_index, _ = self.reduced_P.get_stacked_data_from_tensor(
+                param_mat, with_offset=False)
+            return P_data, P_index, c[:-1], c[-1], A_data, A_index, b
+        return c[:-1], c[-1], A_data, A_index, b
+
+    def apply_parameters_batch(self, id_to_param_values, batch_size: int,
+                               keep_zeros: bool = False, quad_obj: bool = False):
+        """Applies a batch of parameter assignments at once.
+
+        The parameter vectors are stacked into a single dense matrix and the
+        problem data tensors are applied to it with one product each; the
+        matrices of all instances share their index arrays.
+
+        Args:
+          id_to_param_values: dict mapping parameter ids to arrays of values
+                              with a leading batch axis of length batch_size.
+          batch_size: the number of parameter assignments.
+          keep_zeros: (optional) if True, store explicit zeros in A where
+                        parameters are affected; the shared structure always
+                        keeps them.
+          quad_obj: (optional) if True, include quadratic objective term.
+
+        Returns:
+          A list with one tuple per assignment, laid out like the return
+          value of apply_parameters.
+        """
+        param_mat = canonInterface.get_parameter_matrix(
+            self.total_param_size,
+            self.param_id_to_col,
+            self.param_id_to_size,
+            lambda idx: id_to_param_values[idx],
+            batch_size)
+        if param_mat is None:
+            return [self.apply_parameters(keep_zeros=keep_zeros, quad_obj=quad_obj)
+                    ] * batch_size
+        stacked = self.apply_parameter_matrix(param_mat, quad_obj=quad_obj)
+        c, d, A_data, A_index, b = stacked[-5:]
+        instances = [(c[:, j], d[j], csc_from_index(A_data[:, j], A_index), b[:, j])
+                     for j in range(batch_size)]
+        if quad_obj:
+            P_data, P_index = stacked[:2]
+            instances = [(csc_from_index(P_data[:, j], P_index),) + instance
+                         for j, instance in enumerate(instances)]
+        return instances
+
+    def apply_param_jac(self, delc, delA, delb, active_params=None,
+                        delP=None):
         """Multiplies by Jacobian of parameter mapping.
 
-        Assumes delA is sparse.
+        Assumes delA (and delP) is sparse; only its entries that are affected
+        by parameters are read.
+
+        Args:
+          delc: array of shape (n,).
+          delA: sparse matrix of shape (m, n).
+          delb: array of shape (m,).
+          active_params: (optional) the ids of the parameters to return.
+          delP: (optional) sparse matrix of shape (n, n), for problems with a
+                quadratic objective; P is not perturbed if omitted.
 
         Returns:
             A dictionary param.id -> dparam
         """
-        if self.P is not None:
-            raise ValueError("Can't apply Jacobian with a quadratic objective.")
+        delta_params = self.apply_param_jac_batch(
+            np.asarray(delc)[None], [delA], np.asarray(delb)[None],
+            active_params=active_params,
+            delPs=None if delP is None else [delP])
+        return {param_id: delta[0] for param_id, delta in delta_params.items()}
+
+    def apply_param_jac_batch(self, delc, delAs, delb, active_params=None,
+                              delPs=None):
+        """Multiplies a batch of perturbations by the Jacobian of the parameter mapping.
+
+        The perturbations of A and P are read only at the entries affected
+        by parameters, and the whole batch is multiplied by the reduced
+        tensors at once.
+
+        Args:
+          delc: array of shape (batch_size, n).
+          delAs: list of batch_size sparse matrices of shape (m, n).
+          delb: array of shape (batch_size, m).
+          active_params: (optional) the ids of the parameters to return.
+          delPs: (optional) list of batch_size sparse matrices of shape
+                 (n, n), for problems with a quadratic objective; P is not
+                 perturbed if omitted.
+
+        Returns:
+          A dictionary param.id -> dparam, where dparam has a leading batch
+          axis.
+        """
+        if delPs is not None and self.P is None:
+            raise ValueError("Can't perturb P without a quadratic objective.")
 
         if active_params is None:
             active_params = {p.id for p in self.parameters}
 
-        del_param_vec = delc @ self.c[:-1]
-        flatdelA = delA.reshape((np.prod(delA.shape), 1), order='F')
-        delAb = sp.vstack([flatdelA, sp.csc_matrix(delb[:, None])])
-
-        one_gig_of_doubles = 125000000
-        if delAb.shape[0] < one_gig_of_doubles:
-            # fast path: if delAb is small enough, just materialize it
-            # in memory because sparse-matrix @ dense vector is much faster
-            # than sparse @ sparse
-            del_param_vec += np.squeeze(self.A.T.dot(delAb.toarray()))
-        else:
-            # slow path.
-            # TODO: make this faster by intelligently operating on the
-            # sparse matrix data / making use of reduced_A
-            del_param_vec += np.squeeze((delAb.T @ self.A).A)
-        del_param_vec = np.squeeze(del_param_vec)
+        delc = np.atleast_2d(delc)
+        delb = np.atleast_2d(delb)
+        delAbs = [sp.hstack([delA, sp.csc_matrix(db[:, None])])
+                  for delA, db in zip(delAs, delb)]
+        del_param_mat = np.asarray(self.c[:-1].T @ delc.T)
+        del_param_mat += self.reduced_A.apply_adjoint(delAbs)
+        if delPs is not None:
+            del_param_mat += self.reduced_P.apply_adjoint(delPs)
 
         param_id_to_delta_param = {}
         for param_id, col in self.param_id_to_col.items():
             if param_id in active_params:
                 param = self.id_to_param[param_id]
-                delta = del_param_vec[col:col + param.size]
+                delta = del_param_mat[col:col + param.size].T
                 param_id_to_delta_param[param_id] = np.reshape(
-                    delta, param.shape, order='F')
+                    delta, (len(delAs),) + param.shape, order='F')
         return param_id_to_delta_param
 
     def split_solution(self, sltn, active_vars=None):
@@ -308,12 +421,16 @@ class ConeMatrixStuffing(MatrixStuffing):
     affine.
     """
     CONSTRAINTS = 'ordered_constraints'
+    CONES = [Zero, NonNeg, SOC, PSD, ExpCone, PowCone3D]
 
     def __init__(self, quad_obj: bool = False, canon_backend: str | None = None):
         # Assume a quadratic objective?
         self.quad_obj = quad_obj
         self.canon_backend = canon_backend
 
+    def memo_key(self):
+        return (type(self), self.quad_obj, self.canon_backend)
+
     def accepts(self, problem):
         valid_obj_curv = (self.quad_obj and problem.objective.expr.is_quadratic()) or \
             problem.objective.expr.is_affine()
@@ -324,9 +441,6 @@ class ConeMatrixStuffing(MatrixStuffing):
                 and problem.is_dpp())
 
     def stuffed_objective(self, problem, extractor):
-        # concatenate all variables in one vector
-        boolean, integer = extract_mip_idx(problem.variables())
-        x = Variable(extractor.x_length, boolean=boolean, integer=integer)
         if self.quad_obj:
             # extract to 0.5 * x.T * P * x + q.T * x + r
             expr = problem.objective.expr.copy()
@@ -337,61 +451,66 @@ class ConeMatrixStuffing(MatrixStuffing):
             # Extract to c.T * x + r; c is represented by a ma
             params_to_c = extractor.affine(problem.objective.expr)
             params_to_P = None
-        return params_to_P, params_to_c, x
+        return params_to_P, params_to_c
+
+    def lower_constraint(self, con):
+        """Lowers equality and inequality to Zero and NonNeg, and puts the
+        arguments of the other cones in the form the solvers expect.
+        """
+        if isinstance(con, Equality):
+            con = lower_equality(con)
+        elif isinstance(con, Inequality):
+            con = lower_ineq_to_nonneg(con)
+        elif isinstance(con, NonPos):
+            con = nonpos2nonneg(con)
+        elif isinstance(con, SOC) and con.axis == 1:
+            con = SOC(con.args[0], con.args[1].T, axis=0,
+                      constr_id=con.constr_id)
+        elif isinstance(con, PowCone3D) and con.args[0].ndim > 1:
+            x, y, z = con.args
+            alpha = con.alpha
+            con = PowCone3D(x.flatten(), y.flatten(), z.flatten(), alpha.flatten(),
+                            constr_id=con.constr_id)
+        elif isinstance(con, ExpCone) and con.args[0].ndim > 1:
+            x, y, z = con.args
+            con = ExpCone(x.flatten(), y.flatten(), z.flatten(),
+                          constr_id=con.constr_id)
+        return con
 
     def apply(self, problem):
         inverse_data = InverseData(problem)
         # Form the constraints
         extractor = CoeffExtractor(inverse_data, self.canon_backend)
-        params_to_P, params_to_c, flattened_variable = self.stuffed_objective(
-            problem, extractor)
-        # Lower equality and inequality to Zero and NonNeg.
-        cons = []
-        for con in problem.constraints:
-            if isinstance(con, Equality):
-                con = lower_equality(con)
-            elif isinstance(con, Inequality):
-                con = lower_ineq_to_nonneg(con)
-            elif isinstance(con, NonPos):
-                con = nonpos2nonneg(con)
-            elif isinstance(con, SOC) and con.axis == 1:
-                con = SOC(con.args[0], con.args[1].T, axis=0,
-                          constr_id=con.constr_id)
-            elif isinstance(con, PowCone3D) and con.args[0].ndim > 1:
-                x, y, z = con.args
-                alpha = con.alpha
-                con = PowCone3D(x.flatten(), y.flatten(), z.flatten(), alpha.flatten(),
-                                constr_id=con.constr_id)
-            elif isinstance(con, ExpCone) and con.args[0].ndim > 1:
-                x, y, z = con.args
-                con = ExpCone(x.flatten(), y.flatten(), z.flatten(),
-                              constr_id=con.constr_id)
-            cons.append(con)
-        # Reorder constraints to Zero, NonNeg, SOC, PSD, EXP, PowCone3D
-        constr_map = group_constraints(cons)
-        ordered_cons = constr_map[Zero] + constr_map[NonNeg] + \
-            constr_map[SOC] + constr_map[PSD] + constr_map[ExpCone] + constr_map[PowCone3D]
+        flattened_variable = self.stuffed_variable(problem, extractor)
+        # Lower the constraints and reorder them to
+        # Zero, NonNeg, SOC, PSD, EXP, PowCone3D.
+        ordered_cons, extract_constraint_tensor = self.stuffed_constraints(
+            problem, extractor, inverse_data)
         inverse_data.cons_id_map = {con.id: con.id for con in ordered_cons}
 
         inverse_data.constraints = ordered_cons
-        # Batch expressions together, then split apart.
-        expr_list = [arg for c in ordered_cons for arg in c.args]
-        params_to_problem_data = extractor.affine(expr_list)
+
+        def extract_tensors():
+            params_to_P, params_to_c = self.stuffed_objective(problem, extractor)
+            return {'P': params_to_P, 'c': params_to_c,
+                    'A': extract_constraint_tensor()}
+        tensors = self.stuffed_tensors(problem, extract_tensors,
+                                       quad_obj=self.quad_obj)
 
         inverse_data.minimize = type(problem.objective) == Minimize
         variables = problem.variables()
         lower_bounds = extract_lower_bounds(variables, flattened_variable.size)
         upper_bounds = extract_upper_bounds(variables, flattened_variable.size)
         new_prob = ParamConeProg(
-            params_to_c,
+            tensors['c'],
             flattened_variable,
-            params_to_problem_data,
+            tensors['A'],
             variables,
             inverse_data.var_offsets,
             ordered_cons,
             problem.parameters(),
             inverse_data.param_id_map,
-            P=params_to_P,
+            P=tensors['P'],
             lower_bounds=lower_bounds,
             upper_bounds=upper_bounds,
         )
@@ -24,6 +24,7 @@ from cvxpy.reductions.canonicalization import Canonicalization
 from cvxpy.reductions.dcp2cone.canonicalizers import CANON_METHODS as cone_canon_methods
 from cvxpy.reductions.inverse_data import InverseData
 from cvxpy.reductions.qp2quad_form.canonicalizers import QUAD_CANON_METHODS as quad_canon_methods
+from cvxpy.utilities import profiling, traversal
 
 
 class Dcp2Cone(Canonicalization):
@@ -39,6 +40,9 @@ class Dcp2Cone(Canonicalization):
         self.quad_canon_methods = quad_canon_methods
         self.quad_obj = quad_obj
 
+    def memo_key(self):
+        return (type(self), self.quad_obj)
+
     def accepts(self, problem):
         """A problem is accepted if it is a minimization and is DCP.
         """
@@ -52,7 +56,7 @@ class Dcp2Cone(Canonicalization):
 
         inverse_data = InverseData(problem)
 
-        canon_objective, canon_constraints = self.canonicalize_tree(
+        canon_objective, canon_constraints = self.memoized_canonicalize_tree(
             problem.objective, True)
 
         for constraint in problem.constraints:
@@ -60,17 +64,23 @@ class Dcp2Cone(Canonicalization):
             # its canonicalized arguments, and aux_constr are the constraints
             # generated while canonicalizing the arguments of the original
             # constraint
-            canon_constr, aux_constr = self.canonicalize_tree(
+            canon_constr, aux_constr = self.memoized_canonicalize_tree(
                 constraint, False)
             canon_constraints += aux_constr + [canon_constr]
             inverse_data.cons_id_map.update({constraint.id: canon_constr.id})
+        if self.memo is not None:
+            self.memo.commit()
 
         new_problem = problems.problem.Problem(canon_objective,
                                                canon_constraints)
         return new_problem, inverse_data
 
     def canonicalize_tree(self, expr, affine_above: bool) -> Tuple[Expression, list]:
-        """Recursively canonicalize an Expression.
+        """Canonicalize an Expression, visiting its arguments first.
+
+        The tree is traversed without recursion. Every occurrence of a shared
+        subexpression is canonicalized separately, as later reductions may
+        modify the canonicalized tree in place.
 
         Parameters
         ----------
@@ -81,23 +91,30 @@ class Dcp2Cone(Canonicalization):
         -------
         A tuple of the canonicalized expression and generated constraints.
         """
-        # TODO don't copy affine expressions?
-        if type(expr) == cvxtypes.partial_problem():
-            canon_expr, constrs = self.canonicalize_tree(
-              expr.args[0].objective.expr, False)
-            for constr in expr.args[0].constraints:
-                canon_constr, aux_constr = self.canonicalize_tree(constr, False)
-                constrs += [canon_constr] + aux_constr
-        else:
+        constrs = []
+
+        def children(node):
+            expr, affine_above = node
+            if type(expr) is cvxtypes.partial_problem():
+                problem = expr.args[0]
+                return [(problem.objective.expr, False)] + [
+                    (constr, False) for constr in problem.constraints]
             affine_atom = type(expr) not in self.cone_canon_methods
-            canon_args = []
-            constrs = []
-            for arg in expr.args:
-                canon_arg, c = self.canonicalize_tree(arg, affine_atom and affine_above)
-                canon_args += [canon_arg]
-                constrs += c
+            return [(arg, affine_atom and affine_above) for arg in expr.args]
+
+        def canonicalize(node, canon_args):
+            expr, affine_above = node
+            if type(expr) is cvxtypes.partial_problem():
+                # The arguments are the objective and the constraints.
+                constrs.extend(canon_args[1:])
+                return canon_args[0]
+            # TODO don't copy affine expressions?
             canon_expr, c = self.canonicalize_expr(expr, canon_args, affine_above)
-            constrs += c
+            constrs.extend(c)
+            return canon_expr
+
+        canon_expr = traversal.fold_tree(
+            (expr, affine_above), canonicalize, children)
         return canon_expr, constrs
 
     def canonicalize_expr(self, expr, args, affine_above: bool) -> Tuple[Expression, list]:
@@ -121,11 +138,14 @@ class Dcp2Cone(Canonicalization):
         if self.quad_obj and affine_above and type(expr) in self.quad_canon_methods:
             # Special case for power.
             if type(expr) == cvxtypes.power() and not expr._quadratic_power():
-                return self.cone_canon_methods[type(expr)](expr, args)
+                canon_method = self.cone_canon_methods[type(expr)]
             else:
-                return self.quad_canon_methods[type(expr)](expr, args)
+                canon_method = self.quad_canon_methods[type(expr)]
+            with profiling.span(type(expr).__name__):
+                return canon_method(expr, args)
 
         if type(expr) in self.cone_canon_methods:
-            return self.cone_canon_methods[type(expr)](expr, args)
+            with profiling.span(type(expr).__name__):
+                return self.cone_canon_methods[type(expr)](expr, args)
 
         return expr.copy(args), []
@@ -0,0 +1,212 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import annotations
+
+import numpy as np
+import scipy.sparse as sp
+
+import cvxpy.lin_ops.lin_op as lo
+
+
+class Memo:
+    """Maps objects to the results a reduction computed for them.
+
+    Entries are keyed by object identity. Only the entries that were used
+    or added since the previous call to `commit` are kept by `commit`, so
+    that the memo does not grow with objects that have left the problem.
+    """
+
+    def __init__(self) -> None:
+        self._entries = {}
+        self._used = {}
+
+    def get(self, obj):
+        """Returns the result stored for obj, or None."""
+        key = id(obj)
+        entry = self._used.get(key)
+        if entry is None:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] is not obj:
+            return None
+        self._used[key] = entry
+        return entry[1]
+
+    def put(self, obj, result) -> None:
+        """Stores the result computed for obj."""
+        self._used[id(obj)] = (obj, result)
+
+    def commit(self) -> None:
+        """Drops the entries that were not used since the last commit."""
+        self._entries, self._used = self._used, {}
+
+
+class IncrementalCompilation:
+    """The memos shared by the compilations of a growing problem.
+
+    Problems built with Problem.add_constraints share an instance of this
+    class. The reductions of their solving chains reuse the work they did
+    for the constraints of earlier problems, so that compiling a problem
+    costs time proportional to the constraints that were added.
+    """
+
+    def __init__(self) -> None:
+        self._memos = {}
+
+    def attach(self, solving_chain) -> None:
+        """Gives the reductions of a solving chain their memos."""
+        for reduction in solving_chain.reductions:
+            key = reduction.memo_key()
+            if key is not None:
+                reduction.memo = self._memos.setdefault(key, Memo())
+
+
+def _ragged_arange(starts, counts):
+    """Concatenates arange(start, start + count) for each start and count."""
+    total = counts.sum()
+    ends = np.cumsum(counts)
+    return np.arange(total) + np.repeat(starts - (ends - counts), counts)
+
+
+def _remap(cols, old_offsets, new_offsets):
+    """Moves columns from the layout old_offsets to the layout new_offsets.
+
+    The layouts map ids to the first column of contiguous blocks; the
+    blocks missing from new_offsets do not move.
+    """
+    ids = list(old_offsets)
+    old_starts = np.array([old_offsets[i] for i in ids], dtype=np.int64)
+    new_starts = np.array([new_offsets.get(i, old_offsets[i]) for i in ids],
+                          dtype=np.int64)
+    order = np.argsort(old_starts, kind='stable')
+    old_starts, new_starts = old_starts[order], new_starts[order]
+    block = np.searchsorted(old_starts, cols, side='right') - 1
+    return cols + (new_starts - old_starts)[block]
+
+
+def _var_layout(inverse_data):
+    """Returns the variable offsets with the offset of the constant column."""
+    layout = dict(inverse_data.var_offsets)
+    layout[lo.CONSTANT_ID] = inverse_data.x_length
+    return layout
+
+
+class ConstraintTensors:
+    """The problem data tensor of a batch of constraints.
+
+    The tensor is stored as coordinates in the variable and parameter
+    layout of the problem it was extracted from, sorted by constraint, so
+    that the rows of any of the constraints can be placed in the tensor of
+    another problem with a different layout.
+
+    Parameters
+    ----------
+    tensor : SciPy sparse matrix
+        The tensor returned by CoeffExtractor.affine for the arguments of
+        the constraints.
+    sizes : list of int
+        The number of rows of each constraint.
+    inverse_data : InverseData
+        The inverse data of the problem the tensor was extracted from.
+    """
+
+    def __init__(self, tensor, sizes, inverse_data) -> None:
+        tensor = tensor.tocoo()
+        row_starts = np.cumsum([0] + list(sizes), dtype=np.int64)
+        col, row = np.divmod(tensor.row.astype(np.int64),
+                             max(row_starts[-1], 1))
+        constraint = np.searchsorted(row_starts, row, side='right') - 1
+        order = np.argsort(constraint, kind='stable')
+        constraint = constraint[order]
+        self.data = tensor.data[order]
+        self.row = row[order] - row_starts[constraint]
+        self.col = col[order]
+        self.param_col = tensor.col[order].astype(np.int64)
+        self.entry_starts = np.searchsorted(
+            constraint, np.arange(len(sizes) + 1))
+        self.var_layout = _var_layout(inverse_data)
+        self.param_id_map = dict(inverse_data.param_id_map)
+
+    def entries(self, indices, row_offsets, inverse_data):
+        """Returns the entries of some of the constraints in another layout.
+
+        Parameters
+        ----------
+        indices : NumPy array
+            The positions of the constraints in the batch.
+        row_offsets : NumPy array
+            The first row of each constraint in the other tensor.
+        inverse_data : InverseData
+            The inverse data of the problem of the other tensor.
+
+        Returns
+        -------
+        tuple
+            The values, rows, variable columns and parameter columns of the
+            entries.
+        """
+        starts = self.entry_starts[indices]
+        counts = self.entry_starts[indices + 1] - starts
+        idx = _ragged_arange(starts, counts)
+        rows = np.repeat(row_offsets, counts) + self.row[idx]
+        cols, param_cols = self.col[idx], self.param_col[idx]
+        var_layout = _var_layout(inverse_data)
+        if self.var_layout != var_layout:
+            cols = _remap(cols, self.var_layout, var_layout)
+        if self.param_id_map != inverse_data.param_id_map:
+            param_cols = _remap(param_cols, self.param_id_map,
+                                inverse_data.param_id_map)
+        return self.data[idx], rows, cols, param_cols
+
+
+def stack_constraint_tensors(blocks, sizes, inverse_data):
+    """Builds the problem data tensor of constraints from their batches.
+
+    Parameters
+    ----------
+    blocks : list of tuple
+        The (ConstraintTensors, position) of each constraint, in order.
+    sizes : list of int
+        The number of rows of each constraint.
+    inverse_data : InverseData
+        The inverse data of the problem.
+
+    Returns
+    -------
+    SciPy CSC matrix
+        The tensor, as returned by CoeffExtractor.affine for the arguments
+        of the constraints.
+    """
+    num_rows = int(sum(sizes))
+    row_offsets = np.cumsum([0] + list(sizes[:-1]), dtype=np.int64)
+    by_batch = {}
+    for (batch, index), offset in zip(blocks, row_offsets):
+        _, indices, offsets = by_batch.setdefault(id(batch), (batch, [], []))
+        indices.append(index)
+        offsets.append(offset)
+    data, rows, params = [], [], []
+    for batch, indices, offsets in by_batch.values():
+        values, row, col, param_col = batch.entries(
+            np.array(indices, dtype=np.int64),
+            np.array(offsets, dtype=np.int64), inverse_data)
+        data.append(values)
+        rows.append(col * num_rows + row)
+        params.append(param_col)
+    # The constant column comes last.
+    shape = (num_rows * (inverse_data.x_length + 1),
+             inverse_data.param_id_map[lo.CONSTANT_ID] + 1)
+    return sp.csc_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(params))),
+        shape=shape)
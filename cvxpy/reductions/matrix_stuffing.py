@@ -20,7 +20,17 @@ from typing import List, Optional, Tuple
 
 import numpy as np
 
+from cvxpy.expressions.variable import Variable
+from cvxpy.reductions.compilation_cache import (
+    compilation_key,
+    get_compilation_cache,
+)
+from cvxpy.reductions.incremental import (
+    ConstraintTensors,
+    stack_constraint_tensors,
+)
 from cvxpy.reductions.reduction import Reduction
+from cvxpy.reductions.utilities import group_constraints
 
 
 def extract_lower_bounds(variables: list, var_size: int) -> Optional[np.ndarray]:
@@ -108,6 +118,9 @@ class MatrixStuffing(Reduction):
 
     __metaclass__ = abc.ABCMeta
 
+    # The cones of the stuffed problem, in the order of its constraints.
+    CONES = []
+
     def apply(self, problem) -> None:
         """Returns a stuffed problem.
 
@@ -133,3 +146,94 @@ class MatrixStuffing(Reduction):
 
     def stuffed_objective(self, problem, inverse_data):
         raise NotImplementedError()
+
+    def lower_constraint(self, con):
+        """Returns a constraint equivalent to con whose type is in CONES."""
+        raise NotImplementedError()
+
+    def stuffed_constraints(self, problem, extractor, inverse_data):
+        """Lowers the constraints of a problem and orders them by cone.
+
+        If the reduction has a memo, the lowered constraints and the rows of
+        the tensor computed for constraints of an earlier problem are
+        reused, so that only the new constraints are stuffed.
+
+        Parameters
+        ----------
+        problem: The problem to stuff
+        extractor: The CoeffExtractor of the problem
+        inverse_data: The InverseData of the problem
+
+        Returns
+        -------
+        list
+            The lowered constraints, ordered by cone
+        function
+            A function that returns the tensor of the arguments of the
+            ordered constraints, as computed by extractor.affine
+        """
+        lowered, sources = [], {}
+        for con in problem.constraints:
+            entry = None if self.memo is None else self.memo.get(con)
+            if entry is None:
+                entry = (self.lower_constraint(con), None)
+            lowered.append(entry[0])
+            sources[id(entry[0])] = (con, entry[1])
+        constr_map = group_constraints(lowered)
+        ordered_cons = [con for cone in self.CONES for con in constr_map[cone]]
+
+        def extract_constraint_tensor():
+            if self.memo is None:
+                return extractor.affine(
+                    [arg for c in ordered_cons for arg in c.args])
+            sizes = [sum(arg.size for arg in c.args) for c in ordered_cons]
+            blocks = [sources[id(c)][1] for c in ordered_cons]
+            new = [i for i, block in enumerate(blocks) if block is None]
+            if new:
+                new_cons = [ordered_cons[i] for i in new]
+                tensor = extractor.affine(
+                    [arg for c in new_cons for arg in c.args])
+                batch = ConstraintTensors(tensor, [sizes[i] for i in new],
+                                          inverse_data)
+                for position, i in enumerate(new):
+                    blocks[i] = (batch, position)
+            if len(new) < len(ordered_cons):
+                tensor = stack_constraint_tensors(blocks, sizes, inverse_data)
+            for con, block in zip(ordered_cons, blocks):
+                self.memo.put(sources[id(con)][0], (con, block))
+            self.memo.commit()
+            return tensor
+        return ordered_cons, extract_constraint_tensor
+
+    def stuffed_variable(self, problem, extractor) -> Variable:
+        """Returns a variable that concatenates all variables in the problem."""
+        boolean, integer = extract_mip_idx(problem.variables())
+        return Variable(extractor.x_length, boolean=boolean, integer=integer)
+
+    def stuffed_tensors(self, problem, extract_tensors, **options):
+        """Returns the problem data tensors of a problem.
+
+        The tensors are loaded from the compilation cache, if one is set and
+        it holds the tensors of a structurally identical problem; otherwise
+        they are computed by extract_tensors and stored in the cache.
+
+        Parameters
+        ----------
+        problem: The problem to stuff
+        extract_tensors: A function that returns a dict of the tensors
+        options: The options of the reduction that affect the tensors
+
+        Returns
+        -------
+        dict
+            The tensors, keyed by name
+        """
+        cache = get_compilation_cache()
+        if cache is None:
+            return extract_tensors()
+        key = compilation_key(self, problem, **options)
+        tensors = cache.load(key)
+        if tensors is None:
+            tensors = extract_tensors()
+            cache.save(key, tensors)
+        return tensors
@@ -44,6 +44,9 @@ class Qp2SymbolicQp(Canonicalization):
         super(Qp2SymbolicQp, self).__init__(
           problem=problem, canon_methods=qp_canon_methods)
 
+    def memo_key(self):
+        return (type(self),)
+
     def accepts(self, problem):
         """
         Problems with quadratic, piecewise affine objectives,
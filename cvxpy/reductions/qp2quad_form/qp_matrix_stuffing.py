@@ -16,6 +16,7 @@ limitations under the License.
 from __future__ import annotations
 
 import numpy as np
+import scipy.sparse as sp
 
 import cvxpy.settings as s
 from cvxpy.constraints import (
@@ -29,7 +30,6 @@ from cvxpy.constraints import (
     Zero,
 )
 from cvxpy.cvxcore.python import canonInterface
-from cvxpy.expressions.variable import Variable
 from cvxpy.problems.objective import Minimize
 from cvxpy.problems.param_prob import ParamProb
 from cvxpy.reductions import InverseData, Solution
@@ -38,15 +38,15 @@ from cvxpy.reductions.dcp2cone.cone_matrix_stuffing import nonpos2nonneg
 from cvxpy.reductions.matrix_stuffing import (
     MatrixStuffing,
     extract_lower_bounds,
-    extract_mip_idx,
     extract_upper_bounds,
 )
 from cvxpy.reductions.utilities import (
     ReducedMat,
     are_args_affine,
-    group_constraints,
+    csc_from_index,
     lower_equality,
     lower_ineq_to_nonneg,
+    parameter_entries,
 )
 from cvxpy.utilities.coeff_extractor import CoeffExtractor
 
@@ -140,6 +140,7 @@ class ParamQuadProg(ParamProb):
         # of parameters.
         self.reduced_A = ReducedMat(self.A, self.x.size)
         self.reduced_P = ReducedMat(self.P, self.x.size, quad_form=True)
+        self._parameter_entries = None
 
         self.constraints = constraints
         self.constr_size = sum([c.size for c in constraints])
@@ -192,15 +193,102 @@ class ParamQuadProg(ParamProb):
         A, b = self.reduced_A.get_matrix_from_tensor(param_vec, with_offset=True)
         return P, q, d, A, np.atleast_1d(b)
 
+    def parameter_entries(self) -> dict:
+        """Returns the entries of the problem data that depend on parameters.
+
+        Returns:
+          A dict mapping 'q' and 'b' to the indices of the entries of q and
+          of the constraint offset, and 'P' and 'A' to tuples (rows, cols)
+          of the entries of P and of the constraint matrix, whose values
+          change with the values of the parameters.
+        """
+        if self._parameter_entries is None:
+            self._parameter_entries = parameter_entries(
+                self.q, self.reduced_A, self.reduced_P, self.x.size)
+        return self._parameter_entries
+
+    def parameter_dependence(self) -> dict:
+        """Returns which parts of the problem data depend on the parameters.
+
+        Returns:
+          A dict mapping 'P', 'q', 'A' and 'b' to whether that part of the
+          problem data changes with the values of the parameters.
+        """
+        return {key: len(index[0] if isinstance(index, tuple) else index) > 0
+                for key, index in self.parameter_entries().items()}
+
+    def apply_parameter_matrix(self, param_mat: np.ndarray):
+        """Applies a matrix of stacked parameter vectors.
+
+        Args:
+          param_mat: matrix of shape (total_param_size + 1, k) whose columns
+                     are parameter vectors.
+
+        Returns:
+          A tuple (P_data, P_index, q, d, A_data, A_index, b); see
+          ParamConeProg.apply_parameter_matrix.
+        """
+        P_data, P_index, _ = self.reduced_P.get_stacked_data_from_tensor(
+            param_mat, with_offset=False)
+        q = np.asarray(self.q @ param_mat)
+        A_data, A_index, b = self.reduced_A.get_stacked_data_from_tensor(
+            param_mat, with_offset=True)
+        return P_data, P_index, q[:-1], q[-1], A_data, A_index, b
+
+    def apply_parameters_batch(self, id_to_param_values, batch_size: int,
+                               keep_zeros: bool = False):
+        """Applies a batch of parameter assignments at once.
+
+        Args:
+          id_to_param_values: dict mapping parameter ids to arrays of values
+                              with a leading batch axis of length batch_size.
+          batch_size: the number of parameter assignments.
+          keep_zeros: (optional) if True, store explicit zeros in A where
+                        parameters are affected; the shared structure always
+                        keeps them.
+
+        Returns:
+          A list with one (P, q, d, A, b) tuple per assignment.
+        """
+        param_mat = canonInterface.get_parameter_matrix(
+            self.total_param_size,
+            self.param_id_to_col,
+            self.param_id_to_size,
+            lambda idx: id_to_param_values[idx],
+            batch_size)
+        if param_mat is None:
+            return [self.apply_parameters(keep_zeros=keep_zeros)] * batch_size
+        P_data, P_index, q, d, A_data, A_index, b = self.apply_parameter_matrix(
+            param_mat)
+        return [(csc_from_index(P_data[:, j], P_index), q[:, j], d[j],
+                 csc_from_index(A_data[:, j], A_index), b[:, j])
+                for j in range(batch_size)]
+
     def apply_param_jac(self, delP, delq, delA, delb, active_params=None):
         """Multiplies by Jacobian of parameter mapping.
 
-        Assumes delA is sparse.
+        Assumes delP and delA are sparse; only their entries that are affected
+        by parameters are read.
 
         Returns:
             A dictionary param.id -> dparam
         """
-        raise NotImplementedError
+        if active_params is None:
+            active_params = {p.id for p in self.parameters}
+
+        delAb = sp.hstack([delA, sp.csc_matrix(np.asarray(delb)[:, None])])
+        del_param_vec = self.q[:-1].T @ np.asarray(delq)
+        del_param_vec += self.reduced_A.apply_adjoint([delAb])[:, 0]
+        del_param_vec += self.reduced_P.apply_adjoint([delP])[:, 0]
+
+        param_id_to_delta_param = {}
+        for param_id, col in self.param_id_to_col.items():
+            if param_id in active_params:
+                param = self.id_to_param[param_id]
+                delta = del_param_vec[col:col + param.size]
+                param_id_to_delta_param[param_id] = np.reshape(
+                    delta, param.shape, order='F')
+        return param_id_to_delta_param
 
     def split_solution(self, sltn, active_vars=None):
         """Splits the solution into individual variables.
@@ -223,9 +311,14 @@ class QpMatrixStuffing(MatrixStuffing):
        affine arguments.
     """
 
+    CONES = [Zero, NonNeg]
+
     def __init__(self, canon_backend: str | None = None):
         self.canon_backend = canon_backend
 
+    def memo_key(self):
+        return (type(self), self.canon_backend)
+
     @staticmethod
     def accepts(problem):
         return (type(problem.objective) == Minimize
@@ -243,50 +336,46 @@ class QpMatrixStuffing(MatrixStuffing):
         params_to_P, params_to_q = extractor.quad_form(expr)
         # Handle 0.5 factor.
         params_to_P = 2*params_to_P
-
-        # concatenate all variables in one vector
-        boolean, integer = extract_mip_idx(problem.variables())
-        x = Variable(extractor.x_length, boolean=boolean, integer=integer)
-
-        return params_to_P, params_to_q, x
+        return params_to_P, params_to_q
+
+    def lower_constraint(self, con):
+        """Lowers equality and inequality to Zero and NonNeg."""
+        if isinstance(con, Equality):
+            con = lower_equality(con)
+        elif isinstance(con, Inequality):
+            con = lower_ineq_to_nonneg(con)
+        elif isinstance(con, NonPos):
+            con = nonpos2nonneg(con)
+        return con
 
     def apply(self, problem):
         """See docstring for MatrixStuffing.apply"""
         inverse_data = InverseData(problem)
         # Form the constraints
         extractor = CoeffExtractor(inverse_data, self.canon_backend)
-        params_to_P, params_to_q, flattened_variable = self.stuffed_objective(
-            problem, extractor)
-        # Lower equality and inequality to Zero and NonNeg.
-        cons = []
-        for con in problem.constraints:
-            if isinstance(con, Equality):
-                con = lower_equality(con)
-            elif isinstance(con, Inequality):
-                con = lower_ineq_to_nonneg(con)
-            elif isinstance(con, NonPos):
-                con = nonpos2nonneg(con)
-            cons.append(con)
-
-        # Reorder constraints to Zero, NonNeg.
-        constr_map = group_constraints(cons)
-        ordered_cons = constr_map[Zero] + constr_map[NonNeg]
+        flattened_variable = self.stuffed_variable(problem, extractor)
+        # Lower the constraints and reorder them to Zero, NonNeg.
+        ordered_cons, extract_constraint_tensor = self.stuffed_constraints(
+            problem, extractor, inverse_data)
         inverse_data.cons_id_map = {con.id: con.id for con in ordered_cons}
 
         inverse_data.constraints = ordered_cons
-        # Batch expressions together, then split apart.
-        expr_list = [arg for c in ordered_cons for arg in c.args]
-        params_to_Ab = extractor.affine(expr_list)
+
+        def extract_tensors():
+            params_to_P, params_to_q = self.stuffed_objective(problem, extractor)
+            return {'P': params_to_P, 'q': params_to_q,
+                    'A': extract_constraint_tensor()}
+        tensors = self.stuffed_tensors(problem, extract_tensors)
 
         inverse_data.minimize = type(problem.objective) == Minimize
         variables = problem.variables()
         lower_bounds = extract_lower_bounds(variables, flattened_variable.size)
         upper_bounds = extract_upper_bounds(variables, flattened_variable.size)
         new_prob = ParamQuadProg(
-            params_to_P,
-            params_to_q,
+            tensors['P'],
+            tensors['q'],
             flattened_variable,
-            params_to_Ab,
+            tensors['A'],
             variables,
             inverse_data.var_offsets,
             ordered_cons,
@@ -48,6 +48,10 @@ class Reduction:
 
     __metaclass__ = ABCMeta
 
+    # The Memo of the reduction's per-constraint work, set by
+    # IncrementalCompilation.attach for reductions with a memo_key.
+    memo = None
+
     def __init__(self, problem=None) -> None:
         """Construct a reduction for reducing `problem`.
 
@@ -71,6 +75,17 @@ class Reduction:
         """
         raise NotImplementedError()
 
+    def memo_key(self):
+        """Returns a key identifying the reduction's per-constraint work.
+
+        Reductions that transform each constraint independently of the rest
+        of the problem may return a key that covers their options; problems
+        built with Problem.add_constraints then share a Memo among the
+        reductions with equal keys, so that constraints are only reduced
+        once. The default returns None, i.e., nothing is memoized.
+        """
+        return None
+
     def reduce(self):
         """Reduces the owned problem to an equivalent problem.
 
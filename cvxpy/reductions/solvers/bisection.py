@@ -16,24 +16,31 @@ limitations under the License.
 import warnings
 
 import cvxpy.error as error
-import cvxpy.problems as problems
 import cvxpy.settings as s
-from cvxpy.problems.objective import Minimize
 from cvxpy.reductions.solution import failure_solution
 
 
 def _lower_problem(problem):
-    """Evaluates lazy constraints."""
-    return problems.problem.Problem(
-            Minimize(0),
-            problem.constraints + [c() for c in problem._lazy_constraints])
+    """Evaluates lazy constraints.
+
+    Problems without lazy constraints are returned as is: they are DPP in
+    the bisection parameter, so solving them again after the parameter
+    changes reuses their compilation. Otherwise, the evaluated lazy
+    constraints are appended with add_constraints, so that only they are
+    compiled when the parameter changes.
+    """
+    if not problem._lazy_constraints:
+        return problem
+    return problem.add_constraints(
+        *[c() for c in problem._lazy_constraints])
 
 
-def _solve(problem, solver) -> None:
+def _solve(problem, solver, warm_start: bool = False) -> None:
     with warnings.catch_warnings():
-        # TODO(akshayka): Try to emit DPP problems in Dqcp2Dcp
+        # Some quasiconvex atoms have sublevel sets that are not DPP in the
+        # bisection parameter; their problems are recompiled on each query.
         warnings.filterwarnings('ignore', message=r'.*DPP.*')
-        problem.solve(solver=solver)
+        problem.solve(solver=solver, warm_start=warm_start)
 
 
 def _infeasible(problem) -> bool:
@@ -41,11 +48,6 @@ def _infeasible(problem) -> bool:
                                                  s.INFEASIBLE_INACCURATE)
 
 
-# TODO(akshayka): Eliminate the need for reconstructing the problem
-# (via _lower_problem). Right now, some constraints are lazy, namely the
-# callable constraints, because for certain values of the parameters they
-# become invalidated. Either support lazy constraints that do not need
-# recompilation, or (if possible) find rewritings that 'just work'.
 def _find_bisection_interval(problem, t, solver=None, low=None, high=None,
                              max_iters=100):
     """Finds an interval for bisection."""
@@ -114,7 +116,9 @@ def _bisect(problem, solver, t, low, high, tighten_lower, tighten_higher,
             print("(iteration %d) query point: %0.6f " % (i, query_pt))
         t.value = query_pt
         lowered = _lower_problem(problem)
-        _solve(lowered, solver=solver)
+        # Consecutive queries are close, so the solver is warm started
+        # from the solution of the previous one.
+        _solve(lowered, solver=solver, warm_start=True)
 
         if _infeasible(lowered):
             if verbose and i % verbose_freq == 0:
@@ -13,6 +13,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import threading
 from typing import Tuple
 
 import numpy as np
@@ -25,6 +26,7 @@ from cvxpy.reductions.dcp2cone.cone_matrix_stuffing import ParamConeProg
 from cvxpy.reductions.solution import Solution, failure_solution
 from cvxpy.reductions.solvers import utilities
 from cvxpy.reductions.solvers.solver import Solver
+from cvxpy.utilities import profiling
 
 # NOTE(akshayka): Small changes to this file can lead to drastic
 # performance regressions. If you are making a change to this file,
@@ -32,54 +34,84 @@ from cvxpy.reductions.solvers.solver import Solver
 # not introduced a regression.
 
 
-class LinearOperator:
-    """A wrapper for linear operators."""
-    def __init__(self, linear_op, shape: Tuple[int, ...]) -> None:
-        if sp.issparse(linear_op):
-            self._matmul = lambda X: linear_op @ X
+class RowScatter:
+    """Maps the rows of a problem data tensor with a restructuring matrix.
+
+    The rows of the tensor A of a ParamConeProg hold the blocks
+    A[:, j] of the coefficient matrix for the variable entries j, followed
+    by the offset, and the restructuring matrix R maps the rows of each
+    block to the rows of the cones of a solver. Every column of R has at
+    most a few entries, e.g., one for a permutation of the rows, so R is
+    applied to A by scattering its entries directly with index arrays,
+    rather than by multiplying with a block diagonal matrix.
+
+    Parameters
+    ----------
+    restruct_mat : SciPy CSC matrix
+        The restructuring matrix R.
+    """
+
+    def __init__(self, restruct_mat) -> None:
+        restruct_mat = sp.csc_matrix(restruct_mat)
+        restruct_mat.sum_duplicates()
+        self.shape = restruct_mat.shape
+        self.indptr = restruct_mat.indptr.astype(np.int64)
+        self.rows = restruct_mat.indices.astype(np.int64)
+        self.scale = restruct_mat.data
+        counts = np.diff(self.indptr)
+        # Whether each row of A lands on exactly one row.
+        self.one_to_one = bool(np.all(counts == 1))
+        # Whether rows of A may be summed into the same row.
+        self.merges = restruct_mat.nnz > 0 and \
+            np.bincount(self.rows, minlength=self.shape[0]).max() > 1
+        self.identity = self.one_to_one and self.shape[0] == self.shape[1] \
+            and np.array_equal(self.rows, np.arange(self.shape[1])) \
+            and np.all(self.scale == 1)
+
+    def apply(self, tensor):
+        """Returns the restructured tensor, as a COO matrix."""
+        if self.identity or self.shape[1] == 0:
+            return tensor
+        m, n = self.shape
+        tensor = tensor.tocoo()
+        block, old_rows = np.divmod(tensor.row.astype(np.int64), n)
+        if self.one_to_one:
+            entries = self.indptr[old_rows]
+            cols = tensor.col
+            data = tensor.data
         else:
-            self._matmul = linear_op
-        self.shape = shape
-
-    def __call__(self, X):
-        return self._matmul(X)
-
-class IdentityOperator(LinearOperator):
-    """A wrapper for the identity operator."""
-    def __init__(self, n):
-        self.shape = (n,n)
-    def __call__(self, X):
-        return X
-
-class NegativeIdentityOperator(LinearOperator):
-    """A wrapper for the negative identity operator."""
-    def __init__(self, n):
-        self.shape = (n,n)
-    def __call__(self, X):
-        return -X
-
-def as_linear_operator(linear_op):
-    if isinstance(linear_op, LinearOperator):
-        return linear_op
-    elif sp.issparse(linear_op):
-        return LinearOperator(linear_op, linear_op.shape)
-
-
-def as_block_diag_linear_operator(matrices) -> LinearOperator:
-    """Block diag of SciPy sparse matrices or linear operators."""
-    linear_operators = [as_linear_operator(op) for op in matrices]
-    nrows = [op.shape[0] for op in linear_operators]
-    ncols = [op.shape[1] for op in linear_operators]
-    m, n = sum(nrows), sum(ncols)
-    col_indices = np.append(0, np.cumsum(ncols))
-
-    def matmul(X):
-        outputs = []
-        for i, op in enumerate(linear_operators):
-            Xi = X[col_indices[i]:col_indices[i + 1]]
-            outputs.append(op(Xi))
-        return sp.vstack(outputs)
-    return LinearOperator(matmul, (m, n))
+            counts = self.indptr[old_rows + 1] - self.indptr[old_rows]
+            starts = np.repeat(self.indptr[old_rows] - np.cumsum(counts) + counts,
+                               counts)
+            entries = starts + np.arange(starts.size)
+            block = np.repeat(block, counts)
+            cols = np.repeat(tensor.col, counts)
+            data = np.repeat(tensor.data, counts)
+        num_blocks = tensor.shape[0] // n
+        restructured = sp.coo_matrix(
+            (data * self.scale[entries],
+             (block * m + self.rows[entries], cols.astype(np.int64))),
+            shape=(np.int64(m) * num_blocks, tensor.shape[1]))
+        if self.merges:
+            restructured.sum_duplicates()
+        return restructured
+
+
+# The row scatters of format_constraints, keyed by the solver, the layout
+# of the constraints and the order of the exponential cone arguments.
+# The lock guards reads and evictions, since problems may be compiled in
+# several threads at once.
+_RESTRUCT_CACHE = {}
+_RESTRUCT_CACHE_SIZE = 256
+_RESTRUCT_LOCK = threading.Lock()
+
+
+def _constraint_layout(constr):
+    """Returns the data that determines the restructuring of a constraint."""
+    if type(constr) is PSD:
+        return (PSD, constr.expr.shape)
+    return (type(constr), getattr(constr, 'axis', None)) + tuple(
+        arg.shape for arg in constr.args)
 
 
 # Utility method for formatting a ConeDims instance into a dictionary
@@ -165,44 +197,26 @@ class ConicSolver(Solver):
         # Default is identity.
         return sp.eye(constr.size, format='csc')
 
-    def format_constraints(self, problem, exp_cone_order):
-        """
-        Returns a ParamConeProg whose problem data tensors will yield the
-        coefficient "A" and offset "b" for the constraint in the following
-        formats:
-            Linear equations: (A, b) such that A * x + b == 0,
-            Linear inequalities: (A, b) such that A * x + b >= 0,
-            Second order cone: (A, b) such that A * x + b in SOC,
-            Exponential cone: (A, b) such that A * x + b in EXP,
-            Semidefinite cone: (A, b) such that A * x + b in PSD,
-
-        The CVXPY standard for the exponential cone is:
-            K_e = closure{(x,y,z) |  z >= y * exp(x/y), y>0}.
-        Whenever a solver uses this convention, EXP_CONE_ORDER should be
-        [0, 1, 2].
-
-        The CVXPY standard for the second order cone is:
-            SOC(n) = { x : x[0] >= norm(x[1:n], 2)  }.
-        All currently supported solvers use this convention.
+    def restruct_mat(self, constraints, exp_cone_order):
+        """Returns the matrix that maps the rows of the constraints, in the
+        order that CVXPY builds them, to the rows of the cones of the solver.
 
         Args:
-          problem : ParamConeProg
-            The problem that is the provenance of the constraint.
+          constraints: list
+            The constraints of a ParamConeProg.
           exp_cone_order: list
             A list indicating how the exponential cone arguments are ordered.
 
         Returns:
-          ParamConeProg with structured A.
+          A block diagonal SciPy CSC matrix.
         """
-        # Create a matrix to reshape constraints, then replicate for each
-        # variable entry.
         restruct_mat = []  # Form a block diagonal matrix.
-        for constr in problem.constraints:
+        for constr in constraints:
             total_height = sum([arg.size for arg in constr.args])
             if type(constr) == Zero:
-                restruct_mat.append(NegativeIdentityOperator(constr.size))
+                restruct_mat.append(-sp.eye(constr.size, format='csc'))
             elif type(constr) == NonNeg:
-                restruct_mat.append(IdentityOperator(constr.size))
+                restruct_mat.append(sp.eye(constr.size, format='csc'))
             elif type(constr) == SOC:
                 # Group each t row with appropriate X rows.
                 assert constr.axis == 0, 'SOC must be lowered to axis == 0'
@@ -252,30 +266,56 @@ class ConicSolver(Solver):
                 restruct_mat.append(self.psd_format_mat(constr))
             else:
                 raise ValueError("Unsupported constraint type.")
+        if not restruct_mat:
+            return sp.csc_matrix((0, 0))
+        return sp.block_diag(restruct_mat, format='csc')
+
+    def format_constraints(self, problem, exp_cone_order):
+        """
+        Returns a ParamConeProg whose problem data tensors will yield the
+        coefficient "A" and offset "b" for the constraint in the following
+        formats:
+            Linear equations: (A, b) such that A * x + b == 0,
+            Linear inequalities: (A, b) such that A * x + b >= 0,
+            Second order cone: (A, b) such that A * x + b in SOC,
+            Exponential cone: (A, b) such that A * x + b in EXP,
+            Semidefinite cone: (A, b) such that A * x + b in PSD,
+
+        The CVXPY standard for the exponential cone is:
+            K_e = closure{(x,y,z) |  z >= y * exp(x/y), y>0}.
+        Whenever a solver uses this convention, EXP_CONE_ORDER should be
+        [0, 1, 2].
+
+        The CVXPY standard for the second order cone is:
+            SOC(n) = { x : x[0] >= norm(x[1:n], 2)  }.
+        All currently supported solvers use this convention.
+
+        Args:
+          problem : ParamConeProg
+            The problem that is the provenance of the constraint.
+          exp_cone_order: list
+            A list indicating how the exponential cone arguments are ordered.
+
+        Returns:
+          ParamConeProg with structured A.
+        """
+        key = (type(self), tuple(_constraint_layout(constr)
+                                 for constr in problem.constraints),
+               None if exp_cone_order is None else tuple(exp_cone_order))
+        with _RESTRUCT_LOCK:
+            restruct = _RESTRUCT_CACHE.get(key)
+        if restruct is None:
+            # The row scatter is built outside the lock.
+            restruct = RowScatter(
+                self.restruct_mat(problem.constraints, exp_cone_order))
+            with _RESTRUCT_LOCK:
+                if key not in _RESTRUCT_CACHE:
+                    if len(_RESTRUCT_CACHE) >= _RESTRUCT_CACHE_SIZE:
+                        del _RESTRUCT_CACHE[next(iter(_RESTRUCT_CACHE))]
+                    _RESTRUCT_CACHE[key] = restruct
+        restructured_A = restruct.apply(problem.A)
 
         # Form new ParamConeProg
-        if restruct_mat:
-            # TODO(akshayka): profile to see whether using linear operators
-            # or bmat is faster
-            restruct_mat = as_block_diag_linear_operator(restruct_mat)
-            # this is equivalent to but _much_ faster than:
-            #    restruct_mat_rep = sp.block_diag([restruct_mat]*(problem.x.size + 1))
-            #    restruct_A = restruct_mat_rep * problem.A
-            unspecified, remainder = divmod(problem.A.shape[0] *
-                                            problem.A.shape[1],
-                                            restruct_mat.shape[1])
-            reshaped_A = problem.A.reshape(restruct_mat.shape[1],
-                                           unspecified, order='F').tocsr()
-            restructured_A = restruct_mat(reshaped_A).tocoo()
-            # Because of a bug in scipy versions <  1.20, `reshape`
-            # can overflow if indices are int32s.
-            restructured_A.row = restructured_A.row.astype(np.int64)
-            restructured_A.col = restructured_A.col.astype(np.int64)
-            restructured_A = restructured_A.reshape(
-                np.int64(restruct_mat.shape[0]) * (np.int64(problem.x.size) + 1),
-                problem.A.shape[1], order='F')
-        else:
-            restructured_A = problem.A
         new_param_cone_prog = ParamConeProg(
             problem.c,
             problem.x,
@@ -314,6 +354,21 @@ class ConicSolver(Solver):
         else:
             return failure_solution(status)
 
+    @staticmethod
+    def parameter_entries(data):
+        """Returns the entries of the problem data that depend on parameters.
+
+        The entries are keyed like data: c and b map to the indices of the
+        entries of the vectors, and A and P to tuples (rows, cols) of the
+        entries of the matrices. They are the only entries that can differ
+        between solves of the same compiled problem.
+        """
+        entries = data[s.PARAM_PROB].parameter_entries()
+        result = {s.C: entries['c'], s.A: entries['A'], s.B: entries['b']}
+        if s.P in data:
+            result[s.P] = entries['P']
+        return result
+
     def _prepare_data_and_inv_data(self, problem):
         data = {}
         inv_data = {self.VAR_ID: problem.x.id}
@@ -329,7 +384,8 @@ class ConicSolver(Solver):
         # 5. exponential
         # 6. three-dimensional power cones
         if not problem.formatted:
-            problem = self.format_constraints(problem, self.EXP_CONE_ORDER)
+            with profiling.span('format_constraints'):
+                problem = self.format_constraints(problem, self.EXP_CONE_ORDER)
         data[s.PARAM_PROB] = problem
         data[self.DIMS] = problem.cone_dims
         inv_data[self.DIMS] = problem.cone_dims
@@ -356,11 +412,12 @@ class ConicSolver(Solver):
 
         # Apply parameter values.
         # Obtain A, b such that Ax + s = b, s \in cones.
-        if problem.P is None:
-            c, d, A, b = problem.apply_parameters()
-        else:
-            P, c, d, A, b = problem.apply_parameters(quad_obj=True)
-            data[s.P] = P
+        with profiling.span('apply_parameters'):
+            if problem.P is None:
+                c, d, A, b = problem.apply_parameters()
+            else:
+                P, c, d, A, b = problem.apply_parameters(quad_obj=True)
+                data[s.P] = P
         data[s.C] = c
         inv_data[s.OFFSET] = d
         data[s.A] = -A
@@ -137,17 +137,136 @@ class GUROBI(ConicSolver):
         data : dict
             Data used by the solver.
         warm_start : bool
-            Not used.
+            Whether to update the model of the previous solve in place, if
+            it was built for the same compiled problem, or else to start
+            from its solution.
         verbose : bool
             Should the solver print output?
         solver_opts : dict
             Additional arguments for the solver.
+        solver_cache : dict, optional
+            Holds the model of the previous solve.
 
         Returns
         -------
         tuple
             (status, optimal value, primal, equality dual, inequality dual)
         """
+        c = data[s.C]
+        dims = dims_to_solver_dict(data[s.DIMS])
+
+        n = c.shape[0]
+
+        entries = self.parameter_entries(data)
+        data['param_values'] = utilities.parameter_values(data, entries)
+
+        cached = None
+        if warm_start and solver_cache is not None \
+                and self.name() in solver_cache:
+            cached = solver_cache[self.name()]
+        if cached is not None and \
+                cached[1][s.PARAM_PROB] is data[s.PARAM_PROB]:
+            # The model was built for the same compiled problem, so only
+            # the entries that depend on parameters can differ.
+            solver_opts.pop('env', None)
+            model = cached[0]
+            # Drop the parameters of earlier solves, e.g., their solver_opts
+            # or the DualReductions of a reoptimization.
+            model.resetParams()
+            model.setParam("OutputFlag", verbose)
+            old_status = self.STATUS_MAP.get(model.Status, s.SOLVER_ERROR)
+            x = model.getVars()[:n]
+            if (old_status in s.SOLUTION_PRESENT) or (model.solCount > 0):
+                model.setAttr('Start', x, model.getAttr('X', x))
+            changes = utilities.changed_entries(
+                entries, data['param_values'], cached[1]['param_values'])
+            self._update_model(model, changes)
+            variables = model.getVars()
+            # Every row of A is a linear constraint, including the rows of
+            # the second-order cones, and the SOC constraints come last.
+            constrs = model.getConstrs()
+            leq_end = dims[s.EQ_DIM] + dims[s.LEQ_DIM]
+            eq_constrs = constrs[:dims[s.EQ_DIM]]
+            ineq_constrs = constrs[dims[s.EQ_DIM]:leq_end]
+            new_leq_constrs = constrs[leq_end:]
+            soc_constrs = model.getQConstrs()
+        else:
+            model, variables, eq_constrs, ineq_constrs, soc_constrs, \
+                new_leq_constrs = self._build_model(
+                    data, warm_start, solver_opts,
+                    None if cached is None else cached[0])
+            model.setParam("OutputFlag", verbose)
+
+        # Save file (*.mst, *.sol, ect.)
+        if 'save_file' in solver_opts:
+            model.write(solver_opts['save_file'])
+
+        # Set parameters
+        # TODO user option to not compute duals.
+        model.setParam("QCPDual", True)
+        for key, value in solver_opts.items():
+            # Ignore arguments unique to the CVXPY interface.
+            if key not in self.INTERFACE_ARGS:
+                model.setParam(key, value)
+
+        solution = {}
+        try:
+            model.optimize()
+            if model.Status == 4 and solver_opts.get('reoptimize', False):
+                # INF_OR_UNBD. Solve again to get a definitive answer.
+                model.setParam("DualReductions", 0)
+                model.optimize()
+            solution["value"] = model.ObjVal
+            solution["primal"] = np.array([v.X for v in variables])
+
+            # Only add duals if not a MIP.
+            # Not sure why we need to negate the following,
+            # but need to in order to be consistent with other solvers.
+            vals = []
+            if not (data[s.BOOL_IDX] or data[s.INT_IDX]):
+                lin_constrs = eq_constrs + ineq_constrs + new_leq_constrs
+                vals += model.getAttr('Pi', lin_constrs)
+                vals += model.getAttr('QCPi', soc_constrs)
+                solution["y"] = -np.array(vals)
+                solution[s.EQ_DUAL] = solution["y"][0:dims[s.EQ_DIM]]
+                solution[s.INEQ_DUAL] = solution["y"][dims[s.EQ_DIM]:]
+        except Exception:
+            pass
+        solution[s.SOLVE_TIME] = model.Runtime
+        solution["status"] = self.STATUS_MAP.get(model.Status,
+                                                 s.SOLVER_ERROR)
+        if solution["status"] == s.SOLVER_ERROR and model.SolCount:
+            solution["status"] = s.OPTIMAL_INACCURATE
+        if solution["status"] == s.USER_LIMIT and not model.SolCount:
+            solution["status"] = s.INFEASIBLE_INACCURATE
+        solution["model"] = model
+
+        # Save model for warm start.
+        if solver_cache is not None:
+            solver_cache[self.name()] = (model, data)
+
+        return solution
+
+    def _build_model(self, data, warm_start: bool, solver_opts, old_model=None):
+        """Builds a Gurobi model of the problem.
+
+        Parameters
+        ----------
+        data : dict
+            Data used by the solver.
+        warm_start : bool
+            Whether to start from old_model or the initial values.
+        solver_opts : dict
+            Additional arguments for the solver.
+        old_model : Gurobi model, optional
+            A model solved before, to warm start from.
+
+        Returns
+        -------
+        tuple
+            (model, variables, equality constraints, inequality constraints,
+            SOC constraints, linear constraints of the SOC constraints)
+        """
         import gurobipy
 
         c = data[s.C]
@@ -168,9 +287,6 @@ class GUROBI(ConicSolver):
             # Create Gurobi model using default (unspecified) environment
             model = gurobipy.Model()
 
-        # Pass through verbosity
-        model.setParam("OutputFlag", verbose)
-
         variables = []
         for i in range(n):
             # Set variable type.
@@ -193,9 +309,7 @@ class GUROBI(ConicSolver):
 
         # Set the start value of Gurobi vars to user provided values.
         x = model.getVars()
-        if warm_start and solver_cache is not None \
-                and self.name() in solver_cache:
-            old_model = solver_cache[self.name()]
+        if old_model is not None:
             old_status = self.STATUS_MAP.get(old_model.Status,
                                              s.SOLVER_ERROR)
             if (old_status in s.SOLUTION_PRESENT) or (old_model.solCount > 0):
@@ -246,56 +360,35 @@ class GUROBI(ConicSolver):
             new_leq_constrs += new_leq
             variables += new_vars
             soc_start += constr_len
+        return (model, variables, eq_constrs, ineq_constrs, soc_constrs,
+                new_leq_constrs)
 
-        # Save file (*.mst, *.sol, ect.)
-        if 'save_file' in solver_opts:
-            model.write(solver_opts['save_file'])
-
-        # Set parameters
-        # TODO user option to not compute duals.
-        model.setParam("QCPDual", True)
-        for key, value in solver_opts.items():
-            # Ignore arguments unique to the CVXPY interface.
-            if key not in self.INTERFACE_ARGS:
-                model.setParam(key, value)
-
-        solution = {}
-        try:
-            model.optimize()
-            if model.Status == 4 and solver_opts.get('reoptimize', False):
-                # INF_OR_UNBD. Solve again to get a definitive answer.
-                model.setParam("DualReductions", 0)
-                model.optimize()
-            solution["value"] = model.ObjVal
-            solution["primal"] = np.array([v.X for v in variables])
-
-            # Only add duals if not a MIP.
-            # Not sure why we need to negate the following,
-            # but need to in order to be consistent with other solvers.
-            vals = []
-            if not (data[s.BOOL_IDX] or data[s.INT_IDX]):
-                lin_constrs = eq_constrs + ineq_constrs + new_leq_constrs
-                vals += model.getAttr('Pi', lin_constrs)
-                vals += model.getAttr('QCPi', soc_constrs)
-                solution["y"] = -np.array(vals)
-                solution[s.EQ_DUAL] = solution["y"][0:dims[s.EQ_DIM]]
-                solution[s.INEQ_DUAL] = solution["y"][dims[s.EQ_DIM]:]
-        except Exception:
-            pass
-        solution[s.SOLVE_TIME] = model.Runtime
-        solution["status"] = self.STATUS_MAP.get(model.Status,
-                                                 s.SOLVER_ERROR)
-        if solution["status"] == s.SOLVER_ERROR and model.SolCount:
-            solution["status"] = s.OPTIMAL_INACCURATE
-        if solution["status"] == s.USER_LIMIT and not model.SolCount:
-            solution["status"] = s.INFEASIBLE_INACCURATE
-        solution["model"] = model
+    @staticmethod
+    def _update_model(model, changes) -> None:
+        """Pushes the changed entries of the problem data to the model.
 
-        # Save model for warm start.
-        if solver_cache is not None:
-            solver_cache[self.name()] = model
+        The rows of A and b are the linear constraints of the model, in
+        order, and the columns of A the first variables.
 
-        return solution
+        Parameters
+        ----------
+        model : Gurobi model
+            The model built for the previous values of the parameters.
+        changes : dict
+            The changed entries, as returned by utilities.changed_entries.
+        """
+        x = model.getVars()
+        constrs = model.getConstrs()
+        if s.C in changes:
+            idx, vals = changes[s.C]
+            model.setAttr('Obj', [x[i] for i in idx], vals)
+        if s.A in changes:
+            rows, cols, vals = changes[s.A]
+            for row, col, val in zip(rows, cols, vals):
+                model.chgCoeff(constrs[row], x[col], val)
+        if s.B in changes:
+            idx, vals = changes[s.B]
+            model.setAttr('RHS', [constrs[i] for i in idx], vals)
 
     def add_model_lin_constr(self, model, variables,
                              rows, ctype,
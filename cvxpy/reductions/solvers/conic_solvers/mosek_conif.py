@@ -273,18 +273,30 @@ class MOSEK(ConicSolver):
                 else:
                     sol = Solution(s.OPTIMAL, 0.0, dict(), {s.EQ_DUAL: data[s.B]}, dict())
                     return {'sol': sol}
-            else:
-                task = mosek.Task()
-                solver_opts = MOSEK.handle_options(task, verbose, solver_opts)
-                task = MOSEK._build_dualized_task(task, data)
+        elif len(data[s.C]) == 0:
+            sol = Solution(s.OPTIMAL, 0.0, dict(), dict(), dict())
+            return {'sol': sol}
+
+        cached = None
+        if solver_cache is not None:
+            cached = solver_cache.get(self.name())
+        if warm_start and cached is not None \
+                and MOSEK._same_structure(data, cached[1]):
+            # The task was built for the same compiled problem, so only the
+            # values of c, A and b can differ.
+            task = cached[0]
+            # Drop the parameters of earlier solves.
+            task.setdefaults()
+            solver_opts = MOSEK.handle_options(task, verbose, solver_opts)
+            MOSEK._update_task(task, data, cached[1])
+        elif 'dualized' in data:
+            task = mosek.Task()
+            solver_opts = MOSEK.handle_options(task, verbose, solver_opts)
+            task = MOSEK._build_dualized_task(task, data)
         else:
-            if len(data[s.C]) == 0:
-                sol = Solution(s.OPTIMAL, 0.0, dict(), dict(), dict())
-                return {'sol': sol}
-            else:
-                task = mosek.Task()
-                solver_opts = MOSEK.handle_options(task, verbose, solver_opts)
-                task = MOSEK._build_slack_task(task, data)
+            task = mosek.Task()
+            solver_opts = MOSEK.handle_options(task, verbose, solver_opts)
+            task = MOSEK._build_slack_task(task, data)
 
         # Save the task to a file if requested.
         save_file = solver_opts['save_file']
@@ -302,7 +314,62 @@ class MOSEK(ConicSolver):
         if verbose:
             task.solutionsummary(mosek.streamtype.msg)
 
-        return {'task': task, 'solver_options': solver_opts}
+        if solver_cache is not None:
+            if cached is not None and cached[0] is not task:
+                # The replaced task is not used by any later solve.
+                cached[0].__exit__(None, None, None)
+            solver_cache[self.name()] = (task, data)
+
+        return {'task': task, 'solver_options': solver_opts,
+                'cached': solver_cache is not None}
+
+    @staticmethod
+    def _same_structure(data, old_data) -> bool:
+        """Was the task of old_data built for the same problem structure?
+
+        The data of the same compiled problem only differ in the values of
+        c, A and b, unless the problem has PSD constraints, whose data are
+        compared as well.
+        """
+        if data[s.PARAM_PROB] is not old_data[s.PARAM_PROB]:
+            return False
+        for key in ['A_bar_data', 'c_bar_data']:
+            bar_data, old_bar_data = data.get(key, []), old_data.get(key, [])
+            if len(bar_data) != len(old_bar_data):
+                return False
+            # Each entry holds indices and the triples of a symmetric matrix.
+            for entry, old_entry in zip(bar_data, old_bar_data):
+                if entry[:-1] != old_entry[:-1] or not all(
+                        np.array_equal(v, old_v)
+                        for v, old_v in zip(entry[-1], old_entry[-1])):
+                    return False
+        return True
+
+    @staticmethod
+    def _update_task(task, data, old_data) -> None:
+        """Pushes the entries of c, A and b that changed since the task was
+        built for old_data.
+        """
+        import mosek
+
+        c, A, b = data[s.C], data[s.A], data[s.B]
+        changed = np.flatnonzero(c != old_data[s.C])
+        if len(changed) > 0:
+            task.putclist(changed, c[changed])
+        diff = sp.sparse.coo_matrix(A - old_data[s.A])
+        diff.eliminate_zeros()
+        if diff.nnz > 0:
+            vals = np.asarray(sp.sparse.csr_matrix(A)[diff.row, diff.col]).ravel()
+            task.putaijlist(diff.row.tolist(), diff.col.tolist(), vals.tolist())
+        changed = np.flatnonzero(b != old_data[s.B])
+        if len(changed) > 0:
+            if 'dualized' in data:
+                keys = [mosek.boundkey.fx] * len(changed)
+            else:
+                num_eq = data['K_aff'][a2d.ZERO]
+                keys = [mosek.boundkey.fx if i < num_eq else mosek.boundkey.up
+                        for i in changed]
+            task.putconboundlist(changed, keys, b[changed], b[changed])
 
     @staticmethod
     def _build_dualized_task(task, data):
@@ -545,8 +612,10 @@ class MOSEK(ConicSolver):
         else:
             sol = Slacks.invert(raw_sol, inverse_data)
 
-        # Delete the mosek Task and Environment
-        task.__exit__(None, None, None)
+        # Delete the mosek Task and Environment, unless the task is kept in
+        # the solver cache for later solves.
+        if not solver_output.get('cached'):
+            task.__exit__(None, None, None)
  
         return sol
 
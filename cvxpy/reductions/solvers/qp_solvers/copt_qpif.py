@@ -6,6 +6,7 @@ import scipy.sparse as sp
 
 import cvxpy.settings as s
 from cvxpy.reductions.solution import Solution, failure_solution
+from cvxpy.reductions.solvers import utilities
 from cvxpy.reductions.solvers.qp_solvers.qp_solver import QpSolver
 
 
@@ -74,13 +75,14 @@ class COPT(QpSolver):
         data : dict
             Data used by the solver.
         warm_start : bool
-            Not used.
+            Whether to update the model of the previous solve in place, if
+            it was built for the same compiled problem.
         verbose : bool
             Should the solver print output?
         solver_opts : dict
             Additional arguments for the solver.
-        solver_cache: None
-            None
+        solver_cache: dict, optional
+            Holds the model of the previous solve.
 
         Returns
         -------
@@ -89,6 +91,80 @@ class COPT(QpSolver):
         """
         import coptpy as copt
 
+        entries = self.parameter_entries(data)
+        data['param_values'] = utilities.parameter_values(data, entries)
+
+        cached = None
+        if warm_start and solver_cache is not None \
+                and self.name() in solver_cache:
+            cached = solver_cache[self.name()]
+        changes = None
+        if cached is not None and \
+                cached[1][s.PARAM_PROB] is data[s.PARAM_PROB]:
+            changes = utilities.changed_entries(
+                entries, data['param_values'], cached[1]['param_values'])
+        # COPT can only replace the quadratic objective as a whole, so the
+        # model is rebuilt when it changes.
+        if changes is not None and s.P not in changes:
+            # The model was built for the same compiled problem, so only
+            # the entries that depend on parameters can differ.
+            model = cached[0]
+            # Drop the parameters of earlier solves, e.g., their solver_opts
+            # or the Presolve of a reoptimization.
+            model.resetParam()
+            model.setParam(copt.COPT.Param.Logging, verbose)
+            self._update_model(model, changes, data['n_eq'])
+        else:
+            model = self._build_model(data, verbose)
+
+        # Set parameters
+        for key, value in solver_opts.items():
+            # Ignore arguments unique to the CVXPY interface.
+            if key not in self.INTERFACE_ARGS:
+                model.setParam(key, value)
+
+        if 'save_file' in solver_opts:
+            model.write(solver_opts['save_file'])
+
+        # Solve problem
+        solution = {}
+        try:
+            model.solve()
+            # Reoptimize if INF_OR_UNBD, to get definitive answer.
+            if model.status == copt.COPT.INF_OR_UNB and solver_opts.get('reoptimize', True):
+                model.setParam(copt.COPT.Param.Presolve, 0)
+                model.solve()
+            if model.hasmipsol:
+                solution[s.VALUE] = model.objval
+                solution[s.PRIMAL] = np.array(model.getValues())
+            elif model.haslpsol:
+                solution[s.VALUE] = model.objval
+                solution[s.PRIMAL] = np.array(model.getValues())
+                solution['y'] = -np.array(model.getDuals())
+        except Exception:
+            pass
+
+        solution[s.SOLVE_TIME] = model.solvingtime
+        solution[s.NUM_ITERS] = model.barrieriter + model.simplexiter
+
+        solution[s.STATUS] = self.STATUS_MAP.get(model.status, s.SOLVER_ERROR)
+        if solution[s.STATUS] == s.USER_LIMIT and model.hasmipsol:
+            solution[s.STATUS] = s.OPTIMAL_INACCURATE
+        if solution[s.STATUS] == s.USER_LIMIT and not model.hasmipsol:
+            solution[s.STATUS] = s.INFEASIBLE_INACCURATE
+
+        solution['model'] = model
+
+        if solver_cache is not None:
+            solver_cache[self.name()] = (model, data)
+
+        return solution
+
+    @staticmethod
+    def _build_model(data, verbose: bool):
+        """Returns a COPT model of the problem."""
+        import coptpy as copt
+
         # Create COPT environment and model
         envconfig = copt.EnvrConfig()
         if not verbose:
@@ -151,42 +227,41 @@ class COPT(QpSolver):
             P = P.tocoo()
             model.loadQ(0.5*P)
 
-        # Set parameters
-        for key, value in solver_opts.items():
-            # Ignore arguments unique to the CVXPY interface.
-            if key not in self.INTERFACE_ARGS:
-                model.setParam(key, value)
+        return model
 
-        if 'save_file' in solver_opts:
-            model.write(solver_opts['save_file'])
+    @staticmethod
+    def _update_model(model, changes, n_eq: int) -> None:
+        """Pushes the changed entries of the problem data to the model.
 
-        # Solve problem
-        solution = {}
-        try:
-            model.solve()
-            # Reoptimize if INF_OR_UNBD, to get definitive answer.
-            if model.status == copt.COPT.INF_OR_UNB and solver_opts.get('reoptimize', True):
-                model.setParam(copt.COPT.Param.Presolve, 0)
-                model.solve()
-            if model.hasmipsol:
-                solution[s.VALUE] = model.objval
-                solution[s.PRIMAL] = np.array(model.getValues())
-            elif model.haslpsol:
-                solution[s.VALUE] = model.objval
-                solution[s.PRIMAL] = np.array(model.getValues())
-                solution['y'] = -np.array(model.getDuals())
-        except Exception:
-            pass
-
-        solution[s.SOLVE_TIME] = model.solvingtime
-        solution[s.NUM_ITERS] = model.barrieriter + model.simplexiter
-
-        solution[s.STATUS] = self.STATUS_MAP.get(model.status, s.SOLVER_ERROR)
-        if solution[s.STATUS] == s.USER_LIMIT and model.hasmipsol:
-            solution[s.STATUS] = s.OPTIMAL_INACCURATE
-        if solution[s.STATUS] == s.USER_LIMIT and not model.hasmipsol:
-            solution[s.STATUS] = s.INFEASIBLE_INACCURATE
-
-        solution['model'] = model
+        Parameters
+        ----------
+        model : COPT model
+            The model built for the previous values of the parameters.
+        changes : dict
+            The changed entries, as returned by utilities.changed_entries.
+        n_eq : int
+            The number of equality constraints, which precede the
+            inequality constraints.
+        """
+        import coptpy as copt
 
-        return solution
+        x = model.getVars()
+        constrs = model.getConstrs()
+        if s.Q in changes:
+            idx, vals = changes[s.Q]
+            model.setInfo(copt.COPT.Info.Obj, [x[i] for i in idx], vals.tolist())
+        for key, offset in [(s.A, 0), (s.F, n_eq)]:
+            if key in changes:
+                rows, cols, vals = changes[key]
+                for row, col, val in zip(rows, cols, vals):
+                    model.setCoeff(constrs[offset + row], x[col], val)
+        if s.B in changes:
+            # Equality constraints have equal lower and upper bounds.
+            idx, vals = changes[s.B]
+            eq_constrs = [constrs[i] for i in idx]
+            model.setInfo(copt.COPT.Info.LB, eq_constrs, vals.tolist())
+            model.setInfo(copt.COPT.Info.UB, eq_constrs, vals.tolist())
+        if s.G in changes:
+            idx, vals = changes[s.G]
+            model.setInfo(copt.COPT.Info.UB, [constrs[n_eq + i] for i in idx],
+                          vals.tolist())
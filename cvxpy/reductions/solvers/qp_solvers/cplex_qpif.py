@@ -3,6 +3,7 @@ import numpy as np
 import cvxpy.interface as intf
 import cvxpy.settings as s
 from cvxpy.reductions.solution import Solution, failure_solution
+from cvxpy.reductions.solvers import utilities
 from cvxpy.reductions.solvers.conic_solvers.cplex_conif import (
     get_status,
     hide_solver_output,
@@ -74,21 +75,82 @@ class CPLEX(QpSolver):
         return sol
 
     def solve_via_data(self, data, warm_start: bool, verbose: bool, solver_opts, solver_cache=None):
-        import cplex as cpx
         P = data[s.P].tocsr()       # Convert matrix to csr format
         q = data[s.Q]
         A = data[s.A].tocsr()       # Convert A matrix to csr format
         b = data[s.B]
         F = data[s.F].tocsr()       # Convert F matrix to csr format
         g = data[s.G]
-        n_var = data['n_var']
         n_eq = data['n_eq']
-        n_ineq = data['n_ineq']
 
         # Constrain values between bounds
         constrain_cplex_infty(b)
         constrain_cplex_infty(g)
 
+        entries = self.parameter_entries(data)
+        data['param_values'] = utilities.parameter_values(data, entries)
+
+        cached = None
+        if warm_start and solver_cache is not None \
+                and self.name() in solver_cache:
+            cached = solver_cache[self.name()]
+        if cached is not None and \
+                cached[1][s.PARAM_PROB] is data[s.PARAM_PROB]:
+            # The model was built for the same compiled problem, so only
+            # the entries that depend on parameters can differ.
+            model = cached[0]
+            # Drop the parameters of earlier solves.
+            model.parameters.reset()
+            changes = utilities.changed_entries(
+                entries, data['param_values'], cached[1]['param_values'])
+            self._update_model(model, changes, n_eq)
+        else:
+            model = self._build_model(data, P, q, A, b, F, g)
+
+        # Set verbosity
+        if not verbose:
+            hide_solver_output(model)
+
+        # Set parameters
+        reoptimize = solver_opts.pop('reoptimize', False)
+        set_parameters(model, solver_opts)
+
+        # Solve problem
+        results_dict = {}
+        try:
+            start = model.get_time()
+            model.solve()
+            end = model.get_time()
+            results_dict["cputime"] = end - start
+
+            ambiguous_status = get_status(model) == s.INFEASIBLE_OR_UNBOUNDED
+            if ambiguous_status and reoptimize:
+                model.parameters.preprocessing.presolve.set(0)
+                start_time = model.get_time()
+                model.solve()
+                results_dict["cputime"] += model.get_time() - start_time
+
+        except Exception:  # Error in the solution
+            results_dict["status"] = s.SOLVER_ERROR
+
+        results_dict["model"] = model
+
+        if solver_cache is not None:
+            solver_cache[self.name()] = (model, data)
+
+        return results_dict
+
+    @staticmethod
+    def _build_model(data, P, q, A, b, F, g):
+        """Returns a CPLEX model of the problem.
+
+        The matrices P, A and F are in CSR format.
+        """
+        import cplex as cpx
+        n_var = data['n_var']
+        n_eq = data['n_eq']
+        n_ineq = data['n_ineq']
+
         # Define CPLEX problem
         model = cpx.Cplex()
 
@@ -142,33 +204,38 @@ class CPLEX(QpSolver):
                 qmat.append([P.indices[start:end].tolist(),
                             P.data[start:end].tolist()])
             model.objective.set_quadratic(qmat)
-
-        # Set verbosity
-        if not verbose:
-            hide_solver_output(model)
-
-        # Set parameters
-        reoptimize = solver_opts.pop('reoptimize', False)
-        set_parameters(model, solver_opts)
-
-        # Solve problem
-        results_dict = {}
-        try:
-            start = model.get_time()
-            model.solve()
-            end = model.get_time()
-            results_dict["cputime"] = end - start
-
-            ambiguous_status = get_status(model) == s.INFEASIBLE_OR_UNBOUNDED
-            if ambiguous_status and reoptimize:
-                model.parameters.preprocessing.presolve.set(0)
-                start_time = model.get_time()
-                model.solve()
-                results_dict["cputime"] += model.get_time() - start_time
-
-        except Exception:  # Error in the solution
-            results_dict["status"] = s.SOLVER_ERROR
-
-        results_dict["model"] = model
-
-        return results_dict
+        return model
+
+    @staticmethod
+    def _update_model(model, changes, n_eq: int) -> None:
+        """Pushes the changed entries of the problem data to the model.
+
+        Parameters
+        ----------
+        model : CPLEX model
+            The model built for the previous values of the parameters.
+        changes : dict
+            The changed entries, as returned by utilities.changed_entries.
+        n_eq : int
+            The number of equality constraints, which precede the
+            inequality constraints.
+        """
+        if s.Q in changes:
+            idx, vals = changes[s.Q]
+            model.objective.set_linear(list(zip(idx.tolist(), vals.tolist())))
+        if s.P in changes:
+            # Setting an off-diagonal coefficient sets its transpose, too.
+            rows, cols, vals = changes[s.P]
+            upper = rows <= cols
+            model.objective.set_quadratic_coefficients(list(zip(
+                rows[upper].tolist(), cols[upper].tolist(), vals[upper].tolist())))
+        for key, offset in [(s.A, 0), (s.F, n_eq)]:
+            if key in changes:
+                rows, cols, vals = changes[key]
+                model.linear_constraints.set_coefficients(list(zip(
+                    (rows + offset).tolist(), cols.tolist(), vals.tolist())))
+        for key, offset in [(s.B, 0), (s.G, n_eq)]:
+            if key in changes:
+                idx, vals = changes[key]
+                model.linear_constraints.set_rhs(list(zip(
+                    (idx + offset).tolist(), vals.tolist())))
@@ -138,111 +138,119 @@ class GUROBI(QpSolver):
         constrain_gurobi_infty(b)
         constrain_gurobi_infty(g)
 
-        # Create a new model
-        if 'env' in solver_opts:
-            # Specifies environment to create Gurobi model for control over licensing and parameters
-            # https://www.gurobi.com/documentation/9.1/refman/environments.html
-            default_env = solver_opts['env']
-            del solver_opts['env']
-            model = grb.Model(env=default_env)
-        else:
-            # Create Gurobi model using default (unspecified) environment
-            model = grb.Model()
-
-        # Pass through verbosity
-        model.setParam("OutputFlag", verbose)
-
-        # Add variables
-        vtypes = {}
-        for ind in data[s.BOOL_IDX]:
-            vtypes[ind] = grb.GRB.BINARY
-        for ind in data[s.INT_IDX]:
-            vtypes[ind] = grb.GRB.INTEGER
-        for i in range(n):
-            if i not in vtypes:
-                vtypes[i] = grb.GRB.CONTINUOUS
-        x_grb = model.addVars(int(n),
-                              ub={i: grb.GRB.INFINITY for i in range(n)},
-                              lb={i: -grb.GRB.INFINITY for i in range(n)},
-                              vtype=vtypes)
+        entries = self.parameter_entries(data)
+        data['param_values'] = utilities.parameter_values(data, entries)
 
+        cached = None
         if warm_start and solver_cache is not None \
                 and self.name() in solver_cache:
-            old_model = solver_cache[self.name()]
-            old_status = self.STATUS_MAP.get(old_model.Status,
-                                             s.SOLVER_ERROR)
-            if (old_status in s.SOLUTION_PRESENT) or (old_model.solCount > 0):
-                old_x_grb = old_model.getVars()
-                for idx in range(len(x_grb)):
-                    x_grb[idx].start = old_x_grb[idx].X
-        elif warm_start:
-            # Set the start value of Gurobi vars to user provided values.
-            for idx in range(len(x_grb)):
-                x_grb[idx].start = data['init_value'][idx]
-        model.update()
-
-        x = np.array(model.getVars(), copy=False)
-
-        if A.shape[0] > 0:
-            if hasattr(model, 'addMConstr'):
-                # We can pass all of A @ x == b at once, use stable API
-                # introduced with Gurobi v9.5
-                model.addMConstr(A, None, grb.GRB.EQUAL, b)
-            elif hasattr(model, 'addMConstrs'):
-                # We can pass all of A @ x == b at once, use (now) deprecated
-                # API introduced with Gurobi v9.0
-                model.addMConstrs(A, None, grb.GRB.EQUAL, b)
-            else:
-                # Add equality constraints: iterate over the rows of A
-                # adding each row into the model
-                for i in range(A.shape[0]):
-                    start = A.indptr[i]
-                    end = A.indptr[i+1]
-                    variables = x[A.indices[start:end]]
-                    coeff = A.data[start:end]
-                    expr = grb.LinExpr(coeff, variables)
-                    model.addConstr(expr, grb.GRB.EQUAL, b[i])
-        model.update()
-
-        if F.shape[0] > 0:
-            if hasattr(model, 'addMConstr'):
-                # We can pass all of A @ x == b at once, use stable API
-                # introduced with Gurobi v9.5
-                model.addMConstr(F, None, grb.GRB.LESS_EQUAL, g)
-            elif hasattr(model, 'addMConstrs'):
-                # We can pass all of A @ x == b at once, use (now) deprecated
-                # API introduced with Gurobi v9.0
-                model.addMConstrs(F, None, grb.GRB.LESS_EQUAL, g)
-            else:
-                # Add inequality constraints: iterate over the rows of F
-                # adding each row into the model
-                for i in range(F.shape[0]):
-                    start = F.indptr[i]
-                    end = F.indptr[i+1]
-                    variables = x[F.indices[start:end]]
-                    coeff = F.data[start:end]
-                    expr = grb.LinExpr(coeff, variables)
-                    model.addConstr(expr, grb.GRB.LESS_EQUAL, g[i])
-        model.update()
-
-        # Define objective
-        if hasattr(model, 'setMObjective'):
-            # Use stable API starting in Gurobi v9
-            P = P.tocoo()
-            model.setMObjective(0.5 * P, q, 0.0)
-        elif hasattr(model, '_v811_setMObjective'):
-            # Use temporary API for Gurobi v811 only
-            P = P.tocoo()
-            model._v811_setMObjective(0.5 * P, q)
+            cached = solver_cache[self.name()]
+        if cached is not None and \
+                cached[1][s.PARAM_PROB] is data[s.PARAM_PROB]:
+            # The model was built for the same compiled problem, so only
+            # the entries that depend on parameters can differ.
+            solver_opts.pop('env', None)
+            model = cached[0]
+            old_status = self.STATUS_MAP.get(model.Status, s.SOLVER_ERROR)
+            x = model.getVars()
+            if (old_status in s.SOLUTION_PRESENT) or (model.solCount > 0):
+                model.setAttr('Start', x, model.getAttr('X', x))
+            changes = utilities.changed_entries(
+                entries, data['param_values'], cached[1]['param_values'])
+            self._update_model(model, changes, data)
+            # Drop the parameters of earlier solves, e.g., their solver_opts
+            # or the DualReductions of a reoptimization.
+            model.resetParams()
+            model.setParam("OutputFlag", verbose)
         else:
-            obj = grb.QuadExpr()
-            if P.count_nonzero():  # If there are any nonzero elms in P
-                P = P.tocoo()
-                obj.addTerms(0.5*P.data, vars=list(x[P.row]),
-                             vars2=list(x[P.col]))
-            obj.add(grb.LinExpr(q, x))  # Add linear part
-            model.setObjective(obj)  # Set objective
-        model.update()
+            # Create a new model
+            if 'env' in solver_opts:
+                # Specifies environment to create Gurobi model for control over
+                # licensing and parameters
+                # https://www.gurobi.com/documentation/9.1/refman/environments.html
+                default_env = solver_opts['env']
+                del solver_opts['env']
+                model = grb.Model(env=default_env)
+            else:
+                # Create Gurobi model using default (unspecified) environment
+                model = grb.Model()
+
+            # Pass through verbosity
+            model.setParam("OutputFlag", verbose)
+
+            # Add variables
+            vtypes = {}
+            for ind in data[s.BOOL_IDX]:
+                vtypes[ind] = grb.GRB.BINARY
+            for ind in data[s.INT_IDX]:
+                vtypes[ind] = grb.GRB.INTEGER
+            for i in range(n):
+                if i not in vtypes:
+                    vtypes[i] = grb.GRB.CONTINUOUS
+            x_grb = model.addVars(int(n),
+                                  ub={i: grb.GRB.INFINITY for i in range(n)},
+                                  lb={i: -grb.GRB.INFINITY for i in range(n)},
+                                  vtype=vtypes)
+
+            if cached is not None:
+                old_model = cached[0]
+                old_status = self.STATUS_MAP.get(old_model.Status,
+                                                 s.SOLVER_ERROR)
+                if (old_status in s.SOLUTION_PRESENT) or (old_model.solCount > 0):
+                    old_x_grb = old_model.getVars()
+                    for idx in range(len(x_grb)):
+                        x_grb[idx].start = old_x_grb[idx].X
+            elif warm_start:
+                # Set the start value of Gurobi vars to user provided values.
+                for idx in range(len(x_grb)):
+                    x_grb[idx].start = data['init_value'][idx]
+            model.update()
+
+            x = np.array(model.getVars(), copy=False)
+
+            if A.shape[0] > 0:
+                if hasattr(model, 'addMConstr'):
+                    # We can pass all of A @ x == b at once, use stable API
+                    # introduced with Gurobi v9.5
+                    model.addMConstr(A, None, grb.GRB.EQUAL, b)
+                elif hasattr(model, 'addMConstrs'):
+                    # We can pass all of A @ x == b at once, use (now) deprecated
+                    # API introduced with Gurobi v9.0
+                    model.addMConstrs(A, None, grb.GRB.EQUAL, b)
+                else:
+                    # Add equality constraints: iterate over the rows of A
+                    # adding each row into the model
+                    for i in range(A.shape[0]):
+                        start = A.indptr[i]
+                        end = A.indptr[i+1]
+                        variables = x[A.indices[start:end]]
+                        coeff = A.data[start:end]
+                        expr = grb.LinExpr(coeff, variables)
+                        model.addConstr(expr, grb.GRB.EQUAL, b[i])
+            model.update()
+
+            if F.shape[0] > 0:
+                if hasattr(model, 'addMConstr'):
+                    # We can pass all of A @ x == b at once, use stable API
+                    # introduced with Gurobi v9.5
+                    model.addMConstr(F, None, grb.GRB.LESS_EQUAL, g)
+                elif hasattr(model, 'addMConstrs'):
+                    # We can pass all of A @ x == b at once, use (now) deprecated
+                    # API introduced with Gurobi v9.0
+                    model.addMConstrs(F, None, grb.GRB.LESS_EQUAL, g)
+                else:
+                    # Add inequality constraints: iterate over the rows of F
+                    # adding each row into the model
+                    for i in range(F.shape[0]):
+                        start = F.indptr[i]
+                        end = F.indptr[i+1]
+                        variables = x[F.indices[start:end]]
+                        coeff = F.data[start:end]
+                        expr = grb.LinExpr(coeff, variables)
+                        model.addConstr(expr, grb.GRB.LESS_EQUAL, g[i])
+            model.update()
+
+            self._set_objective(model, x, P, q)
 
         # Set parameters
         model.setParam("QCPDual", True)
@@ -272,6 +280,60 @@ class GUROBI(QpSolver):
         results_dict["model"] = model
 
         if solver_cache is not None:
-            solver_cache[self.name()] = model
+            solver_cache[self.name()] = (model, data)
 
         return results_dict
+
+    @staticmethod
+    def _set_objective(model, x, P, q) -> None:
+        """Sets the objective 1/2 x' P x + q' x of the model."""
+        import gurobipy as grb
+
+        if hasattr(model, 'setMObjective'):
+            # Use stable API starting in Gurobi v9
+            P = P.tocoo()
+            model.setMObjective(0.5 * P, q, 0.0)
+        elif hasattr(model, '_v811_setMObjective'):
+            # Use temporary API for Gurobi v811 only
+            P = P.tocoo()
+            model._v811_setMObjective(0.5 * P, q)
+        else:
+            obj = grb.QuadExpr()
+            if P.count_nonzero():  # If there are any nonzero elms in P
+                P = P.tocoo()
+                obj.addTerms(0.5*P.data, vars=list(x[P.row]),
+                             vars2=list(x[P.col]))
+            obj.add(grb.LinExpr(q, x))  # Add linear part
+            model.setObjective(obj)  # Set objective
+        model.update()
+
+    def _update_model(self, model, changes, data) -> None:
+        """Pushes the changed entries of the problem data to the model.
+
+        Parameters
+        ----------
+        model : Gurobi model
+            The model built for the previous values of the parameters.
+        changes : dict
+            The changed entries, as returned by utilities.changed_entries.
+        data : dict
+            The problem data.
+        """
+        x = model.getVars()
+        constrs = model.getConstrs()
+        n_eq = data['n_eq']
+        if s.P in changes:
+            # Gurobi cannot change single terms of a quadratic objective.
+            self._set_objective(model, np.array(x), data[s.P], data[s.Q])
+        elif s.Q in changes:
+            idx, vals = changes[s.Q]
+            model.setAttr('Obj', [x[i] for i in idx], vals)
+        for key, offset in [(s.A, 0), (s.F, n_eq)]:
+            if key in changes:
+                rows, cols, vals = changes[key]
+                for row, col, val in zip(rows, cols, vals):
+                    model.chgCoeff(constrs[offset + row], x[col], val)
+        for key, offset in [(s.B, 0), (s.G, n_eq)]:
+            if key in changes:
+                idx, vals = changes[key]
+                model.setAttr('RHS', [constrs[offset + i] for i in idx], vals)
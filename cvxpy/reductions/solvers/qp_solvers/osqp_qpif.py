@@ -23,6 +23,11 @@ class OSQP(QpSolver):
                   -5: s.SOLVER_ERROR,           # Interrupted by user
                   -10: s.SOLVER_ERROR}          # Unsolved
 
+    # Explicit zeros are kept where parameters affect P and A, so that their
+    # sparsity patterns do not depend on the values of the parameters and
+    # the solver can be updated in place.
+    KEEP_ZEROS = True
+
     def name(self):
         return s.OSQP
 
@@ -55,12 +60,6 @@ class OSQP(QpSolver):
         import osqp
         P = data[s.P]
         q = data[s.Q]
-        A = sp.vstack([data[s.A], data[s.F]]).tocsc()
-        data['Ax'] = A
-        uA = np.concatenate((data[s.B], data[s.G]))
-        data['u'] = uA
-        lA = np.concatenate([data[s.B], -np.inf*np.ones(data[s.G].shape)])
-        data['l'] = lA
 
         # Overwrite defaults eps_abs=eps_rel=1e-3, max_iter=4000
         solver_opts['eps_abs'] = solver_opts.get('eps_abs', 1e-5)
@@ -68,22 +67,47 @@ class OSQP(QpSolver):
         solver_opts['max_iter'] = solver_opts.get('max_iter', 10000)
 
         # Use cached data
+        cached = None
         if warm_start and solver_cache is not None and self.name() in solver_cache:
-            solver, old_data, results = solver_cache[self.name()]
+            cached = solver_cache[self.name()]
+        # The solver can only be updated in place if the sparsity patterns
+        # of P and A are unchanged. They are fixed for a parameterized
+        # problem, because explicit zeros are kept; otherwise, e.g., for a
+        # solver cached by a structurally identical problem or for data
+        # passed in directly, they are compared.
+        same_problem = cached is not None and _same_problem(data, cached[1])
+        if cached is not None and (
+                same_problem or
+                all(_same_pattern(data[key], cached[1][key])
+                    for key in [s.P, s.A, s.F])):
+            solver, old_data, results = cached
+            data['Px_idx'], data['Ax_idx'] = old_data['Px_idx'], old_data['Ax_idx']
+            # Only the data that depends on parameters can change, so the
+            # other data is neither stacked nor compared.
+            if same_problem:
+                dependence = data[s.PARAM_PROB].parameter_dependence()
+            else:
+                dependence = {'P': True, 'q': True, 'A': True, 'b': True}
             new_args = {}
-            for key in ['q', 'l', 'u']:
-                if any(data[key] != old_data[key]):
-                    new_args[key] = data[key]
+            if dependence['q']:
+                new_args['q'] = q
+            if dependence['b']:
+                data['l'], data['u'] = _bounds(data)
+                new_args['l'], new_args['u'] = data['l'], data['u']
+            else:
+                data['l'], data['u'] = old_data['l'], old_data['u']
             factorizing = False
-            if P.data.shape != old_data[s.P].data.shape or any(
-                    P.data != old_data[s.P].data):
-                P_triu = sp.triu(P).tocsc()
-                new_args['Px'] = P_triu.data
-                factorizing = True
-            if A.data.shape != old_data['Ax'].data.shape or any(
-                    A.data != old_data['Ax'].data):
-                new_args['Ax'] = A.data
-                factorizing = True
+            data['Px'], data['Ax'] = old_data['Px'], old_data['Ax']
+            if dependence['P']:
+                Px = P.data[data['Px_idx']]
+                if not np.array_equal(Px, old_data['Px']):
+                    data['Px'] = new_args['Px'] = Px
+                    factorizing = True
+            if dependence['A']:
+                Ax = np.concatenate([data[s.A].data, data[s.F].data])[data['Ax_idx']]
+                if not np.array_equal(Ax, old_data['Ax']):
+                    data['Ax'] = new_args['Ax'] = Ax
+                    factorizing = True
 
             if new_args:
                 solver.update(**new_args)
@@ -95,16 +119,82 @@ class OSQP(QpSolver):
             solver_opts['polish'] = solver_opts.get('polish', factorizing)
             solver.update_settings(verbose=verbose, **solver_opts)
         else:
+            P_triu, A = _setup_matrices(data)
+            data['l'], data['u'] = _bounds(data)
             # Initialize and solve problem
             solver_opts['polish'] = solver_opts.get('polish', True)
             solver = osqp.OSQP()
             try:
-                solver.setup(P, q, A, lA, uA, verbose=verbose, **solver_opts)
+                solver.setup(P_triu, q, A, data['l'], data['u'], verbose=verbose,
+                             **solver_opts)
             except ValueError as e:
                 raise SolverError(e)
+            if cached is not None:
+                results = cached[2]
+                status = self.STATUS_MAP.get(results.info.status_val, s.SOLVER_ERROR)
+                if status == s.OPTIMAL and results.x.shape == q.shape and \
+                        results.y.shape == data['l'].shape:
+                    solver.warm_start(results.x, results.y)
 
         results = solver.solve()
 
         if solver_cache is not None:
             solver_cache[self.name()] = (solver, data, results)
         return results
+
+
+def _bounds(data):
+    """Returns the bounds l and u of the stacked constraints."""
+    uA = np.concatenate((data[s.B], data[s.G]))
+    lA = np.concatenate([data[s.B], -np.inf*np.ones(data[s.G].shape)])
+    return lA, uA
+
+
+def _setup_matrices(data):
+    """Returns the matrices passed to OSQP.setup.
+
+    These are the upper triangle of P and the stacked matrix [A; F], with
+    sorted indices. The positions of their entries in P.data and in the
+    concatenation of A.data and F.data are stored in data['Px_idx'] and
+    data['Ax_idx'], and their values in data['Px'] and data['Ax'], so that
+    the solver can later be updated without forming the matrices again.
+    """
+    P, A, F = data[s.P], data[s.A], data[s.F]
+    # Index the entries with markers, which survive the reordering.
+    P_marker = sp.csc_matrix((np.arange(1, P.nnz + 1, dtype=np.float64),
+                              P.indices, P.indptr), shape=P.shape)
+    P_triu = sp.triu(P_marker, format='csc')
+    P_triu.sort_indices()
+    data['Px_idx'] = P_triu.data.astype(np.int64) - 1
+    data['Px'] = P_triu.data = P.data[data['Px_idx']]
+
+    A_marker = sp.vstack([
+        sp.csc_matrix((np.arange(1, A.nnz + 1, dtype=np.float64),
+                       A.indices, A.indptr), shape=A.shape),
+        sp.csc_matrix((np.arange(A.nnz + 1, A.nnz + F.nnz + 1, dtype=np.float64),
+                       F.indices, F.indptr), shape=F.shape)]).tocsc()
+    A_marker.sort_indices()
+    data['Ax_idx'] = A_marker.data.astype(np.int64) - 1
+    data['Ax'] = A_marker.data = np.concatenate([A.data, F.data])[data['Ax_idx']]
+    return P_triu, A_marker
+
+
+def _same_problem(data, old_data) -> bool:
+    """Did QpSolver.apply build data and old_data for the same problem?
+
+    Then only the data that depends on the parameters can differ. Data
+    that was edited since, or built otherwise, can differ anywhere.
+    """
+    def applied(data) -> bool:
+        arrays = data.get(QpSolver.APPLIED_DATA)
+        return arrays is not None and all(
+            data[key] is value for key, value in arrays.items())
+    return s.PARAM_PROB in data and \
+        data[s.PARAM_PROB] is old_data.get(s.PARAM_PROB) and \
+        applied(data) and applied(old_data)
+
+
+def _same_pattern(A, B) -> bool:
+    """Do the CSC matrices A and B have the same sparsity pattern?"""
+    return A.shape == B.shape and np.array_equal(A.indptr, B.indptr) and \
+        np.array_equal(A.indices, B.indices)
@@ -26,6 +26,7 @@ from cvxpy.reductions.qp2quad_form.qp_matrix_stuffing import (
 )
 from cvxpy.reductions.solvers.solver import Solver
 from cvxpy.reductions.utilities import group_constraints
+from cvxpy.utilities import profiling
 
 
 class QpSolver(Solver):
@@ -40,6 +41,13 @@ class QpSolver(Solver):
     REQUIRES_CONSTR = False
 
     IS_MIP = "IS_MIP"
+    # The problem data as built by apply, to tell it apart from data that
+    # was edited or built otherwise.
+    APPLIED_DATA = "APPLIED_DATA"
+
+    # Whether to store explicit zeros in P and A where parameters are
+    # affected.
+    KEEP_ZEROS = False
 
     def accepts(self, problem):
         return (isinstance(problem, ParamQuadProg)
@@ -75,7 +83,8 @@ class QpSolver(Solver):
         """
         problem, data, inv_data = self._prepare_data_and_inv_data(problem)
 
-        P, q, d, AF, bg = problem.apply_parameters()
+        with profiling.span('apply_parameters'):
+            P, q, d, AF, bg = problem.apply_parameters(keep_zeros=self.KEEP_ZEROS)
         inv_data[s.OFFSET] = d
 
         # Get number of variables
@@ -109,5 +118,25 @@ class QpSolver(Solver):
         data['n_var'] = n
         data['n_eq'] = A.shape[0]
         data['n_ineq'] = F.shape[0]
+        data[QpSolver.APPLIED_DATA] = {key: data[key] for key in
+                                       [s.P, s.Q, s.A, s.B, s.F, s.G]}
 
         return data, inv_data
+
+    @staticmethod
+    def parameter_entries(data):
+        """Returns the entries of the problem data that depend on parameters.
+
+        The entries are keyed like data: P, q, A, b, F and g map to the
+        indices of the entries of the vectors and to tuples (rows, cols) of
+        the entries of the matrices. They are the only entries that can
+        differ between solves of the same compiled problem.
+        """
+        entries = data[s.PARAM_PROB].parameter_entries()
+        n_eq = data['n_eq']
+        rows, cols = entries['A']
+        eq = rows < n_eq
+        b = entries['b']
+        return {s.P: entries['P'], s.Q: entries['q'],
+                s.A: (rows[eq], cols[eq]), s.F: (rows[~eq] - n_eq, cols[~eq]),
+                s.B: b[b < n_eq], s.G: b[b >= n_eq] - n_eq}
@@ -3,6 +3,7 @@ import numpy as np
 import cvxpy.interface as intf
 import cvxpy.settings as s
 from cvxpy.reductions.solution import Solution, failure_solution
+from cvxpy.reductions.solvers import utilities
 from cvxpy.reductions.solvers.conic_solvers.xpress_conif import (
     get_status_maps,
     makeMstart,
@@ -90,52 +91,25 @@ class XPRESS(QpSolver):
 
         import xpress as xp
 
-        # Objective function: 1/2 x' P x + q'x
-
-        Q = data[s.P]          # objective quadratic coefficients
-        q = data[s.Q]          # objective linear coefficient (size n_var)
-
-        # Equations, Ax = b
-
-        A = data[s.A]          # linear coefficient matrix
-        b = data[s.B]          # rhs
-
-        n_var = data['n_var']
-        n_eq = data['n_eq']
-
-        self.prob_ = xp.problem()
-
-        # qp_solver has the following format:
-        #
-        #    minimize      1/2 x' P x + q' x
-        #    subject to    A x =  b
-        #                  F x <= g
-        #
-        # Instead of combining A and F to call loadproblem() once
-        # (which is inefficient due to a necessary Python loop), call
-        # loadproblem() for A and then use addrow()
-
-        mstart = makeMstart(A, n_var, 1)
-
-        if len(Q.data) != 0:
-
-            # Q matrix is input via row/col indices and value, but only
-            # for the upper triangle. We just make it symmetric and twice
-            # itself, then, just remove all lower-triangular elements.
-            Q += Q.transpose()
-            Q /= 2
-            Q = Q.tocoo()
-
-            mqcol1 = Q.row[Q.row <= Q.col]
-            mqcol2 = Q.col[Q.row <= Q.col]
-            dqe = Q.data[Q.row <= Q.col]
-
+        entries = self.parameter_entries(data)
+        data['param_values'] = utilities.parameter_values(data, entries)
+
+        cached = None
+        if warm_start and solver_cache is not None \
+                and self.name() in solver_cache:
+            cached = solver_cache[self.name()]
+        if cached is not None and \
+                cached[1][s.PARAM_PROB] is data[s.PARAM_PROB]:
+            # The problem was built for the same compiled problem, so only
+            # the entries that depend on parameters can differ.
+            self.prob_ = cached[0]
+            # Drop the controls of earlier solves.
+            self.prob_.setDefaults()
+            changes = utilities.changed_entries(
+                entries, data['param_values'], cached[1]['param_values'])
+            self._update_model(self.prob_, changes, data['n_eq'])
         else:
-
-            mqcol1, mqcol2, dqe = [], [], []
-
-        colnames = ['x_{0:09d}'.format(i) for i in range(n_var)]
-        rownames = ['eq_{0:09d}'.format(i) for i in range(n_eq)]
+            self.prob_ = self._build_model(data)
 
         if verbose:
             self.prob_.controls.miplog = 2
@@ -147,54 +121,6 @@ class XPRESS(QpSolver):
             self.prob_.controls.outputlog = 0
             self.prob_.controls.xslp_log = -1
 
-        self.prob_.loadproblem(probname='CVX_xpress_qp',
-                               # constraint types
-                               qrtypes=['E'] * n_eq,
-                               rhs=b,                               # rhs
-                               range=None,                          # range
-                               obj=q,                               # obj coeff
-                               mstart=mstart,                       # mstart
-                               mnel=None,                           # mnel (unused)
-                               # linear coefficients
-                               mrwind=A.indices[A.data != 0],       # row indices
-                               dmatval=A.data[A.data != 0],         # coefficients
-                               dlb=[-xp.infinity] * len(q),         # lower bound
-                               dub=[xp.infinity] * len(q),          # upper bound
-                               # quadratic objective (only upper triangle)
-                               mqcol1=mqcol1,
-                               mqcol2=mqcol2,
-                               dqe=dqe,
-                               # binary and integer variables
-                               qgtype=['B']*len(data[s.BOOL_IDX]) + ['I']*len(data[s.INT_IDX]),
-                               mgcols=data[s.BOOL_IDX] + data[s.INT_IDX],
-                               # variables' and constraints' names
-                               colnames=colnames,
-                               rownames=rownames)
-
-        # The problem currently has the quadratic objective function
-        # and the linear equations. Add the linear inequalities
-        #
-        # Fx <= g
-
-        n_ineq = data['n_ineq']
-
-        if n_ineq > 0:
-
-            F = data[s.F].tocsr()  # linear coefficient matrix, converted to row-major
-            g = data[s.G]          # rhs
-
-            mstartIneq = makeMstart(F, n_ineq, 0)  # ifCol=0 --> check rows
-
-            rownames_ineq = ['ineq_{0:09d}'.format(i) for i in range(n_ineq)]
-
-            self.prob_.addrows(  # constraint types
-                qrtype=['L'] * n_ineq,              # inequalities sign
-                rhs=g,                              # rhs
-                mstart=mstartIneq,                  # starting indices
-                mclind=F.indices[F.data != 0],      # column indices
-                dmatval=F.data[F.data != 0],        # coefficient
-                names=rownames_ineq)                # row names
-
         # Set options
         #
         # The parameter solver_opts is a dictionary that contains only
@@ -254,6 +180,144 @@ class XPRESS(QpSolver):
                 if not (data[s.BOOL_IDX] or data[s.INT_IDX]):
                     results_dict['getDual'] = self.prob_.getDual()
 
+        if solver_cache is not None:
+            solver_cache[self.name()] = (self.prob_, data)
+
         del self.prob_
 
         return results_dict
+
+    @staticmethod
+    def _build_model(data):
+        """Returns an Xpress problem for the problem data."""
+
+        import xpress as xp
+
+        # Objective function: 1/2 x' P x + q'x
+
+        Q = data[s.P]          # objective quadratic coefficients
+        q = data[s.Q]          # objective linear coefficient (size n_var)
+
+        # Equations, Ax = b
+
+        A = data[s.A]          # linear coefficient matrix
+        b = data[s.B]          # rhs
+
+        n_var = data['n_var']
+        n_eq = data['n_eq']
+
+        prob = xp.problem()
+
+        # qp_solver has the following format:
+        #
+        #    minimize      1/2 x' P x + q' x
+        #    subject to    A x =  b
+        #                  F x <= g
+        #
+        # Instead of combining A and F to call loadproblem() once
+        # (which is inefficient due to a necessary Python loop), call
+        # loadproblem() for A and then use addrow()
+
+        mstart = makeMstart(A, n_var, 1)
+
+        if len(Q.data) != 0:
+
+            # Q matrix is input via row/col indices and value, but only
+            # for the upper triangle. We just make it symmetric and twice
+            # itself, then, just remove all lower-triangular elements.
+            Q += Q.transpose()
+            Q /= 2
+            Q = Q.tocoo()
+
+            mqcol1 = Q.row[Q.row <= Q.col]
+            mqcol2 = Q.col[Q.row <= Q.col]
+            dqe = Q.data[Q.row <= Q.col]
+
+        else:
+
+            mqcol1, mqcol2, dqe = [], [], []
+
+        colnames = ['x_{0:09d}'.format(i) for i in range(n_var)]
+        rownames = ['eq_{0:09d}'.format(i) for i in range(n_eq)]
+
+        prob.loadproblem(probname='CVX_xpress_qp',
+                         # constraint types
+                         qrtypes=['E'] * n_eq,
+                         rhs=b,                               # rhs
+                         range=None,                          # range
+                         obj=q,                               # obj coeff
+                         mstart=mstart,                       # mstart
+                         mnel=None,                           # mnel (unused)
+                         # linear coefficients
+                         mrwind=A.indices[A.data != 0],       # row indices
+                         dmatval=A.data[A.data != 0],         # coefficients
+                         dlb=[-xp.infinity] * len(q),         # lower bound
+                         dub=[xp.infinity] * len(q),          # upper bound
+                         # quadratic objective (only upper triangle)
+                         mqcol1=mqcol1,
+                         mqcol2=mqcol2,
+                         dqe=dqe,
+                         # binary and integer variables
+                         qgtype=['B']*len(data[s.BOOL_IDX]) + ['I']*len(data[s.INT_IDX]),
+                         mgcols=data[s.BOOL_IDX] + data[s.INT_IDX],
+                         # variables' and constraints' names
+                         colnames=colnames,
+                         rownames=rownames)
+
+        # The problem currently has the quadratic objective function
+        # and the linear equations. Add the linear inequalities
+        #
+        # Fx <= g
+
+        n_ineq = data['n_ineq']
+
+        if n_ineq > 0:
+
+            F = data[s.F].tocsr()  # linear coefficient matrix, converted to row-major
+            g = data[s.G]          # rhs
+
+            mstartIneq = makeMstart(F, n_ineq, 0)  # ifCol=0 --> check rows
+
+            rownames_ineq = ['ineq_{0:09d}'.format(i) for i in range(n_ineq)]
+
+            prob.addrows(  # constraint types
+                qrtype=['L'] * n_ineq,              # inequalities sign
+                rhs=g,                              # rhs
+                mstart=mstartIneq,                  # starting indices
+                mclind=F.indices[F.data != 0],      # column indices
+                dmatval=F.data[F.data != 0],        # coefficient
+                names=rownames_ineq)                # row names
+        return prob
+
+    @staticmethod
+    def _update_model(prob, changes, n_eq: int) -> None:
+        """Pushes the changed entries of the problem data to the problem.
+
+        Parameters
+        ----------
+        prob : Xpress problem
+            The problem built for the previous values of the parameters.
+        changes : dict
+            The changed entries, as returned by utilities.changed_entries.
+        n_eq : int
+            The number of equality constraints, which precede the
+            inequality constraints.
+        """
+        if s.Q in changes:
+            idx, vals = changes[s.Q]
+            prob.chgobj(idx.tolist(), vals.tolist())
+        if s.P in changes:
+            # The coefficients of the upper triangle define the objective.
+            rows, cols, vals = changes[s.P]
+            upper = rows <= cols
+            prob.chgmqobj(rows[upper].tolist(), cols[upper].tolist(),
+                          vals[upper].tolist())
+        for key, offset in [(s.A, 0), (s.F, n_eq)]:
+            if key in changes:
+                rows, cols, vals = changes[key]
+                prob.chgmcoef((rows + offset).tolist(), cols.tolist(),
+                              vals.tolist())
+        for key, offset in [(s.B, 0), (s.G, n_eq)]:
+            if key in changes:
+                idx, vals = changes[key]
+                prob.chgrhs((idx + offset).tolist(), vals.tolist())
@@ -201,7 +201,7 @@ def construct_solving_chain(problem, candidates,
         When True, DPP problems will be treated as non-DPP,
         which may speed up compilation. Defaults to False.
     canon_backend : str, optional
-        'CPP' (default) | 'SCIPY'
+        'CPP' (default) | 'SCIPY' | 'COO'
         Specifies which backend to use for canonicalization, which can affect
         compilation time. Defaults to None, i.e., selecting the default
         backend.
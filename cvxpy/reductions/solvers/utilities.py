@@ -85,3 +85,65 @@ def get_dual_values(result_vec, parse_func, constraints) -> Dict[Any, Any]:
         # TODO reshape based on dual variable size.
         dual_vars[constr.id], offset = parse_func(result_vec, offset, constr)
     return dual_vars
+
+
+def parameter_values(data, entries) -> Dict[str, np.ndarray]:
+    """Gets the values of the entries of the problem data that depend on
+    parameters.
+
+    Parameters
+    ----------
+    data : dict
+        The problem data returned by the apply method of a solver.
+    entries : dict
+        A map of keys of data to the indices of the entries of a vector or to
+        tuples (rows, cols) of the entries of a sparse matrix, such as the
+        one returned by the parameter_entries method of a solver.
+
+    Returns
+    -------
+       A map of the keys of entries to the values of the entries.
+    """
+    values = {}
+    for key, index in entries.items():
+        if isinstance(index, tuple):
+            rows, cols = index
+            if len(rows) == 0:
+                values[key] = np.zeros(0)
+            else:
+                values[key] = np.asarray(data[key][rows, cols]).ravel()
+        else:
+            values[key] = np.asarray(data[key])[index]
+    return values
+
+
+def changed_entries(entries, values, old_values) -> Dict[str, Any]:
+    """Gets the entries of the problem data whose values changed.
+
+    Parameters
+    ----------
+    entries : dict
+        A map of keys of the problem data to the entries that depend on
+        parameters, as passed to parameter_values.
+    values : dict
+        The values of the entries, as returned by parameter_values.
+    old_values : dict
+        The values of the entries in a previous solve.
+
+    Returns
+    -------
+       A map of the keys whose values changed to tuples (index, values) of
+       the indices of the changed entries of a vector, or (rows, cols,
+       values) for a matrix, and their new values.
+    """
+    changes = {}
+    for key, index in entries.items():
+        changed = np.flatnonzero(values[key] != old_values[key])
+        if len(changed) == 0:
+            continue
+        if isinstance(index, tuple):
+            rows, cols = index
+            changes[key] = (rows[changed], cols[changed], values[key][changed])
+        else:
+            changes[key] = (index[changed], values[key][changed])
+    return changes
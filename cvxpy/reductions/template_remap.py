@@ -0,0 +1,102 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cvxpy.expressions.constants.constant import Constant
+from cvxpy.reductions.reduction import Reduction
+from cvxpy.reductions.solution import Solution
+from cvxpy.utilities.fingerprint import structural_fingerprint_and_leaves
+
+
+class TemplateRemap(Reduction):
+    """Maps a problem onto a structurally identical template problem.
+
+    Two problems with the same structural fingerprint differ only in the ids
+    of their leaves and constraints and in the values of their variables and
+    parameters. This reduction replaces a problem by the template, so that
+    the template's compilation can be reused, and maps the ids in the
+    template's solution back to the ids of the problem.
+
+    Attributes
+    ----------
+    template : Problem
+        The problem whose compilation is reused.
+    template_leaves : list
+        The leaves of the template, in order of first appearance.
+    """
+
+    def __init__(self, template, template_leaves) -> None:
+        super(TemplateRemap, self).__init__(problem=template)
+        self.template = template
+        self.template_leaves = template_leaves
+
+    def accepts(self, problem) -> bool:
+        fingerprint, _ = structural_fingerprint_and_leaves(problem)
+        return fingerprint == self.template.fingerprint()
+
+    def leaf_map(self, leaves):
+        """Maps the ids of the template's leaves to the corresponding leaves.
+
+        Parameters
+        ----------
+        leaves : list
+            The leaves of a structurally identical problem, in order of first
+            appearance.
+        """
+        return {template_leaf.id: leaf for template_leaf, leaf
+                in zip(self.template_leaves, leaves)
+                if not isinstance(template_leaf, Constant)}
+
+    def id_maps(self, leaves, constraints):
+        """Maps the ids of the template's leaves and constraints to the ids of
+        a structurally identical problem's leaves and constraints.
+        """
+        var_map = {template_id: leaf.id for template_id, leaf
+                   in self.leaf_map(leaves).items()}
+        cons_map = {template_con.id: con.id for template_con, con
+                    in zip(self.template.constraints, constraints)}
+        return var_map, cons_map
+
+    def apply(self, problem):
+        """Returns the template and the maps from template ids to problem ids.
+
+        Parameters
+        ----------
+        problem : Problem
+            A problem with the same structural fingerprint as the template.
+
+        Returns
+        -------
+        Problem
+            The template.
+        tuple
+            Maps from the ids of the template's leaves and constraints to the
+            ids of the problem's leaves and constraints.
+        """
+        _, leaves = structural_fingerprint_and_leaves(problem)
+        return self.template, self.id_maps(leaves, problem.constraints)
+
+    def invert(self, solution, inverse_data):
+        """Relabels the template's solution with the problem's ids."""
+        var_map, cons_map = inverse_data
+        primal_vars, dual_vars = solution.primal_vars, solution.dual_vars
+        if primal_vars is not None:
+            primal_vars = {var_map.get(vid, vid): value
+                           for vid, value in primal_vars.items()}
+        if dual_vars is not None:
+            dual_vars = {cons_map.get(cid, cid): value
+                         for cid, value in dual_vars.items()}
+        return Solution(solution.status, solution.opt_val, primal_vars,
+                        dual_vars, solution.attr)
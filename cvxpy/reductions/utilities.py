@@ -84,6 +84,12 @@ def group_constraints(constraints):
     return constr_map
 
 
+def csc_from_index(data, index):
+    """Forms a CSC matrix from its values and an (indices, indptr, shape) tuple."""
+    indices, indptr, shape = index
+    return sp.csc_matrix((data, indices, indptr), shape=shape, copy=False)
+
+
 class ReducedMat:
     """Utility class for condensing the mapping from parameters to problem data.
 
@@ -120,6 +126,10 @@ class ReducedMat:
         # The rows in the map from parameters to problem data that
         # have any nonzeros.
         self.mapping_nonzero = None
+        # The sorted linear indices of the entries of the problem data
+        # matrix, and the positions of the entries in the values array.
+        self._sorted_keys = None
+        self._key_order = None
 
     def cache(self, keep_zeros: bool = False) -> None:
         """Cache computed attributes if not present.
@@ -164,8 +174,162 @@ class ReducedMat:
             and b is a flattened NumPy array representing the constant offset.
             If with_offset=False, returned b is None.
         """
+        if (param_vec is not None and np.ndim(param_vec) == 2
+                and self.problem_data_index is not None):
+            data, index, b = self.get_stacked_data_from_tensor(
+                param_vec, with_offset=with_offset)
+            return [(csc_from_index(data[:, j], index),
+                     None if b is None else b[:, j])
+                    for j in range(data.shape[1])]
         return canonInterface.get_matrix_from_tensor(
             self.reduced_mat, param_vec, self.var_len,
             nonzero_rows=self.mapping_nonzero,
             with_offset=with_offset,
             problem_data_index=self.problem_data_index)
+
+    def get_stacked_data_from_tensor(self, param_mat: np.ndarray,
+                                     with_offset: bool = True) -> Tuple:
+        """Applies the tensor to a matrix whose columns are parameter vectors.
+
+        All instances share the sparsity pattern of the problem data matrix,
+        so only one product is computed and only the values differ between
+        the columns of the result. The pattern includes every entry that is
+        affected by a parameter, i.e., zeros are always kept.
+
+        Parameters
+        ----------
+            param_mat: matrix of shape (param_size + 1, k)
+            with_offset: (optional) split off the offset. Defaults to True.
+
+        Returns
+        -------
+            A tuple (data, (indices, indptr, shape), b), where data has shape
+            (nnz, k) and column j holds the CSC values of the j-th matrix,
+            (indices, indptr, shape) is the shared CSC structure, and b is a
+            dense array of shape (n_rows, k) holding the offsets (None if
+            with_offset=False).
+        """
+        self.cache()
+        if self.problem_data_index is None:
+            # The problem data matrix is empty.
+            n_cols = self.var_len + 1 if with_offset else self.var_len
+            shape = (self.matrix_data.shape[0] // max(n_cols, 1), n_cols)
+            indices = np.zeros(0, dtype=np.int64)
+            indptr = np.zeros(n_cols + 1, dtype=np.int64)
+            values = np.zeros((0, param_mat.shape[1]))
+        else:
+            indices, indptr, shape = self.problem_data_index
+            values = np.asarray(self.reduced_mat @ param_mat)
+        if not with_offset:
+            return values, _normalize_index(indices, indptr, shape), None
+        # The offset is the last column of the CSC matrix, so its values
+        # are a contiguous suffix of the values array.
+        n_rows, n_cols = shape
+        A_nnz = indptr[n_cols - 1]
+        b = np.zeros((n_rows, values.shape[1]))
+        b[indices[A_nnz:], :] = values[A_nnz:, :]
+        A_index = _normalize_index(indices[:A_nnz], indptr[:n_cols],
+                                   (n_rows, n_cols - 1))
+        return values[:A_nnz, :], A_index, b
+
+    def parameter_entries(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the positions of the entries that depend on parameters.
+
+        Returns
+        -------
+            A tuple (rows, cols) of the entries of the problem data matrix,
+            including its offset column if it has one, whose values change
+            with the values of the parameters.
+        """
+        self.cache()
+        if self.problem_data_index is None:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        indices, indptr, shape = self.problem_data_index
+        cols = np.repeat(np.arange(shape[1], dtype=np.int64), np.diff(indptr))
+        # The last column of the tensor holds the constants.
+        affected = sp.csr_matrix(self.reduced_mat)[:, :-1].getnnz(axis=1) > 0
+        return indices[affected].astype(np.int64), cols[affected]
+
+    def apply_adjoint(self, mats) -> np.ndarray:
+        """Applies the transpose of the tensor to a batch of problem data matrices.
+
+        Only the entries of the matrices in the sparsity pattern of the
+        problem data are read, and the reduced tensor is applied to all of
+        them with one product; neither the matrices nor the full tensor are
+        densified.
+
+        Parameters
+        ----------
+            mats: list of SciPy sparse matrices with the shape of the problem
+                  data matrix, including its offset column if it has one.
+
+        Returns
+        -------
+            A dense array of shape (param_size + 1, len(mats)) whose columns
+            are the products of the transposed tensor and the matrices.
+        """
+        self.cache()
+        if self.problem_data_index is None:
+            return np.zeros((self.matrix_data.shape[1], len(mats)))
+        n_rows = self.problem_data_index[2][0]
+        if self._sorted_keys is None:
+            indices, indptr, shape = self.problem_data_index
+            cols = np.repeat(np.arange(shape[1], dtype=np.int64),
+                             np.diff(indptr))
+            keys = cols * n_rows + indices
+            self._key_order = np.argsort(keys, kind='stable')
+            self._sorted_keys = keys[self._key_order]
+        sorted_keys = self._sorted_keys
+        if len(sorted_keys) == 0:
+            # E.g., the empty P of a problem with a linear objective.
+            return np.zeros((self.reduced_mat.shape[1], len(mats)))
+        values = np.zeros((len(sorted_keys), len(mats)))
+        for j, mat in enumerate(mats):
+            mat = sp.coo_matrix(mat)
+            mat_keys = mat.col.astype(np.int64) * n_rows + mat.row
+            pos = np.minimum(np.searchsorted(sorted_keys, mat_keys),
+                             len(sorted_keys) - 1)
+            found = sorted_keys[pos] == mat_keys
+            # Duplicate entries of a matrix are summed.
+            np.add.at(values[:, j], self._key_order[pos[found]],
+                      mat.data[found])
+        return np.asarray(self.reduced_mat.T @ values)
+
+
+def parameter_entries(q, reduced_A, reduced_P, var_len: int) -> dict:
+    """Returns the entries of the problem data that depend on parameters.
+
+    Parameters
+    ----------
+        q: the tensor of the linear objective, with the offset in its last row.
+        reduced_A: the ReducedMat of the constraints, with the offset column.
+        reduced_P: the ReducedMat of the quadratic objective.
+        var_len: the length of the problem variable.
+
+    Returns
+    -------
+        A dict mapping 'q' and 'b' to the indices of the entries of the
+        linear objective and the constraint offset, and 'A' and 'P' to
+        tuples (rows, cols) of the entries of the constraint matrix and of
+        the quadratic objective, whose values change with the values of
+        the parameters.
+    """
+    q_affected = sp.csr_matrix(q)[:-1, :-1].getnnz(axis=1) > 0
+    rows, cols = reduced_A.parameter_entries()
+    in_A = cols < var_len
+    return {'q': np.flatnonzero(q_affected),
+            'A': (rows[in_A], cols[in_A]),
+            'b': rows[~in_A],
+            'P': reduced_P.parameter_entries()}
+
+
+def _normalize_index(indices, indptr, shape):
+    """Casts a CSC structure to the index dtype SciPy uses for it.
+
+    Matrices built from the returned arrays with csc_from_index share them
+    instead of copying them.
+    """
+    template = sp.csc_matrix(
+        (np.zeros(len(indices)), indices, indptr), shape=shape)
+    return template.indices, template.indptr, shape
@@ -0,0 +1,101 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+
+class WarmStartStore:
+    """A thread-safe LRU store of solver warm-start state.
+
+    Solvers record the state they can warm start from, e.g., the primal and
+    dual iterates of SCS or the factorized OSQP solver object, in the solver
+    cache of a problem. When a store is set with set_warm_start_store, that
+    state is moved to the store after every solve, keyed by the structural
+    fingerprint of the problem, its compilation options and the name of the
+    solver, and moved back into the solver cache of the next structurally
+    identical problem that is solved with the same solver. A problem that is
+    rebuilt with fresh variables and parameters, e.g., once per request in a
+    service, thereby warm starts from the previous solve.
+
+    Entries are taken out of the store while a problem uses them, so that
+    stateful solver objects are never used by two problems at once; a
+    concurrent solve of the same structure simply starts cold.
+
+    Any object with the methods take, put and clear can be used as a store.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of entries to keep.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def take(self, key):
+        """Removes the entry stored under key and returns it, or None."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put(self, key, entry) -> None:
+        """Stores an entry, evicting the least recently stored one."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries from the store."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_WARM_START_STORE = None
+
+
+def set_warm_start_store(store) -> None:
+    """Sets the process-wide store of warm-start state.
+
+    Parameters
+    ----------
+    store : WarmStartStore or None
+        The store shared by the solves of all problems, or None to keep the
+        warm-start state of every problem to itself.
+    """
+    global _WARM_START_STORE
+    _WARM_START_STORE = store
+
+
+def get_warm_start_store():
+    """Returns the process-wide store of warm-start state, or None."""
+    return _WARM_START_STORE
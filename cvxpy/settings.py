@@ -179,6 +179,7 @@ UNKNOWN = "UNKNOWN"
 # Canonicalization backends
 NUMPY_CANON_BACKEND = "NUMPY"
 SCIPY_CANON_BACKEND = "SCIPY"
+COO_CANON_BACKEND = "COO"
 RUST_CANON_BACKEND = "RUST"
 CPP_CANON_BACKEND = "CPP"
 
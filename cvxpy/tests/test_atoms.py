@@ -797,6 +797,40 @@ class TestAtoms(BaseTest):
         assert np.allclose(cp.vec_to_upper_tri(1, strict=True).value, np.array([[0, 1], [0, 0]]))
 
 
+    def test_batched_matmul(self) -> None:
+        rng = np.random.default_rng(0)
+        A = rng.standard_normal((5, 2, 3))
+        X = Variable((5, 3))
+        X.value = rng.standard_normal((5, 3))
+        expr = cp.batched_matmul(A, X)
+        self.assertEqual(expr.shape, (5, 2))
+        expect = np.einsum('kmn,kn->km', A, X.value)
+        self.assertItemsAlmostEqual(expr.value, expect)
+        # Inner products and lists of sparse blocks.
+        self.assertItemsAlmostEqual(cp.batched_matmul(A[:, 0], X).value,
+                                    expect[:, 0])
+        blocks = [sp.csr_matrix(block) for block in A]
+        self.assertItemsAlmostEqual(cp.batched_matmul(blocks, X).value, expect)
+
+        # One constraint has the solution and the duals of the loop version.
+        b = np.ones((5, 2))
+        cons = [cp.batched_matmul(A, X) <= b]
+        obj = cp.Minimize(cp.sum_squares(X - 1))
+        Problem(obj, cons).solve(solver=cp.CLARABEL)
+        X_value, dual = X.value, cons[0].dual_value
+        loop = [A[i] @ X[i] <= b[i] for i in range(5)]
+        Problem(obj, loop).solve(solver=cp.CLARABEL)
+        self.assertItemsAlmostEqual(X_value, X.value, places=4)
+        self.assertItemsAlmostEqual(dual, np.vstack([con.dual_value for con in loop]),
+                                    places=4)
+        self.assertGreater(np.abs(dual).max(), 1e-2)
+
+        with pytest.raises(ValueError, match="X must have shape"):
+            cp.batched_matmul(A, Variable((3, 5)))
+        with pytest.raises(ValueError, match="2D or 3D"):
+            cp.batched_matmul(np.ones(3), X)
+
+
     def test_huber(self) -> None:
         # Valid.
         cp.huber(self.x, 1)
@@ -1271,6 +1305,22 @@ class TestAtoms(BaseTest):
         self.assertAlmostEqual(y.value, 42)
         self.assertAlmostEqual(p2.constraints[0].dual_value, 42)
 
+    def test_partial_optimize_value_reuses_compilation(self) -> None:
+        """Evaluating the value repeatedly compiles the problem once.
+        """
+        x, t = Variable(3), Variable(3)
+        g = partial_optimize(Problem(Minimize(cp.sum(t)), [-t <= x, x <= t]),
+                             [t], [x], solver=cp.CLARABEL)
+        with cp.profiling() as profile:
+            for i in range(1, 4):
+                x.value = np.array([1., -2., 3.]) * i
+                self.assertAlmostEqual(g.value, 6 * i)
+                self.assertItemsAlmostEqual(g.grad[x].toarray().ravel(),
+                                            [1, -1, 1])
+        compilation = profile.root.children['compilation']
+        self.assertEqual(compilation.calls, 6)
+        self.assertEqual(compilation.children['Dcp2Cone'].calls, 1)
+
     def test_partial_optimize_stacked(self) -> None:
         """Minimize the 1-norm in the usual way
         """
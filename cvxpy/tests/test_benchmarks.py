@@ -150,6 +150,56 @@ class TestBenchmarks(BaseTest):
 
         benchmark(parameterized_cone_matrix_stuffing, iters=1)
 
+    def test_cone_matrix_stuffing_thread_scaling(self) -> None:
+        self.skipTest("This benchmark takes too long.")
+        m = 20000
+        n = 5
+        x = cp.Variable(m + n)
+        constraints = [np.random.randn(n, n) @ x[i:i + n] <= np.random.randn(n)
+                       for i in range(m)]
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), constraints)
+
+        def cone_matrix_stuffing():
+            ConeMatrixStuffing().apply(problem)
+
+        default_num_threads = cp.get_num_threads()
+        try:
+            for num_threads in [1, 2, 4, 8, 16]:
+                cp.set_num_threads(num_threads)
+                benchmark(cone_matrix_stuffing, iters=3,
+                          name="cone_matrix_stuffing_%d_threads" % num_threads)
+        finally:
+            cp.set_num_threads(default_num_threads)
+
+    def test_canon_backends(self) -> None:
+        self.skipTest("This benchmark takes too long.")
+        m = 200
+        n = 200
+        A = cp.Parameter((m, n))
+        C = cp.Parameter(m // 2)
+        b = cp.Parameter(m)
+        A.value = np.random.randn(m, n)
+        C.value = np.random.rand(m // 2)
+        b.value = np.random.randn(m)
+
+        x = cp.Variable(n)
+        constraints = [C[i] * x[i] <= b[i] for i in range(m // 2)]
+        constraints.extend([C[i] * x[m // 2 + i] == b[m // 2 + i] for i in range(m // 2)])
+        problems = {
+            "parameterized": cp.Problem(cp.Minimize(cp.sum(A @ x)), constraints),
+            "nonparameterized": cp.Problem(cp.Minimize(cp.sum(A.value @ x)),
+                                           [A.value @ x <= b.value]),
+        }
+
+        for name, problem in problems.items():
+            for backend in [cp.CPP_CANON_BACKEND, cp.SCIPY_CANON_BACKEND,
+                            cp.COO_CANON_BACKEND]:
+                def cone_matrix_stuffing():
+                    ConeMatrixStuffing(canon_backend=backend).apply(problem)
+
+                benchmark(cone_matrix_stuffing, iters=3,
+                          name="%s_cone_matrix_stuffing_%s" % (name, backend))
+
     def test_small_cone_matrix_stuffing(self) -> None:
         m = 200
         n = 200
@@ -303,3 +353,22 @@ class TestBenchmarks(BaseTest):
 
         print("Issue #1668 regression test")
         print("Compilation time: ", end - start)
+
+    def test_value_after_leaf_change(self) -> None:
+        """Reading a value after a leaf changes misses the value memo."""
+        n = 200
+        y = cp.Variable(n)
+        expr = cp.sum([cp.exp(y[i]) + cp.square(y[i]) for i in range(n)])
+        values = [np.random.randn(n) for _ in range(50)]
+
+        def value_after_leaf_change():
+            for value in values:
+                y.value = value
+                expr.value
+        benchmark(value_after_leaf_change, iters=3)
+
+        def value_after_in_place_change():
+            for value in values:
+                y.value[:] = value
+                expr.value
+        benchmark(value_after_in_place_change, iters=3)
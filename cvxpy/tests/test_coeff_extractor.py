@@ -187,3 +187,75 @@ def test_coeff_extractor(coeff_extractor):
     assert P.shape == (2, 2)
     assert np.allclose(P.parameter_offset, np.array([0, 0, 1, 1]))
     assert np.allclose(constant.toarray(), np.zeros((3)))
+
+
+def test_cpp_backend_num_threads():
+    """
+    The C++ backend builds the problem data in parallel; the result must not
+    depend on the number of threads.
+    """
+    import cvxpy.cvxcore.python.cvxcore as cvxcore
+    from cvxpy.reductions.dcp2cone.cone_matrix_stuffing import ConeMatrixStuffing
+
+    if not cvxcore.openmp_enabled():
+        pytest.skip("cvxcore was built without OpenMP.")
+
+    np.random.seed(0)
+    x = cp.Variable(40)
+    p = cp.Parameter(3, value=np.random.randn(3))
+    constraints = [p[i % 3] * x[i] + np.random.randn(2) @ x[i + 1:i + 3] <= i
+                   for i in range(37)]
+    constraints += [cp.sum(x[i:i + 4]) == p[i % 3] for i in range(0, 36, 4)]
+    problem = cp.Problem(cp.Minimize(cp.sum(x)), constraints)
+
+    expected, _ = ConeMatrixStuffing(canon_backend=cp.SCIPY_CANON_BACKEND).apply(problem)
+    default_num_threads = cp.get_num_threads()
+    try:
+        tensors = []
+        for num_threads in [1, 4]:
+            cp.set_num_threads(num_threads)
+            param_prog, _ = ConeMatrixStuffing(
+                canon_backend=cp.CPP_CANON_BACKEND).apply(problem)
+            tensors.append(param_prog.A.tocsc())
+    finally:
+        cp.set_num_threads(default_num_threads)
+    assert np.array_equal(tensors[0].indptr, tensors[1].indptr)
+    assert np.array_equal(tensors[0].indices, tensors[1].indices)
+    assert np.array_equal(tensors[0].data, tensors[1].data)
+    assert np.allclose((tensors[0] - expected.A).toarray(), 0)
+
+
+def test_cpp_backend_serialized_forest():
+    """
+    The C++ backend receives the LinOp trees as one flat serialization; shared
+    subtrees, slices, dense, sparse, scalar and LinOp data must round-trip.
+    """
+    import scipy.sparse as sp
+
+    from cvxpy.cvxcore.python.cppbackend import serialize_lin_op_forest
+    from cvxpy.reductions.dcp2cone.cone_matrix_stuffing import ConeMatrixStuffing
+
+    np.random.seed(0)
+    X = cp.Variable((3, 4))
+    p = cp.Parameter(4, value=np.random.randn(4))
+    S = sp.random(2, 3, density=0.5, random_state=0)
+    shared = X[1:, ::2] + 2.0
+    constraints = [
+        S @ X[:, 1:3] <= 1,
+        cp.multiply(p, X[0]) >= shared[0, 0],
+        cp.sum(shared) + np.random.randn(3) @ X[:, 0] == 3,
+        X.T @ np.random.randn(3) >= -p,
+    ]
+    problem = cp.Problem(cp.Minimize(cp.sum(X)), constraints)
+
+    expected, _ = ConeMatrixStuffing(canon_backend=cp.SCIPY_CANON_BACKEND).apply(problem)
+    param_prog, _ = ConeMatrixStuffing(canon_backend=cp.CPP_CANON_BACKEND).apply(problem)
+    assert np.allclose((param_prog.A - expected.A).toarray(), 0)
+
+    lin_op = (X + 1).canonical_form[0]
+    meta, idx, values = serialize_lin_op_forest([lin_op, lin_op])
+    assert meta.dtype == np.int32 and idx.dtype == np.int32
+    assert values.dtype == np.float64
+    # The shared tree is serialized once and listed twice as a root.
+    num_nodes = meta[0]
+    assert list(meta[-3:]) == [2, num_nodes - 1, num_nodes - 1]
@@ -0,0 +1,196 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import cvxpy as cp
+import cvxpy.settings as s
+from cvxpy.reductions.compilation_cache import (
+    CompiledProblemCache,
+    DiskCompilationCache,
+    get_compiled_problem_cache,
+    set_compilation_cache,
+    set_compiled_problem_cache,
+)
+from cvxpy.tests.base_test import BaseTest
+from cvxpy.utilities.fingerprint import structural_fingerprint
+
+
+def _lasso():
+    np.random.seed(0)
+    A = np.random.randn(6, 4)
+    x = cp.Variable(4)
+    b = cp.Parameter(6)
+    gamma = cp.Parameter(nonneg=True)
+    problem = cp.Problem(
+        cp.Minimize(cp.sum_squares(A @ x - b) + gamma * cp.norm1(x)),
+        [cp.sum(x) == 1, x >= -1])
+    b.value = np.random.randn(6)
+    gamma.value = 0.5
+    return problem, x, gamma
+
+
+class TestFingerprint(BaseTest):
+    def test_ignores_ids_and_values(self) -> None:
+        problem, _, _ = _lasso()
+        other, _, other_gamma = _lasso()
+        other_gamma.value = 2.0
+        self.assertEqual(structural_fingerprint(problem),
+                         structural_fingerprint(other))
+
+    def test_structure(self) -> None:
+        x = cp.Variable(2)
+        y = cp.Variable(2)
+        fingerprint = structural_fingerprint(cp.sum(x + x))
+        self.assertNotEqual(fingerprint, structural_fingerprint(cp.sum(x + y)))
+        self.assertNotEqual(fingerprint, structural_fingerprint(cp.sum(x - x)))
+        self.assertNotEqual(fingerprint,
+                            structural_fingerprint(cp.sum(x + x + 1)))
+        self.assertNotEqual(structural_fingerprint(x + 1),
+                            structural_fingerprint(x + 2))
+        self.assertNotEqual(structural_fingerprint(cp.Variable(2)),
+                            structural_fingerprint(cp.Variable(2, nonneg=True)))
+
+    def test_methods(self) -> None:
+        x = cp.Variable(2)
+        constraint = x >= 1
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), [constraint])
+        self.assertEqual(cp.sum(x).fingerprint(), structural_fingerprint(cp.sum(x)))
+        self.assertEqual(constraint.fingerprint(), structural_fingerprint(constraint))
+        self.assertEqual(problem.fingerprint(), structural_fingerprint(problem))
+        y = cp.Variable(2)
+        self.assertEqual(problem.fingerprint(),
+                         cp.Problem(cp.Minimize(cp.sum(y)), [y >= 1]).fingerprint())
+
+
+class TestCompiledProblemCache(BaseTest):
+    def setUp(self) -> None:
+        self.cache = CompiledProblemCache()
+        set_compiled_problem_cache(self.cache)
+
+    def tearDown(self) -> None:
+        set_compiled_problem_cache(None)
+
+    def test_reuse(self) -> None:
+        for solver in [cp.CLARABEL, cp.OSQP]:
+            self.cache.clear()
+            problem, _, _ = _lasso()
+            problem.solve(solver=solver)
+
+            other, x, gamma = _lasso()
+            gamma.value = 2.0
+            other.solve(solver=solver)
+            self.assertEqual(self.cache.hits, 1)
+            self.assertEqual(len(self.cache), 1)
+
+            set_compiled_problem_cache(None)
+            expected, expected_x, expected_gamma = _lasso()
+            expected_gamma.value = 2.0
+            expected.solve(solver=solver)
+            set_compiled_problem_cache(self.cache)
+
+            self.assertAlmostEqual(other.value, expected.value)
+            self.assertItemsAlmostEqual(x.value, expected_x.value)
+            for constraint, expected_constraint in zip(other.constraints,
+                                                       expected.constraints):
+                self.assertItemsAlmostEqual(constraint.dual_value,
+                                            expected_constraint.dual_value,
+                                            places=4)
+
+            # Solving again reuses the instance's own cache.
+            gamma.value = 0.5
+            other.solve(solver=solver)
+            self.assertEqual(self.cache.hits, 1)
+            self.assertAlmostEqual(other.value, problem.value)
+
+    def test_solve_batch(self) -> None:
+        problem, _, _ = _lasso()
+        problem.solve(solver=cp.CLARABEL)
+        other, x, gamma = _lasso()
+        results = other.solve_batch({gamma: [0.5, 2.0]}, solver=cp.CLARABEL)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertAlmostEqual(results[0].opt_value, problem.value)
+        self.assertItemsAlmostEqual(results[0].primal_values[x.id],
+                                    problem.variables()[0].value)
+
+    def test_structure(self) -> None:
+        x = cp.Variable(3)
+        cp.Problem(cp.Minimize(cp.sum(x)), [x >= 1]).solve(solver=cp.CLARABEL)
+        x = cp.Variable(3)
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), [x >= 2])
+        problem.solve(solver=cp.CLARABEL)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertAlmostEqual(problem.value, 6)
+        # Different solvers compile differently.
+        x = cp.Variable(3)
+        cp.Problem(cp.Minimize(cp.sum(x)), [x >= 2]).solve(solver=cp.SCS)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_eviction(self) -> None:
+        set_compiled_problem_cache(CompiledProblemCache(maxsize=2))
+        for bound in range(3):
+            x = cp.Variable(3)
+            cp.Problem(cp.Minimize(cp.sum(x)), [x >= bound]).solve(
+                solver=cp.CLARABEL)
+        self.assertEqual(len(get_compiled_problem_cache()), 2)
+
+
+class TestDiskCompilationCache(BaseTest):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = DiskCompilationCache(self.cache_dir)
+        set_compilation_cache(self.cache)
+
+    def tearDown(self) -> None:
+        set_compilation_cache(None)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_reuse(self) -> None:
+        for solver in [cp.CLARABEL, cp.OSQP]:
+            self.cache.clear()
+            problem, x, gamma = _lasso()
+            problem.solve(solver=solver)
+            self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+            # A structurally identical problem loads the tensors from disk.
+            other, other_x, other_gamma = _lasso()
+            data, _, _ = other.get_problem_data(solver)
+            self.assertFalse(data[s.PARAM_PROB].P.data.flags.writeable)
+            other.solve(solver=solver)
+            self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+            self.assertAlmostEqual(other.value, problem.value)
+            self.assertItemsAlmostEqual(other_x.value, x.value)
+
+            # Parameters can still be updated.
+            gamma.value = 2.0
+            other_gamma.value = 2.0
+            problem.solve(solver=solver)
+            other.solve(solver=solver)
+            self.assertAlmostEqual(other.value, problem.value)
+
+    def test_different_structure(self) -> None:
+        x = cp.Variable(3)
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), [x >= 1])
+        problem.solve(solver=cp.CLARABEL)
+        x = cp.Variable(3)
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), [x >= 2])
+        problem.solve(solver=cp.CLARABEL)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        self.assertAlmostEqual(problem.value, 6)
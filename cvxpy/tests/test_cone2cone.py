@@ -14,6 +14,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -31,7 +33,12 @@ from cvxpy.reductions.cvx_attr2constr import CvxAttr2Constr
 from cvxpy.reductions.dcp2cone.cone_matrix_stuffing import ConeMatrixStuffing
 from cvxpy.reductions.dcp2cone.dcp2cone import Dcp2Cone
 from cvxpy.reductions.solution import Solution
-from cvxpy.reductions.solvers.conic_solvers.conic_solver import ConicSolver
+from cvxpy.reductions.solvers.conic_solvers import conic_solver
+from cvxpy.reductions.solvers.conic_solvers.conic_solver import (
+    ConicSolver,
+    RowScatter,
+)
+from cvxpy.reductions.solvers.conic_solvers.scs_conif import SCS
 from cvxpy.reductions.solvers.defines import INSTALLED_MI_SOLVERS as INSTALLED_MI
 from cvxpy.reductions.solvers.defines import MI_SOCP_SOLVERS as MI_SOCP
 from cvxpy.tests import solver_test_helpers as STH
@@ -188,6 +195,67 @@ class TestDualize(BaseTest):
         sth.verify_dual_values(places=3)
 
 
+class TestFormatConstraints(BaseTest):
+
+    @staticmethod
+    def cone_prog(bound):
+        x = cp.Variable(3)
+        X = cp.Variable((2, 2), symmetric=True)
+        p = cp.Parameter(3, value=bound * np.ones(3))
+        prob = cp.Problem(cp.Minimize(cp.sum(x) + trace(X)),
+                          [x >= p, cp.sum(x) == 1, cp.norm(x) <= 5,
+                           cp.log_sum_exp(x) <= 3, X >> 0,
+                           cp.power(x[0] + 2, 1.5) <= 4])
+        chain = Chain(None, [Dcp2Cone(), CvxAttr2Constr(), ConeMatrixStuffing()])
+        return chain.apply(prob)[0]
+
+    def test_restructured_tensor(self) -> None:
+        for solver in [ConicSolver(), SCS()]:
+            cone_prog = self.cone_prog(1.0)
+            restruct_mat = solver.restruct_mat(cone_prog.constraints, [0, 1, 2])
+            num_blocks = cone_prog.A.shape[0] // restruct_mat.shape[1]
+            expected = sp.sparse.kron(sp.sparse.eye(num_blocks),
+                                      restruct_mat) @ cone_prog.A
+            formatted = solver.format_constraints(cone_prog, [0, 1, 2])
+            self.assertItemsAlmostEqual(formatted.A.toarray(), expected.toarray())
+
+            # Problems with the same layout reuse the row scatter.
+            with mock.patch.object(solver, 'restruct_mat',
+                                   wraps=solver.restruct_mat) as restruct:
+                cone_prog = self.cone_prog(2.0)
+                solver.format_constraints(cone_prog, [0, 1, 2])
+                restruct.assert_not_called()
+                solver.format_constraints(cone_prog, [2, 1, 0])
+                restruct.assert_called_once()
+
+    def test_restruct_cache_threads(self) -> None:
+        # Lookups and evictions of the row scatters from several threads.
+        cone_prog = self.cone_prog(1.0)
+        orders = [[0, 1, 2], [2, 1, 0], [1, 0, 2], [0, 2, 1]]
+
+        def format_constraints(index):
+            return SCS().format_constraints(cone_prog,
+                                            orders[index % 4]).A.toarray()
+        with mock.patch.object(conic_solver, '_RESTRUCT_CACHE', {}), \
+                mock.patch.object(conic_solver, '_RESTRUCT_CACHE_SIZE', 2):
+            expected = [format_constraints(index) for index in range(4)]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(format_constraints, range(200)))
+            self.assertLessEqual(len(conic_solver._RESTRUCT_CACHE), 2)
+        for index, result in enumerate(results):
+            self.assertItemsAlmostEqual(result, expected[index % 4])
+
+    def test_row_scatter(self) -> None:
+        # Rows that are dropped, duplicated and summed.
+        restruct_mat = sp.sparse.csc_matrix(np.array([[1., 0., 2.],
+                                                      [0., 0., 3.],
+                                                      [4., 0., 5.]]))
+        tensor = sp.sparse.random(9, 4, density=0.5, random_state=0, format='csc')
+        expected = sp.sparse.kron(sp.sparse.eye(3), restruct_mat) @ tensor
+        restructured = RowScatter(restruct_mat).apply(tensor)
+        self.assertItemsAlmostEqual(restructured.toarray(), expected.toarray())
+
+
 class TestSlacks(BaseTest):
 
     AFF_LP_CASES = [[a2d.NONNEG], []]
@@ -1,6 +1,7 @@
 import warnings
 
 import numpy as np
+import scipy.sparse as sp
 
 import cvxpy as cp
 import cvxpy.settings as s
@@ -336,6 +337,37 @@ class TestBackward(BaseTest):
         A = data[s.A]
         self.assertIn(0.0, A.data)
 
+    def test_batch(self) -> None:
+        np.random.seed(0)
+        A = cp.Parameter((4, 2))
+        b = cp.Parameter(4)
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.sum_squares(A @ x - b)), [x >= -1])
+        As = np.random.randn(3, 4, 2)
+        bs = np.random.randn(3, 4)
+        x_grads = np.random.randn(3, 2)
+        b_delta = np.random.randn(4)
+        results, grads = problem.backward_batch(
+            {A: As, b: bs}, {x: x_grads}, n_workers=2, eps=1e-10)
+        _, deltas = problem.derivative_batch(
+            {A: As, b: bs}, {b: b_delta}, n_workers=2, eps=1e-10)
+        self.assertEqual(grads[A].shape, (3, 4, 2))
+        self.assertEqual(deltas[x].shape, (3, 2))
+        for i in range(3):
+            A.value, b.value = As[i], bs[i]
+            x.gradient = x_grads[i]
+            b.delta = b_delta
+            problem.solve(solver=cp.DIFFCP, requires_grad=True, eps=1e-10)
+            self.assertItemsAlmostEqual(results[i].primal_values[x.id], x.value)
+            problem.backward()
+            self.assertItemsAlmostEqual(grads[A][i], A.gradient)
+            self.assertItemsAlmostEqual(grads[b][i], b.gradient)
+            problem.derivative()
+            self.assertItemsAlmostEqual(deltas[x][i], x.delta)
+
+        with self.assertRaisesRegex(ValueError, "Invalid dimensions"):
+            problem.backward_batch({A: As, b: bs}, {x: np.ones(3)})
+
 
 class TestBackwardDgp(BaseTest):
     """Test problem.backward() and problem.derivative()."""
@@ -640,3 +672,71 @@ class TestBackwardDgp(BaseTest):
                               cp.sum(w) <= kappa])
         gradcheck(problem, gp=True, solve_methods=[s.SCS], atol=1e-1)
         perturbcheck(problem, gp=True, solve_methods=[s.SCS], atol=1e-1)
+
+
+class TestBatchJacobian(BaseTest):
+    """Test the batched parameter Jacobian, which does not need diffcp."""
+
+    @staticmethod
+    def _param_jac(param_prog, delc, delA, delb):
+        """Applies the Jacobian to one perturbation with the full tensors."""
+        delAb = np.append(delA.toarray().flatten(order='F'), delb)
+        del_param_vec = delc @ param_prog.c[:-1] + param_prog.A.T @ delAb
+        deltas = {}
+        for param in param_prog.parameters:
+            col = param_prog.param_id_to_col[param.id]
+            deltas[param.id] = np.reshape(del_param_vec[col:col + param.size],
+                                          param.shape, order='F')
+        return deltas
+
+    def test_apply_param_jac_batch(self) -> None:
+        np.random.seed(0)
+        A = cp.Parameter((3, 2))
+        b = cp.Parameter(3)
+        gamma = cp.Parameter(nonneg=True)
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.norm(A @ x - b, 1) + gamma * cp.sum(x)),
+                             [x >= b[:2], cp.norm(x) <= 3])
+        A.value, b.value, gamma.value = np.random.randn(3, 2), np.random.randn(3), 1.
+        data, _, _ = problem.get_problem_data(solver=cp.SCS)
+        param_prog = data[s.PARAM_PROB]
+        m, n = data[s.A].shape
+        batch_size = 4
+
+        # Stacked perturbations: per instance, shared by the batch, or omitted.
+        As = np.random.randn(batch_size, 3, 2)
+        b_delta = np.random.randn(3)
+        deltas = problem._stack_leaf_values(
+            {A: As, b: b_delta}, problem.parameters(), batch_size, 0.0, "deltas")
+        for i in range(batch_size):
+            self.assertItemsAlmostEqual(deltas[A.id][i], As[i])
+            self.assertItemsAlmostEqual(deltas[b.id][i], b_delta)
+            self.assertEqual(deltas[gamma.id][i], 0.0)
+        with self.assertRaisesRegex(ValueError, "Invalid dimensions"):
+            problem._stack_leaf_values(
+                {A: np.ones(2)}, problem.parameters(), batch_size, 0.0, "deltas")
+        with self.assertRaisesRegex(ValueError, "does not appear"):
+            problem._stack_leaf_values(
+                {cp.Parameter(): 1.}, problem.parameters(), batch_size, 0.0, "deltas")
+
+        # The adjoint of the perturbations matches a loop over the instances.
+        perturbations = [
+            param_prog.apply_parameters(
+                {param_id: values[i] for param_id, values in deltas.items()},
+                zero_offset=True)
+            for i in range(batch_size)]
+        delcs = np.stack([c for c, _, _, _ in perturbations])
+        delbs = np.stack([b for _, _, _, b in perturbations])
+        # The perturbations of A need not share its sparsity pattern.
+        delAs = [dA + sp.random(m, n, density=0.5, random_state=i)
+                 for i, (_, _, dA, _) in enumerate(perturbations)]
+        batch = param_prog.apply_param_jac_batch(delcs, delAs, delbs)
+        for i in range(batch_size):
+            reference = self._param_jac(param_prog, delcs[i], delAs[i], delbs[i])
+            single = param_prog.apply_param_jac(delcs[i], delAs[i], delbs[i])
+            for param in problem.parameters():
+                self.assertEqual(batch[param.id].shape, (batch_size,) + param.shape)
+                self.assertItemsAlmostEqual(batch[param.id][i], reference[param.id],
+                                            places=10)
+                self.assertItemsAlmostEqual(single[param.id], reference[param.id],
+                                            places=10)
@@ -857,4 +857,79 @@ class TestCallbackParam(BaseTest):
         self.assertAlmostEqual(self.x.value, 8.0)
 
         with pytest.raises(NotImplementedError, match="Cannot set the value of a CallbackParam"):
-            callback_param.value = 1.0
\ No newline at end of file
+            callback_param.value = 1.0
+
+class TestSolveBatch(BaseTest):
+    def test_scalar_param(self) -> None:
+        p = cp.Parameter()
+        x = cp.Variable()
+        problem = cp.Problem(cp.Minimize(cp.square(x - p)), [x >= 0])
+        results = problem.solve_batch({p: np.array([-1.0, 1.0, 2.0])})
+        self.assertEqual(len(results), 3)
+        for result, expected in zip(results, [0.0, 1.0, 2.0]):
+            self.assertEqual(result.status, cp.OPTIMAL)
+            self.assertAlmostEqual(result.primal_values[x.id], expected)
+        # Neither parameters nor variables are mutated.
+        self.assertIsNone(p.value)
+        self.assertIsNone(x.value)
+
+    def test_matches_sequential_solves(self) -> None:
+        np.random.seed(0)
+        A = cp.Parameter((3, 2))
+        b = cp.Parameter(3, nonneg=True)
+        x = cp.Variable(2)
+        constr = x <= 1
+        problem = cp.Problem(
+            cp.Minimize(cp.norm(A @ x - b, 1) + cp.norm(x, 2)), [constr])
+        As = np.random.randn(4, 3, 2)
+        bs = np.abs(np.random.randn(4, 3))
+        results = problem.solve_batch(
+            [{A: As[i], b: bs[i]} for i in range(4)], solver=cp.CLARABEL)
+        for i, result in enumerate(results):
+            A.value = As[i]
+            b.value = bs[i]
+            problem.solve(solver=cp.CLARABEL)
+            self.assertAlmostEqual(result.opt_value, problem.value)
+            self.assertItemsAlmostEqual(result.primal_values[x.id], x.value)
+            self.assertItemsAlmostEqual(result.dual_values[constr.id],
+                                        constr.dual_value)
+
+    def test_qp(self) -> None:
+        np.random.seed(0)
+        q = cp.Parameter(2)
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.sum_squares(x - q)),
+                             [x >= 0, cp.sum(x) <= 1])
+        qs = np.random.randn(5, 2)
+        results = problem.solve_batch({q: qs}, solver=cp.OSQP, eps_abs=1e-8)
+        for i, result in enumerate(results):
+            q.value = qs[i]
+            problem.solve(solver=cp.OSQP, eps_abs=1e-8)
+            self.assertItemsAlmostEqual(result.primal_values[x.id], x.value)
+
+    def test_omitted_param_keeps_value(self) -> None:
+        p = cp.Parameter()
+        q = cp.Parameter(value=10.0)
+        x = cp.Variable()
+        problem = cp.Problem(cp.Minimize(x), [x >= p + q])
+        results = problem.solve_batch([{p: 1.0}, {p: 2.0}])
+        self.assertAlmostEqual(results[0].opt_value, 11.0)
+        self.assertAlmostEqual(results[1].opt_value, 12.0)
+
+    def test_invalid_param_values(self) -> None:
+        p = cp.Parameter(2, nonneg=True)
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), [x >= p])
+        with self.assertRaises(ValueError):
+            problem.solve_batch({p: np.ones((3, 3))})
+        with self.assertRaises(ValueError):
+            problem.solve_batch({p: -np.ones((3, 2))})
+        with self.assertRaises(ValueError):
+            problem.solve_batch([])
+
+    def test_not_dpp(self) -> None:
+        p = cp.Parameter()
+        x = cp.Variable()
+        problem = cp.Problem(cp.Minimize(x), [x >= p * p])
+        with self.assertRaises(error.DPPError):
+            problem.solve_batch({p: np.ones(2)})
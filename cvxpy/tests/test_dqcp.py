@@ -13,6 +13,8 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from unittest import mock
+
 import numpy as np
 import pytest
 
@@ -21,6 +23,7 @@ import cvxpy.settings as s
 from cvxpy.reductions.dqcp2dcp.dqcp2dcp import Dqcp2Dcp
 from cvxpy.reductions.solvers import bisection
 from cvxpy.tests import base_test
+from cvxpy.utilities.coeff_extractor import CoeffExtractor
 
 SOLVER = cp.ECOS
 
@@ -458,6 +461,41 @@ class TestDqcp(base_test.BaseTest):
         np.testing.assert_almost_equal(problem.objective.value, 0.25)
         np.testing.assert_almost_equal(x.value, np.array([0.8, 0.8]))
 
+    def test_bisection_compiles_once(self) -> None:
+        x = cp.Variable()
+        y = cp.Variable(pos=True)
+        problem = cp.Problem(cp.Minimize(x / y), [x >= 1, y <= 2, y >= 0.5])
+        with cp.profiling() as profile:
+            problem.solve(SOLVER, qcp=True)
+        self.assertAlmostEqual(problem.objective.value, 0.5)
+        compilation = profile.root.children['compilation']
+        self.assertGreater(compilation.calls, 10)
+        # The feasibility problem and the problem parametrized by the
+        # bisection parameter are each compiled once.
+        self.assertEqual(compilation.children['Dcp2Cone'].calls, 2)
+
+        # Only the lazy constraints are stuffed again on each query.
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.dist_ratio(x, np.ones(2),
+                                                       np.zeros(2))),
+                             [x <= 0.8, cp.norm(x) <= 2])
+        stuffed_rows = []
+        affine = CoeffExtractor.affine
+
+        def record_affine(extractor, expr):
+            exprs = expr if isinstance(expr, list) else [expr]
+            stuffed_rows.append(sum(e.size for e in exprs))
+            return affine(extractor, expr)
+
+        with mock.patch.object(CoeffExtractor, 'affine', record_affine):
+            problem.solve(SOLVER, qcp=True)
+        self.assertAlmostEqual(problem.objective.value, 0.25)
+        # The objective and constraints of the feasibility problem and of
+        # the first query, then the objective and lazy constraint of each
+        # query.
+        self.assertEqual(stuffed_rows[:4], [1, 6, 1, 11])
+        self.assertEqual(set(stuffed_rows[4:]), {1, 5})
+
     def test_infeasible_exp_constr(self) -> None:
         x = cp.Variable()
         constr = [cp.exp(cp.ceil(x)) <= -5]
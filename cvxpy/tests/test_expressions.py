@@ -14,7 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import pickle
 import warnings
+from unittest import mock
 
 import numpy as np
 import scipy.sparse as sp
@@ -1532,3 +1534,67 @@ class TestExpressions(BaseTest):
         expr = hermitian_wrap(U)
         assert expr.is_hermitian()
 
+
+    def test_memoized_values(self) -> None:
+        """Values are recomputed only below changed leaves."""
+        x = Variable(3)
+        p = Parameter(3)
+        shared = cp.exp(x)
+        left = cp.sum(shared + p)
+        expr = left + cp.norm1(shared) + cp.sum_squares(x)
+        self.assertIsNone(expr.value)
+        p.value = np.ones(3)
+        self.assertIsNone(expr.value)
+
+        x.value = np.zeros(3)
+        with mock.patch.object(cp.exp, 'numeric', autospec=True,
+                               side_effect=cp.exp.numeric) as numeric:
+            self.assertAlmostEqual(expr.value, 9)
+            self.assertAlmostEqual(expr.value, 9)
+            self.assertItemsAlmostEqual(expr.grad[x].toarray().ravel(), [2, 2, 2])
+            self.assertEqual(numeric.call_count, 1)
+
+            # Assigning a parameter leaves the subexpressions of x as is.
+            p.value = np.zeros(3)
+            self.assertAlmostEqual(expr.value, 6)
+            self.assertEqual(numeric.call_count, 1)
+            x.value = np.ones(3)
+            self.assertAlmostEqual(expr.value, 6 * np.e + 3)
+            self.assertEqual(numeric.call_count, 2)
+
+        # Callback parameters are evaluated on every access.
+        q = cp.CallbackParam(lambda: p.value + 1, 3)
+        expr = cp.sum(q)
+        self.assertAlmostEqual(expr.value, 3)
+        p.value = np.ones(3)
+        self.assertAlmostEqual(expr.value, 6)
+
+        # Copies do not share versions with the original.
+        expr = pickle.loads(pickle.dumps(cp.sum(x)))
+        self.assertAlmostEqual(expr.value, 3)
+        expr.variables()[0].value = np.zeros(3)
+        self.assertAlmostEqual(expr.value, 0)
+
+    def test_memoized_values_mutation(self) -> None:
+        """Modifying values in place does not give stale values."""
+        p = Parameter(3)
+        p.value = np.array([1.0, 2.0, 3.0])
+        x = Variable(3)
+        x.value = np.ones(3)
+        expr = cp.exp(p) + x
+        value = expr.value
+        value += 100
+        self.assertItemsAlmostEqual(expr.value, np.exp([1, 2, 3]) + 1)
+        grad = cp.sum(expr).grad
+        grad[x] *= 0
+        self.assertItemsAlmostEqual(cp.sum(expr).grad[x].toarray(), np.ones(3))
+
+        # Leaves modified in place are detected.
+        p.value[0] = 0
+        self.assertItemsAlmostEqual(expr.value, np.exp([0, 2, 3]) + 1)
+        x.value += 1
+        self.assertItemsAlmostEqual(expr.value, np.exp([0, 2, 3]) + 2)
+        norm = cp.norm1(p)
+        self.assertAlmostEqual(norm.value, 5)
+        p.value[:] = 2
+        self.assertAlmostEqual(norm.value, 6)
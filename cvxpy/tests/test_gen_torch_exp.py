@@ -1,4 +1,7 @@
+from unittest import mock
+
 import numpy as np
+import scipy.sparse as sp
 import torch
 
 import cvxpy as cp
@@ -78,4 +81,170 @@ class TestGenTorchExp(BaseTest):
             self.assertTrue(np.all(self.t1==test9))
             self.assertTrue(torch.all(test10==self.n).item())
             self.assertTrue(torch.all(test11_unordered==14*torch.ones(self.n)).item())
-            self.assertTrue(torch.all(test11==13*torch.ones(self.n)).item())
\ No newline at end of file
+            self.assertTrue(torch.all(test11==13*torch.ones(self.n)).item())
+    def test_torch_exp_module(self):
+        #The expression is flattened once, with its constants stored as buffers
+        expr = self.Q@self.x + self.a
+        exp = cp.sum_squares(expr) + cp.sum(expr) + self.x@self.w
+        torch_exp, vars_dict = exp.gen_torch_exp()
+        self.assertIsInstance(torch_exp, torch.nn.Module)
+        buffers = list(torch_exp.buffers())
+        #Q, a and the denominator of sum_squares
+        self.assertEqual(len(buffers), 3)
+        self.assertTrue(all(buffer.dtype == torch.float64 for buffer in buffers))
+
+        x = torch.tensor([1., 2., 3.], dtype=torch.float64)
+        w = torch.tensor([1., -1., 2.], dtype=torch.float64)
+        self.x.value = x.numpy()
+        self.w.value = w.numpy()
+        calls = []
+        apply_torch_numeric = cp.Expression.apply_torch_numeric
+
+        def record(expr, values):
+            calls.append(type(expr).__name__)
+            return apply_torch_numeric(expr, values)
+
+        with mock.patch.object(cp.Expression, 'apply_torch_numeric', record):
+            for _ in range(2):
+                self.assertTrue(np.isclose(torch_exp(x, w).item(), exp.value))
+        #The shared sub-expression is evaluated once per call
+        self.assertEqual(calls.count('MulExpression'), 4)
+        self.assertEqual(calls.count('AddExpression'), 4)
+
+    def test_constant_tensors(self):
+        #Sparse constants become sparse float64 tensors, converted once
+        A = sp.random(50, self.n, density=0.1, random_state=0, format='csc') / 3
+        const = cp.Constant(A)
+        exp = cp.sum_squares(const@self.x - 1) + self.a@self.x
+        torch_exp, _ = exp.gen_torch_exp()
+        sparse = [buffer for buffer in torch_exp.buffers() if buffer.is_sparse]
+        self.assertEqual(len(sparse), 1)
+        self.assertEqual(sparse[0].dtype, torch.float64)
+        self.assertTrue(np.array_equal(sparse[0].to_dense().numpy(), A.toarray()))
+        x = np.array([1., 2., 3.])
+        self.x.value = x
+        self.assertAlmostEqual(torch_exp(torch.tensor(x)).item(), exp.value)
+
+        other_exp, _ = (const@self.x).gen_torch_exp()
+        self.assertIs(next(other_exp.buffers()), sparse[0])
+        #Dense constants share the memory of their value
+        const = cp.Constant(self.Q.astype(np.float64))
+        self.assertIs(const.torch_tensor(), const.torch_tensor())
+        self.assertEqual(const.torch_tensor().data_ptr(), const.value.ctypes.data)
+
+    def test_batched(self):
+        #Every variable and parameter may carry a leading batch axis
+        batch = 1000
+        Q = self.Q.T@self.Q + np.eye(self.n)
+        exp = cp.norm1(self.Q@self.x - self.w) + cp.pnorm(self.x, 3) + \
+            cp.quad_form(self.x, Q) + cp.log_sum_exp(self.x) + self.x@self.w
+        torch_exp, vars_dict = exp.gen_torch_exp(batched=True)
+        self.assertEqual(list(vars_dict.vars_dict), [self.x, self.w])
+        rng = np.random.default_rng(0)
+        xs = rng.standard_normal((batch, self.n))
+        ws = rng.standard_normal((batch, self.n))
+
+        def expected(xs, ws):
+            values = []
+            for x, w in zip(xs, ws):
+                self.x.value, self.w.value = x, w
+                values.append(exp.value)
+            return np.array(values)
+
+        res = torch_exp(torch.tensor(xs), torch.tensor(ws))
+        self.assertEqual(res.shape, (batch,))
+        self.assertItemsAlmostEqual(res.numpy(), expected(xs, ws))
+        #Inputs without a batch axis are shared by the batch
+        res = torch_exp(torch.tensor(xs), torch.tensor(ws[0]))
+        self.assertItemsAlmostEqual(res.numpy(), expected(xs, [ws[0]]*batch))
+        res = torch_exp(torch.tensor(xs[0]), torch.tensor(ws[0]))
+        self.assertEqual(res.shape, ())
+
+        #Constraint residuals
+        constr = self.Q@self.x <= self.w
+        torch_exp, _ = constr.gen_torch_exp(batched=True)
+        res = torch_exp(torch.tensor(xs), torch.tensor(ws))
+        self.assertItemsAlmostEqual(res.numpy(), xs@self.Q.T - ws)
+
+    def test_batched_dtypes(self):
+        #Batched tensors keep their dtype
+        exp = cp.sum(cp.multiply(cp.exp(self.x), self.w))
+        torch_exp, _ = exp.gen_torch_exp(batched=True)
+        xs = np.random.randn(5, self.n)
+        res = torch_exp(torch.tensor(xs, dtype=torch.float32),
+                        torch.ones(self.n, dtype=torch.float32))
+        self.assertEqual(res.dtype, torch.float32)
+        self.assertItemsAlmostEqual(res.numpy(), np.exp(xs).sum(axis=1), places=4)
+
+        #Complex values keep their imaginary part
+        z = cp.Variable(self.n, complex=True)
+        exp = 2*z + self.w
+        torch_exp, _ = exp.gen_torch_exp(batched=True)
+        zs = np.random.randn(5, self.n) + 1j*np.random.randn(5, self.n)
+        for value in [torch.tensor(zs), zs]:
+            res = torch_exp(value, torch.ones(self.n, dtype=torch.float64))
+            self.assertTrue(res.is_complex())
+            self.assertItemsAlmostEqual(res.numpy(), 2*zs + 1)
+
+    def test_all_atoms(self):
+        #Every atom is evaluated in torch, with the same values as with NumPy
+        import inspect
+        import pkgutil
+        from importlib import import_module
+
+        import cvxpy.atoms
+        from cvxpy.atoms.affine import wraps
+        from cvxpy.atoms.atom import Atom
+
+        rng = np.random.default_rng(0)
+        x = cp.Variable(4, pos=True, value=rng.random(4) + 0.5)
+        y = cp.Variable(4, value=rng.random(4) + 0.5)
+        s = cp.Variable(pos=True, value=2.)
+        z = cp.Variable(2, value=rng.standard_normal(2))
+        M = rng.standard_normal((3, 3))
+        X = cp.Variable((3, 3), value=M@M.T + np.eye(3))
+        Y = cp.Variable((3, 3), value=np.diag(rng.random(3) + 1))
+        Z = cp.Variable((3, 3), pos=True, value=rng.random((3, 3)) + 0.1)
+        A = rng.random((3, 4))
+        exps = [x + y, x/y, cp.hstack([x, y]), cp.vstack([x, y]), cp.matrix_frac(x[:3], X),
+                A@x, -x, cp.pnorm(x, 3), cp.prod(x), x + s, cp.quad_form(x, np.eye(4) + 1),
+                cp.sum(X, axis=0), cp.abs(x - 1), cp.ceil(3*x), cp.floor(3*x),
+                cp.condition_number(X), cp.conj(x), cp.real(x), cp.imag(x),
+                cp.convolve(A[0], x), cp.cummax(x), cp.cumsum(x), cp.diag(X), cp.diag(x),
+                cp.dist_ratio(x, np.ones(4), np.zeros(4)), cp.dotsort(x, [1, 2]), cp.entr(x),
+                cp.exp(x), cp.eye_minus_inv(Z/10), cp.gen_lambda_max(X, Y), cp.geo_mean(x),
+                cp.gmatmul(A, x), cp.huber(x - 1, 0.25), x[::-1], x[np.array([0, 2])],
+                cp.kl_div(x, y), cp.rel_entr(x, y), cp.kron(A, X), cp.lambda_max(X),
+                cp.lambda_sum_largest(X, 2), cp.length(x - x[3]), cp.log(x), cp.log1p(x),
+                cp.log_det(X), cp.log_sum_exp(x), cp.logistic(x), cp.max(X, axis=1),
+                cp.min(x), cp.maximum(x, y), cp.minimum(x, y), cp.multiply(x, y),
+                cp.norm1(x - 1), cp.normNuc(X), cp.norm_inf(x - 1), cp.one_minus_pos(x/2),
+                cp.perspective(cp.sum_squares(z), s), cp.pf_eigenvalue(Z), cp.power(x, 3),
+                cp.quad_over_lin(x, s), cp.reshape(X, (9,), order='F'), cp.sigma_max(X),
+                cp.sign(x - 1), cp.sum_largest(x, 2), cp.tr_inv(X), cp.trace(X), X.T,
+                cp.upper_tri(X), cp.von_neumann_entr(X), cp.xexp(x), wraps.nonneg_wrap(x),
+                wraps.nonpos_wrap(-x), wraps.psd_wrap(X), wraps.symmetric_wrap(X),
+                wraps.hermitian_wrap(X), wraps.skew_symmetric_wrap(X - X.T)]
+        with self.assertWarns(DeprecationWarning):
+            exps.append(cp.conv(A[0], x))
+        for exp in exps:
+            torch_exp, vars_dict = exp.gen_torch_exp(strict=True)
+            res = torch_exp(*[torch.tensor(var.value) for var in vars_dict.vars_dict])
+            self.assertItemsAlmostEqual(res.numpy(), exp.value)
+
+        #The test covers every atom
+        covered = {atom for exp in exps for atom in exp.atoms()}
+        no_torch = {'Atom', 'AffAtom', 'AxisAtom', 'BinaryOperator', 'UnaryOperator',
+                    'Elementwise', 'Wrap', 'SuppFuncAtom', 'SymbolicQuadForm'}
+        for module in pkgutil.walk_packages(cvxpy.atoms.__path__, 'cvxpy.atoms.'):
+            module = import_module(module.name)
+            for name, cls in inspect.getmembers(module, inspect.isclass):
+                if issubclass(cls, Atom) and cls.__module__ == module.__name__ and \
+                        name not in no_torch:
+                    self.assertIn(cls, covered)
+
+        #Strict mode raises instead of falling back to NumPy
+        exp = x[0] + cp.suppfunc(z, [cp.norm(z) <= 1])(x[:2])
+        exp.gen_torch_exp()
+        with self.assertRaises(ValueError):
+            exp.gen_torch_exp(strict=True)
@@ -0,0 +1,99 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from unittest import mock
+
+import numpy as np
+
+import cvxpy as cp
+from cvxpy.tests.base_test import BaseTest
+from cvxpy.utilities.coeff_extractor import CoeffExtractor
+
+
+class TestAddConstraints(BaseTest):
+    def assert_same_solution(self, problem, solver) -> None:
+        problem.solve(solver=solver)
+        expected = cp.Problem(problem.objective, problem.constraints)
+        values = [var.value for var in problem.variables()]
+        duals = [con.dual_value for con in problem.constraints]
+        expected.solve(solver=solver)
+        self.assertAlmostEqual(problem.value, expected.value, places=4)
+        for value, var in zip(values, expected.variables()):
+            self.assertItemsAlmostEqual(value, var.value, places=3)
+        for dual, con in zip(duals, expected.constraints):
+            self.assertItemsAlmostEqual(dual, con.dual_value, places=3)
+
+    def test_cutting_planes(self) -> None:
+        np.random.seed(0)
+        x = cp.Variable(4)
+        t = cp.Variable(nonneg=True)
+        for solver in [cp.CLARABEL, cp.SCS, cp.OSQP]:
+            problem = cp.Problem(cp.Minimize(cp.sum_squares(x) - cp.sum(x) + t),
+                                 [cp.sum(x) <= 3, x >= -1])
+            problem = problem.add_constraints()
+            problem.solve(solver=solver)
+            for i in range(3):
+                cuts = [np.random.randn(4) @ x <= t + 1, x[i] == 0.1 * i]
+                if solver != cp.OSQP:
+                    cuts.append(cp.norm(x[:2]) <= 2)
+                problem = problem.add_constraints(*cuts)
+                self.assert_same_solution(problem, solver)
+
+    def test_new_variables_and_parameters(self) -> None:
+        x = cp.Variable(3)
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), [x >= 1])
+        problem = problem.add_constraints(x <= 5)
+        self.assert_same_solution(problem, cp.CLARABEL)
+        # Variables and parameters that appear in a cut move the columns of
+        # the existing constraints.
+        y = cp.Variable(2, nonneg=True)
+        gamma = cp.Parameter(value=2.0)
+        problem = problem.add_constraints(x[:2] + y >= gamma)
+        self.assert_same_solution(problem, cp.CLARABEL)
+        X = cp.Variable((2, 2), PSD=True)
+        problem = problem.add_constraints(X[0, 1] == x[0], cp.trace(X) <= 4)
+        self.assert_same_solution(problem, cp.CLARABEL)
+        gamma.value = 3.0
+        self.assert_same_solution(problem, cp.CLARABEL)
+
+    def test_only_new_constraints_are_stuffed(self) -> None:
+        x = cp.Variable(10)
+        problem = cp.Problem(cp.Minimize(cp.sum(x)),
+                             [x >= 0, cp.sum(x) == 5]).add_constraints()
+        problem.solve(solver=cp.CLARABEL)
+
+        stuffed_rows = []
+        affine = CoeffExtractor.affine
+
+        def record_affine(extractor, expr):
+            exprs = expr if isinstance(expr, list) else [expr]
+            stuffed_rows.append(sum(e.size for e in exprs))
+            return affine(extractor, expr)
+
+        with mock.patch.object(CoeffExtractor, 'affine', record_affine):
+            problem = problem.add_constraints(x[:2] <= 1)
+            problem.solve(solver=cp.CLARABEL)
+        # The objective, then the rows of the new constraint.
+        self.assertEqual(stuffed_rows, [1, 2])
+        self.assertAlmostEqual(problem.value, 5)
+
+    def test_repeated_constraint(self) -> None:
+        x = cp.Variable(2)
+        constraint = x >= 1
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), [constraint])
+        problem = problem.add_constraints(constraint)
+        problem.solve(solver=cp.CLARABEL)
+        problem = problem.add_constraints(constraint, x <= 3)
+        self.assert_same_solution(problem, cp.CLARABEL)
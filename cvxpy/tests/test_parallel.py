@@ -0,0 +1,62 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import numpy as np
+
+import cvxpy as cp
+from cvxpy.parallel import PROCESS_BACKEND, THREAD_BACKEND, solve_many
+from cvxpy.tests.base_test import BaseTest
+
+
+class TestSolveMany(BaseTest):
+    def test_problems(self) -> None:
+        for backend in [THREAD_BACKEND, PROCESS_BACKEND]:
+            for solver in [cp.CLARABEL, cp.OSQP]:
+                variables = [cp.Variable(2) for _ in range(4)]
+                problems = [cp.Problem(cp.Minimize(cp.sum_squares(x - i)), [x <= 1.5])
+                            for i, x in enumerate(variables)]
+                values = solve_many(problems, n_workers=2, backend=backend,
+                                    solver=solver)
+                self.assertItemsAlmostEqual(values, [0, 0, 0.5, 4.5], places=4)
+                for problem, x, expected in zip(problems, variables, [0, 1, 1.5, 1.5]):
+                    self.assertEqual(problem.status, cp.OPTIMAL)
+                    self.assertEqual(problem.solver_stats.solver_name, solver)
+                    self.assertItemsAlmostEqual(x.value, [expected] * 2, places=4)
+
+    def test_param_set(self) -> None:
+        np.random.seed(0)
+        A = cp.Parameter((3, 2))
+        b = cp.Parameter(3)
+        x = cp.Variable(2)
+        constr = x <= 1
+        problem = cp.Problem(cp.Minimize(cp.norm(A @ x - b, 1)), [constr])
+        param_values = {A: np.random.randn(6, 3, 2), b: np.random.randn(6, 3)}
+        expected = problem.solve_batch(param_values, solver=cp.CLARABEL)
+        for backend in [THREAD_BACKEND, PROCESS_BACKEND]:
+            results = solve_many((problem, param_values), n_workers=2,
+                                 backend=backend, solver=cp.CLARABEL)
+            for result, reference in zip(results, expected):
+                self.assertEqual(result.status, reference.status)
+                self.assertAlmostEqual(result.opt_value, reference.opt_value)
+                self.assertItemsAlmostEqual(result.primal_values[x.id],
+                                            reference.primal_values[x.id])
+                self.assertItemsAlmostEqual(result.dual_values[constr.id],
+                                            reference.dual_values[constr.id])
+        self.assertIsNone(x.value)
+
+    def test_unknown_backend(self) -> None:
+        x = cp.Variable()
+        with self.assertRaises(ValueError):
+            solve_many([cp.Problem(cp.Minimize(x), [x >= 0])], backend="mpi")
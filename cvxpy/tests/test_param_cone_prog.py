@@ -16,6 +16,7 @@ limitations under the License.
 import math
 
 import numpy as np
+import scipy.sparse as sp
 
 import cvxpy as cp
 from cvxpy.reductions.solvers.conic_solvers.scs_conif import SCS
@@ -134,3 +135,107 @@ class TestParamConeProg(BaseTest):
         assert np.all(param_cone_prog.lower_bounds == lower_bounds)
         param_upper_bound = np.reshape(param_cone_prog.upper_bounds, (3, 2), order="F")
         assert np.all(param_upper_bound == upper_bounds)
+
+    def test_apply_parameters_batch(self) -> None:
+        np.random.seed(0)
+        A = cp.Parameter((3, 2))
+        b = cp.Parameter(3)
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.norm(A @ x - b, 1)), [x >= b[:2]])
+        As = np.random.randn(3, 3, 2)
+        bs = np.random.randn(3, 3)
+        A.value, b.value = As[0], bs[0]
+        data, _, _ = problem.get_problem_data(solver=cp.SCS)
+        param_cone_prog = data[cp.settings.PARAM_PROB]
+        batch = param_cone_prog.apply_parameters_batch({A.id: As, b.id: bs}, 3)
+        for i, (c, d, A_mat, b_vec) in enumerate(batch):
+            A.value, b.value = As[i], bs[i]
+            c_ref, d_ref, A_ref, b_ref = param_cone_prog.apply_parameters()
+            self.assertItemsAlmostEqual(c, c_ref, places=10)
+            self.assertAlmostEqual(d, d_ref, places=10)
+            self.assertItemsAlmostEqual(A_mat.toarray(), A_ref.toarray(), places=10)
+            self.assertItemsAlmostEqual(b_vec, b_ref, places=10)
+
+    def test_apply_parameter_matrix_shares_structure(self) -> None:
+        np.random.seed(1)
+        P = cp.Parameter((2, 2))
+        q = cp.Parameter(2)
+        x = cp.Variable(2)
+        problem = cp.Problem(
+            cp.Minimize(cp.sum_squares(P @ x) + q @ x), [cp.norm(x, 2) <= q[0] + 2])
+        Ps = np.random.randn(4, 2, 2)
+        qs = np.random.randn(4, 2)
+        P.value, q.value = Ps[0], qs[0]
+        data, _, _ = problem.get_problem_data(solver=cp.CLARABEL)
+        param_cone_prog = data[cp.settings.PARAM_PROB]
+        batch = param_cone_prog.apply_parameters_batch(
+            {P.id: Ps, q.id: qs}, 4, quad_obj=True)
+        self.assertTrue(all(np.shares_memory(inst[3].indices, batch[0][3].indices)
+                            for inst in batch))
+        for i, instance in enumerate(batch):
+            P.value, q.value = Ps[i], qs[i]
+            reference = param_cone_prog.apply_parameters(quad_obj=True)
+            for value, expected in zip(instance, reference):
+                if hasattr(value, 'toarray'):
+                    value, expected = value.toarray(), expected.toarray()
+                self.assertItemsAlmostEqual(value, expected, places=10)
+
+
+    def test_apply_param_jac_batch(self) -> None:
+        np.random.seed(2)
+        A = cp.Parameter((3, 2))
+        b = cp.Parameter(3)
+        gamma = cp.Parameter(nonneg=True)
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.norm(A @ x - b, 1) + gamma * cp.sum(x)),
+                             [x >= b[:2], cp.norm(x) <= 3])
+        A.value, b.value, gamma.value = np.random.randn(3, 2), np.random.randn(3), 1.
+        data, _, _ = problem.get_problem_data(solver=cp.SCS)
+        param_cone_prog = data[cp.settings.PARAM_PROB]
+        m, n = data[cp.settings.A].shape
+        delcs = np.random.randn(4, n)
+        delbs = np.random.randn(4, m)
+        # The perturbations of A need not share its sparsity pattern.
+        delAs = [sp.random(m, n, density=0.5, random_state=i) for i in range(4)]
+        batch = param_cone_prog.apply_param_jac_batch(delcs, delAs, delbs)
+        for i in range(4):
+            reference = param_cone_prog.apply_param_jac(delcs[i], delAs[i], delbs[i])
+            for param in problem.parameters():
+                self.assertEqual(batch[param.id].shape, (4,) + param.shape)
+                self.assertItemsAlmostEqual(batch[param.id][i], reference[param.id],
+                                            places=10)
+
+    def test_apply_param_jac_quad_obj(self) -> None:
+        np.random.seed(3)
+        F = cp.Parameter((3, 2))
+        q = cp.Parameter(2)
+        b = cp.Parameter(2)
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.sum_squares(F @ x) + q @ x), [x >= b])
+        F.value, q.value, b.value = (np.random.randn(3, 2), np.random.randn(2),
+                                     np.random.randn(2))
+        for solver in [cp.CLARABEL, cp.OSQP]:
+            data, _, _ = problem.get_problem_data(solver=solver)
+            param_prog = data[cp.settings.PARAM_PROB]
+            n = param_prog.x.size
+            m = param_prog.A.shape[0] // (n + 1)
+            delP = sp.random(n, n, density=0.7, random_state=0)
+            delA = sp.random(m, n, density=0.7, random_state=1)
+            delq, delb = np.random.randn(n), np.random.randn(m)
+            # The Jacobian of the full tensors, which stack the problem data
+            # in column-major order.
+            delAb = np.concatenate([delA.toarray().flatten(order='F'), delb])
+            expected = param_prog.P.T @ delP.toarray().flatten(order='F') + \
+                param_prog.A.T @ delAb
+            if solver == cp.CLARABEL:
+                expected += param_prog.c[:-1].T @ delq
+                jac = param_prog.apply_param_jac(delq, delA, delb, delP=delP)
+            else:
+                expected += param_prog.q[:-1].T @ delq
+                jac = param_prog.apply_param_jac(delP, delq, delA, delb)
+            for param in problem.parameters():
+                col = param_prog.param_id_to_col[param.id]
+                self.assertItemsAlmostEqual(
+                    jac[param.id],
+                    np.reshape(expected[col:col + param.size], param.shape, order='F'),
+                    places=10)
@@ -16,6 +16,7 @@ limitations under the License.
 import unittest
 
 import numpy as np
+import scipy.sparse as sp
 
 import cvxpy as cp
 from cvxpy.reductions.solvers.defines import INSTALLED_SOLVERS, QP_SOLVERS
@@ -36,6 +37,43 @@ class TestParamQuadProg(BaseTest):
     def assertAlmostEqual(self, a, b, places: int = 2) -> None:
         super(TestParamQuadProg, self).assertAlmostEqual(a, b, places=places)
 
+    def test_apply_parameters_batch(self) -> None:
+        np.random.seed(0)
+        A = cp.Parameter((3, 2))
+        b = cp.Parameter(3)
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.sum_squares(A @ x - b)),
+                             [x >= b[:2], cp.sum(x) == 1])
+        As = np.random.randn(3, 3, 2)
+        bs = np.random.randn(3, 3)
+        A.value, b.value = As[0], bs[0]
+        data, _, _ = problem.get_problem_data(solver=cp.OSQP)
+        param_quad_prog = data[cp.settings.PARAM_PROB]
+        batch = param_quad_prog.apply_parameters_batch({A.id: As, b.id: bs}, 3)
+        for i, instance in enumerate(batch):
+            A.value, b.value = As[i], bs[i]
+            reference = param_quad_prog.apply_parameters()
+            for value, expected in zip(instance, reference):
+                if hasattr(value, 'toarray'):
+                    value, expected = value.toarray(), expected.toarray()
+                self.assertItemsAlmostEqual(value, expected, places=10)
+
+    def test_apply_param_jac_linear_objective(self) -> None:
+        # The tensor of P has no entries, so perturbations of P are ignored.
+        b = cp.Parameter(2, value=np.ones(2))
+        x = cp.Variable(2)
+        problem = cp.Problem(cp.Minimize(cp.sum(x)), [x >= b])
+        data, _, _ = problem.get_problem_data(solver=cp.OSQP)
+        param_quad_prog = data[cp.settings.PARAM_PROB]
+        n_rows = data['n_eq'] + data['n_ineq']
+        delq, delA = np.ones(2), sp.csc_matrix((n_rows, 2))
+        delb = np.arange(1., n_rows + 1)
+        reference = param_quad_prog.apply_param_jac(
+            sp.csc_matrix((2, 2)), delq, delA, delb)
+        delta = param_quad_prog.apply_param_jac(
+            sp.eye(2, format='csc'), delq, delA, delb)
+        self.assertItemsAlmostEqual(delta[b.id], reference[b.id], places=10)
+
     def test_param_data(self) -> None:
         for solver in self.solvers:
             np.random.seed(0)
@@ -0,0 +1,401 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import sys
+import types
+from unittest import mock
+
+import numpy as np
+import scipy.sparse as sp
+
+import cvxpy as cp
+import cvxpy.settings as s
+from cvxpy.reductions.solvers import utilities
+from cvxpy.reductions.solvers.conic_solvers.clarabel_conif import CLARABEL
+from cvxpy.reductions.solvers.conic_solvers.conic_solver import ConicSolver
+from cvxpy.reductions.solvers.conic_solvers.gurobi_conif import (
+    GUROBI as GUROBI_CONIC,
+)
+from cvxpy.reductions.solvers.conic_solvers.mosek_conif import MOSEK
+from cvxpy.reductions.solvers.qp_solvers.copt_qpif import COPT
+from cvxpy.reductions.solvers.qp_solvers.cplex_qpif import CPLEX
+from cvxpy.reductions.solvers.qp_solvers.gurobi_qpif import GUROBI
+from cvxpy.reductions.solvers.qp_solvers.xpress_qpif import XPRESS
+from cvxpy.tests.base_test import BaseTest
+
+
+class FakeVar:
+    def __init__(self, index) -> None:
+        self.index = index
+        self.Obj = 0.0
+        self.X = 0.0
+        self.start = None
+
+
+class FakeConstr:
+    def __init__(self, coeffs, sense, rhs) -> None:
+        self.coeffs = coeffs
+        self.sense = sense
+        self.RHS = rhs
+        self.Pi = 0.0
+
+
+class FakeModel:
+    """An in-memory stand-in for a gurobipy model, which records the calls
+    that modify a built model.
+    """
+    instances = 0
+
+    def __init__(self, env=None) -> None:
+        FakeModel.instances += 1
+        self.vars = []
+        self.constrs = []
+        self.quad = {}
+        self.calls = []
+        self.Status = 1
+        self.solCount = self.SolCount = 0
+        self.ObjVal = self.objVal = 0.0
+        self.Runtime = 0.0
+        self.params = {}
+
+    def setParam(self, key, value) -> None:
+        self.params[key] = value
+
+    def resetParams(self) -> None:
+        self.calls.append(('resetParams',))
+        self.params = {}
+
+    def write(self, filename) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+
+    def addVars(self, n, ub, lb, vtype):
+        new_vars = [FakeVar(len(self.vars) + i) for i in range(n)]
+        self.vars += new_vars
+        return dict(enumerate(new_vars))
+
+    def addVar(self, obj, name, vtype, lb, ub):
+        var = FakeVar(len(self.vars))
+        var.Obj = obj
+        self.vars.append(var)
+        return var
+
+    def getVars(self):
+        return list(self.vars)
+
+    def getQConstrs(self):
+        return []
+
+    def getConstrs(self):
+        return list(self.constrs)
+
+    def addMConstr(self, A, x, sense, rhs):
+        A = sp.csr_matrix(A)
+        new_constrs = []
+        for i in range(A.shape[0]):
+            start, end = A.indptr[i], A.indptr[i + 1]
+            new_constrs.append(FakeConstr(
+                dict(zip(A.indices[start:end], A.data[start:end])), sense, rhs[i]))
+        self.constrs += new_constrs
+        return np.array(new_constrs, dtype=object)
+
+    def setMObjective(self, Q, c, constant) -> None:
+        self.calls.append(('setMObjective',))
+        Q = sp.coo_matrix(Q)
+        self.quad = {}
+        for i, j, v in zip(Q.row, Q.col, Q.data):
+            self.quad[i, j] = self.quad.get((i, j), 0) + v
+        for var, obj in zip(self.vars, c):
+            var.Obj = obj
+
+    def setAttr(self, name, objs, values) -> None:
+        self.calls.append(('setAttr', name, [obj.index if isinstance(obj, FakeVar)
+                                             else self.constrs.index(obj)
+                                             for obj in objs], list(values)))
+        for obj, value in zip(objs, values):
+            setattr(obj, 'start' if name == 'Start' else name, value)
+
+    def getAttr(self, name, objs):
+        return [getattr(obj, name) for obj in objs]
+
+    def chgCoeff(self, constr, var, value) -> None:
+        self.calls.append(('chgCoeff', self.constrs.index(constr), var.index, value))
+        constr.coeffs[var.index] = value
+
+    def optimize(self) -> None:
+        self.Status = 2
+        self.solCount = self.SolCount = 1
+
+    def state(self):
+        """Returns the objective and the constraints, without zeros."""
+        def nonzero(coeffs):
+            return {key: value for key, value in coeffs.items() if value != 0}
+        return (nonzero({var.index: var.Obj for var in self.vars}),
+                nonzero(self.quad),
+                [(nonzero(con.coeffs), con.sense, con.RHS)
+                 for con in self.constrs])
+
+
+class FakeAPI:
+    """Stands in for a module or an object of a solver API.
+
+    Calls of its methods, including those of its attributes such as
+    model.objective.set_linear, are recorded in calls as (path, args), and
+    attribute assignments as (path, value). The paths in values return the
+    given objects instead; the same path always gives the same object.
+    """
+
+    def __init__(self, values=None, calls=None, prefix='') -> None:
+        self.__dict__.update(_values={} if values is None else values,
+                             calls=[] if calls is None else calls,
+                             _prefix=prefix, _children={})
+
+    def __getattr__(self, name):
+        path = self._prefix + name
+        if path in self._values:
+            return self._values[path]
+        if name not in self._children:
+            self._children[name] = FakeAPI(self._values, self.calls, path + '.')
+        return self._children[name]
+
+    def __setattr__(self, name, value) -> None:
+        self.calls.append((self._prefix + name, value))
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.calls.append((self._prefix[:-1], args))
+
+    def called(self, path) -> list:
+        """Returns the arguments of the calls of path."""
+        return [call[1] for call in self.calls
+                if call[0] == path and isinstance(call[1], tuple)]
+
+
+def _fake_gurobipy():
+    module = types.ModuleType('gurobipy')
+    module.Model = FakeModel
+    module.GRB = types.SimpleNamespace(
+        INFINITY=1e100, UNDEFINED=1e101, EQUAL='=', LESS_EQUAL='<',
+        BINARY='B', INTEGER='I', CONTINUOUS='C')
+    return module
+
+
+class TestPersistentModels(BaseTest):
+
+    def setUp(self) -> None:
+        x = cp.Variable(3)
+        self.a = cp.Parameter(3, value=np.array([1.0, 2.0, 3.0]))
+        self.b = cp.Parameter(value=1.0)
+        self.gamma = cp.Parameter(nonneg=True, value=1.0)
+        self.problem = cp.Problem(
+            cp.Minimize(self.gamma * cp.sum_squares(x) + x[0]),
+            [self.a @ x <= self.b, x >= -1, cp.sum(x) == 1])
+
+    def test_parameter_entries(self) -> None:
+        data, _, _ = self.problem.get_problem_data(cp.CLARABEL)
+        entries = CLARABEL.parameter_entries(data)
+        values = utilities.parameter_values(data, entries)
+        # Only the row of a @ x <= b depends on the parameters.
+        rows, cols = entries[s.A]
+        self.assertEqual(sorted(rows), [1, 1, 1])
+        self.assertEqual(sorted(cols), [0, 1, 2])
+        self.assertEqual(sorted(entries[s.B]), [1])
+
+        self.a.value = np.array([1.0, 5.0, 3.0])
+        self.b.value = 2.0
+        new_data, _, _ = self.problem.get_problem_data(cp.CLARABEL)
+        changes = utilities.changed_entries(
+            entries, utilities.parameter_values(new_data, entries), values)
+        self.assertEqual(set(changes), {s.A, s.B})
+        rows, cols, vals = changes[s.A]
+        self.assertEqual(sorted(rows), [1])
+        self.assertEqual(sorted(cols), [1])
+        self.assertItemsAlmostEqual(vals, [5.0])
+        idx, vals = changes[s.B]
+        self.assertEqual(sorted(idx), [1])
+        self.assertItemsAlmostEqual(vals, [2.0])
+
+    def test_gurobi_updates(self) -> None:
+        """A Gurobi model is updated in place with the changed entries."""
+        param_prog = self.problem.get_problem_data(cp.OSQP)[0][s.PARAM_PROB]
+        solver = GUROBI()
+        cache = {}
+        with mock.patch.dict(sys.modules, {'gurobipy': _fake_gurobipy()}):
+            def solve(warm_start=True, cache=cache):
+                data, _ = solver.apply(param_prog)
+                solver.solve_via_data(data, warm_start, False, {}, cache)
+                return cache[s.GUROBI][0]
+
+            instances = FakeModel.instances
+            model = solve()
+            model.calls = []
+            self.b.value = 2.0
+            self.assertIs(solve(), model)
+            self.assertEqual(model.calls, [('setAttr', 'Start', [0, 1, 2], [0.0] * 3),
+                                           ('setAttr', 'RHS', [1], [2.0]),
+                                           ('resetParams',)])
+
+            model.calls = []
+            self.a.value = np.array([1.0, 4.0, 3.0])
+            self.gamma.value = 2.0
+            solve()
+            self.assertEqual(model.calls[1:],
+                             [('setMObjective',), ('chgCoeff', 1, 1, 4.0),
+                              ('resetParams',)])
+            self.assertEqual(FakeModel.instances, instances + 1)
+
+            # The model matches a model built from scratch.
+            expected = solve(warm_start=False, cache={})
+            self.assertEqual(model.state(), expected.state())
+
+    def _linear_program(self):
+        x = cp.Variable(3)
+        return cp.Problem(cp.Minimize(self.gamma * cp.sum(x) + x[0]),
+                          [self.a @ x <= self.b, x >= -1, cp.sum(x) == 1])
+
+    def test_gurobi_parameters(self) -> None:
+        """A reused Gurobi model drops the parameters of earlier solves."""
+        param_prog = self.problem.get_problem_data(cp.OSQP)[0][s.PARAM_PROB]
+        solver = GUROBI()
+        cache = {}
+        with mock.patch.dict(sys.modules, {'gurobipy': _fake_gurobipy()}):
+            data, _ = solver.apply(param_prog)
+            solver.solve_via_data(data, True, False, {'Method': 2}, cache)
+            model = cache[s.GUROBI][0]
+            data, _ = solver.apply(param_prog)
+            solver.solve_via_data(data, True, False, {}, cache)
+        self.assertIs(cache[s.GUROBI][0], model)
+        self.assertIn(('resetParams',), model.calls)
+        self.assertNotIn('Method', model.params)
+        self.assertEqual(model.params['QCPDual'], True)
+
+    def test_gurobi_conic_updates(self) -> None:
+        problem = self._linear_program()
+        param_prog = problem.get_problem_data(cp.CLARABEL)[0][s.PARAM_PROB]
+        solver = GUROBI_CONIC()
+        cache = {}
+        with mock.patch.dict(sys.modules, {'gurobipy': _fake_gurobipy()}):
+            def solve(solver_opts, warm_start=True, cache=cache):
+                data, _ = solver.apply(param_prog)
+                solver.solve_via_data(data, warm_start, False, solver_opts, cache)
+                return cache[s.GUROBI][0]
+
+            model = solve({'Method': 2})
+            model.calls = []
+            self.b.value = 2.0
+            self.gamma.value = 3.0
+            self.assertIs(solve({}), model)
+            self.assertEqual(model.calls[0], ('resetParams',))
+            self.assertNotIn('Method', model.params)
+            self.assertIn(('setAttr', 'RHS', [1], [2.0]), model.calls)
+            self.assertIn(('setAttr', 'Obj', [0, 1, 2], [4.0, 3.0, 3.0]),
+                          model.calls)
+            expected = solve({}, warm_start=False, cache={})
+            self.assertEqual(model.state(), expected.state())
+
+    @staticmethod
+    def _fake_module(constructor, values, model_values):
+        """Returns a fake solver module whose constructor creates fake models
+        with model_values, and the list of the created models.
+        """
+        models = []
+
+        def new_model(*args, **kwargs):
+            models.append(FakeAPI(model_values))
+            return models[-1]
+        return FakeAPI({constructor: new_model, **values}), models
+
+    def _solve_twice(self, solver, module_name, module, problem=None):
+        """Solves the problem, changes b and solves it again; returns the
+        outputs of the solves.
+        """
+        problem = self.problem if problem is None else problem
+        chain_solver = cp.CLARABEL if isinstance(solver, ConicSolver) else cp.OSQP
+        param_prog = problem.get_problem_data(chain_solver)[0][s.PARAM_PROB]
+        cache = {}
+        outputs = []
+        with mock.patch.dict(sys.modules, {module_name: module}):
+            for value in [1.0, 2.0]:
+                self.b.value = value
+                data, inv_data = solver.apply(param_prog)
+                outputs.append(
+                    (solver.solve_via_data(data, True, False, {}, cache), inv_data))
+        return outputs, cache
+
+    def test_cplex_updates(self) -> None:
+        module, models = self._fake_module(
+            'Cplex', {'infinity': 1e20},
+            {'get_time': lambda: 0.0,
+             'variables.add': lambda obj, lb, ub: range(len(obj))})
+        self._solve_twice(CPLEX(), 'cplex', module)
+        model, = models
+        self.assertEqual(model.called('parameters.reset'), [()])
+        self.assertEqual(model.called('linear_constraints.set_rhs'), [([(1, 2.0)],)])
+
+    def test_xpress_updates(self) -> None:
+        module, models = self._fake_module(
+            'problem', {'infinity': 1e20, 'SolverError': RuntimeError},
+            {'getProbStatus': lambda: module.lp_optimal,
+             'getProbStatusString': lambda: 'lp_optimal'})
+        self._solve_twice(XPRESS(), 'xpress', module)
+        model, = models
+        self.assertEqual(model.called('setDefaults'), [()])
+        self.assertEqual(model.called('chgrhs'), [([1], [2.0])])
+
+    def test_copt_updates(self) -> None:
+        env, models = self._fake_module(
+            'createModel', {},
+            {'status': 1, 'hasmipsol': False, 'haslpsol': False,
+             'solvingtime': 0.0, 'barrieriter': 0, 'simplexiter': 0,
+             'getVars': lambda: ['x%d' % i for i in range(3)],
+             'getConstrs': lambda: ['c%d' % i for i in range(5)]})
+        module = FakeAPI({'EnvrConfig': FakeAPI, 'Envr': lambda config: env,
+                          'COPT.INFINITY': 1e30})
+        self._solve_twice(COPT(), 'coptpy', module)
+        model, = models
+        self.assertEqual(model.called('resetParam'), [()])
+        self.assertEqual(model.called('setInfo'),
+                         [(module.COPT.Info.UB, ['c1'], [2.0])])
+
+    def test_mosek_updates(self) -> None:
+        """A MOSEK task is updated in place and stays alive between solves."""
+        module, models = self._fake_module(
+            'Task', {},
+            {'optimize': lambda: None, 'getnumintvar': lambda: 0,
+             'getnumcone': lambda: 0, 'getnumcon': lambda: 4,
+             'getintparam': lambda param: None, 'getprosta': lambda sol: None,
+             'getsolsta': lambda sol: module.solsta.optimal,
+             'getobjsense': lambda: module.objsense.maximize,
+             'getprimalobj': lambda sol: 0.0, 'getdouinf': lambda item: 0.0,
+             'getintinf': lambda item: 0, 'getlintinf': lambda item: 0})
+        solver = MOSEK()
+        outputs, cache = self._solve_twice(
+            solver, 'mosek', module, self._linear_program())
+        task, = models
+        self.assertIs(cache[s.MOSEK][0], task)
+        self.assertEqual(task.called('setdefaults'), [()])
+        self.assertEqual(len(task.called('putclist')), 2)
+        with mock.patch.dict(sys.modules, {'mosek': module}):
+            for output, inv_data in outputs:
+                solver.invert(output, inv_data)
+        self.assertEqual(task.called('__exit__'), [])
+
+        # A task that is replaced after a cache miss is disposed of.
+        with mock.patch.dict(sys.modules, {'mosek': module}):
+            data, _ = solver.apply(cache[s.MOSEK][1][s.PARAM_PROB])
+            solver.solve_via_data(data, False, False, {}, cache)
+        self.assertEqual(len(models), 2)
+        self.assertEqual(task.called('__exit__'), [(None, None, None)])
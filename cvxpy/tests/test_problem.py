@@ -15,11 +15,15 @@ limitations under the License.
 """
 
 import builtins
+import os
 import pickle
+import shutil
 import sys
+import tempfile
 import warnings
 from fractions import Fraction
 from io import StringIO
+from unittest import mock
 
 import ecos
 import numpy
@@ -38,6 +42,10 @@ from cvxpy.error import DCPError, ParameterError, SolverError
 from cvxpy.expressions.constants import Constant, Parameter
 from cvxpy.expressions.variable import Variable
 from cvxpy.problems.problem import Problem
+from cvxpy.reductions.compilation_cache import (
+    DiskCompilationCache,
+    set_compilation_cache,
+)
 from cvxpy.reductions.solvers.conic_solvers import ecos_conif, scs_conif
 from cvxpy.reductions.solvers.conic_solvers.conic_solver import ConicSolver
 from cvxpy.reductions.solvers.defines import (
@@ -45,7 +53,13 @@ from cvxpy.reductions.solvers.defines import (
     SOLVER_MAP_CONIC,
 )
 from cvxpy.reductions.solvers.solving_chain import ECOS_DEPRECATION_MSG
+from cvxpy.reductions.warm_start_store import (
+    WarmStartStore,
+    get_warm_start_store,
+    set_warm_start_store,
+)
 from cvxpy.tests.base_test import BaseTest
+from cvxpy.utilities import traversal
 
 
 class TestProblem(BaseTest):
@@ -2198,3 +2212,84 @@ class TestProblem(BaseTest):
             with warnings.catch_warnings(record=True) as w:
                 prob.solve(solver=cp.ECOS)
                 assert len(w) == 0
+
+    _CANON_BACKENDS = [cp.CPP_CANON_BACKEND, cp.SCIPY_CANON_BACKEND,
+                       cp.COO_CANON_BACKEND]
+
+    @staticmethod
+    def _deep_expression(x):
+        """Returns a scalar expression deeper than the recursion limit."""
+        expr = 0
+        for i in range(2 * sys.getrecursionlimit()):
+            expr = 0.5 * (expr + x[i % 3]) - 1
+        return expr
+
+    def test_deep_expression(self) -> None:
+        """Expressions deeper than the recursion limit can be analyzed,
+        evaluated and solved.
+        """
+        x = cp.Variable(3)
+        expr = self._deep_expression(x)
+        prob = cp.Problem(cp.Minimize(cp.abs(expr)), [x >= -10, x <= 10])
+        self.assertTrue(prob.is_dcp())
+        self.assertEqual(prob.variables(), [x])
+        for canon_backend in self._CANON_BACKENDS:
+            with self.subTest(canon_backend=canon_backend):
+                prob.solve(solver=cp.CLARABEL, canon_backend=canon_backend)
+                self.assertEqual(prob.status, cp.OPTIMAL)
+                self.assertAlmostEqual(prob.value, 0, places=4)
+                self.assertAlmostEqual(expr.value, 0, places=4)
+
+        # Quadratic objectives are compiled for QP solvers. The expression
+        # is affine, c + a @ x, so the optimal value is c**2 / (1 + a @ a).
+        x.value = np.zeros(3)
+        c = expr.value
+        a = np.zeros(3)
+        for i in range(3):
+            x.value = np.eye(3)[i]
+            a[i] = expr.value - c
+        prob = cp.Problem(cp.Minimize(cp.square(expr) + cp.sum_squares(x)))
+        for solver in [cp.OSQP, cp.CLARABEL]:
+            for canon_backend in self._CANON_BACKENDS:
+                with self.subTest(solver=solver, canon_backend=canon_backend):
+                    prob.solve(solver=solver, canon_backend=canon_backend)
+                    self.assertEqual(prob.status, cp.OPTIMAL)
+                    self.assertAlmostEqual(prob.value, c**2 / (1 + a @ a),
+                                           places=3)
+
+    def test_wide_expression(self) -> None:
+        """Wide expressions are analyzed without a traversal per node.
+        """
+        x = cp.Variable(10)
+        expr = sum(x[i % 10] * (i + 1) for i in range(1000))
+        prob = cp.Problem(cp.Minimize(cp.abs(expr)), [x >= -1])
+        with mock.patch.object(traversal, 'post_order',
+                               wraps=traversal.post_order) as post_order:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                prob.get_problem_data(cp.CLARABEL,
+                                      canon_backend=cp.CPP_CANON_BACKEND)
+        self.assertLess(post_order.call_count, 100)
+
+    def test_deep_expression_caches(self) -> None:
+        """Deep problems are fingerprinted for the compilation cache and the
+        warm-start store.
+        """
+        x = cp.Variable(3)
+        for canon_backend in self._CANON_BACKENDS:
+            prob = cp.Problem(cp.Minimize(cp.abs(self._deep_expression(x))),
+                              [x >= -10, x <= 10])
+            cache_dir = tempfile.mkdtemp()
+            set_compilation_cache(DiskCompilationCache(cache_dir))
+            set_warm_start_store(WarmStartStore())
+            try:
+                with self.subTest(canon_backend=canon_backend):
+                    prob.solve(solver=cp.CLARABEL, canon_backend=canon_backend)
+                    self.assertEqual(prob.status, cp.OPTIMAL)
+                    self.assertAlmostEqual(prob.value, 0, places=4)
+                    self.assertEqual(len(get_warm_start_store()), 1)
+                    self.assertTrue(os.listdir(cache_dir))
+            finally:
+                set_compilation_cache(None)
+                set_warm_start_store(None)
+                shutil.rmtree(cache_dir)
@@ -0,0 +1,80 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import threading
+
+import cvxpy as cp
+from cvxpy.tests.base_test import BaseTest
+from cvxpy.utilities import profiling
+
+
+def _problem():
+    x = cp.Variable(3)
+    return cp.Problem(cp.Minimize(cp.norm(x - 1) + cp.sum(cp.abs(x))),
+                      [cp.sum(x) == 1])
+
+
+class TestProfiling(BaseTest):
+    def test_report(self) -> None:
+        problem = _problem()
+        with cp.profiling() as profile:
+            problem.solve(solver=cp.CLARABEL)
+            problem.solve(solver=cp.CLARABEL)
+        compilation = profile.root.children['compilation']
+        self.assertEqual(compilation.calls, 2)
+        # The second solve bypasses the reductions.
+        self.assertEqual(compilation.children['Dcp2Cone'].calls, 1)
+        canonicalizers = compilation.children['Dcp2Cone'].children
+        self.assertEqual(set(canonicalizers), {'Pnorm', 'abs'})
+        stuffing = compilation.children['ConeMatrixStuffing']
+        self.assertIn('build_matrix[CPP]', stuffing.children)
+        solver = compilation.children['CLARABEL']
+        self.assertEqual(solver.calls, 2)
+        self.assertEqual(solver.children['format_constraints'].calls, 1)
+        self.assertIn('solve_via_data', profile.root.children)
+        self.assertGreaterEqual(compilation.time,
+                                sum(child.time for child
+                                    in compilation.children.values()))
+        self.assertIsNone(compilation.memory)
+
+        data = json.loads(profile.to_json())
+        self.assertEqual(data['children'][0]['name'], 'compilation')
+        for line in profile.to_folded().splitlines():
+            path, self_time = line.rsplit(' ', 1)
+            self.assertTrue(path.startswith(('compilation', 'solve_via_data',
+                                             'unpack_results')))
+            self.assertGreater(int(self_time), 0)
+        self.assertIn('compilation;Dcp2Cone;Pnorm', profile.to_folded())
+
+    def test_memory(self) -> None:
+        with cp.profiling(memory=True) as profile:
+            _problem().solve(solver=cp.CLARABEL)
+        self.assertIsInstance(profile.root.children['compilation'].memory, int)
+
+    def test_inactive(self) -> None:
+        with cp.profiling() as profile:
+            pass
+        _problem().solve(solver=cp.CLARABEL)
+        self.assertEqual(profile.root.children, {})
+        self.assertIsNone(profiling._profile)
+
+        # Other threads are not profiled.
+        with cp.profiling() as profile:
+            thread = threading.Thread(
+                target=lambda: _problem().solve(solver=cp.CLARABEL))
+            thread.start()
+            thread.join()
+        self.assertEqual(profile.root.children, {})
@@ -10,10 +10,12 @@ import scipy.sparse as sp
 import cvxpy.settings as s
 from cvxpy.lin_ops.canon_backend import (
     CanonBackend,
+    COOCanonBackend,
     NumPyCanonBackend,
     PythonCanonBackend,
     SciPyCanonBackend,
     TensorRepresentation,
+    _sum_duplicates,
 )
 
 
@@ -61,7 +63,7 @@ class TestBackendInstance:
             CanonBackend.get_backend("notabackend")
 
 
-backends = [s.SCIPY_CANON_BACKEND, s.NUMPY_CANON_BACKEND]
+backends = [s.SCIPY_CANON_BACKEND, s.NUMPY_CANON_BACKEND, s.COO_CANON_BACKEND]
 
 
 class TestBackends:
@@ -1079,11 +1081,19 @@ class TestBackends:
     def test_tensor_view_combine_potentially_none(self, backend):
         view = backend.get_empty_view()
         assert view.combine_potentially_none(None, None) is None
-        a = {"a": [1]}
-        b = {"b": [2]}
+        if isinstance(backend, COOCanonBackend):
+            a = TensorRepresentation(np.array([1]), np.array([0]), np.array([0]),
+                                     np.array([0]), shape=(1, 1))
+            b = TensorRepresentation(np.array([2]), np.array([0]), np.array([0]),
+                                     np.array([1]), shape=(1, 1))
+            expected = a + b
+        else:
+            a = {"a": [1]}
+            b = {"b": [2]}
+            expected = view.add_dicts(a, b)
         assert view.combine_potentially_none(a, None) == a
         assert view.combine_potentially_none(None, a) == a
-        assert view.combine_potentially_none(a, b) == view.add_dicts(a, b)
+        assert view.combine_potentially_none(a, b) == expected
 
 
 class TestParametrizedBackends:
@@ -1951,3 +1961,77 @@ class TestSciPyBackend:
         transposed = scipy_backend._transpose_stacked(stacked, param_id)
         expected = sp.vstack([m.T for m in matrices])
         assert (expected != transposed).nnz == 0
+
+
+class TestCOOBackend:
+    @staticmethod
+    @pytest.fixture()
+    def coo_backend():
+        kwargs = {
+            "id_to_col": {1: 0},
+            "param_to_size": {-1: 1, 2: 2},
+            "param_to_col": {2: 0, -1: 2},
+            "param_size_plus_one": 3,
+            "var_length": 2,
+        }
+        backend = CanonBackend.get_backend(s.COO_CANON_BACKEND, **kwargs)
+        assert isinstance(backend, COOCanonBackend)
+        return backend
+
+    def test_get_variable_tensor(self, coo_backend):
+        tensor = coo_backend.get_variable_tensor((2,), 1)
+        assert tensor.shape == (2, 3)
+        assert np.all(tensor.row == [0, 1])
+        assert np.all(tensor.col == [0, 1])
+        assert np.all(tensor.parameter_offset == 2), "Should only be in the constant slice."
+
+    def test_get_param_tensor(self, coo_backend):
+        tensor = coo_backend.get_param_tensor((2,), 2)
+        assert np.all(tensor.row == [0, 1])
+        assert np.all(tensor.col == 2), "Should only be in the constant column."
+        assert np.all(tensor.parameter_offset == [0, 1])
+
+    @pytest.mark.parametrize("data", [np.array([[1, 0], [3, 4]]), sp.eye(2) * 4])
+    def test_get_data_tensor(self, data, coo_backend):
+        tensor = coo_backend.get_data_tensor(data)
+        expected = sp.coo_matrix(data).reshape((-1, 1), order="F")
+        actual = sp.coo_matrix((tensor.data, (tensor.row, tensor.col - 2)), shape=(4, 1))
+        assert (actual != expected).nnz == 0
+        assert len(tensor.data) == expected.nnz, "Zeros should not be stored."
+        assert np.all(tensor.parameter_offset == 2)
+
+    def test_sum_duplicates(self, coo_backend):
+        tensor = TensorRepresentation(np.array([1., 2., 3., 4.]), np.array([1, 0, 1, 1]),
+                                      np.array([0, 1, 0, 0]), np.array([0, 0, 0, 1]),
+                                      shape=(2, 2))
+        summed = _sum_duplicates(tensor)
+        assert len(summed.data) == 3
+        assert np.all(summed.flatten_tensor(2).toarray()
+                      == tensor.flatten_tensor(2).toarray())
+
+    @staticmethod
+    def test_matches_scipy_backend():
+        import cvxpy as cp
+        from cvxpy.reductions.dcp2cone.cone_matrix_stuffing import ConeMatrixStuffing
+
+        np.random.seed(0)
+        X = cp.Variable((3, 3))
+        x = cp.Variable(3)
+        P = cp.Parameter((2, 3), value=np.random.randn(2, 3))
+        p = cp.Parameter(3, value=np.random.randn(3))
+        M = np.random.randn(3, 3)
+        constraints = [
+            P @ X @ M >= 1,
+            M @ X.T @ p == x,
+            cp.multiply(p, x) + cp.trace(X) <= cp.sum(X[1:, ::2]),
+            cp.kron(np.eye(2), X[:2, :2]) <= 3,
+            cp.kron(X[:, :1], np.ones((2, 1))) <= 2,
+            cp.convolve(np.arange(1., 4.), x) >= -1,
+            cp.diag(x) + cp.diag(cp.diag(X)) + cp.sum(cp.upper_tri(X)) <= 4,
+            cp.vstack([x, X[0]]) / 2 == cp.hstack([X[:, 1:], X[:, :1]])[:2],
+        ]
+        problem = cp.Problem(cp.Minimize(cp.sum(X) + p @ x), constraints)
+        expected, _ = ConeMatrixStuffing(canon_backend=s.SCIPY_CANON_BACKEND).apply(problem)
+        actual, _ = ConeMatrixStuffing(canon_backend=s.COO_CANON_BACKEND).apply(problem)
+        assert np.allclose((actual.A - expected.A).toarray(), 0)
+        assert np.allclose((actual.c - expected.c).toarray(), 0)
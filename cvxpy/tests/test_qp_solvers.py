@@ -458,6 +458,64 @@ class TestQp(BaseTest):
         result2 = prob.solve(solver="OSQP", warm_start=False)
         self.assertAlmostEqual(result, result2)
 
+    def test_warm_start_updates(self) -> None:
+        """Test that a warm started OSQP solver only receives the data
+        that depends on the parameters.
+        """
+        np.random.seed(0)
+        n, T = 3, 10
+        A = np.eye(n) + 0.1 * np.random.randn(n, n)
+        B = np.random.randn(n, 2)
+        x = Variable((n, T + 1))
+        u = Variable((2, T))
+        x0 = Parameter(n)
+        gamma = Parameter(nonneg=True, value=1.0)
+        prob = Problem(Minimize(sum_squares(x) + gamma * sum_squares(u)),
+                       [x[:, 0] == x0, x[:, 1:] == A @ x[:, :-1] + B @ u,
+                        cp.abs(u) <= 1])
+        x0.value = np.random.randn(n)
+        prob.solve(solver=cp.OSQP)
+        solver = prob._solver_cache[cp.OSQP][0]
+
+        updates = []
+        update = solver.update
+
+        def record_update(**kwargs):
+            updates.append(sorted(kwargs))
+            return update(**kwargs)
+        solver.update = record_update
+        for gamma_value in [1.0, 2.0]:
+            x0.value = np.random.randn(n)
+            gamma.value = gamma_value
+            prob.solve(solver=cp.OSQP, eps_abs=1e-8, eps_rel=1e-8)
+            expected = Problem(prob.objective, prob.constraints)
+            expected.solve(solver=cp.CLARABEL)
+            self.assertAlmostEqual(prob.value, expected.value, places=4)
+        # A only depends on constants, and P is only pushed once it changes.
+        self.assertEqual(updates, [['l', 'u'], ['Px', 'l', 'u']])
+
+    def test_warm_start_data(self) -> None:
+        """Test that a warm started OSQP solver receives the data passed
+        to solve_via_data, even if it was not built for this solve.
+        """
+        x = Variable(2)
+        lower = Parameter(2, value=-5 * np.ones(2))
+        prob = Problem(Minimize(sum_squares(x) + cp.sum(x)), [x >= lower])
+        data, chain, _ = prob.get_problem_data(cp.OSQP)
+        solver = chain.solver
+        cache = {}
+        # q does not depend on the parameters, but it is edited.
+        for scale in [1, 3, 1]:
+            scaled = dict(data)
+            scaled[cp.settings.Q] = data[cp.settings.Q] * scale
+            results = solver.solve_via_data(scaled, True, False, {}, cache)
+            self.assertItemsAlmostEqual(results.x, [-0.5 * scale] * 2, places=4)
+        # Data built for another solve of the same problem.
+        lower.value = -0.25 * np.ones(2)
+        data, _, _ = prob.get_problem_data(cp.OSQP)
+        results = solver.solve_via_data(data, True, False, {}, cache)
+        self.assertItemsAlmostEqual(results.x, [-0.25] * 2, places=4)
+
     def test_gurobi_warmstart(self) -> None:
         """Test Gurobi warm start with a user provided point.
         """
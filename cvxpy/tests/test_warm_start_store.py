@@ -0,0 +1,98 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import numpy as np
+
+import cvxpy as cp
+from cvxpy.reductions.warm_start_store import (
+    WarmStartStore,
+    get_warm_start_store,
+    set_warm_start_store,
+)
+from cvxpy.tests.base_test import BaseTest
+
+
+def _lasso(gamma_value: float = 0.5):
+    np.random.seed(0)
+    A = np.random.randn(30, 10)
+    x = cp.Variable(10)
+    b = cp.Parameter(30)
+    gamma = cp.Parameter(nonneg=True)
+    problem = cp.Problem(
+        cp.Minimize(cp.sum_squares(A @ x - b) + gamma * cp.norm1(x)),
+        [cp.sum(x) == 1, x >= -1])
+    b.value = np.random.randn(30)
+    gamma.value = gamma_value
+    return problem, x
+
+
+class TestWarmStartStore(BaseTest):
+    def setUp(self) -> None:
+        self.store = WarmStartStore()
+        set_warm_start_store(self.store)
+
+    def tearDown(self) -> None:
+        set_warm_start_store(None)
+
+    def test_iterates(self) -> None:
+        problem, _ = _lasso()
+        problem.solve(solver=cp.SCS)
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(problem._solver_cache, {})
+
+        # A fresh problem of the same structure starts from the solution.
+        other, x = _lasso()
+        other.solve(solver=cp.SCS)
+        self.assertEqual(self.store.hits, 1)
+        set_warm_start_store(None)
+        expected, expected_x = _lasso()
+        expected.solve(solver=cp.SCS)
+        self.assertLess(other.solver_stats.num_iters,
+                        expected.solver_stats.num_iters)
+        self.assertAlmostEqual(other.value, expected.value, places=3)
+        self.assertItemsAlmostEqual(x.value, expected_x.value, places=3)
+
+    def test_osqp_solver(self) -> None:
+        problem, _ = _lasso()
+        problem.solve(solver=cp.OSQP)
+        (solver, _, _), = self.store._entries.values()
+        other, x = _lasso(0.6)
+        other.solve(solver=cp.OSQP)
+        self.assertEqual(self.store.hits, 1)
+        # The factorized solver was updated in place.
+        (other_solver, _, _), = self.store._entries.values()
+        self.assertIs(other_solver, solver)
+        set_warm_start_store(None)
+        expected, expected_x = _lasso(0.6)
+        expected.solve(solver=cp.OSQP)
+        self.assertAlmostEqual(other.value, expected.value, places=4)
+        self.assertItemsAlmostEqual(x.value, expected_x.value, places=4)
+
+    def test_keys(self) -> None:
+        problem, _ = _lasso()
+        problem.solve(solver=cp.SCS)
+        problem.solve(solver=cp.CLARABEL)
+        # Problems of another structure do not share the state.
+        x = cp.Variable(10)
+        cp.Problem(cp.Minimize(cp.sum(x)), [x >= 1]).solve(solver=cp.SCS)
+        self.assertEqual(self.store.hits, 0)
+        self.assertEqual(len(self.store), 3)
+
+        set_warm_start_store(WarmStartStore(maxsize=2))
+        for bound in range(3):
+            x = cp.Variable(3)
+            cp.Problem(cp.Minimize(cp.sum(x)), [x >= bound]).solve(
+                solver=cp.SCS)
+        self.assertEqual(len(get_warm_start_store()), 2)
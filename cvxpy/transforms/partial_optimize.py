@@ -20,6 +20,7 @@ import cvxpy.settings as s
 import cvxpy.utilities as u
 from cvxpy.atoms import sum, trace
 from cvxpy.expressions.constants.constant import Constant
+from cvxpy.expressions.constants.parameter import Parameter
 from cvxpy.expressions.expression import Expression
 from cvxpy.expressions.variable import Variable
 from cvxpy.problems.objective import Maximize, Minimize
@@ -120,6 +121,8 @@ class PartialProblem(Expression):
         self.solver = solver
         self.args = [prob]
         self._solve_kwargs = kwargs
+        self._fixed_prob = None
+        self._fixed_params = None
         super(PartialProblem, self).__init__()
 
     def get_data(self):
@@ -231,15 +234,9 @@ class PartialProblem(Expression):
             return u.grad.constant_grad(self)
 
         old_vals = {var.id: var.value for var in self.variables()}
-        fix_vars = []
-        for var in self.dont_opt_vars:
-            if var.value is None:
-                return u.grad.error_grad(self)
-            else:
-                fix_vars += [var == var.value]
-        prob = Problem(self.args[0].objective,
-                       fix_vars + self.args[0].constraints)
-        prob.solve(solver=self.solver, **self._solve_kwargs)
+        prob = self._solve_fixed()
+        if prob is None:
+            return u.grad.error_grad(self)
         # Compute gradient.
         if prob.status in s.SOLUTION_PRESENT:
             sign = self.is_convex() - self.is_concave()
@@ -262,6 +259,31 @@ class PartialProblem(Expression):
             var.value = old_vals[var.id]
         return result
 
+    def _solve_fixed(self) -> Optional[Problem]:
+        """Solves the problem with the dont_opt_vars fixed to their values.
+
+        The dont_opt_vars are fixed by equality constraints to parameters,
+        so the problem is only compiled once; later calls update the
+        parameters and reuse the compilation.
+
+        Returns:
+            The solved problem, or None if a dont_opt_var has no value.
+        """
+        if any(var.value is None for var in self.dont_opt_vars):
+            return None
+        if self._fixed_prob is None:
+            self._fixed_params = [Parameter(var.shape,
+                                            complex=var.is_complex())
+                                  for var in self.dont_opt_vars]
+            fix_vars = [var == param for var, param
+                        in zip(self.dont_opt_vars, self._fixed_params)]
+            self._fixed_prob = Problem(self.args[0].objective,
+                                       fix_vars + self.args[0].constraints)
+        for var, param in zip(self.dont_opt_vars, self._fixed_params):
+            param.value = var.value
+        self._fixed_prob.solve(solver=self.solver, **self._solve_kwargs)
+        return self._fixed_prob
+
     @property
     def domain(self):
         """A list of constraints describing the closure of the region
@@ -279,14 +301,9 @@ class PartialProblem(Expression):
             A numpy matrix or a scalar.
         """
         old_vals = {var.id: var.value for var in self.variables()}
-        fix_vars = []
-        for var in self.dont_opt_vars:
-            if var.value is None:
-                return None
-            else:
-                fix_vars += [var == var.value]
-        prob = Problem(self.args[0].objective, fix_vars + self.args[0].constraints)
-        prob.solve(solver=self.solver, **self._solve_kwargs)
+        prob = self._solve_fixed()
+        if prob is None:
+            return None
         # Restore the original values to the variables.
         for var in self.variables():
             var.value = old_vals[var.id]
@@ -19,6 +19,7 @@ import copy
 
 import cvxpy.lin_ops.lin_utils as lu
 from cvxpy.utilities import performance_utils as pu
+from cvxpy.utilities import traversal
 from cvxpy.utilities.deterministic import unique_list
 
 
@@ -35,7 +36,7 @@ class Canonical:
             raise ValueError("'expr' is ambiguous, there should be only one argument")
         return self.args[0]
 
-    @pu.lazyprop
+    @pu.lazyprop_bottom_up
     def canonical_form(self):
         """The graph implementation of the object stored as a property.
 
@@ -49,20 +50,17 @@ class Canonical:
     def variables(self):
         """Returns all the variables present in the arguments.
         """
-        return unique_list(
-            [var for arg in self.args for var in arg.variables()])
+        return unique_list(traversal.collect(self, 'variables', Canonical))
 
     def parameters(self):
         """Returns all the parameters present in the arguments.
         """
-        return unique_list(
-            [param for arg in self.args for param in arg.parameters()])
+        return unique_list(traversal.collect(self, 'parameters', Canonical))
 
     def constants(self):
         """Returns all the constants present in the arguments.
         """
-        return unique_list(
-            [const for arg in self.args for const in arg.constants()])
+        return unique_list(traversal.collect(self, 'constants', Canonical))
 
     def tree_copy(self, id_objects=None):
         new_args = []
@@ -144,6 +142,22 @@ class Canonical:
         """
         return None
 
+    def fingerprint(self) -> str:
+        """Returns a structural fingerprint of the object.
+
+        The fingerprint ignores the ids of variables, parameters and
+        constraints, and the values of variables and parameters; it covers
+        the structure of the object, the shapes and attributes of its leaves,
+        and the values of its constants. Objects built by the same code have
+        the same fingerprint.
+
+        Returns
+        -------
+        str
+        """
+        from cvxpy.utilities.fingerprint import structural_fingerprint
+        return structural_fingerprint(self)
+
     def atoms(self):
         """Returns all the atoms present in the args.
 
@@ -152,7 +166,7 @@ class Canonical:
         list
         """
         # Remove duplicates.
-        return unique_list(atom for arg in self.args for atom in arg.atoms())
+        return unique_list(traversal.collect(self, 'atoms', Canonical))
 
 
 _MISSING = object()
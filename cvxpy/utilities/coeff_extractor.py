@@ -26,6 +26,7 @@ from cvxpy.cvxcore.python import canonInterface
 from cvxpy.lin_ops.canon_backend import TensorRepresentation
 from cvxpy.lin_ops.lin_op import NO_OP, LinOp
 from cvxpy.reductions.inverse_data import InverseData
+from cvxpy.utilities import profiling
 from cvxpy.utilities.replace_quad_forms import (
     replace_quad_forms,
     restore_quad_forms,
@@ -68,7 +69,8 @@ class CoeffExtractor:
             expr_list = [expr]
         assert all([e.is_dpp() for e in expr_list])
         num_rows = sum([e.size for e in expr_list])
-        op_list = [e.canonical_form[0] for e in expr_list]
+        with profiling.span('canonical_form'):
+            op_list = [e.canonical_form[0] for e in expr_list]
         return canonInterface.get_problem_matrix(op_list,
                                                  self.x_length,
                                                  self.id_map,
@@ -21,7 +21,13 @@ MAX_NODES = 10_000
 
 def node_count(expr) -> int:
     """Return node count for the expression/constraint."""
-    return 1 + sum(node_count(arg) for arg in getattr(expr, 'args', []))
+    # Shared subexpressions are counted once per occurrence.
+    count = 0
+    stack = [expr]
+    while stack:
+        count += 1
+        stack.extend(getattr(stack.pop(), 'args', []))
+    return count
 
 
 def build_non_disciplined_error_msg(problem, discipline_type) -> str:
@@ -0,0 +1,170 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import annotations
+
+import hashlib
+from fractions import Fraction
+from numbers import Number
+
+import numpy as np
+import scipy.sparse as sp
+
+from cvxpy.constraints.constraint import Constraint
+from cvxpy.expressions.constants.constant import Constant
+from cvxpy.expressions.leaf import Leaf
+from cvxpy.utilities import traversal
+from cvxpy.utilities.canonical import Canonical
+
+
+class _Token:
+    """A token to emit between the items of a container."""
+
+    def __init__(self, token) -> None:
+        self.token = token
+
+
+class _Fingerprinter:
+    """Computes a structural fingerprint of a tree of Canonical objects.
+
+    The fingerprint covers the types of the nodes, their shapes and the data
+    needed to reconstruct them (see ``Canonical.get_data``), the attributes
+    of the leaves and the values of constants. It ignores the ids of leaves,
+    expressions and constraints, as well as the values of parameters and
+    variables: leaves are identified by the order in which they are first
+    encountered, so that two trees built by the same code are equal exactly
+    when their leaves are used in the same pattern.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        # Maps id(node) to the index of the node in traversal order; a
+        # node that is reached again is encoded as a reference, so that
+        # shared subexpressions are distinguished from copies.
+        self._node_index = {}
+        # The leaves, in order of first appearance.
+        self.leaves = []
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def _emit(self, token) -> None:
+        self._hash.update(repr(token).encode())
+        self._hash.update(b"\x00")
+
+    def visit(self, item) -> None:
+        # The items are visited with an explicit stack, so that deep trees
+        # do not hit the recursion limit.
+        traversal.walk(item, self._visit_item)
+
+    def _visit_item(self, item) -> list:
+        """Emits the tokens of item and returns the items it contains, in
+        the order they are visited. Tokens to emit between the contained
+        items are returned as _Token objects.
+        """
+        if isinstance(item, _Token):
+            self._emit(item.token)
+        elif isinstance(item, Canonical):
+            return self._visit_canonical(item)
+        elif isinstance(item, (list, tuple)):
+            self._emit((type(item).__name__, len(item)))
+            return list(item)
+        elif isinstance(item, dict):
+            self._emit(("dict", len(item)))
+            items = []
+            for key in sorted(item, key=repr):
+                items += [_Token(key), item[key]]
+            return items
+        elif isinstance(item, np.ndarray):
+            return self._visit_array(item)
+        elif sp.issparse(item):
+            item = sp.csc_matrix(item)
+            item.sort_indices()
+            self._emit(("sparse", item.shape))
+            return [item.data, item.indices, item.indptr]
+        elif isinstance(item, slice):
+            self._emit(("slice", item.start, item.stop, item.step))
+        elif item is None or isinstance(item, (str, bool, Number, Fraction)):
+            self._emit(item)
+        else:
+            # Unknown data is compared by identity; this can only cause
+            # spurious differences, never spurious matches.
+            self._emit(("object", type(item).__name__, id(item)))
+        return []
+
+    def _visit_array(self, array: np.ndarray) -> list:
+        array = np.ascontiguousarray(array)
+        if array.dtype == object:
+            self._emit(("object_array", array.shape))
+            return list(array.flat)
+        self._emit(("array", array.dtype.str, array.shape,
+                    hashlib.sha256(array.tobytes()).hexdigest()))
+        return []
+
+    def _visit_canonical(self, node: Canonical) -> list:
+        key = id(node)
+        if key in self._node_index:
+            self._emit(("ref", self._node_index[key]))
+            return []
+        self._node_index[key] = len(self._node_index)
+        if isinstance(node, Leaf):
+            return self._visit_leaf(node)
+        self._emit(("node", type(node).__name__, getattr(node, "shape", None),
+                    len(node.args)))
+        data = node.get_data()
+        if isinstance(node, Constraint) and data:
+            # Constraints store their id as the last datum.
+            data = data[:-1]
+        return list(node.args) + [data]
+
+    def _visit_leaf(self, leaf: Leaf) -> list:
+        self.leaves.append(leaf)
+        self._emit(("leaf", type(leaf).__name__, leaf.shape))
+        if isinstance(leaf, Constant):
+            return [leaf.attributes, leaf.value]
+        return [leaf.attributes]
+
+
+def structural_fingerprint(*objects) -> str:
+    """Returns a structural fingerprint of expressions, constraints or problems.
+
+    Two objects have the same fingerprint when they are built from the same
+    types of nodes, with the same shapes, attributes and constant values,
+    and use their variables and parameters in the same pattern; the ids of
+    the leaves and the values of variables and parameters are ignored.
+
+    Parameters
+    ----------
+    objects : Canonical
+        The objects to fingerprint, e.g., an objective and a list of
+        constraints.
+
+    Returns
+    -------
+    str
+        A hexadecimal digest.
+    """
+    return structural_fingerprint_and_leaves(*objects)[0]
+
+
+def structural_fingerprint_and_leaves(*objects):
+    """Returns the structural fingerprint of objects and their leaves.
+
+    The leaves are returned in order of first appearance. The leaves of two
+    objects with the same fingerprint correspond to each other by position.
+    """
+    fingerprinter = _Fingerprinter()
+    fingerprinter.visit(list(objects))
+    return fingerprinter.hexdigest(), fingerprinter.leaves
@@ -14,24 +14,29 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import functools
+import itertools
+import threading
 from typing import Callable, TypeVar
 
-from cvxpy.utilities import scopes
+from cvxpy.utilities import scopes, traversal
 
 R = TypeVar("R")
 T = TypeVar("T")
 
 
+def _lazy_attr_name(name: str) -> str:
+    if scopes.dpp_scope_active():
+        return '_lazy_dpp_' + name
+    return '_lazy_' + name
+
+
 def lazyprop(func):
     """Wraps a property so it is lazily evaluated."""
 
     @property
     @functools.wraps(func)
     def _lazyprop(self):
-        if scopes.dpp_scope_active():
-            attr_name = '_lazy_dpp_' + func.__name__
-        else:
-            attr_name = '_lazy_' + func.__name__
+        attr_name = _lazy_attr_name(func.__name__)
 
         try:
             return getattr(self, attr_name)
@@ -42,7 +47,7 @@ def lazyprop(func):
 
 
 def _cache_key(args, kwargs):
-    key = args + tuple(list(kwargs.items()))
+    key = args + tuple(kwargs.items()) if kwargs else args
     if scopes.dpp_scope_active():
         key = ('__dpp_scope_active__',) + key
     return key
@@ -74,3 +79,122 @@ def compute_once(func: Callable[[T], R]) -> Callable[[T], R]:
         cache[key] = result
         return result
     return _compute_once
+
+
+_bottom_up = threading.local()
+
+# Computations nested in a bottom-up pass recurse directly, and only every
+# _NESTED_DEPTH-th level of nesting starts a new pass.
+_NESTED_DEPTH = 8
+
+
+def _compute_bottom_up(root, name: str, compute: Callable, uncached: Callable,
+                       evaluate: Callable):
+    """Returns evaluate(), the attribute name of root, after computing the
+    attribute for the uncached nodes below root.
+
+    The nodes are visited in post-order, with an explicit stack, so that
+    the computation for each node only reads the cached results of its
+    args. Only the outermost computation traverses: the computations nested
+    in it, e.g., those of the other attributes of the args, recurse
+    directly until they are _NESTED_DEPTH levels deep, which bounds the
+    depth of the recursion for arbitrarily deep expression trees.
+    """
+    depth = getattr(_bottom_up, 'depth', 0)
+    if depth % _NESTED_DEPTH == 0:
+        def expand(node) -> bool:
+            # Other nodes, e.g., the problem of a partial problem, are skipped.
+            return hasattr(type(node), name) and uncached(node)
+
+        # The common case is that the args were already computed.
+        if any(expand(arg) for arg in getattr(root, 'args', ())):
+            _bottom_up.depth = depth + 1
+            try:
+                for node in traversal.post_order(root, expand=expand)[:-1]:
+                    if expand(node):
+                        compute(node)
+            finally:
+                _bottom_up.depth = depth
+    _bottom_up.depth = depth + 1
+    try:
+        return evaluate()
+    finally:
+        _bottom_up.depth = depth
+
+
+def compute_once_bottom_up(func: Callable[[T], R]) -> Callable[[T], R]:
+    """Like compute_once, for methods without arguments that recurse into
+    the same method of the args of an expression.
+
+    When the result of a node is not cached, the method is first computed
+    for the nodes below it in post-order, so that the depth of the
+    recursion is bounded for arbitrarily deep expression trees.
+    """
+    name = func.__name__
+    cache_name = name + '__cache__'
+
+    @functools.wraps(func)
+    def _compute_once_bottom_up(self) -> R:
+        key = _cache_key((), {})
+        cache = getattr(self, cache_name, None)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        def uncached(node) -> bool:
+            return key not in getattr(node, cache_name, {})
+
+        def evaluate() -> R:
+            result = func(self)
+            if not hasattr(self, cache_name):
+                setattr(self, cache_name, {})
+            getattr(self, cache_name)[key] = result
+            return result
+
+        return _compute_bottom_up(self, name,
+                                  lambda node: getattr(node, name)(),
+                                  uncached, evaluate)
+    return _compute_once_bottom_up
+
+
+def lazyprop_bottom_up(func):
+    """Like lazyprop, for properties that recurse into the same property of
+    the args of an expression; see compute_once_bottom_up.
+    """
+    prop = lazyprop(func)
+    name = func.__name__
+
+    @property
+    @functools.wraps(func)
+    def _lazyprop_bottom_up(self):
+        attr_name = _lazy_attr_name(name)
+        if hasattr(self, attr_name):
+            return getattr(self, attr_name)
+
+        def uncached(node) -> bool:
+            return not hasattr(node, attr_name)
+
+        return _compute_bottom_up(self, name,
+                                  lambda node: getattr(node, name),
+                                  uncached, lambda: prop.fget(self))
+    return _lazyprop_bottom_up
+
+
+_value_versions = itertools.count(1)
+_latest_value_version = 0
+
+
+def next_value_version() -> int:
+    """Returns a new version for a value assigned to a leaf.
+
+    Versions increase with every assignment, so the largest version of the
+    leaves of an expression changes whenever one of their values changes.
+    """
+    global _latest_value_version
+    version = next(_value_versions)
+    _latest_value_version = version
+    return version
+
+
+def latest_value_version() -> int:
+    """Returns the version of the last value assigned to any leaf."""
+    return _latest_value_version
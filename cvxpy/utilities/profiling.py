@@ -0,0 +1,207 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+import time
+import tracemalloc
+from typing import Generator, Optional
+
+_profile: Optional["Profile"] = None
+
+
+class ProfileNode:
+    """The measurements of one call path in a Profile.
+
+    Calls with the same name under the same parent are aggregated into a
+    single node.
+
+    Attributes
+    ----------
+    name : str
+        The name of the measured code, e.g., the name of a reduction.
+    calls : int
+        The number of times the code ran.
+    time : float
+        The total wall time of the calls, in seconds, including the time
+        spent in the children.
+    memory : int or None
+        The net number of bytes allocated by the calls, including the
+        children, or None if memory was not traced.
+    children : dict
+        The nodes of the code called by this code, keyed by name.
+    """
+
+    def __init__(self, name: str, trace_memory: bool) -> None:
+        self.name = name
+        self.calls = 0
+        self.time = 0.0
+        self.memory = 0 if trace_memory else None
+        self.children = {}
+
+    @property
+    def self_time(self) -> float:
+        """The time not spent in the children."""
+        return self.time - sum(child.time for child in self.children.values())
+
+    def child(self, name: str) -> "ProfileNode":
+        node = self.children.get(name)
+        if node is None:
+            node = ProfileNode(name, self.memory is not None)
+            self.children[name] = node
+        return node
+
+    def to_dict(self) -> dict:
+        """Returns the node and its descendants as nested dicts."""
+        return {'name': self.name, 'calls': self.calls, 'time': self.time,
+                'memory': self.memory,
+                'children': [child.to_dict()
+                             for child in self.children.values()]}
+
+
+class Profile:
+    """The measurements taken while a `profiling` context was active.
+
+    The measurements form a tree of ProfileNodes: compilations contain the
+    reductions of the solving chain, which contain the canonicalizers of
+    atoms and the canonicalization backend.
+
+    Attributes
+    ----------
+    root : ProfileNode
+        A node without measurements whose children are the top-level calls.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.root = ProfileNode('root', trace_memory)
+        self._stack = [self.root]
+        self._thread = threading.get_ident()
+
+    @contextlib.contextmanager
+    def _span(self, name: str) -> Generator[None, None, None]:
+        node = self._stack[-1].child(name)
+        self._stack.append(node)
+        if self.trace_memory:
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            node.time += time.perf_counter() - start
+            node.calls += 1
+            if self.trace_memory:
+                node.memory += tracemalloc.get_traced_memory()[0] - start_memory
+            self._stack.pop()
+
+    def to_dict(self) -> dict:
+        """Returns the profile as nested dicts, with times in seconds."""
+        return {'trace_memory': self.trace_memory,
+                'children': [child.to_dict()
+                             for child in self.root.children.values()]}
+
+    def to_json(self, **kwargs) -> str:
+        """Returns the profile as JSON; kwargs are passed to json.dumps."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_folded(self) -> str:
+        """Returns the profile in the folded-stacks format.
+
+        Each line holds a call path, with names separated by semicolons,
+        and the self time of the path in microseconds. The format is read
+        by flamegraph.pl, speedscope and most flame graph viewers.
+        """
+        lines = []
+
+        def visit(node, path):
+            path = path + [node.name]
+            self_time = int(round(node.self_time * 1e6))
+            if self_time > 0:
+                lines.append('%s %d' % (';'.join(path), self_time))
+            for child in node.children.values():
+                visit(child, path)
+        for child in self.root.children.values():
+            visit(child, [])
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        lines = ['%-50s %8s %12s %12s' % ('name', 'calls', 'time (s)',
+                                          'memory (B)')]
+
+        def visit(node, depth):
+            memory = '-' if node.memory is None else str(node.memory)
+            lines.append('%-50s %8d %12.6f %12s' % (
+                '  ' * depth + node.name, node.calls, node.time, memory))
+            for child in node.children.values():
+                visit(child, depth + 1)
+        for child in self.root.children.values():
+            visit(child, 0)
+        return '\n'.join(lines)
+
+
+@contextlib.contextmanager
+def profiling(memory: bool = False) -> Generator[Profile, None, None]:
+    """Context manager that profiles the compilation of problems.
+
+    While the context is active, the compilations and solves of problems
+    in the current thread record the wall time of each reduction of the
+    solving chain, of each canonicalizer of an atom, of the construction
+    of the problem data by the canonicalization backend, and of the
+    solver's formatting of the problem data.
+
+    ```
+        with cp.profiling() as profile:
+            problem.solve()
+        print(profile)
+        open('compile.folded', 'w').write(profile.to_folded())
+    ```
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Whether to also record the memory allocated by each step with
+        tracemalloc, which slows compilation down considerably.
+
+    Yields
+    ------
+    Profile
+        The profile, which is filled in while the context is active.
+    """
+    global _profile
+    prev_profile = _profile
+    profile = Profile(memory)
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _profile = profile
+    try:
+        yield profile
+    finally:
+        _profile = prev_profile
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def span(name: str):
+    """Returns a context manager that records the time spent in its body
+    under name, if a `profiling` context is active in the current thread.
+    """
+    profile = _profile
+    if profile is None or profile._thread != threading.get_ident():
+        return contextlib.nullcontext()
+    return profile._span(name)
@@ -16,14 +16,23 @@ limitations under the License.
 
 from cvxpy.atoms.quad_form import QuadForm, SymbolicQuadForm
 from cvxpy.expressions.variable import Variable
+from cvxpy.utilities import traversal
+
+
+def _is_quad_form(expr) -> bool:
+    return isinstance(expr, SymbolicQuadForm) or isinstance(expr, QuadForm)
 
 
 def replace_quad_forms(expr, quad_forms):
-    for idx, arg in enumerate(expr.args):
-        if isinstance(arg, SymbolicQuadForm) or isinstance(arg, QuadForm):
-            quad_forms = replace_quad_form(expr, idx, quad_forms)
-        else:
-            quad_forms = replace_quad_forms(arg, quad_forms)
+    # The nodes below the quadratic forms are not visited. A node is
+    # visited once even if it is shared, since its quadratic forms are
+    # replaced the first time.
+    for node in traversal.post_order(expr,
+                                     expand=lambda node: not _is_quad_form(node)):
+        if node is expr or not _is_quad_form(node):
+            for idx, arg in enumerate(node.args):
+                if _is_quad_form(arg):
+                    quad_forms = replace_quad_form(node, idx, quad_forms)
     return quad_forms
 
 
@@ -37,8 +46,7 @@ def replace_quad_form(expr, idx, quad_forms):
 
 
 def restore_quad_forms(expr, quad_forms) -> None:
-    for idx, arg in enumerate(expr.args):
-        if isinstance(arg, Variable) and arg.id in quad_forms:
-            expr.args[idx] = quad_forms[arg.id][2]
-        else:
-            restore_quad_forms(arg, quad_forms)
+    for node in traversal.post_order(expr):
+        for idx, arg in enumerate(node.args):
+            if isinstance(arg, Variable) and arg.id in quad_forms:
+                node.args[idx] = quad_forms[arg.id][2]
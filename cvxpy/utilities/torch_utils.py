@@ -48,17 +48,179 @@ class VariablesDict():
                 return True
         return False
 
+def gen_var_type(arg) -> VAR_TYPE:
+    """
+    This is a helper function that generates a VAR_TYPE from an arg.
+    """
+    from cvxpy.expressions.constants.constant import Constant
+    from cvxpy.expressions.constants.parameter import Parameter
+    from cvxpy.expressions.variable import Variable
+    if isinstance(arg, Constant):
+        return VAR_TYPE.CONSTANT
+    elif isinstance(arg, Parameter) or isinstance(arg, Variable):
+        return VAR_TYPE.VARIABLE_PARAMETER
+    else:
+        return VAR_TYPE.EXPRESSION
+
+def is_matmul(expr) -> bool:
+    """
+    This function checks if expr is a valid matrix multiplication
+    """
+    from cvxpy.atoms.affine.binary_operators import MulExpression, multiply
+    if not isinstance(expr, MulExpression):
+        return False
+    #Check if the current expression is not elementwise multiplication
+    if isinstance(expr, multiply):
+        return False
+    return True
+
+def transpose_if_matmul(res: list) -> None:
+    """
+    This function transposes the matrix in res if res holds the two operands of a dot product
+    between two vectors, where one of the vectors is represented by a matrix. While transposing
+    a vector in CVXPY does nothing, this function is important because it helps overloading the
+    dot product to the case where one of the elements is a matrix, where each row is a vector
+    to be multiplied with.
+    """
+    #Work only on objects with ndim (torch/numpy/cvxpy etc.) and ndim<=2
+    ndims = [getattr(vec, "ndim", None) for vec in res]
+    if None in ndims or max(ndims) > 2:
+        return
+    #No need to transpose scalars and vectors. If both elements are matrices, do not
+    #transpose - we only make a vector-by-matrix compatible.
+    if max(ndims) < 2 or min(ndims) == 2:
+        return
+    matrix_ind = ndims.index(2)
+    #Since ndims is a vector with 2 elements, 1-matrix_ind returns the other index
+    vector_ind = 1-matrix_ind
+    if res[vector_ind].shape[0] == res[matrix_ind].shape[matrix_ind]:
+        res[matrix_ind] = res[matrix_ind].T
+
+class TorchExpression(torch.nn.Module):
+    """A torch module that evaluates a CVXPY expression.
+
+    The expression tree is flattened once, when the module is built, into a list of
+    operations in topological order. The constants of the expression are converted to
+    tensors up front and stored as buffers, so they follow the module in calls to .to().
+    Calling the module runs the torch_numeric (or numeric) method of each atom in order,
+    without walking the expression tree, and the module can be passed to torch.compile.
+
+    The positional arguments of the module are the values of the variables and parameters
+    of the expression, in the order given by vars_dict. If batched is True, each value may
+    carry a leading batch axis, and the module evaluates the expression for each entry of
+    the batch in a single vectorized call, with torch.func.vmap. Values without a batch axis
+    are shared by all the entries.
+
+    Atoms without a torch_numeric method are evaluated with their NumPy numeric method,
+    which leaves torch and breaks autograd. If strict is True, such atoms raise a ValueError
+    when the module is built instead.
+    """
+    def __init__(self, expr, vars_dict: VariablesDict, batched: bool = False,
+                 strict: bool = False):
+        super().__init__()
+        self.batched = batched
+        self.strict = strict
+        #Each operation is (atom, inputs, transpose), where the inputs are (VAR_TYPE, ref)
+        #pairs: ref is the name of a buffer for constants, the position of the argument for
+        #variables and parameters, and the position of the operation for expressions.
+        self._ops = []
+        self._add_ops(expr, vars_dict, dict())
+        self._leaf_ndims = [var.ndim for var in vars_dict.vars_dict]
+
+    def _add_ops(self, expr, vars_dict: VariablesDict, op_inds: dict) -> int:
+        """Appends the operations that evaluate expr and returns the position of the last."""
+        if self.strict and not hasattr(expr, "torch_numeric"):
+            raise ValueError("%s has no torch_numeric method; it can only be evaluated with "
+                             "NumPy." % type(expr).__name__)
+        inputs = []
+        #In order to support dot products of vectors,
+        #where one vector is represented by a matrix, we need to see if:
+        #1. The operation is matmul
+        #2. between two vectors (variables/parameters with ndim==1)
+        #These checks happen on the original variables/parameters,
+        #and NOT on the values of the arguments, so they are done once here.
+        transposable_elements = []
+        for arg in expr.args:
+            var_type = gen_var_type(arg)
+            if var_type == VAR_TYPE.CONSTANT:
+                value = arg.torch_tensor(dtype=torch.float64)
+                name = "const%d" % len(self._buffers)
+                self.register_buffer(name, value)
+                inputs.append((var_type, name))
+            elif var_type == VAR_TYPE.VARIABLE_PARAMETER:
+                vars_dict.add_var(arg)
+                inputs.append((var_type, vars_dict.vars_dict[arg]))
+            else:
+                #Shared sub-expressions are evaluated once.
+                if id(arg) not in op_inds:
+                    op_inds[id(arg)] = self._add_ops(arg, vars_dict, op_inds)
+                inputs.append((var_type, op_inds[id(arg)]))
+            transposable_elements.append(arg.ndim == 1)
+        #Transpose only a dot product between two elements
+        transpose = is_matmul(expr) and len(inputs) == 2 and all(transposable_elements)
+        self._ops.append((expr, inputs, transpose))
+        return len(self._ops) - 1
+
+    def forward(self, *args):
+        if not self.batched:
+            return self._evaluate(*args)
+        #Tensors keep their dtype; other values are converted like the constants.
+        args = [arg if isinstance(arg, torch.Tensor) else
+                torch.as_tensor(arg, dtype=torch.complex128 if np.iscomplexobj(arg)
+                                else torch.float64)
+                for arg in args]
+        in_dims = tuple(0 if arg.ndim > ndim else None
+                        for arg, ndim in zip(args, self._leaf_ndims))
+        if all(in_dim is None for in_dim in in_dims):
+            return self._evaluate(*args)
+        return torch.func.vmap(self._evaluate, in_dims=in_dims)(*args)
+
+    def _evaluate(self, *args):
+        values = []
+        for expr, inputs, transpose in self._ops:
+            res = []
+            for var_type, ref in inputs:
+                if var_type == VAR_TYPE.CONSTANT:
+                    res.append(self._buffers[ref])
+                elif var_type == VAR_TYPE.VARIABLE_PARAMETER:
+                    res.append(args[ref])
+                else:
+                    res.append(values[ref])
+            #If this is a matrix multiplication operation between 2 elements, transpose the
+            #second. This helps with overloading the operation to be used with matrices.
+            if transpose:
+                transpose_if_matmul(res)
+            values.append(expr.apply_torch_numeric(res))
+        return values[-1]
+
 def gen_tensor(value, dtype=torch.float64) -> torch.Tensor:
     """This function generates a tensor from an np.array or a sparse matrix.
-    If the input is a sparse matrix, a sparse tensor is generated."""
-    if not issparse(value):
-        return torch.tensor(value, dtype=dtype)
-    value_coo = coo_matrix(value)
-    vals = value_coo.data
-    inds = np.vstack((value_coo.row, value_coo.col))
-    i = torch.LongTensor(inds)
-    v = torch.FloatTensor(vals)
-    return torch.sparse.FloatTensor(i, v, torch.Size(value_coo.shape)).to(dtype)
+    If the input is a sparse matrix, a sparse COO tensor is generated.
+    Dense arrays that already have the requested dtype are not copied: the tensor shares
+    their memory."""
+    if issparse(value):
+        value_coo = coo_matrix(value)
+        inds = np.vstack((value_coo.row, value_coo.col)).astype(np.int64)
+        vals = torch.from_numpy(value_coo.data).to(dtype)
+        return torch.sparse_coo_tensor(torch.from_numpy(inds), vals,
+                                       value_coo.shape).coalesce()
+    value = np.asarray(value)
+    if not value.flags.writeable or any(stride < 0 for stride in value.strides):
+        value = value.copy()
+    return torch.as_tensor(value, dtype=dtype)
+
+def torch_convolve(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+    """This function returns the full discrete convolution of two 1D tensors,
+    like numpy.convolve."""
+    kernel = torch.flip(y, dims=(0,)).reshape(1, 1, -1)
+    output = torch.nn.functional.conv1d(x.reshape(1, 1, -1), kernel, padding=y.shape[0]-1)
+    return output.flatten()
+
+def torch_index(value: torch.Tensor, key) -> torch.Tensor:
+    """This function indexes a tensor with a NumPy key.
+    Unlike torch, the key may contain slices with negative steps and index arrays."""
+    inds = np.arange(value.numel()).reshape(tuple(value.shape))[key]
+    return value.flatten()[torch.as_tensor(np.ascontiguousarray(inds))]
 
 def tensor_reshape_fortran(value: torch.Tensor, shape: tuple) -> torch.Tensor:
     """This function reshapes a tensor in Fortran order (similar to numpy.reshape with order="F").
@@ -0,0 +1,165 @@
+"""
+Copyright, the CVXPY authors
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+_DONE = object()
+
+
+def _args(node) -> list:
+    return node.args
+
+
+def post_order(root, children: Callable = _args,
+               expand: Callable | None = None) -> list:
+    """Returns the nodes of the DAG below root in post-order.
+
+    The DAG is traversed with an explicit stack, so that deep trees, e.g.,
+    sums built one term at a time, do not hit the recursion limit. Every
+    node is listed once, after its children, even if it is shared; the
+    children of a node are visited from left to right.
+
+    Parameters
+    ----------
+    root : object
+        The root of the DAG.
+    children : callable, optional
+        Returns the children of a node, by default its args.
+    expand : callable, optional
+        Nodes for which expand returns False are listed without their
+        children. The root is always expanded.
+
+    Returns
+    -------
+    list
+        The nodes, ending with root.
+    """
+    order = []
+    visited = {id(root)}
+    stack = [(root, iter(children(root)))]
+    while stack:
+        node, child_iter = stack[-1]
+        for child in child_iter:
+            if id(child) in visited:
+                continue
+            visited.add(id(child))
+            if expand is None or expand(child):
+                stack.append((child, iter(children(child))))
+                break
+            order.append(child)
+        else:
+            stack.pop()
+            order.append(node)
+    return order
+
+
+def walk(root, visit: Callable[[Any], list]) -> None:
+    """Calls visit for the items below root in pre-order.
+
+    visit(item) returns the items to visit after item, before the items
+    that follow it, i.e., the children of item. Nothing is deduplicated,
+    so that shared items are visited at every occurrence. An explicit stack
+    is used, so that deep trees do not hit the recursion limit.
+    """
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        stack.extend(reversed(visit(item)))
+
+
+def fold(root, combine: Callable[[Any, list], Any],
+         children: Callable = _args, memo: dict | None = None) -> Any:
+    """Combines results over the DAG below root, from the leaves up.
+
+    Computes combine(node, results) for every node, where results are the
+    results of the children of the node, without recursion. The results
+    of shared nodes are computed once.
+
+    Parameters
+    ----------
+    root : object
+        The root of the DAG.
+    combine : callable
+        Returns the result of a node from the node and the results of its
+        children. It is called for the nodes in post-order.
+    children : callable, optional
+        Returns the children of a node, by default its args.
+    memo : dict, optional
+        Maps id(node) to the result of the node. Passing the same memo to
+        several calls shares results between DAGs; the nodes must outlive
+        the memo.
+
+    Returns
+    -------
+    object
+        The result of root.
+    """
+    if memo is None:
+        memo = {}
+    if id(root) in memo:
+        return memo[id(root)]
+    for node in post_order(root, children,
+                           expand=lambda node: id(node) not in memo):
+        if id(node) not in memo:
+            memo[id(node)] = combine(
+                node, [memo[id(child)] for child in children(node)])
+    return memo[id(root)]
+
+
+def fold_tree(root, combine: Callable[[Any, list], Any],
+              children: Callable = _args) -> Any:
+    """Like fold, but combines every occurrence of a shared node separately,
+    as if the DAG were a tree.
+
+    This is needed when the results must not be shared, e.g., when they
+    are expression trees that are later modified in place.
+    """
+    # The results of the children of the nodes on the stack; the first
+    # list receives the result of root.
+    results = [[], []]
+    stack = [(root, iter(children(root)))]
+    while stack:
+        node, child_iter = stack[-1]
+        child = next(child_iter, _DONE)
+        if child is _DONE:
+            stack.pop()
+            child_results = results.pop()
+            results[-1].append(combine(node, child_results))
+        else:
+            stack.append((child, iter(children(child))))
+            results.append([])
+    return results[0][0]
+
+
+def collect(root, method: str, base: type) -> list:
+    """Concatenates method() of the nodes below root that override it.
+
+    Nodes whose class inherits method from base are traversed; the others,
+    e.g., leaves, contribute the result of their own method. The results
+    are concatenated in the order of a left-to-right depth-first traversal,
+    as if every node concatenated the results of its args.
+    """
+    default = getattr(base, method)
+
+    def inherits(node) -> bool:
+        return getattr(type(node), method) is default
+
+    result = []
+    for node in post_order(root, expand=inherits):
+        if node is not root and not inherits(node):
+            result += getattr(node, method)()
+    return result
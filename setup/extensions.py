@@ -40,6 +40,7 @@ compiler_args = [
 cvxcore = Extension(
     '_cvxcore',
     sources=['cvxpy/cvxcore/src/cvxcore.cpp',
+             'cvxpy/cvxcore/src/LinOpForest.cpp',
              'cvxpy/cvxcore/src/LinOpOperations.cpp',
              'cvxpy/cvxcore/src/Utils.cpp',
              'cvxpy/cvxcore/python/cvxcore_wrap.cxx'],